@@ -0,0 +1 @@
+# Benchmarks do NetworkTools
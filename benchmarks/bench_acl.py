@@ -0,0 +1,102 @@
+"""
+Benchmark das ACLs compiladas (core.acl)
+Gera ACLs de 10 a 10 mil regras (prefixos de origem e destino, hosts,
+curingas não contíguos e algumas regras "any") e compara a avaliação de
+primeira regra que casa percorrendo a lista com a ListaAcesso compilada,
+um pacote por vez e em lote (tráfego com fluxos repetidos e aleatório).
+
+Para executar: python -m benchmarks.bench_acl
+"""
+
+import random
+import time
+
+import numpy as np
+
+from core.acl import NEGAR, PERMITIR, QUALQUER, SEM_REGRA, ListaAcesso, RegraACL
+
+
+def gerar_regras(quantidade: int, semente: int = 11) -> list:
+    """ACL sintética com a mistura de regras de uma borda de rede típica."""
+    aleatorio = random.Random(semente)
+
+    def campo():
+        sorteio = aleatorio.random()
+        if sorteio < 0.05:
+            return 0, QUALQUER
+        if sorteio < 0.15:
+            return aleatorio.getrandbits(32), 0
+        if sorteio < 0.20:
+            curinga = 0x0000FF00 | (1 << aleatorio.randrange(8)) - 1
+            return aleatorio.getrandbits(32) & ~curinga & QUALQUER, curinga
+        cidr = aleatorio.randrange(12, 29)
+        curinga = (1 << (32 - cidr)) - 1
+        return aleatorio.getrandbits(32) & ~curinga & QUALQUER, curinga
+
+    return [RegraACL(aleatorio.choice((PERMITIR, NEGAR)), *campo(), *campo())
+            for _ in range(quantidade)]
+
+
+def primeira_regra_linear(regras, origem: int, destino: int) -> int:
+    """A abordagem direta: testa as regras em ordem até uma casar."""
+    for indice, regra in enumerate(regras):
+        if regra.casa(origem, destino):
+            return indice
+    return SEM_REGRA
+
+
+def gerar_pacotes(regras, quantidade: int, hosts: int, semente: int = 5) -> tuple:
+    """Pacotes entre `hosts` endereços, metade deles dentro das redes das regras."""
+    aleatorio = random.Random(semente)
+    enderecos = []
+    for _ in range(hosts):
+        regra = aleatorio.choice(regras)
+        if aleatorio.random() < 0.5:
+            enderecos.append(regra.origem | aleatorio.getrandbits(32) & regra.curinga_origem)
+        else:
+            enderecos.append(aleatorio.getrandbits(32))
+    enderecos = np.asarray(enderecos, dtype=np.uint32)
+    gerador = np.random.default_rng(semente)
+    return (enderecos[gerador.integers(0, hosts, quantidade)],
+            enderecos[gerador.integers(0, hosts, quantidade)])
+
+
+def por_pacote(funcao, origens, destinos) -> float:
+    """Tempo médio (µs) de funcao(origem, destino) sobre os pacotes."""
+    origens, destinos = origens.tolist(), destinos.tolist()
+    inicio = time.perf_counter()
+    for origem, destino in zip(origens, destinos):
+        funcao(origem, destino)
+    return (time.perf_counter() - inicio) / len(origens) * 1e6
+
+
+def main():
+    print(f"{'regras':>7} {'compilar':>10} {'linear':>12} {'compilada':>12} "
+          f"{'lote (fluxos)':>14} {'lote (aleatório)':>17}")
+    for quantidade in (10, 100, 1_000, 10_000):
+        regras = gerar_regras(quantidade)
+        inicio = time.perf_counter()
+        acl = ListaAcesso(regras)
+        compilar = time.perf_counter() - inicio
+
+        origens, destinos = gerar_pacotes(regras, 200_000, hosts=5_000)
+        linear = por_pacote(lambda o, d: primeira_regra_linear(regras, o, d),
+                            origens[:max(200, 200_000 // quantidade)], destinos[:max(200, 200_000 // quantidade)])
+        compilada = por_pacote(acl.avaliar_indice, origens[:20_000], destinos[:20_000])
+
+        acl.avaliar_lote(origens[:10], destinos[:10])  # tabelas do lote fora da medição
+        inicio = time.perf_counter()
+        acl.avaliar_lote(origens, destinos)
+        lote_fluxos = (time.perf_counter() - inicio) / len(origens) * 1e6
+
+        aleatorias = np.random.default_rng(1).integers(0, 1 << 32, (2, 200_000), dtype=np.uint64)
+        inicio = time.perf_counter()
+        acl.avaliar_lote(aleatorias[0], aleatorias[1])
+        lote_aleatorio = (time.perf_counter() - inicio) / aleatorias.shape[1] * 1e6
+
+        print(f"{quantidade:>7} {compilar * 1e3:>8.0f}ms {linear:>10.2f}µs {compilada:>10.2f}µs "
+              f"{lote_fluxos:>12.2f}µs {lote_aleatorio:>15.2f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark do agrupamento de IPs por rede (core.network_utils)
+Compara a comparação de todos os pares com ips_mesma_rede (em uma amostra
+pequena, por ser O(n²)), agrupar_por_rede (uma chave por IP, tabela hash)
+e agrupar_por_rede_lote (ordenação das chaves) até 10 milhões de endereços.
+
+Para executar: python -m benchmarks.bench_agrupamento
+"""
+
+import time
+
+import numpy as np
+
+from core.network_utils import (
+    agrupar_por_rede,
+    agrupar_por_rede_lote,
+    inteiro_para_ip,
+    ips_mesma_rede,
+)
+
+CIDR = 16
+
+
+def agrupar_por_pares(ips, cidr: int) -> list:
+    """A abordagem direta: cada IP entra no primeiro grupo cujo líder está na mesma rede."""
+    grupos = []
+    for ip in ips:
+        for grupo in grupos:
+            if ips_mesma_rede(grupo[0], ip, cidr):
+                grupo.append(ip)
+                break
+        else:
+            grupos.append([ip])
+    return grupos
+
+
+def cronometrar(funcao, *args) -> float:
+    inicio = time.perf_counter()
+    funcao(*args)
+    return time.perf_counter() - inicio
+
+
+def main():
+    gerador = np.random.default_rng(3)
+    # Tráfego concentrado em 2 mil redes /16, como em logs de uma rede grande
+    redes = gerador.integers(0, 1 << 16, 2_000, dtype=np.uint32) << np.uint32(16)
+
+    print(f"{'IPs':>11} {'pares':>10} {'hash':>10} {'lote':>10}")
+    for quantidade in (2_000, 100_000, 1_000_000, 10_000_000):
+        inteiros = (redes[gerador.integers(0, len(redes), quantidade)]
+                    | gerador.integers(0, 1 << 16, quantidade, dtype=np.uint32))
+        pares = hash_ = "-"
+        if quantidade <= 2_000:
+            textos = [inteiro_para_ip(ip) for ip in inteiros.tolist()]
+            pares = f"{cronometrar(agrupar_por_pares, textos, CIDR):.3f}s"
+        if quantidade <= 1_000_000:
+            textos = [inteiro_para_ip(ip) for ip in inteiros.tolist()]
+            hash_ = f"{cronometrar(agrupar_por_rede, textos, CIDR):.3f}s"
+        lote = f"{cronometrar(agrupar_por_rede_lote, inteiros, CIDR):.3f}s"
+        print(f"{quantidade:>11,} {pares:>10} {hash_:>10} {lote:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark da agregação de fluxos (core.fluxos)
+Gera fluxos sintéticos em CSV sob demanda (sem arquivo, para testar entradas
+de qualquer tamanho) e compara a soma direta (calcular_rede em cada endereço
+e um dict por par) com agregar_fluxos, medindo fluxos por segundo e o pico
+de memória do processo, que deve ficar estável com o aumento da entrada.
+
+Para executar: python -m benchmarks.bench_fluxos [--fluxos 2000000]
+"""
+
+import argparse
+import csv
+import random
+import resource
+import time
+
+from core.fluxos import agregar_fluxos
+from core.network_utils import calcular_rede, inteiro_para_ip
+
+CIDR = 24
+
+
+def gerar_csv(quantidade: int, semente: int = 9):
+    """Linhas CSV de fluxos entre 20 mil hosts espalhados por 400 redes /24."""
+    aleatorio = random.Random(semente)
+    redes = [aleatorio.getrandbits(24) << 8 for _ in range(400)]
+    hosts = [inteiro_para_ip(aleatorio.choice(redes) | aleatorio.getrandbits(8))
+             for _ in range(20_000)]
+    yield "src,dst,bytes,packets\n"
+    for _ in range(quantidade):
+        yield (f"{aleatorio.choice(hosts)},{aleatorio.choice(hosts)},"
+               f"{aleatorio.randrange(40, 1 << 20)},{aleatorio.randrange(1, 1000)}\n")
+
+
+def agregar_direto(linhas, cidr: int) -> dict:
+    """A abordagem direta: uma chamada a calcular_rede por endereço e um dict por par."""
+    pares = {}
+    leitor = csv.reader(linhas)
+    next(leitor)
+    for origem, destino, quantidade_bytes, pacotes in leitor:
+        chave = (calcular_rede(origem, cidr), calcular_rede(destino, cidr))
+        soma = pares.setdefault(chave, [0, 0, 0])
+        soma[0] += int(quantidade_bytes)
+        soma[1] += int(pacotes)
+        soma[2] += 1
+    return pares
+
+
+def medir(funcao, quantidade: int) -> float:
+    """Fluxos por segundo de funcao(linhas), descontando a geração das linhas."""
+    linhas = list(gerar_csv(quantidade))
+    inicio = time.perf_counter()
+    funcao(linhas)
+    return quantidade / (time.perf_counter() - inicio)
+
+
+def pico_memoria_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fluxos", type=int, default=2_000_000,
+                        help="Fluxos da medição de memória em fluxo contínuo")
+    args = parser.parse_args(argv)
+
+    direto = medir(lambda linhas: agregar_direto(linhas, CIDR), 500_000)
+    agregado = medir(lambda linhas: agregar_fluxos(linhas, CIDR), 500_000)
+    print(f"  soma direta:     {direto:>12,.0f} fluxos/s")
+    print(f"  agregar_fluxos:  {agregado:>12,.0f} fluxos/s ({agregado / direto:.1f}x)")
+
+    # Entrada gerada durante a leitura: a memória é só a do agregador
+    for quantidade in (args.fluxos // 4, args.fluxos):
+        inicio = time.perf_counter()
+        matriz = agregar_fluxos(gerar_csv(quantidade), CIDR)
+        duracao = time.perf_counter() - inicio
+        print(f"  {quantidade:>11,} fluxos gerados e agregados em {duracao:.1f}s: "
+              f"{len(matriz):,} pares, pico de memória {pico_memoria_mb():.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
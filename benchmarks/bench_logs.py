@@ -0,0 +1,94 @@
+"""
+Benchmark do enriquecimento de logs de acesso (core.logs)
+Gera um log sintético no formato combined e compara o processamento linha a
+linha (regex por linha + ips_mesma_rede) com o pipeline em blocos de
+enriquecer_log, em texto puro e gzip, medindo linhas por segundo.
+
+Para executar: python -m benchmarks.bench_logs [--linhas 1000000]
+"""
+
+import argparse
+import gzip
+import os
+import random
+import re
+import shutil
+import tempfile
+import time
+
+from core.logs import REMOTO, INVALIDO, LOCAL, abrir_log, enriquecer_log, ler_blocos
+from core.network_utils import ips_mesma_rede
+
+IP_ORIGEM = "192.168.1.10"
+CIDR = 24
+
+_PADRAO_LINHA = re.compile(r"[ \t]*(\S*)")
+
+
+def gerar_log(caminho: str, linhas: int, semente: int = 7) -> None:
+    """Escreve um log combined com 5 mil clientes distintos, alguns na rede local."""
+    aleatorio = random.Random(semente)
+    clientes = ([f"192.168.1.{aleatorio.randrange(256)}" for _ in range(200)]
+                + [".".join(str(aleatorio.randrange(1, 224 if i == 0 else 256)) for i in range(4))
+                   for _ in range(4800)])
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        for numero in range(linhas):
+            arquivo.write(f'{aleatorio.choice(clientes)} - - [10/Oct/2025:13:55:36 -0300] '
+                          f'"GET /produtos?id={numero} HTTP/1.1" 200 2326 "https://exemplo.com/" '
+                          f'"Mozilla/5.0 (X11; Linux x86_64)"\n')
+
+
+def enriquecer_linha_a_linha(caminho: str, saida) -> int:
+    """A abordagem direta: uma expressão e uma chamada de ips_mesma_rede por linha."""
+    total = 0
+    with open(caminho, encoding="utf-8", errors="replace") as entrada:
+        for linha in entrada:
+            ip = _PADRAO_LINHA.match(linha).group(1)
+            try:
+                rotulo = LOCAL if ips_mesma_rede(IP_ORIGEM, ip, CIDR) else REMOTO
+            except ValueError:
+                rotulo = INVALIDO
+            saida.write(f"{linha.rstrip(chr(10))} {rotulo}\n")
+            total += 1
+    return total
+
+
+def enriquecer_em_blocos(caminho: str, saida) -> int:
+    with abrir_log(caminho) as arquivo:
+        return enriquecer_log(ler_blocos(arquivo), saida, IP_ORIGEM, CIDR)["total"]
+
+
+def medir(funcao, caminho: str) -> float:
+    """Linhas por segundo de funcao(caminho, saida) escrevendo em /dev/null."""
+    with open(os.devnull, "w", encoding="utf-8") as saida:
+        inicio = time.perf_counter()
+        linhas = funcao(caminho, saida)
+        return linhas / (time.perf_counter() - inicio)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--linhas", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    pasta = tempfile.mkdtemp()
+    try:
+        caminho = os.path.join(pasta, "access.log")
+        gerar_log(caminho, args.linhas)
+        with open(caminho, "rb") as origem, gzip.open(caminho + ".gz", "wb", compresslevel=1) as destino:
+            shutil.copyfileobj(origem, destino)
+
+        tamanho_mb = os.path.getsize(caminho) / 1e6
+        print(f"Log sintético: {args.linhas} linhas ({tamanho_mb:.0f} MB)")
+        linha_a_linha = medir(enriquecer_linha_a_linha, caminho)
+        em_blocos = medir(enriquecer_em_blocos, caminho)
+        em_blocos_gzip = medir(enriquecer_em_blocos, caminho + ".gz")
+        print(f"  linha a linha:     {linha_a_linha:>12,.0f} linhas/s")
+        print(f"  em blocos:         {em_blocos:>12,.0f} linhas/s ({em_blocos / linha_a_linha:.1f}x)")
+        print(f"  em blocos (gzip):  {em_blocos_gzip:>12,.0f} linhas/s")
+    finally:
+        shutil.rmtree(pasta)
+
+
+if __name__ == "__main__":
+    main()
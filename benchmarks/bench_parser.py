@@ -0,0 +1,79 @@
+"""
+Benchmark do parser de IPv4 de passada única
+Compara o caminho antigo (regex em validar_ip + split/int em ip_para_inteiro)
+com analisar_ip e com a versão atual de ips_mesma_rede, e o parser de IPv6
+(analisar_ipv6) com o módulo ipaddress da biblioteca padrão.
+
+Para executar: python -m benchmarks.bench_parser
+"""
+
+import ipaddress
+import re
+import timeit
+
+from core.network_utils import analisar_ip, analisar_ipv6, ips_mesma_rede
+
+_PADRAO_ANTIGO = r'^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$'
+
+IPS_EXEMPLO = ["192.168.1.10", "10.0.0.1", "172.16.254.3", "8.8.8.8", "255.255.255.0"]
+
+IPS_EXEMPLO_V6 = ["2001:db8::1", "fe80::1ff:fe23:4567:890a", "2001:db8:85a3:0:0:8a2e:370:7334",
+                  "::ffff:192.168.1.10", "::1"]
+
+
+def _validar_ip_antigo(ip):
+    """validar_ip como era antes do parser de passada única."""
+    match = re.match(_PADRAO_ANTIGO, ip)
+    if not match:
+        return False
+    for octeto in match.groups():
+        if int(octeto) > 255:
+            return False
+    return True
+
+
+def _ip_para_inteiro_antigo(ip):
+    """ip_para_inteiro como era antes do parser de passada única."""
+    octetos = ip.split('.')
+    return (int(octetos[0]) << 24) + (int(octetos[1]) << 16) + (int(octetos[2]) << 8) + int(octetos[3])
+
+
+def _ips_mesma_rede_antigo(ip_origem, ip_destino, cidr):
+    """ips_mesma_rede como era antes: valida e depois reconverte cada IP."""
+    if not _validar_ip_antigo(ip_origem) or not _validar_ip_antigo(ip_destino):
+        raise ValueError("IP inválido")
+    mascara = (0xFFFFFFFF << (32 - cidr)) & 0xFFFFFFFF
+    return (_ip_para_inteiro_antigo(ip_origem) & mascara) == (_ip_para_inteiro_antigo(ip_destino) & mascara)
+
+
+def medir(funcao, repeticoes=200_000, ips=IPS_EXEMPLO):
+    """Retorna o tempo médio por chamada (ns) aplicando funcao aos IPs de exemplo."""
+    def laco():
+        for ip in ips:
+            funcao(ip)
+    melhor = min(timeit.repeat(laco, number=repeticoes // len(ips), repeat=3))
+    return melhor / repeticoes * 1e9
+
+
+def main():
+    """Executa o benchmark e imprime a comparação."""
+    antigo = medir(lambda ip: _validar_ip_antigo(ip) and _ip_para_inteiro_antigo(ip))
+    novo = medir(analisar_ip)
+    print(f"validar_ip + ip_para_inteiro (antigo): {antigo:8.1f} ns/IP")
+    print(f"analisar_ip (passada única):          {novo:8.1f} ns/IP  ({antigo / novo:.2f}x)")
+    
+    antigo = medir(lambda ip: _ips_mesma_rede_antigo("192.168.1.10", ip, 24))
+    novo = medir(lambda ip: ips_mesma_rede("192.168.1.10", ip, 24))
+    print(f"ips_mesma_rede (antigo):              {antigo:8.1f} ns/par")
+    print(f"ips_mesma_rede (atual):               {novo:8.1f} ns/par ({antigo / novo:.2f}x)")
+    
+    ipv4 = medir(analisar_ip)
+    referencia = medir(lambda ip: int(ipaddress.IPv6Address(ip)), ips=IPS_EXEMPLO_V6)
+    novo = medir(analisar_ipv6, ips=IPS_EXEMPLO_V6)
+    print(f"int(ipaddress.IPv6Address):           {referencia:8.1f} ns/IP")
+    print(f"analisar_ipv6:                        {novo:8.1f} ns/IP  "
+          f"({referencia / novo:.2f}x; {novo / ipv4:.2f}x o custo do IPv4)")
+
+
+if __name__ == "__main__":
+    main()
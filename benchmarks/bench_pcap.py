@@ -0,0 +1,94 @@
+"""
+Benchmark da leitura de capturas (core.pcap)
+Grava uma captura pcap sintética (Ethernet, 90% IPv4 com e sem VLAN, o resto
+ARP, tamanhos de quadro variados) e mede a classificação só com contagens e
+com a saída CSV por pacote, em pacotes por segundo e MB/s; para comparar,
+mede também a leitura do arquivo com read() em blocos (o limite do disco/cache).
+
+Para executar: python -m benchmarks.bench_pcap [--pacotes N] [--arquivo captura.pcap]
+"""
+
+import argparse
+import os
+import random
+import struct
+import tempfile
+import time
+
+from core.pcap import classificar_captura
+
+ORIGEM = "192.168.1.10"
+
+
+def gravar_captura(caminho: str, quantidade: int, semente: int = 2) -> None:
+    """Captura com hosts de 192.168.1.0/24 conversando entre si e com a internet."""
+    aleatorio = random.Random(semente)
+    locais = [0xC0A80100 | host for host in range(1, 255)]
+    remotos = [aleatorio.getrandbits(32) for _ in range(5_000)]
+    enderecos = [(aleatorio.choice(locais), aleatorio.choice(remotos + locais))
+                 for _ in range(20_000)]
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(struct.pack("<IHHiIII", 0xA1B2C3D4, 2, 4, 0, 0, 65535, 1))
+        registros = []
+        for numero in range(quantidade):
+            sorteio = aleatorio.random()
+            if sorteio < 0.1:
+                quadro = b"\xff" * 12 + b"\x08\x06" + bytes(28)
+            else:
+                origem, destino = aleatorio.choice(enderecos)
+                if aleatorio.random() < 0.5:
+                    origem, destino = destino, origem
+                tag = b"\x81\x00\x00\x0a" if sorteio < 0.2 else b""
+                carga = bytes(aleatorio.choice((6, 40, 500, 1400)))
+                quadro = (b"\x02" * 12 + tag + b"\x08\x00"
+                          + struct.pack(">BBHHHBBHII", 0x45, 0, 20 + len(carga), 0, 0, 64, 6, 0,
+                                        origem, destino) + carga)
+            registros.append(struct.pack("<IIII", numero, 0, len(quadro), len(quadro)) + quadro)
+            if len(registros) == 10_000:
+                arquivo.write(b"".join(registros))
+                registros = []
+        arquivo.write(b"".join(registros))
+
+
+class _Descartar:
+    def write(self, texto):
+        return len(texto)
+
+
+def medir(descricao: str, funcao, tamanho: int, pacotes: int) -> None:
+    inicio = time.perf_counter()
+    funcao()
+    duracao = time.perf_counter() - inicio
+    print(f"{descricao:<28} {duracao:7.2f}s {pacotes / duracao / 1e6:8.2f} Mpps "
+          f"{tamanho / duracao / 1e6:8.0f} MB/s")
+
+
+def ler_tudo(caminho: str) -> None:
+    with open(caminho, "rb", buffering=0) as arquivo:
+        while arquivo.read(1 << 24):
+            pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da leitura de capturas pcap.")
+    parser.add_argument("--pacotes", type=int, default=2_000_000)
+    parser.add_argument("--arquivo", help="Usa esta captura em vez de gerar uma")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = args.arquivo or os.path.join(diretorio, "captura.pcap")
+        if not args.arquivo:
+            gravar_captura(caminho, args.pacotes)
+        tamanho = os.path.getsize(caminho)
+        contagens = classificar_captura(caminho, ORIGEM, 24)
+        pacotes = contagens["pacotes"]
+        print(f"{pacotes:,} pacotes, {tamanho / 1e6:.0f} MB")
+
+        medir("read() em blocos", lambda: ler_tudo(caminho), tamanho, pacotes)
+        medir("só contagens", lambda: classificar_captura(caminho, ORIGEM, 24), tamanho, pacotes)
+        medir("saída CSV por pacote",
+              lambda: classificar_captura(caminho, ORIGEM, 24, _Descartar()), tamanho, pacotes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Benchmark do serviço HTTP/JSON (core.servidor_http)
+Abre várias conexões keep-alive, envia as requisições em pipeline e mede
+requisições por segundo em cada rota, além da vazão (IPs/s) do endpoint
+/lote. Sem --porta, sobe o servidor em um processo separado.
+
+Para executar: python -m benchmarks.bench_servidor [--conexoes 16] [--pipeline 32]
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from core.servidor_http import servir
+
+ROTAS_EXEMPLO = [
+    "/mascara?cidr=24",
+    "/mesma-rede?origem=192.168.1.10&destino=192.168.1.100&cidr=24",
+    "/descrever?ip=192.168.1.10&cidr=24",
+]
+
+
+def _executar_servidor(porta):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        asyncio.run(servir("127.0.0.1", porta, executor))
+
+
+def _porta_livre() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _contar_respostas(buffer: bytearray) -> int:
+    """Remove do buffer as respostas completas e retorna quantas eram."""
+    completas = 0
+    while True:
+        fim_cabecalho = buffer.find(b"\r\n\r\n")
+        if fim_cabecalho < 0:
+            return completas
+        inicio = buffer.find(b"Content-Length: ", 0, fim_cabecalho) + 16
+        tamanho = int(buffer[inicio:buffer.find(b"\r\n", inicio)])
+        fim = fim_cabecalho + 4 + tamanho
+        if len(buffer) < fim:
+            return completas
+        del buffer[:fim]
+        completas += 1
+
+
+async def _conexao(porta: int, requisicao: bytes, profundidade: int, fim: float) -> int:
+    """Envia rodadas de `profundidade` requisições em pipeline até o prazo."""
+    leitor, escritor = await asyncio.open_connection("127.0.0.1", porta)
+    rodada = requisicao * profundidade
+    buffer = bytearray()
+    total = 0
+    while time.perf_counter() < fim:
+        escritor.write(rodada)
+        faltam = profundidade
+        while faltam:
+            buffer += await leitor.read(256 * 1024)
+            faltam -= _contar_respostas(buffer)
+        total += profundidade
+    escritor.close()
+    return total
+
+
+async def medir_rota(porta: int, alvo: str, conexoes: int, profundidade: int,
+                     duracao: float, corpo: bytes = None) -> float:
+    """Retorna requisições por segundo na rota."""
+    if corpo is None:
+        requisicao = f"GET {alvo} HTTP/1.1\r\nHost: bench\r\n\r\n".encode()
+    else:
+        requisicao = (f"POST {alvo} HTTP/1.1\r\nHost: bench\r\nContent-Length: {len(corpo)}\r\n\r\n"
+                      .encode() + corpo)
+    comeco = time.perf_counter()
+    totais = await asyncio.gather(*(_conexao(porta, requisicao, profundidade, comeco + duracao)
+                                    for _ in range(conexoes)))
+    return sum(totais) / (time.perf_counter() - comeco)
+
+
+async def _aguardar_servidor(porta: int) -> None:
+    for _ in range(100):
+        try:
+            _, escritor = await asyncio.open_connection("127.0.0.1", porta)
+            escritor.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.05)
+    raise RuntimeError("O servidor não respondeu")
+
+
+async def executar(porta: int, conexoes: int, profundidade: int, duracao: float) -> None:
+    await _aguardar_servidor(porta)
+    print(f"{conexoes} conexões, pipeline de {profundidade}, {duracao:.0f}s por rota")
+    for alvo in ROTAS_EXEMPLO:
+        taxa = await medir_rota(porta, alvo, conexoes, profundidade, duracao)
+        print(f"GET {alvo.split('?')[0]:<12} {taxa:12,.0f} req/s")
+
+    for tamanho in (100, 10_000, 100_000):
+        corpo = json.dumps([f"192.168.{i % 4}.{i % 256}" for i in range(tamanho)]).encode()
+        taxa = await medir_rota(porta, "/lote?origem=192.168.1.10&cidr=24", min(conexoes, 4),
+                                1, duracao, corpo)
+        print(f"POST /lote ({tamanho:>7,} IPs) {taxa:10,.1f} req/s = {taxa * tamanho:12,.0f} IPs/s")
+
+
+def main():
+    """Executa o benchmark e imprime as taxas."""
+    parser = argparse.ArgumentParser(description="Benchmark do serviço HTTP/JSON")
+    parser.add_argument("--porta", type=int, help="Porta de um servidor já em execução")
+    parser.add_argument("--conexoes", type=int, default=16)
+    parser.add_argument("--pipeline", type=int, default=32)
+    parser.add_argument("--duracao", type=float, default=3.0)
+    args = parser.parse_args()
+
+    processo = None
+    porta = args.porta
+    if porta is None:
+        porta = _porta_livre()
+        processo = multiprocessing.Process(target=_executar_servidor, args=(porta,), daemon=True)
+        processo.start()
+    try:
+        asyncio.run(executar(porta, args.conexoes, args.pipeline, args.duracao))
+    finally:
+        if processo is not None:
+            processo.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,414 @@
+"""
+Suíte de benchmarks das funções de core.network_utils
+Mede o tempo por operação de validar_ip, ip_para_inteiro, calcular_rede,
+cidr_para_mascara_decimal e ips_mesma_rede em três conjuntos de entrada
+(realista, adversário e IPv6), dos caminhos em lote em vários tamanhos de
+lote, e o equivalente com o módulo ipaddress da biblioteca padrão.
+
+Os resultados vão para um JSON e são comparados com uma baseline gravada
+(benchmarks/baseline.json). Para reduzir a diferença entre máquinas (e a
+oscilação de velocidade de máquinas virtuais), cada caso é medido
+intercalado com um laço de calibração em Python puro e guardado também
+normalizado por ele; a comparação usa os valores normalizados e falha
+(código de saída 1) se algum caso ficar mais lento que a tolerância.
+
+Para executar:
+    python -m benchmarks.suite                      # mede e compara com a baseline
+    python -m benchmarks.suite --rapido             # menos repetições
+    python -m benchmarks.suite --saida atual.json   # grava os resultados
+    python -m benchmarks.suite --salvar-baseline    # atualiza a baseline
+"""
+
+import argparse
+import ipaddress
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+
+from core.network_utils import (
+    analisar_ips_lote,
+    calcular_rede,
+    calcular_rede_lote,
+    cidr_para_mascara_decimal,
+    ip_para_inteiro,
+    ips_mesma_rede,
+    ips_mesma_rede_lote,
+    validar_ip,
+)
+from core.processamento import classificar_bloco
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BASELINE_PADRAO = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Regressão = tempo normalizado acima de baseline * (1 + tolerância). Em
+# máquinas virtuais compartilhadas a oscilação entre execuções chega a ~30%
+TOLERANCIA_PADRAO = 0.35
+
+# Tamanhos de lote medidos nos caminhos em lote
+TAMANHOS_LOTE = (1_000, 10_000, 100_000)
+
+# Itens em cada conjunto de entrada das funções de um IP por chamada
+TAMANHO_CONJUNTO = 1_000
+
+ORIGEM = "192.168.1.10"
+
+
+# ---------------------------------------------------------------------------
+# Conjuntos de entrada (determinísticos)
+# ---------------------------------------------------------------------------
+
+def gerar_realista(quantidade: int, semente: int = 0) -> list:
+    """IPv4 válidos: metade em faixas privadas comuns, metade em qualquer lugar."""
+    aleatorio = random.Random(semente)
+    prefixos = ("192.168.", "10.", "172.16.")
+    ips = []
+    for _ in range(quantidade):
+        if aleatorio.random() < 0.5:
+            prefixo = aleatorio.choice(prefixos)
+            octetos = [aleatorio.randrange(256) for _ in range(4 - prefixo.count("."))]
+            ips.append(prefixo + ".".join(map(str, octetos)))
+        else:
+            ips.append(".".join(str(aleatorio.randrange(256)) for _ in range(4)))
+    return ips
+
+
+# Entradas hostis ou de borda: fora do range, formato errado, zeros à
+# esquerda, espaços, dígitos não ASCII, textos longos
+_ADVERSARIOS = [
+    "256.1.1.1", "1.2.3", "1.2.3.4.5", "", "   ", "01.02.03.04", "1.2.3.-4",
+    "a.b.c.d", "1" * 200, "1.2.3.4 ", " 1.2.3.4", "١.٢.٣.٤", "0x7f.0.0.1",
+    "999.999.999.999", "1..2.3", "1.2.3.", ".1.2.3", "1.2.3.4/24", "::1",
+    "255.255.255.255", "0.0.0.0", "00000000001.2.3.4", "1.2.3.4" * 20,
+]
+
+
+def gerar_adversario(quantidade: int, semente: int = 0) -> list:
+    """Sorteio de _ADVERSARIOS (inválidos e alguns válidos de borda)."""
+    aleatorio = random.Random(semente)
+    return [aleatorio.choice(_ADVERSARIOS) for _ in range(quantidade)]
+
+
+def gerar_ipv6(quantidade: int, semente: int = 0) -> list:
+    """IPv6 válidos, com e sem compressão "::"."""
+    aleatorio = random.Random(semente)
+    ips = []
+    for _ in range(quantidade):
+        valor = (0x20010DB8 << 96) | aleatorio.getrandbits(64 if aleatorio.random() < 0.5 else 16)
+        ips.append(str(ipaddress.IPv6Address(valor)))
+    return ips
+
+
+CONJUNTOS = {
+    "realista": gerar_realista,
+    "adversario": gerar_adversario,
+    "ipv6": gerar_ipv6,
+}
+
+
+# ---------------------------------------------------------------------------
+# Casos: (nosso, ipaddress) aplicados a um item do conjunto
+# ---------------------------------------------------------------------------
+
+def _sem_excecao(funcao):
+    """Envolve a função para que entradas inválidas não interrompam o laço."""
+    def chamar(*argumentos):
+        try:
+            return funcao(*argumentos)
+        except ValueError:
+            return None
+    return chamar
+
+
+def _validar_ipaddress(ip):
+    try:
+        ipaddress.ip_address(ip)
+        return True
+    except ValueError:
+        return False
+
+
+def _cidr_do_ip(ip):
+    """CIDR usado com cada IP: 24 para IPv4, 64 para IPv6."""
+    return 64 if ":" in ip else 24
+
+
+CASOS_UNITARIOS = {
+    "validar_ip": (
+        lambda ip: validar_ip(ip, versao=None),
+        _validar_ipaddress,
+    ),
+    "ip_para_inteiro": (
+        _sem_excecao(ip_para_inteiro),
+        _sem_excecao(lambda ip: int(ipaddress.ip_address(ip))),
+    ),
+    "calcular_rede": (
+        _sem_excecao(lambda ip: calcular_rede(ip, _cidr_do_ip(ip))),
+        _sem_excecao(lambda ip: int(ipaddress.ip_network(f"{ip}/{_cidr_do_ip(ip)}", strict=False)
+                                    .network_address)),
+    ),
+    "ips_mesma_rede": (
+        _sem_excecao(lambda ip: ips_mesma_rede(ip, ip, _cidr_do_ip(ip))),
+        _sem_excecao(lambda ip: ipaddress.ip_address(ip) in
+                     ipaddress.ip_network(f"{ip}/{_cidr_do_ip(ip)}", strict=False)),
+    ),
+}
+
+# Comparações com a origem IPv4 fixa só fazem sentido para IPv4
+CASOS_UNITARIOS_V4 = {
+    "ips_mesma_rede_origem_fixa": (
+        _sem_excecao(lambda ip: ips_mesma_rede(ORIGEM, ip, 24)),
+        _sem_excecao(lambda ip: ipaddress.IPv4Address(ip) in
+                     ipaddress.IPv4Network(f"{ORIGEM}/24", strict=False)),
+    ),
+}
+
+# cidr_para_mascara_decimal recebe CIDRs, não IPs
+CIDRS_REALISTAS = list(range(33))
+CIDRS_ADVERSARIOS = [-1, 33, 64, 128, -32, 10 ** 6, 0, 32]
+
+
+# ---------------------------------------------------------------------------
+# Medição
+# ---------------------------------------------------------------------------
+
+def _laco(funcao, itens):
+    """Função sem argumentos que aplica funcao a cada item."""
+    def laco():
+        for item in itens:
+            funcao(item)
+    return laco
+
+
+def _laco_calibracao():
+    """
+    Laço fixo em Python puro usado para normalizar os tempos.
+
+    Mistura as operações que dominam as funções medidas (split de string,
+    consulta a dict, operações de bits), para acompanhar a velocidade do
+    interpretador na máquina (e no instante) da medição.
+    """
+    tabela = {str(i): i for i in range(256)}
+    textos = [f"{i % 256}.{i * 7 % 256}.{i * 13 % 256}.{i * 31 % 256}" for i in range(1000)]
+
+    def referencia(texto):
+        a, b, c, d = texto.split(".")
+        return (tabela[a] << 24 | tabela[b] << 16 | tabela[c] << 8 | tabela[d]) & 0xFFFFFF00
+
+    return _laco(referencia, textos), len(textos)
+
+
+def cronometrar(funcoes, repeticoes: int = 5, tempo_minimo: float = 0.05) -> list:
+    """
+    Melhor tempo por chamada (segundos) de cada função sem argumentos.
+
+    Uma chamada inicial estima o custo de cada função; depois as medições
+    são intercaladas (uma de cada função por rodada), para que oscilações
+    de velocidade da máquina afetem todas igualmente.
+
+    Args:
+        funcoes: Funções sem argumentos
+        repeticoes (int): Rodadas de medição
+        tempo_minimo (float): Duração mínima de cada medição, em segundos
+
+    Returns:
+        list: Melhor tempo por chamada de cada função, na mesma ordem
+    """
+    temporizadores = [timeit.Timer(funcao) for funcao in funcoes]
+    passadas = []
+    for temporizador in temporizadores:
+        uma = temporizador.timeit(1)
+        passadas.append(max(1, int(tempo_minimo / uma)) if uma > 0 else 1000)
+
+    melhores = [float("inf")] * len(temporizadores)
+    for _ in range(repeticoes):
+        for i, (temporizador, numero) in enumerate(zip(temporizadores, passadas)):
+            melhores[i] = min(melhores[i], temporizador.timeit(numero) / numero)
+    return melhores
+
+
+def _arredondar(valor: float) -> float:
+    """Quatro algarismos significativos (tempos de lote chegam a frações de ns)."""
+    return float(f"{valor:.4g}")
+
+
+def medir_caso(nosso, quantidade: int, referencia=None, repeticoes: int = 5,
+               tempo_minimo: float = 0.05) -> dict:
+    """
+    Mede um caso junto com a calibração e, se houver, a referência ipaddress.
+
+    Args:
+        nosso: Função sem argumentos que processa `quantidade` itens
+        quantidade (int): Itens processados por chamada
+        referencia: Função equivalente com ipaddress (opcional)
+
+    Returns:
+        dict: "ns" (por item), "normalizado" (ns dividido pelo tempo por
+            item da calibração medida no mesmo intervalo) e "ipaddress_ns"
+    """
+    calibracao, itens_calibracao = _laco_calibracao()
+    funcoes = [nosso, calibracao] + ([referencia] if referencia is not None else [])
+    tempos = cronometrar(funcoes, repeticoes, tempo_minimo)
+
+    ns = tempos[0] / quantidade * 1e9
+    resultado = {"ns": _arredondar(ns),
+                 "normalizado": _arredondar(ns / (tempos[1] / itens_calibracao * 1e9))}
+    if referencia is not None:
+        resultado["ipaddress_ns"] = _arredondar(tempos[2] / quantidade * 1e9)
+    return resultado
+
+
+def executar_suite(rapido: bool = False, registrar=None) -> dict:
+    """
+    Executa todos os casos e retorna o dicionário de resultados.
+
+    Args:
+        rapido (bool): Menos repetições e lotes menores (para CI e testes)
+        registrar: Função chamada com cada (nome, resultado), para progresso
+
+    Returns:
+        dict: {"ambiente": {...}, "resultados": {nome: {"ns", "normalizado",
+            "ipaddress_ns" (se houver)}}}
+    """
+    repeticoes = 3 if rapido else 7
+    tempo_minimo = 0.005 if rapido else 0.02
+    tamanho_conjunto = TAMANHO_CONJUNTO // 10 if rapido else TAMANHO_CONJUNTO
+    tamanhos_lote = TAMANHOS_LOTE[:2] if rapido else TAMANHOS_LOTE
+    resultados = {}
+
+    def anotar(nome, nosso, quantidade, referencia=None):
+        resultado = medir_caso(nosso, quantidade, referencia, repeticoes, tempo_minimo)
+        resultados[nome] = resultado
+        if registrar is not None:
+            registrar(nome, resultado)
+
+    # Funções de um IP por chamada, por conjunto de entrada
+    for nome_conjunto, gerar in CONJUNTOS.items():
+        itens = gerar(tamanho_conjunto)
+        casos = dict(CASOS_UNITARIOS)
+        if nome_conjunto != "ipv6":
+            casos.update(CASOS_UNITARIOS_V4)
+        for nome, (nosso, referencia) in casos.items():
+            anotar(f"{nome}/{nome_conjunto}", _laco(nosso, itens), len(itens), _laco(referencia, itens))
+
+    mascara_ipaddress = _sem_excecao(lambda cidr: str(ipaddress.IPv4Network(f"0.0.0.0/{cidr}").netmask))
+    for nome_conjunto, cidrs in (("realista", CIDRS_REALISTAS), ("adversario", CIDRS_ADVERSARIOS)):
+        anotar(f"cidr_para_mascara_decimal/{nome_conjunto}",
+               _laco(_sem_excecao(cidr_para_mascara_decimal), cidrs), len(cidrs),
+               _laco(mascara_ipaddress, cidrs))
+
+    # Caminhos em lote, em vários tamanhos
+    origem_int = ip_para_inteiro(ORIGEM)
+    rede = ipaddress.IPv4Network(f"{ORIGEM}/24", strict=False)
+    for tamanho in tamanhos_lote:
+        ips = gerar_realista(tamanho, semente=tamanho)
+        inteiros = analisar_ips_lote(ips)
+        if np is not None:
+            inteiros = inteiros.astype(np.uint32)
+
+        anotar(f"analisar_ips_lote/{tamanho}", lambda: analisar_ips_lote(ips), tamanho,
+               lambda: [int(ipaddress.IPv4Address(ip)) for ip in ips])
+        anotar(f"ips_mesma_rede_lote/{tamanho}",
+               lambda: ips_mesma_rede_lote(origem_int, inteiros, 24), tamanho)
+        anotar(f"calcular_rede_lote/{tamanho}", lambda: calcular_rede_lote(inteiros, 24), tamanho)
+        anotar(f"classificar_bloco/{tamanho}", lambda: classificar_bloco(ips, origem_int, 24), tamanho,
+               lambda: [ipaddress.IPv4Address(ip) in rede for ip in ips])
+
+    ambiente = {
+        "python": platform.python_version(),
+        "implementacao": platform.python_implementation(),
+        "plataforma": platform.platform(),
+        "numpy": np.__version__ if np is not None else None,
+        "rapido": rapido,
+    }
+    return {"ambiente": ambiente, "resultados": resultados}
+
+
+# ---------------------------------------------------------------------------
+# Baseline
+# ---------------------------------------------------------------------------
+
+def comparar_com_baseline(atual: dict, baseline: dict, tolerancia: float = TOLERANCIA_PADRAO) -> list:
+    """
+    Lista os casos mais lentos que a baseline além da tolerância.
+
+    Compara os tempos normalizados; casos que não existem nos dois lados
+    são ignorados.
+
+    Args:
+        atual (dict): Resultado de executar_suite
+        baseline (dict): Resultado gravado anteriormente
+        tolerancia (float): Folga relativa (0.35 = até 35% mais lento)
+
+    Returns:
+        list: Tuplas (nome, normalizado_baseline, normalizado_atual, razão),
+            da maior para a menor razão
+    """
+    regressoes = []
+    anteriores = baseline.get("resultados", {})
+    for nome, resultado in atual.get("resultados", {}).items():
+        if nome not in anteriores:
+            continue
+        antes, agora = anteriores[nome]["normalizado"], resultado["normalizado"]
+        if agora > antes * (1 + tolerancia):
+            regressoes.append((nome, antes, agora, agora / antes))
+    return sorted(regressoes, key=lambda regressao: -regressao[3])
+
+
+def _imprimir(nome, resultado):
+    linha = f"{nome:<42} {resultado['ns']:>12,.1f} ns"
+    if "ipaddress_ns" in resultado:
+        linha += f"   ipaddress {resultado['ipaddress_ns']:>10,.1f} ns " \
+                 f"({resultado['ipaddress_ns'] / resultado['ns']:5.1f}x)"
+    print(linha, flush=True)
+
+
+def main(argv=None):
+    """Executa a suíte, grava/compara a baseline e retorna o código de saída."""
+    parser = argparse.ArgumentParser(description="Benchmarks das funções de rede")
+    parser.add_argument("--rapido", action="store_true", help="Menos repetições e lotes menores")
+    parser.add_argument("--saida", help="Arquivo JSON para gravar os resultados")
+    parser.add_argument("--baseline", default=BASELINE_PADRAO, help="Arquivo JSON da baseline")
+    parser.add_argument("--salvar-baseline", action="store_true",
+                        help="Grava os resultados como nova baseline (sem comparar)")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA_PADRAO,
+                        help="Folga relativa antes de acusar regressão (padrão: 0.35)")
+    args = parser.parse_args(argv)
+
+    atual = executar_suite(rapido=args.rapido, registrar=_imprimir)
+
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(atual, arquivo, indent=2, ensure_ascii=False)
+
+    if args.salvar_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as arquivo:
+            json.dump(atual, arquivo, indent=2, ensure_ascii=False)
+        print(f"\nBaseline gravada em {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\nSem baseline em {args.baseline}; use --salvar-baseline para criar")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as arquivo:
+        baseline = json.load(arquivo)
+    regressoes = comparar_com_baseline(atual, baseline, args.tolerancia)
+    if not regressoes:
+        print(f"\n✅ Nenhuma regressão acima de {args.tolerancia:.0%} em relação à baseline")
+        return 0
+
+    print(f"\n❌ {len(regressoes)} regressão(ões) acima de {args.tolerancia:.0%}:")
+    for nome, antes, agora, razao in regressoes:
+        print(f"   {nome:<42} {antes:8.3f} -> {agora:8.3f} ({razao:.2f}x)")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
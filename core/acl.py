@@ -0,0 +1,423 @@
+"""
+Listas de controle de acesso (ACL) com máscaras curinga no estilo Cisco
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo avalia listas ordenadas de regras "permit"/"deny" por rede de
+origem e de destino, em que a primeira regra que casar decide (e, se
+nenhuma casar, vale o "deny" implícito), com:
+- analisar_regra / analisar_acl: leem regras na sintaxe do IOS
+  ("permit 10.0.0.0 0.0.0.255 any", "deny host 10.1.1.1 any", CIDR)
+- ListaAcesso: compila as regras e avalia pacotes um a um ou em lote
+
+A máscara curinga (wildcard) marca com 1 os bits ignorados e não precisa ser
+contígua (0.0.255.0 casa qualquer 3º octeto). Como a comparação é bit a bit,
+ela pode ser feita octeto a octeto: a compilação monta, para cada octeto de
+origem e de destino, uma tabela de 256 conjuntos de bits (bit i = regra i
+aceita aquele valor). Avaliar um pacote é consultar as 8 tabelas, fazer o
+AND dos conjuntos e pegar o bit mais baixo, sem percorrer as regras.
+"""
+
+from typing import NamedTuple
+
+from core.network_utils import _MASCARAS_INTEIRAS, _numpy, inteiro_para_ip, validar_cidr
+from core.roteamento import _para_inteiro
+
+
+# Ações das regras (palavras-chave do IOS)
+PERMITIR = "permit"
+NEGAR = "deny"
+
+# Índice retornado quando nenhuma regra casa (deny implícito)
+SEM_REGRA = -1
+
+# Curinga que ignora todos os bits ("any")
+QUALQUER = 0xFFFFFFFF
+
+# Deslocamento de cada octeto, do mais alto ao mais baixo
+_DESLOCAMENTOS = (24, 16, 8, 0)
+
+
+class RegraACL(NamedTuple):
+    """Uma regra da ACL: ação e, para origem e destino, endereço e curinga."""
+    acao: str
+    origem: int
+    curinga_origem: int
+    destino: int
+    curinga_destino: int
+
+    def casa(self, origem: int, destino: int) -> bool:
+        """Indica se o par (origem, destino), em formato inteiro, casa com a regra."""
+        return ((origem ^ self.origem) & ~self.curinga_origem & QUALQUER == 0
+                and (destino ^ self.destino) & ~self.curinga_destino & QUALQUER == 0)
+
+    def __str__(self) -> str:
+        return (f"{self.acao} {_formatar_endereco(self.origem, self.curinga_origem)} "
+                f"{_formatar_endereco(self.destino, self.curinga_destino)}")
+
+
+def _formatar_endereco(endereco: int, curinga: int) -> str:
+    if curinga == QUALQUER:
+        return "any"
+    if curinga == 0:
+        return f"host {inteiro_para_ip(endereco)}"
+    return f"{inteiro_para_ip(endereco)} {inteiro_para_ip(curinga)}"
+
+
+def _analisar_endereco(termos: list, posicao: int) -> tuple:
+    """
+    Lê uma especificação de endereço a partir de termos[posicao].
+
+    Returns:
+        tuple: (endereço, curinga, próxima posição), com os bits ignorados
+            zerados no endereço
+    """
+    if posicao >= len(termos):
+        raise ValueError("Regra incompleta: faltam origem ou destino")
+
+    termo = termos[posicao].lower()
+    if termo == "any":
+        return 0, QUALQUER, posicao + 1
+    if termo == "host":
+        if posicao + 1 >= len(termos):
+            raise ValueError("Regra incompleta: falta o IP depois de host")
+        return _para_inteiro(termos[posicao + 1]), 0, posicao + 2
+
+    if "/" in termo:
+        endereco, _, cidr = termo.partition("/")
+        if not cidr.isdigit() or not validar_cidr(int(cidr)):
+            raise ValueError(f"CIDR inválido: {termos[posicao]}")
+        curinga = ~_MASCARAS_INTEIRAS[int(cidr)] & QUALQUER
+        return _para_inteiro(endereco) & ~curinga, curinga, posicao + 1
+
+    if posicao + 1 >= len(termos):
+        raise ValueError(f"Falta a máscara curinga depois de {termos[posicao]}")
+    curinga = _para_inteiro(termos[posicao + 1])
+    return _para_inteiro(termo) & ~curinga, curinga, posicao + 2
+
+
+def analisar_regra(texto: str) -> RegraACL:
+    """
+    Converte uma linha na sintaxe do IOS em RegraACL.
+
+    Aceita "[access-list NOME] [SEQUÊNCIA] permit|deny [ip] ORIGEM DESTINO",
+    em que ORIGEM e DESTINO são "any", "host A.B.C.D", "A.B.C.D CURINGA" ou
+    "A.B.C.D/CIDR". Só endereços são avaliados: outros protocolos e portas
+    são recusados em vez de ignorados.
+
+    Args:
+        texto (str): A regra
+
+    Returns:
+        RegraACL: A regra, com os bits ignorados zerados nos endereços
+
+    Raises:
+        ValueError: Se a regra estiver incompleta, tiver termos não
+            suportados ou algum endereço for inválido
+
+    Exemplo:
+        >>> analisar_regra("access-list 101 permit ip 10.1.0.0 0.0.255.255 any")
+        RegraACL(acao='permit', origem=167837696, curinga_origem=65535, destino=0, curinga_destino=4294967295)
+        >>> str(analisar_regra("deny 10.0.0.7/24 host 8.8.8.8"))
+        'deny 10.0.0.0 0.0.0.255 host 8.8.8.8'
+    """
+    termos = texto.split()
+    posicao = 0
+    if termos[:1] and termos[0].lower() == "access-list":
+        posicao = 2
+    if posicao < len(termos) and termos[posicao].isdigit():
+        posicao += 1
+
+    acao = termos[posicao].lower() if posicao < len(termos) else ""
+    if acao not in (PERMITIR, NEGAR):
+        raise ValueError(f"A regra deve ter permit ou deny: {texto!r}")
+    posicao += 1
+
+    if posicao < len(termos) and termos[posicao].lower() in ("tcp", "udp", "icmp"):
+        raise ValueError(f"Só regras de endereço (ip) são suportadas: {texto!r}")
+    if posicao < len(termos) and termos[posicao].lower() == "ip":
+        posicao += 1
+
+    origem, curinga_origem, posicao = _analisar_endereco(termos, posicao)
+    destino, curinga_destino, posicao = _analisar_endereco(termos, posicao)
+    if posicao != len(termos):
+        raise ValueError(f"Termos não suportados: {' '.join(termos[posicao:])!r}")
+    return RegraACL(acao, origem, curinga_origem, destino, curinga_destino)
+
+
+def analisar_acl(texto: str) -> list:
+    """
+    Lê uma ACL inteira, uma regra por linha.
+
+    Linhas vazias, comentários ("!" ou "#") e linhas "remark" são ignorados.
+
+    Args:
+        texto (str): A configuração
+
+    Returns:
+        list: RegraACL na ordem do texto
+
+    Raises:
+        ValueError: Se alguma regra for inválida (com o número da linha)
+    """
+    regras = []
+    for numero, linha in enumerate(texto.splitlines(), start=1):
+        termos = linha.split()
+        if not termos or termos[0].startswith(("!", "#")) or "remark" in (termo.lower() for termo in termos[:3]):
+            continue
+        try:
+            regras.append(analisar_regra(linha))
+        except ValueError as erro:
+            raise ValueError(f"Linha {numero}: {erro}") from None
+    return regras
+
+
+def _tabela_octeto(valores, curingas, deslocamento: int, tamanho: int) -> list:
+    """
+    Conjuntos de regras (inteiros usados como bitsets) que aceitam cada valor
+    de um octeto.
+
+    Args:
+        valores: Endereço de cada regra no campo
+        curingas: Curinga de cada regra no campo
+        deslocamento (int): Posição do octeto (24, 16, 8 ou 0)
+        tamanho (int): Bytes de cada conjunto (número de regras / 8, arredondado)
+
+    Returns:
+        list: 256 inteiros; o bit i do item v indica que a regra i aceita v
+    """
+    linhas = [bytearray(tamanho) for _ in range(256)]
+    todas = bytearray(tamanho)
+
+    for indice, (valor, curinga) in enumerate(zip(valores, curingas)):
+        livre = curinga >> deslocamento & 0xFF
+        byte, bit = indice >> 3, 1 << (indice & 7)
+        if livre == 0xFF:
+            todas[byte] |= bit
+            continue
+        # Percorre os valores que diferem da base só nos bits livres
+        base = valor >> deslocamento & 0xFF & ~livre
+        variacao = livre
+        while True:
+            linhas[base | variacao][byte] |= bit
+            if not variacao:
+                break
+            variacao = (variacao - 1) & livre
+
+    comuns = int.from_bytes(todas, "little")
+    return [int.from_bytes(linha, "little") | comuns for linha in linhas]
+
+
+def _primeira_regra(conjunto: int) -> int:
+    """Índice do bit mais baixo (a primeira regra que casa), ou SEM_REGRA."""
+    return (conjunto & -conjunto).bit_length() - 1 if conjunto else SEM_REGRA
+
+
+class ListaAcesso:
+    """
+    ACL compilada para avaliação por primeira regra que casa.
+
+    Exemplo:
+        >>> acl = ListaAcesso(["deny host 10.0.0.5 any",
+        ...                    "permit 10.0.0.0 0.0.0.255 192.168.0.0 0.0.255.255"])
+        >>> acl.avaliar("10.0.0.9", "192.168.7.1"), acl.avaliar("10.0.0.5", "192.168.7.1")
+        ('permit', 'deny')
+        >>> acl.avaliar_indice("10.0.1.9", "192.168.7.1")
+        -1
+    """
+
+    def __init__(self, regras):
+        """
+        Args:
+            regras: Iterável de RegraACL ou de linhas na sintaxe do IOS
+                (veja analisar_regra), na ordem de avaliação
+
+        Raises:
+            ValueError: Se alguma regra for inválida
+        """
+        self.regras = [regra if isinstance(regra, RegraACL) else analisar_regra(regra)
+                       for regra in regras]
+        tamanho = (len(self.regras) + 7) // 8
+
+        # Oito tabelas: os octetos da origem e depois os do destino
+        self._tabelas = tuple(
+            _tabela_octeto([regra[campo] for regra in self.regras],
+                           [regra[campo + 1] for regra in self.regras],
+                           deslocamento, tamanho)
+            for campo in (1, 3) for deslocamento in _DESLOCAMENTOS
+        )
+        self._permitidas = [regra.acao == PERMITIR for regra in self.regras]
+
+        # Tabelas das metades de 16 bits para a avaliação em lote
+        # (compiladas sob demanda)
+        self._metades = None
+
+    def __len__(self) -> int:
+        return len(self.regras)
+
+    def _avaliar_inteiros(self, origem: int, destino: int) -> int:
+        o1, o2, o3, o4, d1, d2, d3, d4 = self._tabelas
+        return _primeira_regra(o1[origem >> 24] & o2[origem >> 16 & 0xFF]
+                               & o3[origem >> 8 & 0xFF] & o4[origem & 0xFF]
+                               & d1[destino >> 24] & d2[destino >> 16 & 0xFF]
+                               & d3[destino >> 8 & 0xFF] & d4[destino & 0xFF])
+
+    def avaliar_indice(self, origem, destino) -> int:
+        """
+        Retorna o índice da primeira regra que casa com o pacote.
+
+        Args:
+            origem: IP de origem em str ou inteiro
+            destino: IP de destino em str ou inteiro
+
+        Returns:
+            int: Índice em regras, ou SEM_REGRA (-1)
+
+        Raises:
+            ValueError: Se algum IP for inválido
+        """
+        return self._avaliar_inteiros(_para_inteiro(origem), _para_inteiro(destino))
+
+    def avaliar(self, origem, destino) -> str:
+        """
+        Retorna a ação para o pacote: a da primeira regra que casa, ou NEGAR.
+
+        Args:
+            origem: IP de origem em str ou inteiro
+            destino: IP de destino em str ou inteiro
+
+        Returns:
+            str: PERMITIR ("permit") ou NEGAR ("deny")
+        """
+        indice = self.avaliar_indice(origem, destino)
+        return NEGAR if indice == SEM_REGRA else self.regras[indice].acao
+
+    def avaliar_lote(self, origens, destinos):
+        """
+        Avalia muitos pacotes (IPs já em formato inteiro) de uma vez.
+
+        Com NumPy a avaliação é feita em etapas, como na classificação
+        recursiva de fluxos (RFC): tabelas pré-calculadas levam cada metade
+        de 16 bits de cada endereço a uma classe de equivalência (valores
+        aceitos pelo mesmo conjunto de regras); depois só os pares de classes
+        distintos presentes no lote (alta x baixa, e origem x destino) são
+        combinados com AND. Assim o custo acompanha a repetição do tráfego
+        (fluxos), não o número de pacotes; se quase não houver repetição, ou
+        sem NumPy, cada pacote é avaliado como em avaliar_indice.
+
+        Args:
+            origens: Sequência ou array uint32 de IPs de origem
+            destinos: Sequência ou array uint32 de IPs de destino
+
+        Returns:
+            numpy.ndarray de int64 (com NumPy) ou list[int] (sem NumPy) com o
+            índice da primeira regra de cada pacote, ou SEM_REGRA (-1)
+
+        Raises:
+            ValueError: Se as sequências tiverem tamanhos diferentes
+        """
+        if len(origens) != len(destinos):
+            raise ValueError("Sequências de origens e destinos devem ter o mesmo tamanho")
+
+        np = _numpy()
+        if np is None:
+            avaliar = self._avaliar_inteiros
+            return [avaliar(origem, destino) for origem, destino in zip(origens, destinos)]
+
+        if self._metades is None:
+            self._compilar_metades()
+
+        origens = np.asarray(origens, dtype=np.uint32).reshape(-1)
+        destinos = np.asarray(destinos, dtype=np.uint32).reshape(-1)
+        distintos = [_pares_distintos(tabela_alta[ips >> 16], tabela_baixa[ips & 0xFFFF], len(baixas))
+                     for ips, (tabela_alta, _, tabela_baixa, baixas) in zip((origens, destinos), self._metades)]
+
+        # Com pouca repetição no lote, combinar os pares distintos sai mais
+        # caro que avaliar pacote a pacote
+        if sum(len(pares) for pares, _ in distintos) > len(origens):
+            avaliar = self._avaliar_inteiros
+            return np.fromiter(map(avaliar, origens.tolist(), destinos.tolist()),
+                               dtype=np.int64, count=len(origens))
+
+        campos = [_combinar(pares, inverso, altas, baixas, deduplicar=True)
+                  for (pares, inverso), (_, altas, _, baixas) in zip(distintos, self._metades)]
+        (classes_origem, conjuntos_origem), (classes_destino, conjuntos_destino) = campos
+        pares, inverso = _pares_distintos(classes_origem, classes_destino, len(conjuntos_destino))
+        classes, conjuntos = _combinar(pares, inverso, conjuntos_origem, conjuntos_destino)
+        return np.asarray([_primeira_regra(conjunto) for conjunto in conjuntos], dtype=np.int64)[classes]
+
+    def permitidos_lote(self, origens, destinos):
+        """
+        Indica, para cada pacote, se a ACL o permite (True) ou nega (False).
+
+        Returns:
+            numpy.ndarray de bool (com NumPy) ou list[bool] (sem NumPy)
+        """
+        indices = self.avaliar_lote(origens, destinos)
+        # O último item atende SEM_REGRA (-1): deny implícito
+        permitidas = self._permitidas + [False]
+        np = _numpy()
+        if np is not None:
+            return np.asarray(permitidas, dtype=bool)[indices]
+        return [permitidas[indice] for indice in indices]
+
+    def _compilar_metades(self):
+        """Monta, para cada campo, as tabelas de 65536 entradas das metades alta e baixa."""
+        np = _numpy()
+        metades = []
+        for campo in (0, 4):
+            tabelas = []
+            for t1, t2 in ((0, 1), (2, 3)):
+                ids1, conjuntos1 = _classes_octeto(self._tabelas[campo + t1])
+                ids2, conjuntos2 = _classes_octeto(self._tabelas[campo + t2])
+                pares, inverso = _pares_distintos(np.repeat(ids1, 256), np.tile(ids2, 256),
+                                                  len(conjuntos2))
+                classes, conjuntos = _combinar(pares, inverso, conjuntos1, conjuntos2, deduplicar=True)
+                tabelas += [classes, conjuntos]
+            metades.append(tuple(tabelas))
+        self._metades = metades
+
+
+def _classes_octeto(tabela) -> tuple:
+    """Agrupa os 256 valores de um octeto pelo conjunto de regras: (ids, conjuntos distintos)."""
+    np = _numpy()
+    distintos = {}
+    identificadores = [distintos.setdefault(conjunto, len(distintos)) for conjunto in tabela]
+    return np.asarray(identificadores, dtype=np.int64), list(distintos)
+
+
+def _pares_distintos(classes_a, classes_b, quantidade_b: int) -> tuple:
+    """
+    Pares (classe a, classe b) distintos, codificados como a * quantidade_b + b.
+
+    Returns:
+        tuple: (array ordenado dos pares, array com a posição de cada item nele)
+    """
+    np = _numpy()
+    pares, inverso = np.unique(classes_a * quantidade_b + classes_b, return_inverse=True)
+    return pares, inverso.reshape(-1)
+
+
+def _combinar(pares, inverso, conjuntos_a: list, conjuntos_b: list, deduplicar: bool = False) -> tuple:
+    """
+    Calcula o AND dos conjuntos de cada par distinto (de _pares_distintos).
+
+    Args:
+        pares, inverso: Resultado de _pares_distintos
+        conjuntos_a, conjuntos_b (list): Conjunto de regras de cada classe
+        deduplicar (bool): Junta os pares que resultam no mesmo conjunto
+            (reduz as etapas seguintes, mas custa o hash de cada conjunto)
+
+    Returns:
+        tuple: (array com a nova classe de cada item, conjunto de cada classe)
+    """
+    quantidade_b = len(conjuntos_b)
+    conjuntos = [conjuntos_a[par // quantidade_b] & conjuntos_b[par % quantidade_b]
+                 for par in pares.tolist()]
+    if not deduplicar:
+        return inverso, conjuntos
+
+    np = _numpy()
+    distintos = {}
+    novas = [distintos.setdefault(conjunto, len(distintos)) for conjunto in conjuntos]
+    return np.asarray(novas, dtype=np.int64)[inverso], list(distintos)
@@ -0,0 +1,100 @@
+"""
+Comandos de uma chamada só para uso em scripts de shell
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Instalado como o comando "networktools" (pyproject.toml), responde uma
+consulta e sai, sem a sessão interativa de main.py:
+    networktools mascara 24                       -> 255.255.255.0
+    networktools mesma-rede 10.0.0.1 10.0.0.9 24  -> sim (código 0) / não (1)
+    networktools descrever 192.168.1.10/24        -> um campo por linha
+
+Chamado milhares de vezes por scripts, o tempo de partida domina: por isso o
+módulo importa só core.network_utils (que adia o NumPy para as funções em
+lote) e lê os argumentos sem argparse. Erros de uso ou de entrada saem com
+código 2 e a mensagem em stderr.
+"""
+
+import sys
+
+from core.network_utils import cidr_para_mascara_decimal, descrever_rede, ips_mesma_rede
+
+USO = """uso: networktools <comando> [argumentos]
+
+comandos:
+  mascara CIDR                    máscara decimal do CIDR (0-32)
+  mesma-rede ORIGEM DESTINO CIDR  "sim" (código 0) ou "não" (código 1)
+  descrever IP/CIDR               rede, broadcast, hosts etc., um campo por linha
+"""
+
+
+def _cidr(texto: str) -> int:
+    """Converte o CIDR da linha de comando, recusando o que não for número."""
+    try:
+        return int(texto)
+    except ValueError:
+        raise ValueError(f"CIDR inválido: {texto}") from None
+
+
+def comando_mascara(cidr: str) -> int:
+    """Imprime a máscara decimal de um CIDR."""
+    print(cidr_para_mascara_decimal(_cidr(cidr)))
+    return 0
+
+
+def comando_mesma_rede(origem: str, destino: str, cidr: str) -> int:
+    """Imprime "sim" ou "não"; o código de saída permite usar em um if do shell."""
+    mesma = ips_mesma_rede(origem, destino, _cidr(cidr))
+    print("sim" if mesma else "não")
+    return 0 if mesma else 1
+
+
+def comando_descrever(rede: str) -> int:
+    """Imprime cada campo de descrever_rede como "campo: valor"."""
+    ip, barra, cidr = rede.partition("/")
+    if not barra:
+        raise ValueError(f"Use o formato IP/CIDR: {rede}")
+    for campo, valor in descrever_rede(ip, _cidr(cidr)).items():
+        print(f"{campo}: {valor}")
+    return 0
+
+
+# Nome do comando -> (função, quantidade de argumentos)
+COMANDOS = {
+    "mascara": (comando_mascara, 1),
+    "mesma-rede": (comando_mesma_rede, 3),
+    "descrever": (comando_descrever, 1),
+}
+
+
+def main(argv=None) -> int:
+    """
+    Executa um comando e devolve o código de saída.
+
+    Args:
+        argv (list): Argumentos sem o nome do programa (padrão: sys.argv[1:])
+
+    Returns:
+        int: 0 em caso de sucesso, 1 para "não" em mesma-rede e 2 para erros
+            de uso ou entradas inválidas
+    """
+    argumentos = sys.argv[1:] if argv is None else list(argv)
+    if argumentos and argumentos[0] in ("-h", "--help", "ajuda"):
+        sys.stdout.write(USO)
+        return 0
+
+    comando = COMANDOS.get(argumentos[0]) if argumentos else None
+    if comando is None or len(argumentos) - 1 != comando[1]:
+        sys.stderr.write(USO)
+        return 2
+
+    funcao, _ = comando
+    try:
+        return funcao(*argumentos[1:])
+    except ValueError as erro:
+        print(f"networktools: {erro}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+"""
+Conjuntos de endereços IPv4
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo contém:
+- IPSet: conjunto imutável de endereços, guardado como intervalos inteiros
+  disjuntos e ordenados, com união, interseção, diferença, pertinência por
+  busca binária e agregação no menor conjunto de blocos CIDR
+- intervalo_para_cidrs: conversão de uma faixa início-fim em blocos CIDR
+"""
+
+from bisect import bisect_right
+
+from core.enderecos import EnderecoIPv4, RedeIPv4
+from core.network_utils import (
+    IP_INVALIDO,
+    _MASCARAS_INTEIRAS,
+    analisar_ip,
+    ip_para_inteiro,
+    validar_cidr,
+)
+
+
+def _para_inteiro(endereco) -> int:
+    """Converte str ou int (inclusive EnderecoIPv4) para a forma inteira."""
+    if isinstance(endereco, int):
+        if not 0 <= endereco <= 0xFFFFFFFF:
+            raise ValueError(f"IP fora do range de 32 bits: {endereco}")
+        return int(endereco)
+    return ip_para_inteiro(endereco)
+
+
+def _blocos_do_intervalo(inicio: int, fim: int):
+    """Gera (rede, cidr) cobrindo exatamente [inicio, fim] (fim inclusivo)."""
+    while inicio <= fim:
+        # Maior bloco alinhado em `inicio` que não ultrapassa `fim`
+        bits = (inicio & -inicio).bit_length() - 1 if inicio else 32
+        tamanho_max = (fim - inicio + 1).bit_length() - 1
+        bits = min(bits, tamanho_max)
+        yield inicio, 32 - bits
+        inicio += 1 << bits
+
+
+def intervalo_para_cidrs(inicio, fim) -> list:
+    """
+    Converte uma faixa arbitrária de endereços no menor conjunto de blocos CIDR.
+
+    Args:
+        inicio: Primeiro endereço da faixa (str ou int)
+        fim: Último endereço da faixa, inclusive (str ou int)
+
+    Returns:
+        list: Redes (RedeIPv4) em ordem crescente
+
+    Raises:
+        ValueError: Se algum endereço for inválido ou inicio > fim
+
+    Exemplo:
+        >>> [str(rede) for rede in intervalo_para_cidrs("192.168.0.1", "192.168.0.6")]
+        ['192.168.0.1/32', '192.168.0.2/31', '192.168.0.4/31', '192.168.0.6/32']
+    """
+    inicio, fim = _para_inteiro(inicio), _para_inteiro(fim)
+    if inicio > fim:
+        raise ValueError("O início da faixa deve ser menor ou igual ao fim")
+    return [RedeIPv4(rede, cidr) for rede, cidr in _blocos_do_intervalo(inicio, fim)]
+
+
+def _normalizar(intervalos) -> tuple:
+    """Ordena e funde intervalos [inicio, fim) sobrepostos ou adjacentes."""
+    inicios, fins = [], []
+    for inicio, fim in sorted(intervalos):
+        if fins and inicio <= fins[-1]:
+            if fim > fins[-1]:
+                fins[-1] = fim
+        else:
+            inicios.append(inicio)
+            fins.append(fim)
+    return inicios, fins
+
+
+class IPSet:
+    """
+    Conjunto imutável de endereços IPv4.
+
+    Internamente guarda duas listas ordenadas com os intervalos disjuntos
+    [inicio, fim) do conjunto (fim exclusivo). A construção ordena e funde
+    os intervalos em O(n log n); as operações entre conjuntos percorrem as
+    duas listas em paralelo em O(n + m); a pertinência usa busca binária.
+
+    Os elementos aceitos na construção são redes ("10.0.0.0/8", RedeIPv4 ou
+    tuplas (rede, cidr), com a semântica de calcular_rede) e endereços
+    individuais (str, int ou EnderecoIPv4).
+
+    Exemplo:
+        >>> permitidos = IPSet(["10.0.0.0/8", "192.168.0.0/16"])
+        >>> bloqueados = IPSet(["10.1.0.0/16"])
+        >>> [str(rede) for rede in (permitidos - bloqueados).para_cidrs()][:2]
+        ['10.0.0.0/16', '10.2.0.0/15']
+        >>> "10.1.2.3" in permitidos - bloqueados
+        False
+    """
+
+    __slots__ = ('_inicios', '_fins')
+
+    def __init__(self, elementos=()):
+        """
+        Args:
+            elementos: Iterável de redes e/ou endereços
+
+        Raises:
+            ValueError: Se algum elemento for inválido
+        """
+        intervalos = []
+        adicionar = intervalos.append
+        for elemento in elementos:
+            adicionar(self._intervalo_do_elemento(elemento))
+        self._inicios, self._fins = _normalizar(intervalos)
+
+    @staticmethod
+    def _intervalo_do_elemento(elemento) -> tuple:
+        """Converte um elemento aceito pelo construtor em um intervalo [inicio, fim)."""
+        if isinstance(elemento, RedeIPv4):
+            rede, cidr = int(elemento.rede), elemento.cidr
+        elif isinstance(elemento, tuple):
+            endereco, cidr = elemento
+            if not validar_cidr(cidr):
+                raise ValueError(f"CIDR inválido: {cidr}")
+            rede = _para_inteiro(endereco) & _MASCARAS_INTEIRAS[cidr]
+        elif isinstance(elemento, str) and '/' in elemento:
+            rede_ipv4 = RedeIPv4(elemento)
+            rede, cidr = int(rede_ipv4.rede), rede_ipv4.cidr
+        else:
+            rede, cidr = _para_inteiro(elemento), 32
+        return rede, rede + (1 << (32 - cidr))
+
+    @classmethod
+    def _de_listas(cls, inicios: list, fins: list) -> "IPSet":
+        """Cria um IPSet a partir de listas já normalizadas (sem validar)."""
+        conjunto = cls.__new__(cls)
+        conjunto._inicios = inicios
+        conjunto._fins = fins
+        return conjunto
+
+    @classmethod
+    def de_intervalos(cls, intervalos) -> "IPSet":
+        """
+        Cria um IPSet a partir de faixas arbitrárias (inicio, fim), com fim inclusivo.
+
+        Args:
+            intervalos: Iterável de tuplas (inicio, fim) em str ou int
+
+        Raises:
+            ValueError: Se algum endereço for inválido ou inicio > fim
+        """
+        faixas = []
+        for inicio, fim in intervalos:
+            inicio, fim = _para_inteiro(inicio), _para_inteiro(fim)
+            if inicio > fim:
+                raise ValueError("O início da faixa deve ser menor ou igual ao fim")
+            faixas.append((inicio, fim + 1))
+        return cls._de_listas(*_normalizar(faixas))
+
+    # Consultas -----------------------------------------------------------
+
+    def __contains__(self, item) -> bool:
+        if isinstance(item, RedeIPv4):
+            inicio = int(item.rede)
+            fim = inicio + item.num_enderecos
+        else:
+            if isinstance(item, str):
+                inicio = analisar_ip(item)
+                if inicio == IP_INVALIDO:
+                    return False
+            elif isinstance(item, int):
+                inicio = item
+            else:
+                return False
+            fim = inicio + 1
+
+        posicao = bisect_right(self._inicios, inicio) - 1
+        return posicao >= 0 and fim <= self._fins[posicao]
+
+    @property
+    def num_enderecos(self) -> int:
+        """Quantidade total de endereços no conjunto."""
+        return sum(self._fins) - sum(self._inicios)
+
+    def __len__(self) -> int:
+        return self.num_enderecos
+
+    def __bool__(self) -> bool:
+        return bool(self._inicios)
+
+    def intervalos(self) -> list:
+        """Faixas do conjunto como tuplas (inicio, fim) de EnderecoIPv4, fim inclusivo."""
+        return [(EnderecoIPv4(inicio), EnderecoIPv4(fim - 1))
+                for inicio, fim in zip(self._inicios, self._fins)]
+
+    def para_cidrs(self) -> list:
+        """
+        Agrega o conjunto no menor número de blocos CIDR.
+
+        Returns:
+            list: Redes (RedeIPv4) em ordem crescente
+        """
+        return [RedeIPv4(rede, cidr)
+                for inicio, fim in zip(self._inicios, self._fins)
+                for rede, cidr in _blocos_do_intervalo(inicio, fim - 1)]
+
+    # Operações entre conjuntos -------------------------------------------
+
+    def uniao(self, outro: "IPSet") -> "IPSet":
+        """Endereços presentes em pelo menos um dos conjuntos."""
+        intervalos = []
+        i = j = 0
+        a_ini, a_fim, b_ini, b_fim = self._inicios, self._fins, outro._inicios, outro._fins
+        # Intercala as duas listas já ordenadas e funde na passagem
+        while i < len(a_ini) or j < len(b_ini):
+            if j >= len(b_ini) or (i < len(a_ini) and a_ini[i] <= b_ini[j]):
+                intervalos.append((a_ini[i], a_fim[i]))
+                i += 1
+            else:
+                intervalos.append((b_ini[j], b_fim[j]))
+                j += 1
+
+        inicios, fins = [], []
+        for inicio, fim in intervalos:
+            if fins and inicio <= fins[-1]:
+                if fim > fins[-1]:
+                    fins[-1] = fim
+            else:
+                inicios.append(inicio)
+                fins.append(fim)
+        return IPSet._de_listas(inicios, fins)
+
+    def intersecao(self, outro: "IPSet") -> "IPSet":
+        """Endereços presentes nos dois conjuntos."""
+        inicios, fins = [], []
+        i = j = 0
+        a_ini, a_fim, b_ini, b_fim = self._inicios, self._fins, outro._inicios, outro._fins
+        while i < len(a_ini) and j < len(b_ini):
+            inicio = max(a_ini[i], b_ini[j])
+            fim = min(a_fim[i], b_fim[j])
+            if inicio < fim:
+                inicios.append(inicio)
+                fins.append(fim)
+            if a_fim[i] < b_fim[j]:
+                i += 1
+            else:
+                j += 1
+        return IPSet._de_listas(inicios, fins)
+
+    def diferenca(self, outro: "IPSet") -> "IPSet":
+        """Endereços deste conjunto que não estão no outro."""
+        inicios, fins = [], []
+        j = 0
+        b_ini, b_fim = outro._inicios, outro._fins
+        for inicio, fim in zip(self._inicios, self._fins):
+            # Pula os intervalos do outro que terminam antes deste começar
+            while j < len(b_ini) and b_fim[j] <= inicio:
+                j += 1
+            k = j
+            while k < len(b_ini) and b_ini[k] < fim:
+                if b_ini[k] > inicio:
+                    inicios.append(inicio)
+                    fins.append(b_ini[k])
+                inicio = max(inicio, b_fim[k])
+                k += 1
+            if inicio < fim:
+                inicios.append(inicio)
+                fins.append(fim)
+        return IPSet._de_listas(inicios, fins)
+
+    __or__ = uniao
+    __and__ = intersecao
+    __sub__ = diferenca
+
+    def __eq__(self, outro):
+        if not isinstance(outro, IPSet):
+            return NotImplemented
+        return self._inicios == outro._inicios and self._fins == outro._fins
+
+    def __hash__(self):
+        return hash((tuple(self._inicios), tuple(self._fins)))
+
+    def __repr__(self):
+        blocos = self.para_cidrs()
+        texto = ", ".join(f"'{rede}'" for rede in blocos[:5])
+        if len(blocos) > 5:
+            texto += f", ... (+{len(blocos) - 5})"
+        return f"IPSet([{texto}])"
@@ -0,0 +1,235 @@
+"""
+Tipos de valor para endereços e redes IPv4
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo contém tipos compactos e imutáveis que guardam apenas a forma
+inteira dos endereços (e o tamanho do prefixo), evitando reconverter strings
+a cada camada:
+- EnderecoIPv4: um endereço IPv4 (subclasse de int, sem atributos extras)
+- RedeIPv4: uma rede IPv4 (endereço de rede + CIDR)
+"""
+
+from core.network_utils import (
+    IP_INVALIDO,
+    _MASCARAS_INTEIRAS,
+    analisar_ip,
+    inteiro_para_ip,
+    validar_cidr,
+)
+
+
+class EnderecoIPv4(int):
+    """
+    Endereço IPv4 imutável armazenado como inteiro de 32 bits.
+
+    Por ser uma subclasse de int com __slots__ vazio, cada instância é um
+    único objeto (sem __dict__ nem um int interno separado, como em
+    ipaddress.IPv4Address), menor que a string equivalente, e
+    hash, comparação e ordenação são as operações nativas de inteiros. A
+    conversão da string acontece uma única vez, no construtor.
+
+    Note que, por ser um int, EnderecoIPv4("0.0.0.1") == 1 e os dois têm o
+    mesmo hash. Operações aritméticas retornam int comum.
+
+    Exemplo:
+        >>> ip = EnderecoIPv4("192.168.1.10")
+        >>> int(ip)
+        3232235786
+        >>> str(ip)
+        '192.168.1.10'
+        >>> ip.binario
+        '11000000101010000000000100001010'
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, endereco):
+        if type(endereco) is cls:
+            return endereco
+
+        if isinstance(endereco, str):
+            valor = analisar_ip(endereco)
+            if valor == IP_INVALIDO:
+                raise ValueError(f"IP inválido: {endereco}")
+        elif isinstance(endereco, int):
+            valor = endereco
+            if not 0 <= valor <= 0xFFFFFFFF:
+                raise ValueError(f"IP fora do range de 32 bits: {endereco}")
+        else:
+            raise TypeError(f"Esperado str ou int, recebido {type(endereco).__name__}")
+
+        return int.__new__(cls, valor)
+
+    def __str__(self):
+        return inteiro_para_ip(int(self))
+
+    def __repr__(self):
+        return f"EnderecoIPv4('{self}')"
+
+    def __format__(self, especificacao):
+        # Formatos numéricos ('b', 'x', '032b'...) continuam funcionando como em int
+        if not especificacao:
+            return str(self)
+        return int.__format__(self, especificacao)
+
+    @property
+    def octetos(self) -> tuple:
+        """Os 4 octetos do endereço como tupla de inteiros."""
+        valor = int(self)
+        return (valor >> 24, (valor >> 16) & 255, (valor >> 8) & 255, valor & 255)
+
+    @property
+    def binario(self) -> str:
+        """Representação binária de 32 bits (sem separadores)."""
+        return format(int(self), '032b')
+
+    @property
+    def binario_octetos(self) -> str:
+        """Representação binária separada por pontos (ex: 11000000.10101000...)."""
+        return '.'.join(format(octeto, '08b') for octeto in self.octetos)
+
+
+class RedeIPv4:
+    """
+    Rede IPv4 imutável representada pelo endereço de rede e pelo CIDR.
+
+    Guarda apenas dois inteiros (endereço de rede já mascarado e CIDR) e um
+    campo para o broadcast, calculado sob demanda na primeira consulta. A
+    máscara vem da tabela pré-calculada do módulo network_utils, sem custo
+    por instância. Assim como calcular_rede, bits de host no endereço
+    informado são zerados (a menos que estrito=True).
+
+    Suporta `in` com endereços (str, int ou EnderecoIPv4) e com outras redes
+    (sub-rede contida), além de comparação, ordenação e hash.
+
+    Exemplo:
+        >>> rede = RedeIPv4("192.168.1.10/24")
+        >>> str(rede)
+        '192.168.1.0/24'
+        >>> "192.168.1.100" in rede
+        True
+        >>> str(rede.broadcast)
+        '192.168.1.255'
+    """
+
+    __slots__ = ('_rede', '_cidr', '_broadcast')
+
+    def __init__(self, rede, cidr: int = None, estrito: bool = False):
+        """
+        Args:
+            rede: "a.b.c.d/n", ou endereço (str, int ou EnderecoIPv4) com cidr
+            cidr (int): Máscara CIDR, obrigatória se rede não contiver "/n"
+            estrito (bool): Se True, rejeita endereços com bits de host ligados
+
+        Raises:
+            ValueError: Se o endereço ou o CIDR forem inválidos
+        """
+        if isinstance(rede, str) and '/' in rede:
+            if cidr is not None:
+                raise ValueError("CIDR informado duas vezes")
+            rede, texto_cidr = rede.split('/', 1)
+            if not texto_cidr.isdigit():
+                raise ValueError(f"CIDR inválido: {texto_cidr}")
+            cidr = int(texto_cidr)
+
+        if cidr is None:
+            raise ValueError("CIDR não informado")
+        if not validar_cidr(cidr):
+            raise ValueError(f"CIDR inválido: {cidr}")
+
+        endereco = int(EnderecoIPv4(rede))
+        rede_int = endereco & _MASCARAS_INTEIRAS[cidr]
+        if estrito and rede_int != endereco:
+            raise ValueError(f"{EnderecoIPv4(endereco)}/{cidr} tem bits de host ligados")
+
+        object.__setattr__(self, '_rede', rede_int)
+        object.__setattr__(self, '_cidr', cidr)
+        object.__setattr__(self, '_broadcast', None)
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError("RedeIPv4 é imutável")
+
+    def __delattr__(self, nome):
+        raise AttributeError("RedeIPv4 é imutável")
+
+    def __reduce__(self):
+        return (RedeIPv4, (self._rede, self._cidr))
+
+    @property
+    def cidr(self) -> int:
+        """Tamanho do prefixo (0-32)."""
+        return self._cidr
+
+    @property
+    def rede(self) -> EnderecoIPv4:
+        """Endereço de rede."""
+        return EnderecoIPv4(self._rede)
+
+    @property
+    def mascara(self) -> EnderecoIPv4:
+        """Máscara de rede."""
+        return EnderecoIPv4(_MASCARAS_INTEIRAS[self._cidr])
+
+    @property
+    def broadcast(self) -> EnderecoIPv4:
+        """Endereço de broadcast (calculado na primeira consulta)."""
+        broadcast = self._broadcast
+        if broadcast is None:
+            broadcast = EnderecoIPv4(self._rede | (~_MASCARAS_INTEIRAS[self._cidr] & 0xFFFFFFFF))
+            object.__setattr__(self, '_broadcast', broadcast)
+        return broadcast
+
+    @property
+    def num_enderecos(self) -> int:
+        """Quantidade total de endereços da rede (incluindo rede e broadcast)."""
+        return 1 << (32 - self._cidr)
+
+    def __contains__(self, item) -> bool:
+        if isinstance(item, RedeIPv4):
+            return (item._cidr >= self._cidr and
+                    item._rede & _MASCARAS_INTEIRAS[self._cidr] == self._rede)
+        if isinstance(item, str):
+            item = analisar_ip(item)
+            if item == IP_INVALIDO:
+                return False
+        elif not isinstance(item, int):
+            return False
+        return item & _MASCARAS_INTEIRAS[self._cidr] == self._rede
+
+    def _chave(self):
+        return (self._rede, self._cidr)
+
+    def __eq__(self, outra):
+        if not isinstance(outra, RedeIPv4):
+            return NotImplemented
+        return self._rede == outra._rede and self._cidr == outra._cidr
+
+    def __lt__(self, outra):
+        if not isinstance(outra, RedeIPv4):
+            return NotImplemented
+        return self._chave() < outra._chave()
+
+    def __le__(self, outra):
+        if not isinstance(outra, RedeIPv4):
+            return NotImplemented
+        return self._chave() <= outra._chave()
+
+    def __gt__(self, outra):
+        if not isinstance(outra, RedeIPv4):
+            return NotImplemented
+        return self._chave() > outra._chave()
+
+    def __ge__(self, outra):
+        if not isinstance(outra, RedeIPv4):
+            return NotImplemented
+        return self._chave() >= outra._chave()
+
+    def __hash__(self):
+        return hash((self._rede, self._cidr))
+
+    def __str__(self):
+        return f"{EnderecoIPv4(self._rede)}/{self._cidr}"
+
+    def __repr__(self):
+        return f"RedeIPv4('{self}')"
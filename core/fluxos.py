@@ -0,0 +1,506 @@
+"""
+Agregação de registros de fluxo em matrizes de tráfego entre redes
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo soma bytes, pacotes e fluxos de exportações de fluxo (NetFlow,
+IPFIX, sFlow já convertidos para CSV ou JSONL com src, dst, bytes e packets)
+por par rede de origem x rede de destino, com:
+- MatrizTrafego: o acumulador (um dict de inteiros por par de redes)
+- ler_fluxos: lê o arquivo em blocos de colunas
+- agregar_fluxos: junta os dois
+- MatrizTrafego.maiores / MatrizTrafego.matriz: os N maiores pares e a
+  matriz das N maiores origens x N maiores destinos
+
+Cada endereço vira a rede, com a mesma conta de calcular_rede, e o par de
+redes vira um único inteiro (origem nos 32 bits altos, destino nos baixos).
+Com NumPy cada bloco é reduzido de uma vez (ordenação das chaves e soma por
+trecho) antes de ir para o dicionário. A memória depende do tamanho do bloco
+e da quantidade de pares distintos, que é limitada por limite_pares: ao
+passar dele, metade dos pares (os com menos bytes) é descartada e somada à
+parte. Os pares grandes, que são os que interessam, ficam; o total descartado
+mostra quanto tráfego deixou de ser atribuído a um par.
+
+Para executar:
+    python -m core.fluxos fluxos.csv --cidr 24 --top 20
+    python -m core.fluxos fluxos.jsonl --formato jsonl --cidr 16 --cidr-destino 8 --matriz
+"""
+
+import csv
+import heapq
+import json
+import sys
+from itertools import islice
+from operator import itemgetter
+from typing import NamedTuple
+
+from core.network_utils import (
+    IP_INVALIDO,
+    _MASCARAS_INTEIRAS,
+    _numpy,
+    analisar_ip,
+    inteiro_para_ip,
+    validar_cidr,
+)
+
+
+FORMATOS_FLUXO = ("csv", "jsonl")
+
+# Campo -> nomes aceitos no cabeçalho CSV ou nas chaves JSONL
+CAMPOS = {
+    "src": ("src", "origem"),
+    "dst": ("dst", "destino"),
+    "bytes": ("bytes",),
+    "packets": ("packets", "pacotes"),
+}
+
+# Métricas somadas por par, na ordem em que ficam guardadas
+METRICAS = ("bytes", "pacotes", "fluxos")
+
+# Registros lidos e somados por vez
+TAMANHO_BLOCO_PADRAO = 1 << 16
+
+# Pares de redes distintos guardados antes de descartar os menores (~80 MB)
+LIMITE_PARES_PADRAO = 1 << 18
+
+# IPs distintos guardados no cache de conversão antes de esvaziá-lo
+LIMITE_CACHE = 1 << 17
+
+
+class ParRedes(NamedTuple):
+    """Totais de um par rede de origem -> rede de destino."""
+    origem: str
+    destino: str
+    bytes: int
+    pacotes: int
+    fluxos: int
+
+
+class MatrizTop(NamedTuple):
+    """
+    Matriz das maiores origens (linhas) x maiores destinos (colunas).
+
+    valores[i][j] é o total da métrica escolhida de linhas[i] para colunas[j].
+    """
+    linhas: list
+    colunas: list
+    valores: list
+
+
+def _inteiro(valor) -> int:
+    """Contador de um registro (int ou texto), ou -1 se não for um inteiro >= 0."""
+    try:
+        numero = int(valor)
+    except (TypeError, ValueError):
+        return -1
+    return numero if numero >= 0 else -1
+
+
+class MatrizTrafego:
+    """
+    Acumulador de bytes, pacotes e fluxos por par de redes.
+
+    Args:
+        cidr (int): Máscara CIDR das redes de origem
+        cidr_destino (int): Máscara das redes de destino (padrão: a mesma)
+        limite_pares (int): Pares distintos guardados antes de descartar a
+            metade com menos bytes (os totais descartados ficam em descartado)
+
+    Raises:
+        ValueError: Se algum CIDR for inválido
+
+    Exemplo:
+        >>> matriz = MatrizTrafego(24)
+        >>> matriz.adicionar("10.0.0.5", "192.168.1.9", 1500, 3)
+        >>> matriz.maiores(1)
+        [ParRedes(origem='10.0.0.0/24', destino='192.168.1.0/24', bytes=1500, pacotes=3, fluxos=1)]
+    """
+
+    def __init__(self, cidr: int, cidr_destino: int = None,
+                 limite_pares: int = LIMITE_PARES_PADRAO):
+        if cidr_destino is None:
+            cidr_destino = cidr
+        for bits in (cidr, cidr_destino):
+            if not validar_cidr(bits):
+                raise ValueError(f"CIDR inválido: {bits}")
+        if limite_pares < 1:
+            raise ValueError(f"Limite de pares inválido: {limite_pares}")
+
+        self.cidr = cidr
+        self.cidr_destino = cidr_destino
+        self.mascara_origem = _MASCARAS_INTEIRAS[cidr]
+        self.mascara_destino = _MASCARAS_INTEIRAS[cidr_destino]
+        self.limite_pares = limite_pares
+
+        # (rede de origem << 32) | rede de destino -> [bytes, pacotes, fluxos]
+        self.pares = {}
+        self.totais = [0, 0, 0]
+        self.descartado = [0, 0, 0]
+        self.invalidos = 0
+        self._cache = {}
+
+    def __len__(self) -> int:
+        return len(self.pares)
+
+    def adicionar(self, origem: str, destino: str, bytes_: int, pacotes: int) -> None:
+        """
+        Soma um fluxo.
+
+        Raises:
+            ValueError: Se algum IP ou contador for inválido
+        """
+        origem_int, destino_int = analisar_ip(origem), analisar_ip(destino)
+        if IP_INVALIDO in (origem_int, destino_int):
+            raise ValueError(f"IP inválido: {origem if origem_int == IP_INVALIDO else destino}")
+        if _inteiro(bytes_) < 0 or _inteiro(pacotes) < 0:
+            raise ValueError(f"Contadores inválidos: {bytes_}, {pacotes}")
+        self.adicionar_lote([origem_int], [destino_int], [int(bytes_)], [int(pacotes)])
+
+    def adicionar_bloco(self, origens, destinos, bytes_, pacotes) -> int:
+        """
+        Soma um bloco de registros lidos de um arquivo.
+
+        IPs são convertidos por um cache (fluxos repetem muito os mesmos
+        endereços); registros com IP ou contador inválido são ignorados e
+        contados em invalidos.
+
+        Args:
+            origens, destinos: Listas de IPs em texto
+            bytes_, pacotes: Listas de contadores (int ou texto)
+
+        Returns:
+            int: Registros ignorados neste bloco
+        """
+        cache = self._cache
+        distintos = set(origens).union(destinos)
+        novos = distintos.difference(cache)
+        if novos:
+            if len(cache) + len(novos) > LIMITE_CACHE:
+                cache.clear()
+                novos = distintos
+            cache.update({ip: analisar_ip(ip) if isinstance(ip, str) else IP_INVALIDO
+                          for ip in novos})
+        origens = list(map(cache.__getitem__, origens))
+        destinos = list(map(cache.__getitem__, destinos))
+
+        try:
+            contadores = [list(map(int, bytes_)), list(map(int, pacotes))]
+        except (TypeError, ValueError):
+            contadores = [list(map(_inteiro, bytes_)), list(map(_inteiro, pacotes))]
+
+        np = _numpy()
+        if np is not None:
+            origens = np.array(origens, dtype=np.int64)
+            destinos = np.array(destinos, dtype=np.int64)
+            contadores = np.asarray(contadores, dtype=np.int64)
+            validos = ((origens != IP_INVALIDO) & (destinos != IP_INVALIDO)
+                       & (contadores >= 0).all(axis=0))
+            ignorados = len(validos) - int(np.count_nonzero(validos))
+            if ignorados:
+                origens, destinos = origens[validos], destinos[validos]
+                contadores = contadores[:, validos]
+            self.adicionar_lote(origens, destinos, contadores[0], contadores[1])
+        else:
+            linhas = [linha for linha in zip(origens, destinos, *contadores) if min(linha) >= 0]
+            ignorados = len(origens) - len(linhas)
+            self.adicionar_lote(*(zip(*linhas) if linhas else ([], [], [], [])))
+
+        self.invalidos += ignorados
+        return ignorados
+
+    def adicionar_lote(self, origens, destinos, bytes_, pacotes) -> None:
+        """
+        Soma muitos fluxos com endereços já convertidos para inteiro.
+
+        Com NumPy as chaves do lote são ordenadas e somadas por trecho
+        (np.add.reduceat), e só os pares distintos passam pelo dicionário.
+
+        Args:
+            origens, destinos: Sequências ou arrays de IPs inteiros válidos
+            bytes_, pacotes: Sequências ou arrays de contadores >= 0
+        """
+        pares = self.pares
+        np = _numpy()
+        if np is not None:
+            origens = np.asarray(origens, dtype=np.uint64)
+            if not len(origens):
+                return
+            chaves = (origens & np.uint64(self.mascara_origem)) << np.uint64(32)
+            chaves |= np.asarray(destinos, dtype=np.uint64) & np.uint64(self.mascara_destino)
+            ordem = np.argsort(chaves)
+            chaves = chaves[ordem]
+            inicios = np.flatnonzero(np.concatenate(([True], chaves[1:] != chaves[:-1])))
+            somas_bytes = np.add.reduceat(np.asarray(bytes_, dtype=np.int64)[ordem], inicios)
+            somas_pacotes = np.add.reduceat(np.asarray(pacotes, dtype=np.int64)[ordem], inicios)
+            fluxos = np.diff(np.append(inicios, len(chaves)))
+            grupos = zip(chaves[inicios].tolist(), somas_bytes.tolist(),
+                         somas_pacotes.tolist(), fluxos.tolist())
+        else:
+            somas = {}
+            mascara_origem, mascara_destino = self.mascara_origem, self.mascara_destino
+            for origem, destino, quantidade_bytes, quantidade_pacotes in zip(origens, destinos,
+                                                                             bytes_, pacotes):
+                chave = (origem & mascara_origem) << 32 | destino & mascara_destino
+                soma = somas.get(chave)
+                if soma is None:
+                    somas[chave] = [quantidade_bytes, quantidade_pacotes, 1]
+                else:
+                    soma[0] += quantidade_bytes
+                    soma[1] += quantidade_pacotes
+                    soma[2] += 1
+            grupos = ((chave, *soma) for chave, soma in somas.items())
+
+        totais = self.totais
+        for chave, quantidade_bytes, quantidade_pacotes, fluxos in grupos:
+            totais[0] += quantidade_bytes
+            totais[1] += quantidade_pacotes
+            totais[2] += fluxos
+            soma = pares.get(chave)
+            if soma is None:
+                pares[chave] = [quantidade_bytes, quantidade_pacotes, fluxos]
+            else:
+                soma[0] += quantidade_bytes
+                soma[1] += quantidade_pacotes
+                soma[2] += fluxos
+
+        if len(pares) > self.limite_pares:
+            self._descartar_menores()
+
+    def _descartar_menores(self) -> None:
+        """Mantém a metade (de limite_pares) dos pares com mais bytes e soma o resto em descartado."""
+        metade = max(self.limite_pares // 2, 1)
+        limiar = sorted([soma[0] for soma in self.pares.values()], reverse=True)[metade - 1]
+        mantidos = {chave: soma for chave, soma in self.pares.items() if soma[0] > limiar}
+        # Empates no limiar completam a metade na ordem de chegada
+        for chave, soma in self.pares.items():
+            if len(mantidos) >= metade:
+                break
+            if soma[0] == limiar:
+                mantidos[chave] = soma
+
+        # Invariante: totais = soma dos pares guardados + descartado
+        for indice, mantido in enumerate(map(sum, zip(*mantidos.values()))):
+            self.descartado[indice] = self.totais[indice] - mantido
+        self.pares = mantidos
+
+    def _rede(self, rede: int, cidr: int) -> str:
+        return f"{inteiro_para_ip(rede)}/{cidr}"
+
+    def maiores(self, n: int = 10, por: str = "bytes") -> list:
+        """
+        Os n pares de redes com os maiores totais.
+
+        Args:
+            n (int): Quantidade de pares
+            por (str): Métrica da ordenação: "bytes", "pacotes" ou "fluxos"
+
+        Returns:
+            list[ParRedes]: Do maior para o menor
+
+        Raises:
+            ValueError: Se a métrica for inválida
+        """
+        indice = _indice_metrica(por)
+        return [ParRedes(self._rede(chave >> 32, self.cidr),
+                         self._rede(chave & 0xFFFFFFFF, self.cidr_destino), *soma)
+                for chave, soma in heapq.nlargest(n, self.pares.items(),
+                                                  key=lambda item: item[1][indice])]
+
+    def matriz(self, n: int = 10, por: str = "bytes") -> MatrizTop:
+        """
+        Matriz das n redes de origem x n redes de destino com mais tráfego.
+
+        Args:
+            n (int): Máximo de linhas e de colunas
+            por (str): Métrica: "bytes", "pacotes" ou "fluxos"
+
+        Returns:
+            MatrizTop: Redes das linhas e colunas (em "rede/cidr", da maior
+                para a menor) e os totais de cada célula
+
+        Raises:
+            ValueError: Se a métrica for inválida
+        """
+        indice = _indice_metrica(por)
+        por_origem, por_destino = {}, {}
+        for chave, soma in self.pares.items():
+            origem, destino = chave >> 32, chave & 0xFFFFFFFF
+            por_origem[origem] = por_origem.get(origem, 0) + soma[indice]
+            por_destino[destino] = por_destino.get(destino, 0) + soma[indice]
+
+        origens = heapq.nlargest(n, por_origem, key=por_origem.__getitem__)
+        destinos = heapq.nlargest(n, por_destino, key=por_destino.__getitem__)
+        vazio = (0, 0, 0)
+        valores = [[self.pares.get(origem << 32 | destino, vazio)[indice] for destino in destinos]
+                   for origem in origens]
+        return MatrizTop([self._rede(origem, self.cidr) for origem in origens],
+                         [self._rede(destino, self.cidr_destino) for destino in destinos],
+                         valores)
+
+
+def _indice_metrica(por: str) -> int:
+    if por not in METRICAS:
+        raise ValueError(f"Métrica inválida: {por} (use {', '.join(METRICAS)})")
+    return METRICAS.index(por)
+
+
+def _posicoes_campos(nomes) -> list:
+    """Posição de src, dst, bytes e packets no cabeçalho CSV."""
+    nomes = [nome.strip().lower() for nome in nomes]
+    posicoes = []
+    for campo, aceitos in CAMPOS.items():
+        posicao = next((nomes.index(nome) for nome in aceitos if nome in nomes), None)
+        if posicao is None:
+            raise ValueError(f"Coluna ausente no cabeçalho: {campo}")
+        posicoes.append(posicao)
+    return posicoes
+
+
+def ler_fluxos(entrada, formato: str = "csv", tamanho_bloco: int = TAMANHO_BLOCO_PADRAO):
+    """
+    Lê registros de fluxo em blocos de colunas.
+
+    Args:
+        entrada: Arquivo de texto aberto (ou sys.stdin); CSV com cabeçalho ou
+            JSONL com um objeto por linha
+        formato (str): "csv" ou "jsonl"
+        tamanho_bloco (int): Registros por bloco
+
+    Yields:
+        tuple: (origens, destinos, bytes, pacotes), listas do mesmo tamanho;
+            linhas CSV curtas e linhas JSONL inválidas saem com IP None, para
+            serem contadas como inválidas
+
+    Raises:
+        ValueError: Se o formato for inválido ou faltar alguma coluna no CSV
+    """
+    if formato not in FORMATOS_FLUXO:
+        raise ValueError(f"Formato inválido: {formato} (use {', '.join(FORMATOS_FLUXO)})")
+
+    if formato == "csv":
+        leitor = csv.reader(entrada)
+        cabecalho = next(leitor, None)
+        if cabecalho is None:
+            return
+        posicoes = _posicoes_campos(cabecalho)
+        necessario = max(posicoes) + 1
+        campos = itemgetter(*posicoes)
+        registro_invalido = (None,) * 4
+        while True:
+            linhas = list(islice(leitor, tamanho_bloco))
+            if not linhas:
+                break
+            try:
+                registros = list(map(campos, linhas))
+            except IndexError:
+                registros = [campos(linha) if len(linha) >= necessario else registro_invalido
+                             for linha in linhas if linha]
+            if registros:
+                yield tuple(map(list, zip(*registros)))
+        return
+
+    while True:
+        linhas = list(islice(entrada, tamanho_bloco))
+        if not linhas:
+            break
+        colunas = ([], [], [], [])
+        for linha in linhas:
+            if not linha.strip():
+                continue
+            try:
+                registro = json.loads(linha)
+                valores = [next((registro[nome] for nome in aceitos if nome in registro), None)
+                           for aceitos in CAMPOS.values()]
+                if not all(isinstance(ip, str) for ip in valores[:2]):
+                    valores = [None] * 4
+            except (ValueError, TypeError, AttributeError):
+                valores = [None] * 4
+            for coluna, valor in zip(colunas, valores):
+                coluna.append(valor)
+        if colunas[0]:
+            yield colunas
+
+
+def agregar_fluxos(entrada, cidr: int, formato: str = "csv", cidr_destino: int = None,
+                   limite_pares: int = LIMITE_PARES_PADRAO,
+                   tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> MatrizTrafego:
+    """
+    Agrega um arquivo de fluxos por par de redes.
+
+    Args:
+        entrada: Arquivo de texto aberto (ou sys.stdin) com os fluxos
+        cidr (int): Máscara das redes de origem
+        formato (str): "csv" ou "jsonl"
+        cidr_destino (int): Máscara das redes de destino (padrão: cidr)
+        limite_pares (int): Pares distintos guardados (veja MatrizTrafego)
+        tamanho_bloco (int): Registros lidos e somados por vez
+
+    Returns:
+        MatrizTrafego: Os totais, com invalidos contando os registros ignorados
+
+    Raises:
+        ValueError: Se o CIDR, o formato ou o cabeçalho forem inválidos
+    """
+    matriz = MatrizTrafego(cidr, cidr_destino, limite_pares)
+    for bloco in ler_fluxos(entrada, formato, tamanho_bloco):
+        matriz.adicionar_bloco(*bloco)
+    return matriz
+
+
+def main(argv=None) -> int:
+    """Agrega um arquivo de fluxos (ou '-' para stdin) e escreve os maiores pares em CSV."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Soma bytes, pacotes e fluxos por rede de origem x rede de destino."
+    )
+    parser.add_argument("entrada", help="Arquivo CSV/JSONL com src, dst, bytes e packets, ou '-' para stdin")
+    parser.add_argument("--cidr", type=int, required=True, help="Máscara das redes de origem")
+    parser.add_argument("--cidr-destino", type=int,
+                        help="Máscara das redes de destino (padrão: a mesma de --cidr)")
+    parser.add_argument("--formato", choices=FORMATOS_FLUXO, default="csv",
+                        help="Formato da entrada (padrão: csv)")
+    parser.add_argument("--top", type=int, default=10, help="Quantidade de pares, ou de linhas e colunas")
+    parser.add_argument("--por", choices=METRICAS, default="bytes",
+                        help="Métrica da ordenação (padrão: bytes)")
+    parser.add_argument("--matriz", action="store_true",
+                        help="Escreve a matriz das maiores origens x maiores destinos")
+    parser.add_argument("--limite-pares", type=int, default=LIMITE_PARES_PADRAO,
+                        help=f"Pares distintos guardados na memória (padrão: {LIMITE_PARES_PADRAO})")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.entrada == "-":
+            matriz = agregar_fluxos(sys.stdin, args.cidr, args.formato, args.cidr_destino,
+                                    args.limite_pares)
+        else:
+            with open(args.entrada, encoding="utf-8", newline="", buffering=1 << 20) as entrada:
+                matriz = agregar_fluxos(entrada, args.cidr, args.formato, args.cidr_destino,
+                                        args.limite_pares)
+    except ValueError as erro:
+        parser.error(str(erro))
+    except OSError as erro:
+        print(f"❌ ERRO: {erro}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+
+    escritor = csv.writer(sys.stdout, lineterminator="\n")
+    if args.matriz:
+        tabela = matriz.matriz(args.top, args.por)
+        escritor.writerow([f"origem\\destino ({args.por})", *tabela.colunas])
+        escritor.writerows([linha, *valores] for linha, valores in zip(tabela.linhas, tabela.valores))
+    else:
+        escritor.writerow(ParRedes._fields)
+        escritor.writerows(matriz.maiores(args.top, args.por))
+
+    resumo = (f"Fluxos: {matriz.totais[2]} | Inválidos: {matriz.invalidos} | "
+              f"Pares de redes: {len(matriz)}")
+    if matriz.descartado[2]:
+        resumo += f" | Fluxos em pares descartados: {matriz.descartado[2]}"
+    print(resumo, file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
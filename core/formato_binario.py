@@ -0,0 +1,297 @@
+"""
+Formato binário compacto para listas de IPv4
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo converte listas de IPs em texto (um por linha) para um arquivo
+binário com os endereços já convertidos para inteiro, e lê esse arquivo por
+mapeamento em memória (mmap), sem copiar nem reconverter nada. Assim a mesma
+lista pode ser classificada contra várias origens e máscaras pagando o custo
+de conversão uma única vez.
+
+Layout do arquivo (little-endian):
+    Cabeçalho de 16 bytes: assinatura b"NTIP", versão (uint16),
+    reservado (uint16), quantidade de endereços (uint64)
+    Dados: um uint32 por endereço
+
+Para converter pela linha de comando:
+    python -m core.formato_binario ips.txt ips.bin
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from itertools import islice
+
+from core.network_utils import (
+    IP_INVALIDO,
+    _numpy,
+    analisar_ip,
+    inteiro_para_ip,
+    ips_mesma_rede_lote,
+    validar_cidr,
+)
+from core.processamento import (
+    CABECALHO_CSV,
+    FORMATOS,
+    acumular_contagens,
+    formatar_resultados,
+)
+
+
+ASSINATURA = b"NTIP"
+VERSAO = 1
+CABECALHO = struct.Struct("<4sHHQ")
+TAMANHO_CABECALHO = CABECALHO.size
+
+# Linhas convertidas por vez
+TAMANHO_BLOCO = 1 << 20
+
+
+def converter_texto_para_binario(entrada, caminho_saida: str) -> dict:
+    """
+    Converte um fluxo de texto com um IP por linha para o formato binário.
+
+    Linhas vazias são ignoradas e linhas inválidas são descartadas (e
+    contadas). A memória usada depende apenas do tamanho do bloco.
+
+    Args:
+        entrada: Arquivo de texto aberto (ou sys.stdin) com um IP por linha
+        caminho_saida (str): Caminho do arquivo binário a ser criado
+
+    Returns:
+        dict: Contagens "validos" e "invalidos"
+    """
+    validos = invalidos = 0
+
+    with open(caminho_saida, "wb") as saida:
+        # Cabeçalho provisório: a quantidade só é conhecida no final
+        saida.write(CABECALHO.pack(ASSINATURA, VERSAO, 0, 0))
+
+        while True:
+            linhas = list(islice(entrada, TAMANHO_BLOCO))
+            if not linhas:
+                break
+
+            bloco = array("I")
+            for linha in linhas:
+                ip = linha.strip()
+                if not ip:
+                    continue
+                ip_int = analisar_ip(ip)
+                if ip_int == IP_INVALIDO:
+                    invalidos += 1
+                else:
+                    bloco.append(ip_int)
+
+            if sys.byteorder == "big":
+                bloco.byteswap()
+            bloco.tofile(saida)
+            validos += len(bloco)
+
+        saida.seek(0)
+        saida.write(CABECALHO.pack(ASSINATURA, VERSAO, 0, validos))
+
+    return {"validos": validos, "invalidos": invalidos}
+
+
+def eh_arquivo_binario(caminho: str) -> bool:
+    """Verifica se o arquivo começa com a assinatura do formato binário."""
+    try:
+        with open(caminho, "rb") as arquivo:
+            return arquivo.read(len(ASSINATURA)) == ASSINATURA
+    except OSError:
+        return False
+
+
+class ArquivoIPs:
+    """
+    Leitura de um arquivo binário de IPs mapeado em memória.
+
+    Abrir o arquivo não lê os dados: o sistema operacional carrega as páginas
+    sob demanda. As visões retornadas (memoryview e array NumPy) apontam
+    direto para o mapeamento, sem cópia, e podem ser passadas para
+    ips_mesma_rede_lote, calcular_rede_lote e TabelaRotas.buscar_lote.
+
+    Exemplo:
+        >>> with ArquivoIPs("ips.bin") as arquivo:
+        ...     resultado = ips_mesma_rede_lote(origem, arquivo.como_numpy(), 24)
+    """
+
+    def __init__(self, caminho: str):
+        """
+        Args:
+            caminho (str): Arquivo gerado por converter_texto_para_binario
+
+        Raises:
+            ValueError: Se o arquivo não estiver no formato esperado
+        """
+        self._arquivo = open(caminho, "rb")
+        try:
+            cabecalho = self._arquivo.read(TAMANHO_CABECALHO)
+            if len(cabecalho) < TAMANHO_CABECALHO:
+                raise ValueError(f"Arquivo binário truncado: {caminho}")
+
+            assinatura, versao, _, quantidade = CABECALHO.unpack(cabecalho)
+            if assinatura != ASSINATURA:
+                raise ValueError(f"Não é um arquivo binário de IPs: {caminho}")
+            if versao != VERSAO:
+                raise ValueError(f"Versão não suportada: {versao}")
+
+            self._quantidade = quantidade
+            if quantidade:
+                self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+                if len(self._mapa) < TAMANHO_CABECALHO + 4 * quantidade:
+                    raise ValueError(f"Arquivo binário truncado: {caminho}")
+            else:
+                self._mapa = None
+            self._visao = None
+        except Exception:
+            self.close()
+            raise
+
+    def __len__(self) -> int:
+        return self._quantidade
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.close()
+
+    def como_memoryview(self) -> memoryview:
+        """
+        Retorna uma memoryview de uint32 (formato 'I') sobre os endereços.
+
+        Raises:
+            RuntimeError: Em máquinas big-endian, onde a visão nativa não
+                corresponde ao formato little-endian do arquivo
+        """
+        if sys.byteorder == "big":
+            raise RuntimeError("memoryview nativa indisponível em big-endian; use como_numpy()")
+
+        if self._visao is None:
+            if self._mapa is None:
+                self._visao = memoryview(b"").cast("I")
+            else:
+                fim = TAMANHO_CABECALHO + 4 * self._quantidade
+                self._visao = memoryview(self._mapa)[TAMANHO_CABECALHO:fim].cast("I")
+        return self._visao
+
+    def como_numpy(self):
+        """
+        Retorna um array NumPy somente leitura (uint32 little-endian) sobre
+        os endereços, sem cópia.
+
+        Raises:
+            RuntimeError: Se o NumPy não estiver instalado
+        """
+        np = _numpy()
+        if np is None:
+            raise RuntimeError("NumPy não está instalado; use como_memoryview()")
+        if self._mapa is None:
+            return np.empty(0, dtype="<u4")
+        return np.frombuffer(self._mapa, dtype="<u4", count=self._quantidade,
+                             offset=TAMANHO_CABECALHO)
+
+    def blocos(self, tamanho: int = TAMANHO_BLOCO):
+        """Gera fatias consecutivas (visões, sem cópia) de até `tamanho` endereços."""
+        visao = self.como_numpy() if _numpy() is not None else self.como_memoryview()
+        for inicio in range(0, self._quantidade, tamanho):
+            yield visao[inicio:inicio + tamanho]
+
+    def close(self) -> None:
+        """
+        Fecha o mapeamento e o arquivo.
+
+        Se ainda houver arrays NumPy apontando para o mapeamento, ele só é
+        liberado quando esses arrays deixarem de existir.
+        """
+        if getattr(self, "_visao", None) is not None:
+            self._visao.release()
+            self._visao = None
+        if getattr(self, "_mapa", None) is not None:
+            try:
+                self._mapa.close()
+            except BufferError:
+                pass
+            self._mapa = None
+        self._arquivo.close()
+
+
+def classificar_binario(caminho: str, saida, ip_origem: str, cidr: int,
+                        formato: str = "csv", tamanho_bloco: int = TAMANHO_BLOCO) -> dict:
+    """
+    Classifica um arquivo binário de IPs contra o IP de origem.
+
+    Equivalente a processamento.classificar_fluxo, mas sem nenhuma conversão
+    de texto na entrada: cada bloco é comparado de uma vez com
+    ips_mesma_rede_lote diretamente sobre o mapeamento em memória.
+
+    Args:
+        caminho (str): Arquivo binário de IPs
+        saida: Arquivo de texto aberto (ou sys.stdout) para os resultados
+        ip_origem (str): IP de origem
+        cidr (int): Máscara CIDR
+        formato (str): "csv" ou "jsonl"
+        tamanho_bloco (int): Endereços processados por vez
+
+    Returns:
+        dict: Contagens "total", "mesma_rede", "outra_rede" e "invalidos"
+
+    Raises:
+        ValueError: Se o IP de origem, o CIDR, o formato ou o arquivo forem inválidos
+    """
+    origem_int = analisar_ip(ip_origem)
+    if origem_int == IP_INVALIDO:
+        raise ValueError(f"IP de origem inválido: {ip_origem}")
+
+    if not validar_cidr(cidr):
+        raise ValueError(f"CIDR inválido: {cidr}")
+
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato inválido: {formato} (use {', '.join(FORMATOS)})")
+
+    contagens = {"total": 0, "mesma_rede": 0, "outra_rede": 0, "invalidos": 0}
+    np = _numpy()
+
+    if formato == "csv":
+        saida.write(CABECALHO_CSV)
+
+    with ArquivoIPs(caminho) as arquivo:
+        for bloco in arquivo.blocos(tamanho_bloco):
+            mesma_rede = ips_mesma_rede_lote(origem_int, bloco, cidr)
+            if np is not None:
+                bloco, mesma_rede = bloco.tolist(), mesma_rede.tolist()
+            resultados = list(zip(map(inteiro_para_ip, bloco), mesma_rede))
+            saida.write(formatar_resultados(resultados, formato))
+            acumular_contagens(contagens, resultados)
+
+    return contagens
+
+
+def main(argv=None) -> int:
+    """Converte um arquivo de texto (ou '-' para stdin) para o formato binário."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Converte uma lista de IPs (um por linha) para o formato binário do NetworkTools."
+    )
+    parser.add_argument("entrada", help="Arquivo de texto com um IP por linha, ou '-' para stdin")
+    parser.add_argument("saida", help="Arquivo binário a ser criado")
+    args = parser.parse_args(argv)
+
+    if args.entrada == "-":
+        contagens = converter_texto_para_binario(sys.stdin, args.saida)
+    else:
+        with open(args.entrada, encoding="utf-8", buffering=1 << 20) as entrada:
+            contagens = converter_texto_para_binario(entrada, args.saida)
+
+    print(f"Convertidos: {contagens['validos']} | Inválidos descartados: {contagens['invalidos']}",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""
+Instrumentação opcional das funções de core.network_utils
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo conta as chamadas de cada função pública de network_utils (só
+as feitas de fora do módulo, não as internas), as falhas de validação
+(entrada recusada ou ValueError) e monta um histograma de latência por
+função, com:
+- ativar / desativar: liga e desliga a coleta
+- instantaneo: cópia dos números atuais em um dict
+- exportar_prometheus: os mesmos números no formato de texto do Prometheus
+
+Desativada, a instrumentação não custa nada: as funções originais não são
+tocadas. Ao ativar, cada função é trocada por uma versão instrumentada em
+network_utils e em todo módulo já carregado que a tenha importado com
+"from core.network_utils import ..." (o CLI, a versão web, os outros
+módulos de core); ao desativar, as originais voltam para os mesmos lugares.
+"""
+
+import functools
+import sys
+import threading
+import time
+from bisect import bisect_left
+
+from core import network_utils
+from core.network_utils import IP_INVALIDO
+
+# Limites superiores (ns) dos baldes do histograma de latência; o último
+# balde (+Inf) recebe o que passar de 100 ms
+LIMITES_NS = (100, 250, 500, 1_000, 2_500, 5_000, 10_000, 25_000, 50_000,
+              100_000, 1_000_000, 10_000_000, 100_000_000)
+
+# Funções instrumentadas e, para as que sinalizam entrada inválida pelo
+# retorno (sem exceção), o teste que identifica a falha
+FUNCOES = {
+    "analisar_ip": lambda resultado: resultado == IP_INVALIDO,
+    "analisar_ipv6": lambda resultado: resultado == IP_INVALIDO,
+    "validar_ip": lambda resultado: resultado is False,
+    "validar_cidr": lambda resultado: resultado is False,
+    "versao_ip": lambda resultado: resultado is None,
+    "cidr_para_mascara_decimal": None,
+    "ip_para_inteiro": None,
+    "ip_para_inteiro_versao": None,
+    "inteiro_para_ip": None,
+    "inteiro_para_ipv6": None,
+    "calcular_rede": None,
+    "ips_mesma_rede": None,
+    "descrever_rede": None,
+    "agrupar_por_rede": None,
+    "analisar_ips_lote": None,
+    "ips_mesma_rede_lote": None,
+    "calcular_rede_lote": None,
+    "agrupar_por_rede_lote": None,
+    "ipv6_para_colunas": None,
+    "ips_mesma_rede_lote_ipv6": None,
+}
+
+
+class _Estatistica:
+    """Contadores e histograma de uma função (atualizados sob uma trava)."""
+
+    __slots__ = ('chamadas', 'falhas', 'soma_ns', 'baldes', 'trava')
+
+    def __init__(self):
+        self.trava = threading.Lock()
+        self.zerar()
+
+    def zerar(self):
+        self.chamadas = 0
+        self.falhas = 0
+        self.soma_ns = 0
+        self.baldes = [0] * (len(LIMITES_NS) + 1)
+
+    def registrar(self, duracao_ns: int, falhou: bool):
+        balde = bisect_left(LIMITES_NS, duracao_ns)
+        with self.trava:
+            self.chamadas += 1
+            self.falhas += falhou
+            self.soma_ns += duracao_ns
+            self.baldes[balde] += 1
+
+
+_ESTATISTICAS = {nome: _Estatistica() for nome in FUNCOES}
+
+# Função original de cada nome enquanto a instrumentação está ativa
+_ORIGINAIS = {}
+
+
+class _Aninhamento(threading.local):
+    """Marca, por thread, que uma função instrumentada está em execução."""
+
+    ativa = False
+
+
+_ANINHAMENTO = _Aninhamento()
+
+
+def _instrumentar(nome: str, funcao, falhou):
+    """
+    Envolve funcao medindo a duração e contando chamadas e falhas.
+
+    Chamadas internas (uma função de network_utils chamando outra, como
+    ips_mesma_rede chamando analisar_ip) não são contadas: os números
+    refletem só as chamadas feitas de fora do módulo.
+    """
+    estatistica = _ESTATISTICAS[nome]
+    relogio = time.perf_counter_ns
+    aninhamento = _ANINHAMENTO
+
+    @functools.wraps(funcao)
+    def instrumentada(*args, **kwargs):
+        if aninhamento.ativa:
+            return funcao(*args, **kwargs)
+        aninhamento.ativa = True
+        inicio = relogio()
+        try:
+            resultado = funcao(*args, **kwargs)
+        except ValueError:
+            estatistica.registrar(relogio() - inicio, True)
+            raise
+        finally:
+            aninhamento.ativa = False
+        estatistica.registrar(relogio() - inicio, falhou is not None and falhou(resultado))
+        return resultado
+
+    return instrumentada
+
+
+def _substituir_referencias(substitutos: dict) -> None:
+    """
+    Troca, em todos os módulos carregados, cada função antiga pela nova.
+
+    Args:
+        substitutos (dict): id(função antiga) -> função nova
+    """
+    for modulo in list(sys.modules.values()):
+        atributos = getattr(modulo, "__dict__", None)
+        if not isinstance(atributos, dict):
+            continue
+        for nome, valor in list(atributos.items()):
+            novo = substitutos.get(id(valor))
+            if novo is not None and callable(valor):
+                atributos[nome] = novo
+
+
+def ativo() -> bool:
+    """Indica se a instrumentação está ligada."""
+    return bool(_ORIGINAIS)
+
+
+def ativar() -> None:
+    """
+    Liga a coleta (sem efeito se já estiver ligada).
+
+    Módulos importados depois da ativação recebem as versões instrumentadas
+    normalmente, pois elas já estão em core.network_utils.
+    """
+    if _ORIGINAIS:
+        return
+    substitutos = {}
+    for nome, falhou in FUNCOES.items():
+        original = getattr(network_utils, nome)
+        _ORIGINAIS[nome] = original
+        substitutos[id(original)] = _instrumentar(nome, original, falhou)
+    _substituir_referencias(substitutos)
+
+
+def desativar() -> None:
+    """Desliga a coleta, devolvendo as funções originais (os números ficam)."""
+    substitutos = {id(getattr(network_utils, nome)): original
+                   for nome, original in _ORIGINAIS.items()}
+    _substituir_referencias(substitutos)
+    _ORIGINAIS.clear()
+
+
+def zerar() -> None:
+    """Zera todos os contadores e histogramas."""
+    for estatistica in _ESTATISTICAS.values():
+        with estatistica.trava:
+            estatistica.zerar()
+
+
+def instantaneo(somente_chamadas: bool = True) -> dict:
+    """
+    Cópia dos números atuais.
+
+    Args:
+        somente_chamadas (bool): Omite funções que ainda não foram chamadas
+
+    Returns:
+        dict: nome -> {"chamadas", "falhas", "soma_segundos", "baldes"},
+            com "baldes" como lista de (limite em segundos, contagem
+            acumulada), terminando em (inf, chamadas)
+
+    Exemplo:
+        >>> ativar(); network_utils.validar_ip("1.2.3.400"); desativar()
+        False
+        >>> instantaneo()["validar_ip"]["falhas"]
+        1
+    """
+    resultado = {}
+    for nome, estatistica in _ESTATISTICAS.items():
+        with estatistica.trava:
+            chamadas, falhas = estatistica.chamadas, estatistica.falhas
+            soma_ns, baldes = estatistica.soma_ns, list(estatistica.baldes)
+        if somente_chamadas and not chamadas:
+            continue
+        limites = [limite / 1e9 for limite in LIMITES_NS] + [float("inf")]
+        acumulados, total = [], 0
+        for contagem in baldes:
+            total += contagem
+            acumulados.append(total)
+        resultado[nome] = {
+            "chamadas": chamadas,
+            "falhas": falhas,
+            "soma_segundos": soma_ns / 1e9,
+            "baldes": list(zip(limites, acumulados)),
+        }
+    return resultado
+
+
+def _formatar_limite(limite: float) -> str:
+    return "+Inf" if limite == float("inf") else repr(limite)
+
+
+def exportar_prometheus(prefixo: str = "networktools") -> str:
+    """
+    Métricas no formato de texto de exposição do Prometheus (versão 0.0.4).
+
+    Gera três famílias: {prefixo}_chamadas_total e {prefixo}_falhas_total
+    (contadores) e {prefixo}_duracao_segundos (histograma), todas com o
+    rótulo funcao.
+
+    Returns:
+        str: Texto pronto para ser servido em /metrics
+    """
+    numeros = instantaneo()
+    linhas = [
+        f"# HELP {prefixo}_chamadas_total Chamadas de cada função de core.network_utils.",
+        f"# TYPE {prefixo}_chamadas_total counter",
+    ]
+    linhas += [f'{prefixo}_chamadas_total{{funcao="{nome}"}} {dados["chamadas"]}'
+               for nome, dados in numeros.items()]
+    linhas += [
+        f"# HELP {prefixo}_falhas_total Chamadas com entrada recusada (retorno inválido ou ValueError).",
+        f"# TYPE {prefixo}_falhas_total counter",
+    ]
+    linhas += [f'{prefixo}_falhas_total{{funcao="{nome}"}} {dados["falhas"]}'
+               for nome, dados in numeros.items()]
+    linhas += [
+        f"# HELP {prefixo}_duracao_segundos Duração de cada chamada.",
+        f"# TYPE {prefixo}_duracao_segundos histogram",
+    ]
+    for nome, dados in numeros.items():
+        linhas += [f'{prefixo}_duracao_segundos_bucket{{funcao="{nome}",le="{_formatar_limite(limite)}"}} '
+                   f'{acumulado}' for limite, acumulado in dados["baldes"]]
+        linhas.append(f'{prefixo}_duracao_segundos_sum{{funcao="{nome}"}} {dados["soma_segundos"]!r}')
+        linhas.append(f'{prefixo}_duracao_segundos_count{{funcao="{nome}"}} {dados["chamadas"]}')
+    return "\n".join(linhas) + "\n"
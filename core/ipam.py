@@ -0,0 +1,330 @@
+"""
+Cadastro de redes e endereços (IPAM) em SQLite
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo guarda redes e atribuições de endereços IPv4 em um banco SQLite,
+sempre na forma inteira (início e fim de cada rede, e o IP de cada
+atribuição), para que todas as consultas sejam buscas em índice:
+- Redes que contêm um IP: uma rede que contém o IP começa em ip & máscara,
+  então bastam 33 buscas pontuais no índice (inicio, cidr)
+- Redes sobrepostas a um bloco: as que o contêm (mesma ideia) mais as que
+  começam dentro dele (uma varredura de intervalo no mesmo índice)
+- Próximo endereço livre: uma tabela de ocupação por bloco /24, atualizada
+  junto com as atribuições, permite pular blocos cheios sem ler os IPs
+
+Importações em massa usam executemany dentro de uma única transação.
+"""
+
+import sqlite3
+from collections import Counter
+from itertools import islice
+
+from core.enderecos import RedeIPv4
+from core.network_utils import (
+    IP_INVALIDO,
+    _MASCARAS_INTEIRAS,
+    analisar_ip,
+    inteiro_para_ip,
+)
+
+# Linhas enviadas por chamada de executemany nas importações
+TAMANHO_LOTE = 50_000
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS redes (
+    id INTEGER PRIMARY KEY,
+    inicio INTEGER NOT NULL,
+    fim INTEGER NOT NULL,
+    cidr INTEGER NOT NULL,
+    nome TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS redes_inicio_cidr ON redes (inicio, cidr);
+
+CREATE TABLE IF NOT EXISTS atribuicoes (
+    ip INTEGER PRIMARY KEY,
+    nome TEXT
+);
+
+-- Quantidade de IPs atribuídos em cada bloco /24 (ip >> 8)
+CREATE TABLE IF NOT EXISTS ocupacao (
+    bloco INTEGER PRIMARY KEY,
+    usados INTEGER NOT NULL
+);
+"""
+
+_SOMAR_OCUPACAO = """
+INSERT INTO ocupacao (bloco, usados) VALUES (?, ?)
+ON CONFLICT (bloco) DO UPDATE SET usados = usados + excluded.usados
+"""
+
+
+def _ip_para_inteiro(ip) -> int:
+    """Converte str ou int para a forma inteira, validando o range."""
+    if isinstance(ip, int):
+        if not 0 <= ip <= 0xFFFFFFFF:
+            raise ValueError(f"IP fora do range de 32 bits: {ip}")
+        return int(ip)
+    valor = analisar_ip(ip)
+    if valor == IP_INVALIDO:
+        raise ValueError(f"IP inválido: {ip}")
+    return valor
+
+
+def _para_rede(rede) -> RedeIPv4:
+    return rede if isinstance(rede, RedeIPv4) else RedeIPv4(rede)
+
+
+def _inicios_candidatos(ip_int: int, cidr_maximo: int) -> list:
+    """Inícios possíveis de uma rede /0../cidr_maximo que contém o IP (ip & máscara)."""
+    return sorted({ip_int & _MASCARAS_INTEIRAS[cidr] for cidr in range(cidr_maximo + 1)})
+
+
+def _marcadores(valores) -> str:
+    return ", ".join("?" * len(valores))
+
+
+class IPAM:
+    """
+    Cadastro de redes e atribuições de IPv4 em SQLite.
+
+    Exemplo:
+        >>> with IPAM() as ipam:
+        ...     ipam.adicionar_rede("10.0.0.0/8", "corporativa")
+        ...     ipam.adicionar_rede("10.1.0.0/16", "filial")
+        ...     ipam.atribuir("10.1.0.1", "gateway")
+        ...     [nome for _, nome in ipam.redes_contendo("10.1.0.1")], ipam.proximo_livre("10.1.0.0/16")
+        (['filial', 'corporativa'], '10.1.0.2')
+    """
+
+    def __init__(self, caminho: str = ":memory:"):
+        """
+        Args:
+            caminho (str): Arquivo do banco (padrão: banco em memória)
+        """
+        self._conexao = sqlite3.connect(caminho)
+        self._conexao.executescript(_ESQUEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.close()
+
+    def close(self) -> None:
+        """Fecha a conexão com o banco."""
+        self._conexao.close()
+
+    # Redes ---------------------------------------------------------------
+
+    def adicionar_rede(self, rede, nome: str = None) -> RedeIPv4:
+        """
+        Cadastra uma rede (bits de host são zerados, como em calcular_rede).
+
+        Raises:
+            ValueError: Se a rede for inválida ou já estiver cadastrada
+        """
+        return self.importar_redes([(rede, nome)])[0]
+
+    def importar_redes(self, itens) -> list:
+        """
+        Cadastra várias redes em uma única transação.
+
+        Args:
+            itens: Iterável de tuplas (rede, nome), com rede em RedeIPv4 ou
+                "a.b.c.d/n"
+
+        Returns:
+            list: Redes cadastradas (RedeIPv4)
+
+        Raises:
+            ValueError: Se alguma rede for inválida ou repetida (nada é gravado)
+        """
+        redes = [(_para_rede(rede), nome) for rede, nome in itens]
+        linhas = [(int(rede.rede), int(rede.broadcast), rede.cidr, nome) for rede, nome in redes]
+        try:
+            with self._conexao:
+                self._conexao.executemany(
+                    "INSERT INTO redes (inicio, fim, cidr, nome) VALUES (?, ?, ?, ?)", linhas)
+        except sqlite3.IntegrityError:
+            raise ValueError("Rede já cadastrada")
+        return [rede for rede, _ in redes]
+
+    def remover_rede(self, rede) -> None:
+        """Remove uma rede do cadastro (as atribuições não são afetadas)."""
+        rede = _para_rede(rede)
+        with self._conexao:
+            self._conexao.execute("DELETE FROM redes WHERE inicio = ? AND cidr = ?",
+                                  (int(rede.rede), rede.cidr))
+
+    def redes_contendo(self, ip) -> list:
+        """
+        Redes cadastradas que contêm o IP, da mais específica à menos.
+
+        Returns:
+            list: Tuplas (RedeIPv4, nome)
+        """
+        ip_int = _ip_para_inteiro(ip)
+        inicios = _inicios_candidatos(ip_int, 32)
+        linhas = self._conexao.execute(
+            f"SELECT inicio, cidr, nome FROM redes WHERE inicio IN ({_marcadores(inicios)}) "
+            "AND fim >= ? ORDER BY cidr DESC", (*inicios, ip_int)).fetchall()
+        return [(RedeIPv4(inicio, cidr), nome) for inicio, cidr, nome in linhas]
+
+    def redes_sobrepostas(self, rede) -> list:
+        """
+        Redes cadastradas que se sobrepõem ao bloco (o contêm ou estão nele).
+
+        Returns:
+            list: Tuplas (RedeIPv4, nome), em ordem de endereço
+        """
+        rede = _para_rede(rede)
+        inicio, fim = int(rede.rede), int(rede.broadcast)
+        # Redes CIDR não se cruzam: ou começam dentro do bloco, ou o contêm
+        inicios = _inicios_candidatos(inicio, rede.cidr)
+        linhas = self._conexao.execute(
+            "SELECT inicio, cidr, nome FROM redes WHERE inicio BETWEEN ? AND ? "
+            f"OR (inicio IN ({_marcadores(inicios)}) AND fim >= ?) ORDER BY inicio, cidr",
+            (inicio, fim, *inicios, fim)).fetchall()
+        return [(RedeIPv4(inicio, cidr), nome) for inicio, cidr, nome in linhas]
+
+    def redes(self) -> list:
+        """Todas as redes cadastradas, como tuplas (RedeIPv4, nome)."""
+        linhas = self._conexao.execute(
+            "SELECT inicio, cidr, nome FROM redes ORDER BY inicio, cidr").fetchall()
+        return [(RedeIPv4(inicio, cidr), nome) for inicio, cidr, nome in linhas]
+
+    # Atribuições ---------------------------------------------------------
+
+    def atribuir(self, ip, nome: str = None) -> None:
+        """
+        Registra a atribuição de um IP.
+
+        Raises:
+            ValueError: Se o IP for inválido ou já estiver atribuído
+        """
+        self.importar_atribuicoes([(ip, nome)])
+
+    def importar_atribuicoes(self, itens) -> int:
+        """
+        Registra várias atribuições em uma única transação.
+
+        Args:
+            itens: Iterável de tuplas (ip, nome), com ip em str ou int
+
+        Returns:
+            int: Quantidade de atribuições gravadas
+
+        Raises:
+            ValueError: Se algum IP for inválido ou repetido (nada é gravado)
+        """
+        itens = iter(itens)
+        total = 0
+        try:
+            with self._conexao:
+                while True:
+                    lote = [(_ip_para_inteiro(ip), nome) for ip, nome in islice(itens, TAMANHO_LOTE)]
+                    if not lote:
+                        break
+                    self._conexao.executemany(
+                        "INSERT INTO atribuicoes (ip, nome) VALUES (?, ?)", lote)
+                    por_bloco = Counter(ip >> 8 for ip, _ in lote)
+                    self._conexao.executemany(_SOMAR_OCUPACAO, por_bloco.items())
+                    total += len(lote)
+        except sqlite3.IntegrityError:
+            raise ValueError("IP já atribuído")
+        return total
+
+    def liberar(self, ip) -> None:
+        """
+        Remove a atribuição de um IP.
+
+        Raises:
+            ValueError: Se o IP não estiver atribuído
+        """
+        ip_int = _ip_para_inteiro(ip)
+        with self._conexao:
+            cursor = self._conexao.execute("DELETE FROM atribuicoes WHERE ip = ?", (ip_int,))
+            if cursor.rowcount == 0:
+                raise ValueError(f"IP não atribuído: {ip}")
+            self._conexao.execute(_SOMAR_OCUPACAO, (ip_int >> 8, -1))
+
+    def atribuicao(self, ip):
+        """Nome associado ao IP, ou None se ele não estiver atribuído."""
+        linha = self._conexao.execute("SELECT nome FROM atribuicoes WHERE ip = ?",
+                                      (_ip_para_inteiro(ip),)).fetchone()
+        return None if linha is None else linha[0]
+
+    def __contains__(self, ip) -> bool:
+        try:
+            ip_int = _ip_para_inteiro(ip)
+        except ValueError:
+            return False
+        return self._conexao.execute("SELECT 1 FROM atribuicoes WHERE ip = ?",
+                                     (ip_int,)).fetchone() is not None
+
+    def atribuicoes_em(self, rede):
+        """Gera as atribuições (ip, nome) dentro do bloco, em ordem de endereço."""
+        rede = _para_rede(rede)
+        cursor = self._conexao.execute(
+            "SELECT ip, nome FROM atribuicoes WHERE ip BETWEEN ? AND ? ORDER BY ip",
+            (int(rede.rede), int(rede.broadcast)))
+        for ip, nome in cursor:
+            yield inteiro_para_ip(ip), nome
+
+    def contar_atribuicoes(self, rede) -> int:
+        """Quantidade de IPs atribuídos dentro do bloco."""
+        rede = _para_rede(rede)
+        return self._conexao.execute(
+            "SELECT count(*) FROM atribuicoes WHERE ip BETWEEN ? AND ?",
+            (int(rede.rede), int(rede.broadcast))).fetchone()[0]
+
+    def proximo_livre(self, rede):
+        """
+        Primeiro host da rede ainda não atribuído.
+
+        Segue descrever_rede: até /30, endereço de rede e broadcast não são
+        hosts. Blocos /24 totalmente ocupados são pulados pela tabela de
+        ocupação, sem ler as atribuições.
+
+        Returns:
+            str: Endereço livre, ou None se a rede estiver cheia
+        """
+        rede = _para_rede(rede)
+        primeiro, ultimo = int(rede.rede), int(rede.broadcast)
+        if rede.cidr <= 30:
+            primeiro, ultimo = primeiro + 1, ultimo - 1
+
+        # Um bloco não cheio pode ter livre só fora do intervalo de hosts
+        # (rede ou broadcast); nesse caso segue para o próximo
+        bloco, ultimo_bloco = primeiro >> 8, ultimo >> 8
+        while True:
+            bloco = self._proximo_bloco_nao_cheio(bloco, ultimo_bloco)
+            if bloco > ultimo_bloco:
+                return None
+            livre = self._primeiro_livre_no_intervalo(max(primeiro, bloco << 8),
+                                                      min(ultimo, (bloco << 8) | 0xFF))
+            if livre is not None:
+                return inteiro_para_ip(livre)
+            bloco += 1
+
+    def _proximo_bloco_nao_cheio(self, bloco: int, ultimo_bloco: int) -> int:
+        """Primeiro bloco /24 a partir de `bloco` com menos de 256 IPs atribuídos."""
+        cheios = self._conexao.execute(
+            "SELECT bloco FROM ocupacao WHERE bloco BETWEEN ? AND ? AND usados >= 256 "
+            "ORDER BY bloco", (bloco, ultimo_bloco))
+        for (cheio,) in cheios:
+            if cheio != bloco:
+                break
+            bloco += 1
+        return bloco
+
+    def _primeiro_livre_no_intervalo(self, inicio: int, fim: int):
+        """Primeiro inteiro de [inicio, fim] sem atribuição (até 256 endereços)."""
+        candidato = inicio
+        for (ip,) in self._conexao.execute(
+                "SELECT ip FROM atribuicoes WHERE ip BETWEEN ? AND ? ORDER BY ip", (inicio, fim)):
+            if ip != candidato:
+                break
+            candidato += 1
+        return candidato if candidato <= fim else None
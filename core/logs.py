@@ -0,0 +1,374 @@
+"""
+Enriquecimento de logs de acesso (nginx/Apache)
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo marca o IP do cliente de cada linha de um log de acesso (formato
+common/combined do nginx e do Apache, em que o IP é o primeiro campo) como
+"local" (na mesma rede do IP de origem), "remoto" ou "invalido", com:
+- ler_blocos: lê o log (texto puro ou gzip) em blocos de linhas completas
+- seguir_arquivo: o mesmo para um arquivo que continua crescendo (tail -F)
+- enriquecer_blocos: gera a saída (linha original + rótulo, ou JSONL)
+- enriquecer_log: junta tudo, escrevendo a saída e contando as categorias
+
+Tudo é feito em geradores, bloco a bloco: a memória depende do tamanho do
+bloco e do cache de IPs, não do tamanho do log. Em cada bloco os IPs saem de
+uma única busca com a expressão pré-compilada sobre o texto inteiro, e só os
+IPs ainda não vistos são analisados (clientes se repetem muito em logs); o
+resto são consultas a um dicionário.
+
+Para executar:
+    python -m core.logs access.log.gz --cidr 24 > enriquecido.log
+    python -m core.logs /var/log/nginx/access.log --cidr 24 --formato jsonl --seguir
+"""
+
+import gzip
+import json
+import os
+import re
+import sys
+import time
+from collections import Counter
+
+from core.network_utils import (
+    IP_INVALIDO,
+    _MASCARAS_INTEIRAS,
+    _MASCARAS_IPV6,
+    _analisar_qualquer,
+    validar_cidr,
+)
+
+# Formatos de saída: a linha original com o rótulo no fim, ou um objeto JSON por linha
+FORMATOS_LOG = ("texto", "jsonl")
+
+# Rótulos de cada linha
+LOCAL = "local"
+REMOTO = "remoto"
+INVALIDO = "invalido"
+
+# Bytes lidos por vez (o bloco é estendido até a próxima quebra de linha)
+TAMANHO_BLOCO_PADRAO = 1 << 22
+
+# Quantos IPs distintos ficam no cache antes de ele ser esvaziado
+LIMITE_CACHE = 1 << 17
+
+# Segundos entre verificações de um arquivo seguido que não cresceu
+INTERVALO_SEGUIR = 0.5
+
+# O IP do cliente é o primeiro campo da linha; uma busca sobre o bloco inteiro
+# devolve exatamente um item por linha (vazio nas linhas em branco). O ".*"
+# final consome o resto da linha, para a busca não tentar "^" em cada caractere
+PADRAO_CLIENTE = re.compile(r"^[ \t]*(\S*).*", re.MULTILINE)
+
+_ASSINATURA_GZIP = b"\x1f\x8b"
+
+
+def abrir_log(caminho: str):
+    """
+    Abre um log em modo binário, descompactando se for gzip.
+
+    O gzip é reconhecido pela assinatura do arquivo, não pela extensão.
+
+    Args:
+        caminho (str): Caminho do log
+
+    Returns:
+        Arquivo binário aberto (gzip.GzipFile ou arquivo comum)
+    """
+    with open(caminho, "rb") as arquivo:
+        compactado = arquivo.read(2) == _ASSINATURA_GZIP
+    if compactado:
+        return gzip.open(caminho, "rb")
+    return open(caminho, "rb", buffering=0)
+
+
+def _separar_linhas(pendente: bytes, dados: bytes) -> tuple:
+    """Junta os dados ao resto do bloco anterior; retorna (linhas completas ou None, resto)."""
+    dados = pendente + dados
+    fim = dados.rfind(b"\n")
+    if fim < 0:
+        return None, dados
+    return dados[:fim].decode("utf-8", "replace"), dados[fim + 1:]
+
+
+def ler_blocos(arquivo, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO):
+    """
+    Lê um arquivo binário em blocos de linhas completas.
+
+    Args:
+        arquivo: Arquivo binário aberto (de abrir_log, ou sys.stdin.buffer)
+        tamanho_bloco (int): Bytes lidos por vez
+
+    Yields:
+        str: Linhas completas separadas por "\\n", sem a quebra final (bytes
+            inválidos em UTF-8 viram U+FFFD)
+    """
+    pendente = b""
+    while True:
+        dados = arquivo.read(tamanho_bloco)
+        if not dados:
+            break
+        bloco, pendente = _separar_linhas(pendente, dados)
+        if bloco is not None:
+            yield bloco
+
+    if pendente:
+        yield pendente.decode("utf-8", "replace")
+
+
+def seguir_arquivo(caminho: str, tamanho_bloco: int = TAMANHO_BLOCO_PADRAO,
+                   intervalo: float = INTERVALO_SEGUIR, parar=None):
+    """
+    Lê um log do início e continua lendo o que for acrescentado (como tail -F).
+
+    Uma linha só é entregue depois da sua quebra de linha. Se o arquivo for
+    truncado (logrotate com copytruncate), a leitura recomeça do início; se
+    for trocado por outro (rotação por renomeação), o antigo é lido até o fim
+    e o novo é aberto.
+
+    Args:
+        caminho (str): Caminho do log (texto puro)
+        tamanho_bloco (int): Bytes lidos por vez
+        intervalo (float): Segundos de espera quando não há nada novo
+        parar: Função sem argumentos consultada a cada espera; quando
+            retornar True a leitura termina (padrão: segue para sempre)
+
+    Yields:
+        str: Blocos de linhas completas, como em ler_blocos
+    """
+    arquivo = open(caminho, "rb", buffering=0)
+    pendente = b""
+    try:
+        while True:
+            dados = arquivo.read(tamanho_bloco)
+            if dados:
+                bloco, pendente = _separar_linhas(pendente, dados)
+                if bloco is not None:
+                    yield bloco
+                continue
+
+            try:
+                trocado = os.stat(caminho).st_ino != os.fstat(arquivo.fileno()).st_ino
+            except FileNotFoundError:  # entre a renomeação e a criação do novo
+                trocado = False
+            if trocado:
+                if pendente:
+                    yield pendente.decode("utf-8", "replace")
+                    pendente = b""
+                arquivo.close()
+                arquivo = open(caminho, "rb", buffering=0)
+                continue
+
+            if os.fstat(arquivo.fileno()).st_size < arquivo.tell():
+                arquivo.seek(0)
+                pendente = b""
+                continue
+
+            if parar is not None and parar():
+                break
+            time.sleep(intervalo)
+    finally:
+        arquivo.close()
+
+
+class Classificador:
+    """
+    Classifica IPs de clientes contra a rede de origem, com cache por IP.
+
+    Args:
+        ip_origem (str): IP de origem (IPv4 ou IPv6)
+        cidr (int): Máscara CIDR da rede de origem (0-32, ou 0-128 em IPv6)
+        limite_cache (int): IPs distintos guardados antes de esvaziar o cache
+
+    Raises:
+        ValueError: Se o IP de origem ou o CIDR forem inválidos
+    """
+
+    def __init__(self, ip_origem: str, cidr: int, limite_cache: int = LIMITE_CACHE):
+        origem, self.versao = _analisar_qualquer(ip_origem)
+        if origem == IP_INVALIDO:
+            raise ValueError(f"IP de origem inválido: {ip_origem}")
+        if not validar_cidr(cidr, versao=self.versao):
+            raise ValueError(f"CIDR inválido: {cidr}")
+
+        self.mascara = (_MASCARAS_INTEIRAS if self.versao == 4 else _MASCARAS_IPV6)[cidr]
+        self.rede = origem & self.mascara
+        self.limite_cache = limite_cache
+        self.cache = {}
+
+    def classificar(self, ip: str) -> str:
+        """Rótulo (LOCAL, REMOTO ou INVALIDO) de um IP, sem passar pelo cache."""
+        valor, versao = _analisar_qualquer(ip)
+        if valor == IP_INVALIDO:
+            return INVALIDO
+        # IPv4 mapeado em IPv6 (::ffff:a.b.c.d), comum em sockets dual-stack
+        if versao == 6 and valor >> 32 == 0xFFFF:
+            valor, versao = valor & 0xFFFFFFFF, 4
+        if versao != self.versao:
+            return REMOTO
+        return LOCAL if valor & self.mascara == self.rede else REMOTO
+
+    def classificar_bloco(self, ips) -> list:
+        """
+        Rótulos de uma lista de IPs; só os que não estão no cache são analisados.
+
+        Args:
+            ips (list): IPs em texto (um por linha do bloco)
+
+        Returns:
+            list: Rótulos na mesma ordem
+        """
+        cache = self.cache
+        distintos = set(ips)
+        novos = distintos.difference(cache)
+        if novos:
+            if len(cache) + len(novos) > self.limite_cache:
+                # O bloco inteiro precisa estar no cache, inclusive o que já estava
+                cache.clear()
+                novos = distintos
+            classificar = self.classificar
+            cache.update({ip: classificar(ip) for ip in novos})
+        return list(map(cache.__getitem__, ips))
+
+
+# Sufixo de cada rótulo no formato texto
+_SUFIXOS = {rotulo: f" {rotulo}\n" for rotulo in (LOCAL, REMOTO, INVALIDO)}
+
+
+def enriquecer_blocos(blocos, classificador: Classificador, formato: str = "texto",
+                      contagens: dict = None):
+    """
+    Gera a saída enriquecida de cada bloco de linhas.
+
+    Linhas em branco são puladas (não saem nem entram nas contagens), e o
+    "\\r" de linhas terminadas em CRLF é removido antes do rótulo.
+
+    Args:
+        blocos: Iterável de blocos (de ler_blocos ou seguir_arquivo)
+        classificador (Classificador): Rede de origem e cache de IPs
+        formato (str): "texto" (a linha original seguida de " local",
+            " remoto" ou " invalido") ou "jsonl" ({"ip", "rede", "linha"})
+        contagens (dict): Se informado, recebe as somas de "total" e de cada
+            rótulo ("local", "remoto", "invalido")
+
+    Yields:
+        str: Texto de saída de cada bloco, terminado em quebra de linha
+
+    Raises:
+        ValueError: Se o formato for inválido
+    """
+    if formato not in FORMATOS_LOG:
+        raise ValueError(f"Formato inválido: {formato} (use {', '.join(FORMATOS_LOG)})")
+
+    encontrar = PADRAO_CLIENTE.findall
+    for bloco in blocos:
+        if "\r" in bloco:
+            bloco = bloco.replace("\r\n", "\n").removesuffix("\r")
+        ips = encontrar(bloco)
+        linhas = bloco.split("\n")
+        if "" in ips:
+            # Só linhas em branco não têm o primeiro campo
+            linhas = [linha for linha, ip in zip(linhas, ips) if ip]
+            ips = [ip for ip in ips if ip]
+        rotulos = classificador.classificar_bloco(ips)
+
+        if contagens is not None:
+            contagens["total"] = contagens.get("total", 0) + len(linhas)
+            for rotulo, quantidade in Counter(rotulos).items():
+                contagens[rotulo] = contagens.get(rotulo, 0) + quantidade
+
+        if formato == "texto":
+            # Intercala linhas e sufixos sem criar uma string nova por linha
+            partes = [None] * (2 * len(linhas))
+            partes[::2] = linhas
+            partes[1::2] = map(_SUFIXOS.__getitem__, rotulos)
+            yield "".join(partes)
+        else:
+            dumps = json.dumps
+            yield "".join([f'{{"ip": {dumps(ip)}, "rede": "{rotulo}", "linha": {dumps(linha)}}}\n'
+                           for ip, rotulo, linha in zip(ips, rotulos, linhas)])
+
+
+def enriquecer_log(blocos, saida, ip_origem: str, cidr: int, formato: str = "texto",
+                   descarregar: bool = False) -> dict:
+    """
+    Enriquece um log inteiro, escrevendo bloco a bloco.
+
+    Args:
+        blocos: Iterável de blocos (de ler_blocos ou seguir_arquivo)
+        saida: Arquivo de texto aberto (ou sys.stdout)
+        ip_origem (str): IP de origem
+        cidr (int): Máscara CIDR
+        formato (str): "texto" ou "jsonl"
+        descarregar (bool): Chama saida.flush() após cada bloco (para seguir
+            um arquivo e entregar as linhas assim que chegam)
+
+    Returns:
+        dict: Contagens "total", "local", "remoto" e "invalido"
+
+    Raises:
+        ValueError: Se o IP de origem, o CIDR ou o formato forem inválidos
+
+    Exemplo:
+        >>> import io
+        >>> saida = io.StringIO()
+        >>> enriquecer_log(["192.168.1.7 - - [x] \\"GET / HTTP/1.1\\" 200 5"], saida, "192.168.1.10", 24)
+        {'total': 1, 'local': 1, 'remoto': 0, 'invalido': 0}
+        >>> saida.getvalue()
+        '192.168.1.7 - - [x] "GET / HTTP/1.1" 200 5 local\\n'
+    """
+    classificador = Classificador(ip_origem, cidr)
+    contagens = {"total": 0, LOCAL: 0, REMOTO: 0, INVALIDO: 0}
+    for texto in enriquecer_blocos(blocos, classificador, formato, contagens):
+        saida.write(texto)
+        if descarregar:
+            saida.flush()
+    return contagens
+
+
+def main(argv=None) -> int:
+    """Enriquece um log de acesso (ou '-' para stdin) e escreve em stdout."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Marca o IP do cliente de cada linha de um log de acesso como local ou remoto."
+    )
+    parser.add_argument("entrada", help="Log de acesso (texto puro ou gzip), ou '-' para stdin")
+    parser.add_argument("--origem", default="192.168.1.10",
+                        help="IP de origem que define a rede local (padrão: 192.168.1.10)")
+    parser.add_argument("--cidr", type=int, required=True, help="Máscara CIDR da rede local")
+    parser.add_argument("--formato", choices=FORMATOS_LOG, default="texto",
+                        help="texto (linha + rótulo) ou jsonl (padrão: texto)")
+    parser.add_argument("--seguir", "--follow", action="store_true",
+                        help="Continua lendo o que for acrescentado ao arquivo (como tail -F)")
+    args = parser.parse_args(argv)
+
+    if args.seguir and args.entrada == "-":
+        parser.error("--seguir precisa de um arquivo")
+
+    try:
+        if args.seguir:
+            contagens = enriquecer_log(seguir_arquivo(args.entrada), sys.stdout, args.origem,
+                                       args.cidr, args.formato, descarregar=True)
+        elif args.entrada == "-":
+            contagens = enriquecer_log(ler_blocos(sys.stdin.buffer), sys.stdout, args.origem,
+                                       args.cidr, args.formato)
+        else:
+            with abrir_log(args.entrada) as arquivo:
+                contagens = enriquecer_log(ler_blocos(arquivo), sys.stdout, args.origem,
+                                           args.cidr, args.formato)
+    except ValueError as erro:
+        parser.error(str(erro))
+    except OSError as erro:
+        print(f"❌ ERRO: {erro}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+
+    print(f"Linhas: {contagens['total']} | Locais: {contagens[LOCAL]} | "
+          f"Remotas: {contagens[REMOTO]} | IP inválido: {contagens[INVALIDO]}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""
+Mapas de calor do espaço de endereçamento IPv4
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo transforma um bloco de endereços em uma grade 256 x 256 em que
+cada célula informa a fração dos seus endereços que está coberta por um
+conjunto de intervalos:
+- Em uma /16 cada célula é um endereço (linha = 3º octeto, coluna = 4º)
+- Em uma /8 cada célula resume uma /24 (linha = 2º octeto, coluna = 3º)
+
+Tudo é calculado de uma vez com NumPy a partir dos intervalos [início, fim)
+(de um IPSet, ou da rede do IP de origem): as células totalmente cobertas
+vêm de um vetor de diferenças acumulado (cumsum) e as parcialmente cobertas
+das pontas de cada intervalo, sem percorrer endereço por endereço.
+"""
+
+from core.conjunto_ip import IPSet
+from core.enderecos import RedeIPv4
+from core.network_utils import _MASCARAS_INTEIRAS, _numpy, ip_para_inteiro, validar_cidr
+
+
+# A grade tem LADO x LADO células
+LADO = 256
+NUM_CELULAS = LADO * LADO
+
+
+def _exigir_numpy():
+    """NumPy (importado sob demanda), obrigatório para os mapas."""
+    np = _numpy()
+    if np is None:
+        raise RuntimeError("NumPy não está instalado; os mapas de calor precisam dele")
+    return np
+
+
+def ocupacao_por_celula(inicios, fins, base: int, tamanho_celula: int,
+                        num_celulas: int = NUM_CELULAS):
+    """
+    Conta quantos endereços de cada célula estão cobertos pelos intervalos.
+
+    Args:
+        inicios: Inícios dos intervalos (inclusivos), disjuntos entre si
+        fins: Fins dos intervalos (exclusivos)
+        base (int): Primeiro endereço da primeira célula
+        tamanho_celula (int): Endereços por célula
+        num_celulas (int): Quantidade de células
+
+    Returns:
+        numpy.ndarray de int64 com a contagem de cada célula
+
+    Raises:
+        RuntimeError: Se o NumPy não estiver instalado
+    """
+    np = _exigir_numpy()
+    limite = num_celulas * tamanho_celula
+
+    # Posições relativas à base, recortadas ao bloco
+    inicios = np.clip(np.asarray(inicios, dtype=np.int64) - base, 0, limite)
+    fins = np.clip(np.asarray(fins, dtype=np.int64) - base, 0, limite)
+    nao_vazios = inicios < fins
+    inicios, fins = inicios[nao_vazios], fins[nao_vazios]
+
+    contagem = np.zeros(num_celulas + 1, dtype=np.int64)
+
+    # Células inteiramente cobertas: [primeira_cheia, fim_cheias)
+    primeira_cheia = -(-inicios // tamanho_celula)
+    fim_cheias = fins // tamanho_celula
+    tem_cheias = primeira_cheia < fim_cheias
+    diferencas = np.zeros(num_celulas + 1, dtype=np.int64)
+    np.add.at(diferencas, primeira_cheia[tem_cheias], tamanho_celula)
+    np.add.at(diferencas, fim_cheias[tem_cheias], -tamanho_celula)
+    contagem += np.cumsum(diferencas)
+
+    # Intervalos que começam e terminam dentro da mesma célula, sem enchê-la
+    celula_inicio = inicios // tamanho_celula
+    mesma_celula = (celula_inicio == (fins - 1) // tamanho_celula) & ~tem_cheias
+    np.add.at(contagem, celula_inicio[mesma_celula],
+              (fins - inicios)[mesma_celula])
+
+    # Pontas parciais dos demais: cabeça até a primeira cheia, cauda após a última
+    outros = ~mesma_celula
+    cabeca = outros & (inicios % tamanho_celula != 0)
+    np.add.at(contagem, celula_inicio[cabeca],
+              (primeira_cheia * tamanho_celula - inicios)[cabeca])
+    cauda = outros & (fins % tamanho_celula != 0)
+    np.add.at(contagem, fim_cheias[cauda], (fins - fim_cheias * tamanho_celula)[cauda])
+
+    return contagem[:num_celulas]
+
+
+def _bloco_do_mapa(rede) -> RedeIPv4:
+    """Valida o bloco exibido: precisa ter pelo menos 65536 endereços (/16 ou maior)."""
+    if not isinstance(rede, RedeIPv4):
+        rede = RedeIPv4(rede)
+    if rede.cidr > 16:
+        raise ValueError(f"O mapa precisa de um bloco /16 ou maior: {rede}")
+    return rede
+
+
+def mapa_de_calor(rede, intervalos):
+    """
+    Grade 256 x 256 com a fração coberta de cada célula do bloco.
+
+    Args:
+        rede: Bloco exibido (RedeIPv4 ou "a.b.c.d/n", de /0 a /16). Cada
+            célula tem num_enderecos / 65536 endereços
+        intervalos: Iterável de tuplas (inicio, fim) com fim exclusivo,
+            disjuntas entre si
+
+    Returns:
+        numpy.ndarray float64 de forma (256, 256), com valores entre 0 e 1
+
+    Raises:
+        ValueError: Se o bloco for menor que /16
+        RuntimeError: Se o NumPy não estiver instalado
+    """
+    _exigir_numpy()
+    rede = _bloco_do_mapa(rede)
+    tamanho_celula = rede.num_enderecos // NUM_CELULAS
+
+    pares = list(intervalos)
+    inicios = [inicio for inicio, _ in pares]
+    fins = [fim for _, fim in pares]
+    contagem = ocupacao_por_celula(inicios, fins, int(rede.rede), tamanho_celula)
+    return (contagem / tamanho_celula).reshape(LADO, LADO)
+
+
+def mapa_mesma_rede(rede, ip_origem, cidr: int):
+    """
+    Mapa das células na mesma rede /cidr do IP de origem.
+
+    Args:
+        rede: Bloco exibido (de /0 a /16)
+        ip_origem: IP de origem (str ou int)
+        cidr (int): Máscara CIDR usada na comparação
+
+    Returns:
+        numpy.ndarray float64 (256, 256); em uma /8, uma /24 parcialmente na
+        rede da origem (CIDR acima de 24) tem fração entre 0 e 1
+
+    Exemplo:
+        >>> mapa = mapa_mesma_rede("192.168.0.0/16", "192.168.1.10", 24)
+        >>> int(mapa.sum()), bool(mapa[1].all())
+        (256, True)
+    """
+    if not validar_cidr(cidr):
+        raise ValueError(f"CIDR inválido: {cidr}")
+    origem = ip_origem if isinstance(ip_origem, int) else ip_para_inteiro(ip_origem)
+    inicio = origem & _MASCARAS_INTEIRAS[cidr]
+    return mapa_de_calor(rede, [(inicio, inicio + (1 << (32 - cidr)))])
+
+
+def mapa_cobertura(rede, conjunto: IPSet):
+    """
+    Mapa das células cobertas por um conjunto de prefixos.
+
+    Args:
+        rede: Bloco exibido (de /0 a /16)
+        conjunto (IPSet): Prefixos/endereços a destacar
+
+    Returns:
+        numpy.ndarray float64 (256, 256) com a fração coberta de cada célula
+    """
+    return mapa_de_calor(rede, ((int(inicio), int(fim) + 1)
+                                for inicio, fim in conjunto.intervalos()))
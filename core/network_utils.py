@@ -7,17 +7,222 @@ Este módulo contém funções para:
 - Converter máscara CIDR para formato decimal
 - Verificar se dois IPs estão na mesma rede
 - Validar endereços IP
+- Verificar em lote (arrays de inteiros) se pares de IPs estão na mesma rede
+- Descrever uma sub-rede (rede, broadcast, hosts, wildcard)
+- Agrupar IPs por rede (tabela hash, ou ordenação das chaves em lote)
+- Fazer o mesmo para IPv6 (inteiros de 128 bits; em lote, duas colunas uint64)
 """
 
-import re
+from typing import NamedTuple
 
 
-def validar_ip(ip: str) -> bool:
+def _numpy():
     """
-    Valida se um endereço IP está em formato válido (IPv4).
+    Importa o NumPy na primeira função em lote que precisar dele.
+
+    Consultas avulsas (uma máscara, um par de IPs) não usam NumPy, e a
+    importação dele domina o tempo de partida do CLI de uma chamada só.
+
+    Returns:
+        O módulo numpy, ou None se não estiver instalado (as funções em lote
+        usam Python puro)
+    """
+    global np
+    try:
+        return np
+    except NameError:
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+        return np
+
+
+def __getattr__(nome):
+    # network_utils.np continua acessível (e substituível) de fora
+    if nome == "np":
+        return _numpy()
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+
+# Valor retornado por analisar_ip quando o endereço é inválido
+IP_INVALIDO = -1
+
+# Octetos em forma canônica ("0" a "255") → valor inteiro
+_OCTETOS = {str(valor): valor for valor in range(256)}
+
+
+
+class InfoPrefixo(NamedTuple):
+    """Valores pré-calculados de um tamanho de prefixo (uma linha de TABELA_PREFIXOS)."""
+    mascara_int: int
+    mascara_decimal: str
+    wildcard_decimal: str
+    num_hosts: int
+    mascara_binaria: str
+
+
+def _construir_info_prefixo(cidr: int) -> InfoPrefixo:
+    """Calcula a linha de TABELA_PREFIXOS para um CIDR (usado só na importação)."""
+    mascara = (0xFFFFFFFF << (32 - cidr)) & 0xFFFFFFFF
+    wildcard = ~mascara & 0xFFFFFFFF
+    
+    # /31 (enlaces ponto a ponto, RFC 3021) e /32 não reservam rede/broadcast
+    num_hosts = (1 << (32 - cidr)) - 2 if cidr <= 30 else 1 << (32 - cidr)
+    
+    return InfoPrefixo(
+        mascara_int=mascara,
+        mascara_decimal='.'.join(str((mascara >> d) & 255) for d in (24, 16, 8, 0)),
+        wildcard_decimal='.'.join(str((wildcard >> d) & 255) for d in (24, 16, 8, 0)),
+        num_hosts=num_hosts,
+        mascara_binaria=format(mascara, '032b'),
+    )
+
+
+# Tabela indexada pelo CIDR (0-32), construída uma única vez na importação
+TABELA_PREFIXOS = tuple(_construir_info_prefixo(cidr) for cidr in range(33))
+
+# Máscaras inteiras indexadas pelo CIDR (atalho para os laços mais quentes)
+_MASCARAS_INTEIRAS = tuple(info.mascara_int for info in TABELA_PREFIXOS)
+
+# Máscaras IPv6 (128 bits) indexadas pelo CIDR (0-128)
+_MASCARAS_IPV6 = tuple(((1 << 128) - 1) ^ ((1 << (128 - cidr)) - 1) for cidr in range(129))
+
+_UM_64 = (1 << 64) - 1
+
+# Grupos hexadecimais canônicos ("0" a "ffff") → valor; criada no primeiro uso de IPv6
+_GRUPOS_HEX = None
+
+# Caracteres aceitos em um grupo IPv6 (int(..., 16) aceitaria também "0x" e "_")
+_DIGITOS_HEX = frozenset("0123456789abcdefABCDEF")
+
+
+def analisar_ip(ip: str) -> int:
+    """
+    Valida e converte um endereço IPv4 para inteiro em uma única passada.
+    
+    Substitui a combinação validar_ip + ip_para_inteiro (regex e depois
+    split/int de novo). Cada octeto é resolvido por consulta a uma tabela
+    pré-calculada com as 256 formas canônicas ("0" a "255"), que já valida
+    o range; octetos com zeros à esquerda ("010") caem no caminho lento.
+    
+    Args:
+        ip (str): Endereço IP a ser analisado
+        
+    Returns:
+        int: Representação inteira do IP, ou IP_INVALIDO (-1) se inválido
+        
+    Exemplo:
+        >>> analisar_ip("192.168.1.1")
+        3232235777
+        >>> analisar_ip("300.1.1.1")
+        -1
+    """
+    partes = ip.split('.')
+    if len(partes) != 4:
+        return IP_INVALIDO
+    
+    a, b, c, d = partes
+    obter = _OCTETOS.get
+    a = obter(a, -1)
+    b = obter(b, -1)
+    c = obter(c, -1)
+    d = obter(d, -1)
+    if a < 0 or b < 0 or c < 0 or d < 0:
+        return _analisar_ip_lento(partes)
+    
+    return (a << 24) | (b << 16) | (c << 8) | d
+
+
+def _analisar_ip_lento(partes: list) -> int:
+    """Caminho lento de analisar_ip para octetos não canônicos (ex: "010")."""
+    valor = 0
+    for parte in partes:
+        if not (0 < len(parte) <= 3 and parte.isascii() and parte.isdigit()):
+            return IP_INVALIDO
+        octeto = int(parte)
+        if octeto > 255:
+            return IP_INVALIDO
+        valor = (valor << 8) | octeto
+    return valor
+
+
+def analisar_ipv6(ip: str) -> int:
+    """
+    Valida e converte um endereço IPv6 para inteiro de 128 bits.
+    
+    Aceita a compressão "::" e um IPv4 embutido nos últimos 32 bits
+    (ex: "::ffff:192.168.1.10"). Assim como em analisar_ip, cada grupo
+    canônico (minúsculo, sem zeros à esquerda) é resolvido por tabela;
+    os demais caem no caminho lento.
+    
+    Args:
+        ip (str): Endereço IPv6 a ser analisado
+        
+    Returns:
+        int: Representação inteira do IP, ou IP_INVALIDO (-1) se inválido
+        
+    Exemplo:
+        >>> analisar_ipv6("2001:db8::1")
+        42540766411282592856903984951653826561
+        >>> analisar_ipv6("1::2::3")
+        -1
+    """
+    global _GRUPOS_HEX
+    if _GRUPOS_HEX is None:
+        _GRUPOS_HEX = {format(valor, 'x'): valor for valor in range(65536)}
+    
+    # IPv4 embutido: converte os últimos 32 bits para dois grupos hexadecimais
+    if '.' in ip:
+        posicao = ip.rfind(':')
+        if posicao < 0:
+            return IP_INVALIDO
+        ipv4 = analisar_ip(ip[posicao + 1:])
+        if ipv4 == IP_INVALIDO:
+            return IP_INVALIDO
+        ip = f"{ip[:posicao + 1]}{ipv4 >> 16:x}:{ipv4 & 0xFFFF:x}"
+    
+    if '::' in ip:
+        esquerda, _, direita = ip.partition('::')
+        if '::' in direita:
+            return IP_INVALIDO
+        grupos_esquerda = esquerda.split(':') if esquerda else []
+        grupos_direita = direita.split(':') if direita else []
+        faltam = 8 - len(grupos_esquerda) - len(grupos_direita)
+        if faltam < 1:
+            return IP_INVALIDO
+        grupos = grupos_esquerda + ['0'] * faltam + grupos_direita
+    else:
+        grupos = ip.split(':')
+        if len(grupos) != 8:
+            return IP_INVALIDO
+    
+    obter = _GRUPOS_HEX.get
+    valor = 0
+    for grupo in grupos:
+        grupo_int = obter(grupo)
+        if grupo_int is None:
+            grupo_int = _analisar_grupo_hex_lento(grupo)
+            if grupo_int < 0:
+                return IP_INVALIDO
+        valor = (valor << 16) | grupo_int
+    return valor
+
+
+def _analisar_grupo_hex_lento(grupo: str) -> int:
+    """Caminho lento de analisar_ipv6 para grupos não canônicos (ex: "0DB8")."""
+    if not (0 < len(grupo) <= 4 and _DIGITOS_HEX.issuperset(grupo)):
+        return IP_INVALIDO
+    return int(grupo, 16)
+
+
+def validar_ip(ip: str, versao: int = 4) -> bool:
+    """
+    Valida se um endereço IP está em formato válido.
     
     Args:
         ip (str): Endereço IP a ser validado
+        versao (int): 4 (padrão), 6, ou None para aceitar as duas versões
         
     Returns:
         bool: True se o IP for válido, False caso contrário
@@ -27,28 +232,48 @@ def validar_ip(ip: str) -> bool:
         True
         >>> validar_ip("300.1.1.1")
         False
+        >>> validar_ip("2001:db8::1", versao=6)
+        True
     """
-    # Padrão regex para IPv4
-    padrao = r'^(\d{1,3})\.(\d{1,3})\.(\d{1,3})\.(\d{1,3})$'
-    match = re.match(padrao, ip)
-    
-    if not match:
-        return False
+    if versao == 4:
+        return analisar_ip(ip) != IP_INVALIDO
+    if versao == 6:
+        return analisar_ipv6(ip) != IP_INVALIDO
+    return _analisar_qualquer(ip)[0] != IP_INVALIDO
+
+
+def versao_ip(ip: str):
+    """
+    Identifica a versão de um endereço IP.
     
-    # Verifica se cada octeto está entre 0 e 255
-    for octeto in match.groups():
-        if int(octeto) > 255:
-            return False
-            
-    return True
+    Args:
+        ip (str): Endereço IP
+        
+    Returns:
+        int: 4 ou 6, ou None se o IP for inválido
+        
+    Exemplo:
+        >>> versao_ip("10.0.0.1"), versao_ip("::1"), versao_ip("abc")
+        (4, 6, None)
+    """
+    valor, versao = _analisar_qualquer(ip)
+    return None if valor == IP_INVALIDO else versao
+
 
+def _analisar_qualquer(ip: str) -> tuple:
+    """Analisa um IPv4 ou IPv6 (decidido pela presença de ':'); retorna (valor, versão)."""
+    if ':' in ip:
+        return analisar_ipv6(ip), 6
+    return analisar_ip(ip), 4
 
-def validar_cidr(cidr: int) -> bool:
+
+def validar_cidr(cidr: int, versao: int = 4) -> bool:
     """
-    Valida se o valor CIDR está no range válido (0-32).
+    Valida se o valor CIDR está no range válido (0-32, ou 0-128 para IPv6).
     
     Args:
         cidr (int): Valor CIDR a ser validado
+        versao (int): 4 (padrão) ou 6
         
     Returns:
         bool: True se o CIDR for válido, False caso contrário
@@ -58,7 +283,11 @@ def validar_cidr(cidr: int) -> bool:
         True
         >>> validar_cidr(33)
         False
+        >>> validar_cidr(64, versao=6)
+        True
     """
+    if versao == 6:
+        return 0 <= cidr <= 128
     return 0 <= cidr <= 32
 
 
@@ -84,17 +313,7 @@ def cidr_para_mascara_decimal(cidr: int) -> str:
     if not validar_cidr(cidr):
         raise ValueError("CIDR deve estar entre 0 e 32")
     
-    # Cria a máscara binária
-    mascara_binaria = '1' * cidr + '0' * (32 - cidr)
-    
-    # Converte para decimal em octetos
-    octetos = []
-    for i in range(0, 32, 8):
-        octeto_binario = mascara_binaria[i:i+8]
-        octeto_decimal = int(octeto_binario, 2)
-        octetos.append(str(octeto_decimal))
-    
-    return '.'.join(octetos)
+    return TABELA_PREFIXOS[cidr].mascara_decimal
 
 
 def ip_para_inteiro(ip: str) -> int:
@@ -102,17 +321,105 @@ def ip_para_inteiro(ip: str) -> int:
     Converte um IP em formato string para inteiro.
     
     Args:
-        ip (str): Endereço IP em formato string
+        ip (str): Endereço IPv4 em formato string
         
     Returns:
-        int: Representação inteira do IP
+        int: Representação inteira do IP (32 bits)
+        
+    Raises:
+        ValueError: Se o IP for inválido (inclusive IPv6; ver ip_para_inteiro_versao)
         
     Exemplo:
         >>> ip_para_inteiro("192.168.1.1")
         3232235777
     """
-    octetos = ip.split('.')
-    return (int(octetos[0]) << 24) + (int(octetos[1]) << 16) + (int(octetos[2]) << 8) + int(octetos[3])
+    ip_int = analisar_ip(ip)
+    if ip_int == IP_INVALIDO:
+        raise ValueError(f"IP inválido: {ip}")
+    return ip_int
+
+
+def ip_para_inteiro_versao(ip: str) -> tuple:
+    """
+    Converte um IPv4 ou IPv6 em formato string para inteiro, junto com a versão.
+    
+    Args:
+        ip (str): Endereço IPv4 ou IPv6 em formato string
+        
+    Returns:
+        tuple: (inteiro de 32 ou 128 bits, versão 4 ou 6)
+        
+    Raises:
+        ValueError: Se o IP for inválido
+        
+    Exemplo:
+        >>> ip_para_inteiro_versao("192.168.1.1")
+        (3232235777, 4)
+        >>> ip_para_inteiro_versao("::1")
+        (1, 6)
+    """
+    ip_int, versao = _analisar_qualquer(ip)
+    if ip_int == IP_INVALIDO:
+        raise ValueError(f"IP inválido: {ip}")
+    return ip_int, versao
+
+
+def inteiro_para_ip(valor: int) -> str:
+    """
+    Converte um inteiro de 32 bits para IP em formato string.
+    
+    Args:
+        valor (int): Representação inteira do IP (0 a 4294967295)
+        
+    Returns:
+        str: Endereço IP no formato xxx.xxx.xxx.xxx
+        
+    Exemplo:
+        >>> inteiro_para_ip(3232235777)
+        '192.168.1.1'
+    """
+    return f"{valor >> 24}.{(valor >> 16) & 255}.{(valor >> 8) & 255}.{valor & 255}"
+
+
+def inteiro_para_ipv6(valor: int) -> str:
+    """
+    Converte um inteiro de 128 bits para IPv6 na forma canônica (RFC 5952).
+    
+    Args:
+        valor (int): Representação inteira do IPv6
+        
+    Returns:
+        str: Endereço IPv6 com a maior sequência de grupos zero comprimida
+            (IPv4 mapeado, ::ffff:0:0/96, sai com os últimos 32 bits em decimal)
+        
+    Exemplo:
+        >>> inteiro_para_ipv6(42540766411282592856903984951653826561)
+        '2001:db8::1'
+    """
+    if valor >> 32 == 0xFFFF:
+        return f"::ffff:{inteiro_para_ip(valor & 0xFFFFFFFF)}"
+    
+    grupos = [(valor >> deslocamento) & 0xFFFF for deslocamento in range(112, -1, -16)]
+    
+    # Maior sequência de zeros (pelo menos 2 grupos; a primeira em caso de empate)
+    melhor_inicio, melhor_tamanho = -1, 1
+    inicio = tamanho = 0
+    for i, grupo in enumerate(grupos):
+        if grupo == 0:
+            if tamanho == 0:
+                inicio = i
+            tamanho += 1
+            if tamanho > melhor_tamanho:
+                melhor_inicio, melhor_tamanho = inicio, tamanho
+        else:
+            tamanho = 0
+    
+    texto = [format(grupo, 'x') for grupo in grupos]
+    if melhor_inicio < 0:
+        return ':'.join(texto)
+    esquerda = ':'.join(texto[:melhor_inicio])
+    direita = ':'.join(texto[melhor_inicio + melhor_tamanho:])
+    return f"{esquerda}::{direita}"
 
 
 def calcular_rede(ip: str, cidr: int) -> int:
@@ -120,21 +427,28 @@ def calcular_rede(ip: str, cidr: int) -> int:
     Calcula o endereço de rede dado um IP e CIDR.
     
     Args:
-        ip (str): Endereço IP
+        ip (str): Endereço IP (IPv4, ou IPv6 com CIDR até 128)
         cidr (int): Máscara CIDR
         
     Returns:
         int: Endereço de rede em formato inteiro
+        
+    Raises:
+        ValueError: Se o IP ou o CIDR forem inválidos
     """
-    ip_int = ip_para_inteiro(ip)
-    mascara_int = (0xFFFFFFFF << (32 - cidr)) & 0xFFFFFFFF
-    return ip_int & mascara_int
+    ip_int, versao = ip_para_inteiro_versao(ip)
+    if not validar_cidr(cidr, versao):
+        raise ValueError(f"CIDR inválido: {cidr}")
+    mascaras = _MASCARAS_IPV6 if versao == 6 else _MASCARAS_INTEIRAS
+    return ip_int & mascaras[cidr]
 
 
 def ips_mesma_rede(ip_origem: str, ip_destino: str, cidr: int) -> bool:
     """
     Verifica se dois IPs estão na mesma rede.
     
+    Os dois IPs devem ser da mesma versão; para IPv6 o CIDR vai até 128.
+    
     Args:
         ip_origem (str): IP de origem
         ip_destino (str): IP de destino
@@ -143,22 +457,541 @@ def ips_mesma_rede(ip_origem: str, ip_destino: str, cidr: int) -> bool:
     Returns:
         bool: True se estiverem na mesma rede, False caso contrário
         
+    Raises:
+        ValueError: Se algum IP ou o CIDR forem inválidos, ou se as versões
+            dos IPs forem diferentes
+        
     Exemplo:
         >>> ips_mesma_rede("192.168.1.1", "192.168.1.100", 24)
         True
         >>> ips_mesma_rede("192.168.1.1", "192.168.2.1", 24)
         False
+        >>> ips_mesma_rede("2001:db8::1", "2001:db8::ffff", 64)
+        True
     """
-    if not validar_ip(ip_origem):
+    if ':' in ip_origem or ':' in ip_destino:
+        return _ipv6_mesma_rede(ip_origem, ip_destino, cidr)
+    
+    origem_int = analisar_ip(ip_origem)
+    if origem_int == IP_INVALIDO:
+        raise ValueError(f"IP de origem inválido: {ip_origem}")
+    
+    destino_int = analisar_ip(ip_destino)
+    if destino_int == IP_INVALIDO:
+        raise ValueError(f"IP de destino inválido: {ip_destino}")
+    
+    if not validar_cidr(cidr):
+        raise ValueError(f"CIDR inválido: {cidr}")
+    
+    return (origem_int ^ destino_int) & _MASCARAS_INTEIRAS[cidr] == 0
+
+
+def _ipv6_mesma_rede(ip_origem: str, ip_destino: str, cidr: int) -> bool:
+    """Versão de ips_mesma_rede para quando algum dos IPs é IPv6."""
+    origem_int, versao_origem = _analisar_qualquer(ip_origem)
+    if origem_int == IP_INVALIDO:
         raise ValueError(f"IP de origem inválido: {ip_origem}")
     
-    if not validar_ip(ip_destino):
+    destino_int, versao_destino = _analisar_qualquer(ip_destino)
+    if destino_int == IP_INVALIDO:
         raise ValueError(f"IP de destino inválido: {ip_destino}")
     
+    if versao_origem != versao_destino:
+        raise ValueError(f"Versões de IP diferentes: {ip_origem} e {ip_destino}")
+    
+    if not validar_cidr(cidr, versao=6):
+        raise ValueError(f"CIDR inválido: {cidr}")
+    
+    return (origem_int ^ destino_int) & _MASCARAS_IPV6[cidr] == 0
+
+
+def descrever_rede(ip: str, cidr: int) -> dict:
+    """
+    Descreve a sub-rede à qual um IP pertence dado o CIDR.
+    
+    Todos os campos saem de operações inteiras sobre o IP e a linha do CIDR
+    em TABELA_PREFIXOS; nenhuma string binária é montada por chamada.
+    
+    Args:
+        ip (str): Endereço IP
+        cidr (int): Máscara CIDR
+        
+    Returns:
+        dict: Campos "ip", "cidr", "mascara", "mascara_binaria", "wildcard",
+            "rede", "broadcast", "primeiro_host", "ultimo_host",
+            "num_enderecos" e "num_hosts"
+        
+    Raises:
+        ValueError: Se o IP ou o CIDR forem inválidos
+        
+    Exemplo:
+        >>> info = descrever_rede("192.168.1.10", 24)
+        >>> info["rede"], info["broadcast"], info["num_hosts"]
+        ('192.168.1.0', '192.168.1.255', 254)
+    """
+    if ':' in ip:
+        return _descrever_rede_ipv6(ip, cidr)
+    
+    ip_int = analisar_ip(ip)
+    if ip_int == IP_INVALIDO:
+        raise ValueError(f"IP inválido: {ip}")
+    
     if not validar_cidr(cidr):
         raise ValueError(f"CIDR inválido: {cidr}")
     
-    rede_origem = calcular_rede(ip_origem, cidr)
-    rede_destino = calcular_rede(ip_destino, cidr)
+    info = TABELA_PREFIXOS[cidr]
+    rede = ip_int & info.mascara_int
+    broadcast = rede | (~info.mascara_int & 0xFFFFFFFF)
+    
+    # Em /31 e /32 todos os endereços são utilizáveis como host
+    if cidr <= 30:
+        primeiro_host, ultimo_host = rede + 1, broadcast - 1
+    else:
+        primeiro_host, ultimo_host = rede, broadcast
+    
+    return {
+        "ip": inteiro_para_ip(ip_int),
+        "cidr": cidr,
+        "mascara": info.mascara_decimal,
+        "mascara_binaria": info.mascara_binaria,
+        "wildcard": info.wildcard_decimal,
+        "rede": inteiro_para_ip(rede),
+        "broadcast": inteiro_para_ip(broadcast),
+        "primeiro_host": inteiro_para_ip(primeiro_host),
+        "ultimo_host": inteiro_para_ip(ultimo_host),
+        "num_enderecos": 1 << (32 - cidr),
+        "num_hosts": info.num_hosts,
+    }
+
+
+def _descrever_rede_ipv6(ip: str, cidr: int) -> dict:
+    """
+    Versão de descrever_rede para IPv6, com as mesmas chaves.
+    
+    IPv6 não tem broadcast: o campo traz o último endereço do bloco, e todos
+    os endereços contam como hosts. "mascara_binaria" vem agrupada de 16 em
+    16 bits, e "wildcard" é a máscara invertida na notação IPv6.
+    """
+    ip_int = analisar_ipv6(ip)
+    if ip_int == IP_INVALIDO:
+        raise ValueError(f"IP inválido: {ip}")
+    
+    if not validar_cidr(cidr, versao=6):
+        raise ValueError(f"CIDR inválido: {cidr}")
+    
+    mascara = _MASCARAS_IPV6[cidr]
+    wildcard = mascara ^ ((1 << 128) - 1)
+    rede = ip_int & mascara
+    ultimo = rede | wildcard
+    binario = f"{mascara:0128b}"
+    
+    return {
+        "ip": inteiro_para_ipv6(ip_int),
+        "cidr": cidr,
+        "mascara": inteiro_para_ipv6(mascara),
+        "mascara_binaria": ':'.join(binario[i:i + 16] for i in range(0, 128, 16)),
+        "wildcard": inteiro_para_ipv6(wildcard),
+        "rede": inteiro_para_ipv6(rede),
+        "broadcast": inteiro_para_ipv6(ultimo),
+        "primeiro_host": inteiro_para_ipv6(rede),
+        "ultimo_host": inteiro_para_ipv6(ultimo),
+        "num_enderecos": 1 << (128 - cidr),
+        "num_hosts": 1 << (128 - cidr),
+    }
+
+
+def agrupar_por_rede(ips, cidr: int) -> dict:
+    """
+    Agrupa IPs pela rede à qual pertencem dado o CIDR.
+    
+    Substitui a comparação de todos os pares com ips_mesma_rede (O(n²), com
+    duas conversões por chamada): a rede de cada IP é calculada uma única
+    vez, como em calcular_rede, e serve de chave em uma tabela hash.
+    
+    Args:
+        ips: Iterável de IPs em str (IPv4, ou IPv6 com CIDR até 128)
+        cidr (int): Máscara CIDR
+        
+    Returns:
+        dict: Endereço de rede (str) -> lista dos IPs dessa rede na ordem de
+            entrada; as redes ficam na ordem em que apareceram
+        
+    Raises:
+        ValueError: Se algum IP ou o CIDR forem inválidos
+        
+    Exemplo:
+        >>> agrupar_por_rede(["192.168.1.10", "10.0.0.1", "192.168.1.99"], 24)
+        {'192.168.1.0': ['192.168.1.10', '192.168.1.99'], '10.0.0.0': ['10.0.0.1']}
+    """
+    if not validar_cidr(cidr, versao=6):
+        raise ValueError(f"CIDR inválido: {cidr}")
+    mascara = _MASCARAS_INTEIRAS[cidr] if cidr <= 32 else None
+    
+    # Chaves: rede IPv4 como int; rede IPv6 como (int, 6), para não colidirem
+    grupos = {}
+    analisar = analisar_ip
+    for ip in ips:
+        valor = analisar(ip)
+        if valor != IP_INVALIDO and mascara is not None:
+            chave = valor & mascara
+        elif ':' in ip:
+            chave = (calcular_rede(ip, cidr), 6)
+        elif valor == IP_INVALIDO:
+            raise ValueError(f"IP inválido: {ip}")
+        else:
+            raise ValueError(f"CIDR inválido: {cidr}")
+        
+        grupo = grupos.get(chave)
+        if grupo is None:
+            grupos[chave] = [ip]
+        else:
+            grupo.append(ip)
+    
+    return {(inteiro_para_ip(chave) if isinstance(chave, int) else inteiro_para_ipv6(chave[0])): membros
+            for chave, membros in grupos.items()}
+
+
+def analisar_ips_lote(ips):
+    """
+    Converte muitos IPs em texto para inteiros de uma vez, sem exceções.
+    
+    É a porta de entrada das funções em lote para dados vindos de arquivos
+    (CSV, listas): IPs inválidos viram IP_INVALIDO (-1) em vez de
+    interromper a conversão, e podem ser separados com uma máscara.
+    
+    Args:
+        ips: Iterável de strings (espaços nas pontas são ignorados)
+        
+    Returns:
+        numpy.ndarray de int64 (com NumPy) ou list[int] (sem NumPy), com
+        IP_INVALIDO nas posições inválidas
+        
+    Exemplo:
+        >>> list(analisar_ips_lote(["10.0.0.1", "abc", " 10.0.0.2 "]))
+        [167772161, -1, 167772162]
+    """
+    np = _numpy()
+    valores = [analisar_ip(ip.strip()) if isinstance(ip, str) else IP_INVALIDO for ip in ips]
+    if np is not None:
+        return np.array(valores, dtype=np.int64)
+    return valores
+
+
+def ips_mesma_rede_lote(ips_origem, ips_destino, cidr):
+    """
+    Verifica em lote se pares de IPs (já convertidos para inteiro) estão na mesma rede.
+    
+    Versão vetorizada de ips_mesma_rede para grandes volumes: recebe os
+    endereços já em formato inteiro de 32 bits (como os de ip_para_inteiro),
+    evitando validar e converter strings a cada par. Com NumPy disponível a
+    comparação é feita em uma única passada (XOR, AND com a máscara e
+    comparação com zero); sem NumPy usa um laço em Python puro.
+    
+    Args:
+        ips_origem: Inteiro único ou sequência/array uint32 de IPs de origem
+        ips_destino: Inteiro único ou sequência/array uint32 de IPs de destino
+        cidr: Máscara CIDR única (int) ou sequência/array com uma por linha
+        
+    Returns:
+        numpy.ndarray de bool (com NumPy) ou list[bool] (sem NumPy)
+        
+    Raises:
+        ValueError: Se algum CIDR estiver fora do range 0-32, algum IP fora
+            do range de 32 bits ou os tamanhos das sequências forem diferentes
+        
+    Exemplo:
+        >>> origem = ip_para_inteiro("192.168.1.10")
+        >>> destinos = [ip_para_inteiro("192.168.1.100"), ip_para_inteiro("10.0.0.1")]
+        >>> list(ips_mesma_rede_lote(origem, destinos, 24))
+        [True, False]
+    """
+    np = _numpy()
+    if np is not None:
+        return _ips_mesma_rede_lote_numpy(ips_origem, ips_destino, cidr)
+    return _ips_mesma_rede_lote_python(ips_origem, ips_destino, cidr)
+
+
+def calcular_rede_lote(ips, cidr):
+    """
+    Calcula em lote o endereço de rede de IPs já convertidos para inteiro.
+    
+    Versão vetorizada de calcular_rede: aceita qualquer sequência de
+    inteiros de 32 bits, inclusive arrays NumPy e memoryviews (por exemplo,
+    a visão de um arquivo binário mapeado em memória), sem cópia prévia.
+    
+    Args:
+        ips: Sequência ou array uint32 de IPs em formato inteiro
+        cidr: Máscara CIDR única (int) ou sequência/array com uma por linha
+        
+    Returns:
+        numpy.ndarray de uint32 (com NumPy) ou list[int] (sem NumPy)
+        
+    Raises:
+        ValueError: Se algum CIDR estiver fora do range 0-32, algum IP fora
+            do range de 32 bits ou os tamanhos das sequências forem diferentes
+        
+    Exemplo:
+        >>> [inteiro_para_ip(int(r)) for r in calcular_rede_lote([ip_para_inteiro("10.1.2.3")], 16)]
+        ['10.1.0.0']
+    """
+    np = _numpy()
+    if np is not None:
+        ips = _uint32_numpy(ips)
+        mascara = _mascaras_numpy(cidr)
+        try:
+            return ips & mascara
+        except ValueError:
+            raise ValueError("Sequências de IPs e CIDRs devem ter o mesmo tamanho")
+    
+    if len(ips) and not (0 <= min(ips) and max(ips) <= 0xFFFFFFFF):
+        raise ValueError("IPs devem ser inteiros entre 0 e 4294967295")
+    
+    if isinstance(cidr, int):
+        if not validar_cidr(cidr):
+            raise ValueError(f"CIDR inválido: {cidr}")
+        mascara = _MASCARAS_INTEIRAS[cidr]
+        return [ip & mascara for ip in ips]
+    
+    if len(cidr) != len(ips):
+        raise ValueError("Sequências de IPs e CIDRs devem ter o mesmo tamanho")
+    if not all(validar_cidr(bits) for bits in cidr):
+        raise ValueError("CIDR deve estar entre 0 e 32")
+    return [ip & _MASCARAS_INTEIRAS[bits] for ip, bits in zip(ips, cidr)]
+
+
+class GruposRede(NamedTuple):
+    """
+    Resultado de agrupar_por_rede_lote.
+    
+    O grupo i tem a rede redes[i] e os IPs das posições
+    ordem[fronteiras[i]:fronteiras[i + 1]] da entrada.
+    """
+    redes: object
+    ordem: object
+    fronteiras: object
+
+
+def agrupar_por_rede_lote(ips, cidr: int) -> GruposRede:
+    """
+    Agrupa em lote IPs já convertidos para inteiro pela rede de cada um.
+    
+    Versão vetorizada de agrupar_por_rede: calcula as redes com
+    calcular_rede_lote e ordena as chaves uma vez. Com NumPy, rede e posição
+    são juntadas em um único uint64 (rede nos 32 bits altos), o que torna
+    uma ordenação simples equivalente a uma estável e bem mais rápida que
+    argsort; sem NumPy usa sorted.
+    
+    Args:
+        ips: Sequência ou array uint32 de IPs em formato inteiro
+        cidr (int): Máscara CIDR (0-32)
+        
+    Returns:
+        GruposRede: redes em ordem crescente (uint32), ordem (posições na
+            entrada, agrupadas por rede e na ordem original dentro de cada
+            grupo) e fronteiras (len(redes) + 1 posições em ordem), como
+            arrays NumPy (com NumPy) ou listas (sem NumPy)
+        
+    Raises:
+        ValueError: Se o CIDR for inválido
+        
+    Exemplo:
+        >>> ips = [ip_para_inteiro(ip) for ip in ("10.0.1.5", "10.0.0.1", "10.0.1.7")]
+        >>> grupos = agrupar_por_rede_lote(ips, 24)
+        >>> [inteiro_para_ip(int(rede)) for rede in grupos.redes]
+        ['10.0.0.0', '10.0.1.0']
+        >>> list(grupos.ordem[grupos.fronteiras[1]:grupos.fronteiras[2]])
+        [0, 2]
+    """
+    np = _numpy()
+    if not isinstance(cidr, int) or not validar_cidr(cidr):
+        raise ValueError(f"CIDR inválido: {cidr}")
+    
+    redes = calcular_rede_lote(ips, cidr)
+    quantidade = len(redes)
+    
+    if np is None:
+        ordem = sorted(range(quantidade), key=redes.__getitem__)
+        ordenadas = [redes[posicao] for posicao in ordem]
+        inicios = [posicao for posicao in range(quantidade)
+                   if posicao == 0 or ordenadas[posicao] != ordenadas[posicao - 1]]
+        return GruposRede([ordenadas[inicio] for inicio in inicios], ordem,
+                          inicios + [quantidade])
+    
+    if quantidade > 0xFFFFFFFF:
+        ordem = np.argsort(redes, kind="stable")
+        ordenadas = redes[ordem]
+    else:
+        chaves = redes.astype(np.uint64) << np.uint64(32)
+        chaves |= np.arange(quantidade, dtype=np.uint64)
+        chaves.sort()
+        ordem = (chaves & np.uint64(0xFFFFFFFF)).astype(np.int64)
+        ordenadas = (chaves >> np.uint64(32)).astype(np.uint32)
+    
+    if not quantidade:
+        return GruposRede(ordenadas, ordem, np.zeros(1, dtype=np.int64))
+    inicios = np.flatnonzero(ordenadas[1:] != ordenadas[:-1]) + 1
+    fronteiras = np.concatenate(([0], inicios, [quantidade])).astype(np.int64)
+    return GruposRede(ordenadas[fronteiras[:-1]], ordem, fronteiras)
+
+
+def _mascaras_numpy(cidr):
+    """Converte um CIDR único ou um array de CIDRs nas máscaras uint32 (NumPy)."""
+    np = _numpy()
+    cidrs = np.asarray(cidr)
+    if cidrs.ndim == 0:
+        if not validar_cidr(int(cidrs)):
+            raise ValueError(f"CIDR inválido: {cidr}")
+        return np.uint32(_MASCARAS_INTEIRAS[int(cidrs)])
+    
+    if cidrs.size and (cidrs.min() < 0 or cidrs.max() > 32):
+        raise ValueError("CIDR deve estar entre 0 e 32")
+    return np.asarray(_MASCARAS_INTEIRAS, dtype=np.uint32)[cidrs]
+
+
+def _uint32_numpy(ips):
+    """
+    Converte IPs inteiros em array uint32 (NumPy), recusando valores fora de 32 bits.
+    
+    np.asarray só recusa listas de int do Python: um array de outro tipo
+    (ex: int64 de analisar_ips_lote, com IP_INVALIDO) seria truncado em silêncio.
+    """
+    np = _numpy()
+    if isinstance(ips, (np.ndarray, np.generic)) and ips.dtype != np.uint32 and ips.size:
+        if ips.min() < 0 or ips.max() > 0xFFFFFFFF:
+            raise ValueError("IPs devem ser inteiros entre 0 e 4294967295")
+    try:
+        return np.asarray(ips, dtype=np.uint32)
+    except OverflowError:
+        raise ValueError("IPs devem ser inteiros entre 0 e 4294967295")
+
+
+def _ips_mesma_rede_lote_numpy(ips_origem, ips_destino, cidr):
+    """Implementação vetorizada de ips_mesma_rede_lote usando NumPy."""
+    origem = _uint32_numpy(ips_origem)
+    destino = _uint32_numpy(ips_destino)
+    
+    mascara = _mascaras_numpy(cidr)
+    
+    try:
+        return ((origem ^ destino) & mascara) == 0
+    except ValueError:
+        raise ValueError("Sequências de IPs e CIDRs devem ter o mesmo tamanho")
+
+
+def _ips_mesma_rede_lote_python(ips_origem, ips_destino, cidr):
+    """Implementação de ips_mesma_rede_lote em Python puro (sem NumPy)."""
+    tamanhos = [len(valor) for valor in (ips_origem, ips_destino, cidr)
+                if not isinstance(valor, int)]
+    if len(set(tamanhos)) > 1:
+        raise ValueError("Sequências de IPs e CIDRs devem ter o mesmo tamanho")
+    n = tamanhos[0] if tamanhos else 1
+    
+    origens = [ips_origem] * n if isinstance(ips_origem, int) else ips_origem
+    destinos = [ips_destino] * n if isinstance(ips_destino, int) else ips_destino
+    cidrs = [cidr] * n if isinstance(cidr, int) else cidr
+    
+    resultado = []
+    for origem, destino, bits in zip(origens, destinos, cidrs):
+        if not validar_cidr(bits):
+            raise ValueError(f"CIDR inválido: {bits}")
+        if not (0 <= origem <= 0xFFFFFFFF and 0 <= destino <= 0xFFFFFFFF):
+            raise ValueError("IPs devem ser inteiros entre 0 e 4294967295")
+        resultado.append((origem ^ destino) & _MASCARAS_INTEIRAS[bits] == 0)
+    return resultado
+
+
+def ipv6_para_colunas(ips):
+    """
+    Converte IPv6 (str ou inteiro de 128 bits) em duas colunas de 64 bits.
+    
+    É a representação usada pelas funções em lote de IPv6: como não existe
+    inteiro nativo de 128 bits no NumPy, cada endereço vira a metade alta e
+    a metade baixa, e as operações de máscara são feitas nas duas colunas.
+    
+    Args:
+        ips: Sequência de IPv6 em str ou inteiro
+        
+    Returns:
+        tuple: (alto, baixo) como arrays uint64 (com NumPy) ou listas de int
+        
+    Raises:
+        ValueError: Se algum IP for inválido
+        
+    Exemplo:
+        >>> alto, baixo = ipv6_para_colunas(["2001:db8::1"])
+        >>> hex(int(alto[0])), int(baixo[0])
+        ('0x20010db800000000', 1)
+    """
+    np = _numpy()
+    alto, baixo = [], []
+    for ip in ips:
+        if isinstance(ip, int):
+            valor = ip
+            if not 0 <= valor < 1 << 128:
+                raise ValueError(f"IP fora do range de 128 bits: {ip}")
+        else:
+            valor = analisar_ipv6(ip)
+            if valor == IP_INVALIDO:
+                raise ValueError(f"IP inválido: {ip}")
+        alto.append(valor >> 64)
+        baixo.append(valor & _UM_64)
+    
+    if np is not None:
+        return np.asarray(alto, dtype=np.uint64), np.asarray(baixo, dtype=np.uint64)
+    return alto, baixo
+
+
+def ips_mesma_rede_lote_ipv6(ip_origem, alto, baixo, cidr: int):
+    """
+    Verifica em lote se IPv6 (em duas colunas de 64 bits) estão na rede da origem.
+    
+    Equivalente IPv6 de ips_mesma_rede_lote: a máscara de 128 bits é dividida
+    em metade alta e baixa, e cada endereço é comparado com duas operações
+    XOR/AND (vetorizadas com NumPy, ou em laço com inteiros Python).
+    
+    Args:
+        ip_origem: IPv6 de origem (str ou inteiro de 128 bits)
+        alto: Metades altas dos destinos (de ipv6_para_colunas)
+        baixo: Metades baixas dos destinos (de ipv6_para_colunas)
+        cidr (int): Máscara CIDR (0-128)
+        
+    Returns:
+        numpy.ndarray de bool (com NumPy) ou list[bool] (sem NumPy)
+        
+    Raises:
+        ValueError: Se a origem ou o CIDR forem inválidos, ou as colunas
+            tiverem tamanhos diferentes
+        
+    Exemplo:
+        >>> alto, baixo = ipv6_para_colunas(["2001:db8::1", "2001:db9::1"])
+        >>> list(ips_mesma_rede_lote_ipv6("2001:db8::ffff", alto, baixo, 32))
+        [True, False]
+    """
+    np = _numpy()
+    if isinstance(ip_origem, int):
+        origem = ip_origem
+        if not 0 <= origem < 1 << 128:
+            raise ValueError(f"IP de origem fora do range de 128 bits: {ip_origem}")
+    else:
+        origem = analisar_ipv6(ip_origem)
+        if origem == IP_INVALIDO:
+            raise ValueError(f"IP de origem inválido: {ip_origem}")
+    
+    if not validar_cidr(cidr, versao=6):
+        raise ValueError(f"CIDR inválido: {cidr}")
+    
+    if len(alto) != len(baixo):
+        raise ValueError("Colunas alta e baixa devem ter o mesmo tamanho")
+    
+    mascara = _MASCARAS_IPV6[cidr]
+    mascara_alta, mascara_baixa = mascara >> 64, mascara & _UM_64
+    rede_alta, rede_baixa = (origem >> 64) & mascara_alta, origem & mascara_baixa
+    
+    if np is not None:
+        alto = np.asarray(alto, dtype=np.uint64)
+        baixo = np.asarray(baixo, dtype=np.uint64)
+        return (((alto & np.uint64(mascara_alta)) == np.uint64(rede_alta))
+                & ((baixo & np.uint64(mascara_baixa)) == np.uint64(rede_baixa)))
     
-    return rede_origem == rede_destino
\ No newline at end of file
+    return [a & mascara_alta == rede_alta and b & mascara_baixa == rede_baixa
+            for a, b in zip(alto, baixo)]
@@ -0,0 +1,238 @@
+"""
+Classificação paralela de arquivos grandes de IPs
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo divide um arquivo de IPs (um por linha) em fatias de bytes
+alinhadas ao início de linha e classifica cada fatia em um processo separado
+(ProcessPoolExecutor), reaproveitando o processamento em blocos de
+core.processamento. Cada fatia grava sua própria saída; no final as saídas
+são concatenadas em ordem (ou mantidas separadas) e o relatório traz a taxa
+de cada processo trabalhador.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from core.formato_binario import eh_arquivo_binario
+from core.network_utils import IP_INVALIDO, analisar_ip, validar_cidr
+from core.processamento import (
+    CABECALHO_CSV,
+    FORMATOS,
+    acumular_contagens,
+    classificar_bloco,
+    formatar_resultados,
+)
+
+# Bytes lidos por vez dentro de uma fatia
+TAMANHO_LEITURA = 8 * 1024 * 1024
+
+# Fatias por trabalhador (mais fatias equilibram melhor a carga)
+FATIAS_POR_TRABALHADOR = 4
+
+
+def dividir_em_fatias(caminho: str, num_fatias: int) -> list:
+    """
+    Divide um arquivo em intervalos de bytes que começam e terminam em
+    fronteiras de linha.
+
+    Args:
+        caminho (str): Arquivo de entrada
+        num_fatias (int): Quantidade desejada de fatias
+
+    Returns:
+        list: Tuplas (inicio, fim) com fim exclusivo, sem fatias vazias
+    """
+    tamanho = os.path.getsize(caminho)
+    if tamanho == 0:
+        return []
+
+    num_fatias = max(1, min(num_fatias, tamanho))
+    fronteiras = [0]
+
+    with open(caminho, 'rb') as arquivo:
+        for i in range(1, num_fatias):
+            posicao = tamanho * i // num_fatias
+            if posicao <= fronteiras[-1]:
+                continue
+            # Avança até o início da próxima linha
+            arquivo.seek(posicao - 1)
+            arquivo.readline()
+            posicao = arquivo.tell()
+            if fronteiras[-1] < posicao < tamanho:
+                fronteiras.append(posicao)
+
+    fronteiras.append(tamanho)
+    return list(zip(fronteiras, fronteiras[1:]))
+
+
+def _ler_blocos_de_linhas(arquivo, inicio: int, fim: int):
+    """Gera listas de linhas (str) lidas em blocos do intervalo [inicio, fim)."""
+    arquivo.seek(inicio)
+    restante = fim - inicio
+    sobra = b''
+
+    while restante > 0:
+        dados = arquivo.read(min(TAMANHO_LEITURA, restante))
+        if not dados:
+            break
+        restante -= len(dados)
+
+        dados = sobra + dados
+        corte = dados.rfind(b'\n') + 1
+        if restante > 0 and corte == 0:
+            sobra = dados
+            continue
+        if restante > 0:
+            dados, sobra = dados[:corte], dados[corte:]
+        else:
+            sobra = b''
+
+        yield dados.decode('utf-8', errors='replace').split('\n')
+
+    if sobra:
+        yield sobra.decode('utf-8', errors='replace').split('\n')
+
+
+def _processar_fatia(caminho_entrada: str, inicio: int, fim: int, origem_int: int,
+                     cidr: int, formato: str, caminho_saida: str, cabecalho: bool) -> dict:
+    """
+    Classifica uma fatia do arquivo (executado em um processo trabalhador).
+
+    Returns:
+        dict: "pid", "contagens", "bytes" e "segundos" da fatia
+    """
+    comeco = time.perf_counter()
+    contagens = {"total": 0, "mesma_rede": 0, "outra_rede": 0, "invalidos": 0}
+
+    with open(caminho_entrada, 'rb') as entrada, \
+            open(caminho_saida, 'w', encoding='utf-8', newline='') as saida:
+        if cabecalho:
+            saida.write(CABECALHO_CSV)
+        for linhas in _ler_blocos_de_linhas(entrada, inicio, fim):
+            resultados = classificar_bloco(linhas, origem_int, cidr)
+            saida.write(formatar_resultados(resultados, formato))
+            acumular_contagens(contagens, resultados)
+
+    return {
+        "pid": os.getpid(),
+        "contagens": contagens,
+        "bytes": fim - inicio,
+        "segundos": time.perf_counter() - comeco,
+    }
+
+
+def classificar_arquivo_paralelo(caminho_entrada: str, caminho_saida: str, ip_origem: str,
+                                 cidr: int, formato: str = "csv", trabalhadores: int = None,
+                                 manter_fatias: bool = False) -> dict:
+    """
+    Classifica um arquivo de IPs em paralelo, usando vários processos.
+
+    Args:
+        caminho_entrada (str): Arquivo com um IP de destino por linha
+        caminho_saida (str): Arquivo de saída. Com manter_fatias=True, é o
+            prefixo das saídas por fatia (caminho_saida.parte0000, ...)
+        ip_origem (str): IP de origem
+        cidr (int): Máscara CIDR
+        formato (str): "csv" ou "jsonl"
+        trabalhadores (int): Quantidade de processos (padrão: os.cpu_count())
+        manter_fatias (bool): Se True, não concatena as saídas das fatias
+            (cada uma recebe seu próprio cabeçalho CSV)
+
+    Returns:
+        dict: "contagens" totais, "segundos" totais, "arquivos" gerados e
+            "trabalhadores" (lista com pid, linhas, bytes, segundos e
+            linhas_por_segundo de cada processo)
+
+    Raises:
+        ValueError: Se o IP de origem, o CIDR, o formato ou o número de
+            trabalhadores forem inválidos, ou se a entrada estiver no formato
+            binário (as fatias são cortadas em quebras de linha)
+    """
+    origem_int = analisar_ip(ip_origem)
+    if origem_int == IP_INVALIDO:
+        raise ValueError(f"IP de origem inválido: {ip_origem}")
+
+    if not validar_cidr(cidr):
+        raise ValueError(f"CIDR inválido: {cidr}")
+
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato inválido: {formato} (use {', '.join(FORMATOS)})")
+
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+    if trabalhadores < 1:
+        raise ValueError("O número de trabalhadores deve ser pelo menos 1")
+
+    if eh_arquivo_binario(caminho_entrada):
+        raise ValueError(f"Arquivo binário não pode ser dividido em linhas: {caminho_entrada}")
+
+    comeco = time.perf_counter()
+    fatias = dividir_em_fatias(caminho_entrada, trabalhadores * FATIAS_POR_TRABALHADOR)
+
+    if manter_fatias:
+        pasta_temporaria = None
+        saidas = [f"{caminho_saida}.parte{i:04d}" for i in range(len(fatias))]
+    else:
+        pasta_temporaria = tempfile.mkdtemp(prefix="networktools-",
+                                            dir=os.path.dirname(os.path.abspath(caminho_saida)))
+        saidas = [os.path.join(pasta_temporaria, f"parte{i:04d}") for i in range(len(fatias))]
+
+    try:
+        with ProcessPoolExecutor(max_workers=trabalhadores) as executor:
+            futuros = [executor.submit(_processar_fatia, caminho_entrada, inicio, fim,
+                                       origem_int, cidr, formato, saida,
+                                       manter_fatias and formato == "csv")
+                       for (inicio, fim), saida in zip(fatias, saidas)]
+            relatorios = [futuro.result() for futuro in futuros]
+
+        if manter_fatias:
+            arquivos = saidas
+        else:
+            _concatenar(saidas, caminho_saida, formato)
+            arquivos = [caminho_saida]
+    finally:
+        if pasta_temporaria is not None:
+            shutil.rmtree(pasta_temporaria, ignore_errors=True)
+
+    contagens = {"total": 0, "mesma_rede": 0, "outra_rede": 0, "invalidos": 0}
+    for relatorio in relatorios:
+        for chave, valor in relatorio["contagens"].items():
+            contagens[chave] += valor
+
+    return {
+        "contagens": contagens,
+        "segundos": time.perf_counter() - comeco,
+        "arquivos": arquivos,
+        "trabalhadores": _resumir_por_trabalhador(relatorios),
+    }
+
+
+def _concatenar(partes: list, caminho_saida: str, formato: str) -> None:
+    """Junta as saídas das fatias, em ordem, no arquivo final."""
+    with open(caminho_saida, 'wb') as saida:
+        if formato == "csv":
+            saida.write(CABECALHO_CSV.encode('utf-8'))
+        for parte in partes:
+            with open(parte, 'rb') as arquivo:
+                shutil.copyfileobj(arquivo, saida, TAMANHO_LEITURA)
+
+
+def _resumir_por_trabalhador(relatorios: list) -> list:
+    """Agrupa os relatórios das fatias por processo e calcula as taxas."""
+    por_pid = {}
+    for relatorio in relatorios:
+        resumo = por_pid.setdefault(relatorio["pid"], {
+            "pid": relatorio["pid"], "fatias": 0, "linhas": 0, "bytes": 0, "segundos": 0.0})
+        resumo["fatias"] += 1
+        resumo["linhas"] += relatorio["contagens"]["total"]
+        resumo["bytes"] += relatorio["bytes"]
+        resumo["segundos"] += relatorio["segundos"]
+
+    for resumo in por_pid.values():
+        segundos = resumo["segundos"] or 1e-9
+        resumo["linhas_por_segundo"] = resumo["linhas"] / segundos
+
+    return sorted(por_pid.values(), key=lambda resumo: resumo["pid"])
@@ -0,0 +1,433 @@
+"""
+Leitura de capturas de pacotes (pcap e pcapng) e classificação do tráfego
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo lê arquivos gravados pelo tcpdump/Wireshark (libpcap clássico,
+com timestamps em micro ou nanossegundos, e pcapng) e classifica cada pacote
+IPv4 pela posição de origem e destino em relação à rede do IP de origem:
+- "local": origem e destino dentro da rede
+- "saida": origem dentro, destino fora
+- "entrada": origem fora, destino dentro
+- "externo": os dois fora
+
+O arquivo é mapeado em memória (mmap) e percorrido com struct.unpack_from
+sobre uma memoryview: nenhum pacote é copiado, só os campos lidos viram
+inteiros. Quadros Ethernet (com ou sem tags VLAN), Linux "cooked" (SLL) e IP
+puro são reconhecidos; o resto (ARP, IPv6, outros enlaces) é só contado.
+
+Para executar:
+    python -m core.pcap captura.pcap --cidr 24
+    python -m core.pcap captura.pcapng --origem 10.0.0.1 --cidr 16 --pacotes --formato jsonl
+"""
+
+import mmap
+import os
+import struct
+import sys
+
+from core.network_utils import (
+    IP_INVALIDO,
+    _MASCARAS_INTEIRAS,
+    analisar_ip,
+    inteiro_para_ip,
+    validar_cidr,
+)
+from core.processamento import FORMATOS
+
+LOCAL = "local"
+SAIDA = "saida"
+ENTRADA = "entrada"
+EXTERNO = "externo"
+
+# Índice = 2 * (origem na rede) + (destino na rede)
+CLASSES = (EXTERNO, ENTRADA, SAIDA, LOCAL)
+
+# Tipos de enlace (LINKTYPE_*) reconhecidos
+ENLACE_ETHERNET = 1
+ENLACE_RAW = 101
+ENLACE_LINUX_SLL = 113
+ENLACE_IPV4 = 228
+
+ETHERTYPE_IPV4 = 0x0800
+ETHERTYPES_VLAN = (0x8100, 0x88A8, 0x9100)
+
+# Assinatura do pcap clássico (timestamps em µs ou ns) -> ordem dos bytes
+ASSINATURAS_PCAP = {
+    b"\xd4\xc3\xb2\xa1": "<",
+    b"\xa1\xb2\xc3\xd4": ">",
+    b"\x4d\x3c\xb2\xa1": "<",
+    b"\xa1\xb2\x3c\x4d": ">",
+}
+TAMANHO_CABECALHO_PCAP = 24
+TAMANHO_REGISTRO_PCAP = 16
+
+# Blocos do pcapng usados aqui (os demais são pulados)
+BLOCO_SECAO = 0x0A0D0D0A
+BLOCO_INTERFACE = 0x00000001
+BLOCO_PACOTE_OBSOLETO = 0x00000002
+BLOCO_PACOTE_SIMPLES = 0x00000003
+BLOCO_PACOTE_MELHORADO = 0x00000006
+ORDENS_PCAPNG = {b"\x4d\x3c\x2b\x1a": "<", b"\x1a\x2b\x3c\x4d": ">"}
+# Comprimento mínimo de cada bloco lido (cabeçalho fixo + comprimento final)
+COMPRIMENTO_MINIMO_PCAPNG = {
+    BLOCO_INTERFACE: 20,
+    BLOCO_PACOTE_OBSOLETO: 32,
+    BLOCO_PACOTE_SIMPLES: 16,
+    BLOCO_PACOTE_MELHORADO: 32,
+}
+
+# Caminho rápido: quadro Ethernet sem tag com cabeçalho IPv4 (34 bytes):
+# ethertype, versão/IHL e os endereços de origem e destino
+ETHERNET_IPV4 = struct.Struct(">12xHB11xII")
+ENDERECOS_IPV4 = struct.Struct(">II")
+ETHERTYPE = struct.Struct(">H")
+
+# Pacotes formatados e escritos por vez na saída por pacote
+TAMANHO_BLOCO_SAIDA = 65536
+
+CABECALHO_CSV = "pacote,origem,destino,classe\n"
+
+
+def _ipv4_do_quadro(visao, tipo_enlace: int, inicio: int, capturado: int):
+    """
+    Extrai (origem, destino) de um quadro que não caiu no caminho rápido.
+
+    Returns:
+        tuple: (origem, destino) como inteiros, ou None se o quadro não for
+            IPv4 ou estiver cortado antes dos endereços
+    """
+    if tipo_enlace == ENLACE_ETHERNET:
+        deslocamento = 12
+        if capturado < deslocamento + 2:
+            return None
+        ethertype = ETHERTYPE.unpack_from(visao, inicio + deslocamento)[0]
+        while ethertype in ETHERTYPES_VLAN and capturado >= deslocamento + 6:
+            deslocamento += 4
+            ethertype = ETHERTYPE.unpack_from(visao, inicio + deslocamento)[0]
+        deslocamento += 2
+    elif tipo_enlace == ENLACE_LINUX_SLL:
+        if capturado < 16:
+            return None
+        ethertype = ETHERTYPE.unpack_from(visao, inicio + 14)[0]
+        deslocamento = 16
+    elif tipo_enlace in (ENLACE_RAW, ENLACE_IPV4):
+        ethertype, deslocamento = ETHERTYPE_IPV4, 0
+    else:
+        return None
+
+    if (ethertype != ETHERTYPE_IPV4 or capturado < deslocamento + 20
+            or visao[inicio + deslocamento] >> 4 != 4):
+        return None
+    return ENDERECOS_IPV4.unpack_from(visao, inicio + deslocamento + 12)
+
+
+class Captura:
+    """
+    Arquivo pcap ou pcapng mapeado em memória.
+
+    Os atributos pacotes, nao_ipv4 e truncada são atualizados quando
+    enderecos_ipv4 termina (ou é interrompido). Uma captura interrompida no meio de um
+    registro (tcpdump encerrado à força) é lida até o último pacote
+    completo, com truncada = True.
+
+    Exemplo:
+        >>> with Captura("captura.pcap") as captura:
+        ...     for numero, origem, destino in captura.enderecos_ipv4():
+        ...         ...
+    """
+
+    def __init__(self, caminho: str):
+        """
+        Args:
+            caminho (str): Arquivo .pcap ou .pcapng
+
+        Raises:
+            ValueError: Se o arquivo não for uma captura reconhecida
+        """
+        self._arquivo = open(caminho, "rb")
+        self._mapa = self._visao = None
+        try:
+            if os.fstat(self._arquivo.fileno()).st_size < 12:
+                raise ValueError(f"Não é um arquivo pcap/pcapng: {caminho}")
+            self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(self._mapa, "madvise"):
+                self._mapa.madvise(mmap.MADV_SEQUENTIAL)
+            self._visao = memoryview(self._mapa)
+
+            assinatura = bytes(self._visao[:4])
+            if assinatura in ASSINATURAS_PCAP:
+                if len(self._visao) < TAMANHO_CABECALHO_PCAP:
+                    raise ValueError(f"Cabeçalho pcap truncado: {caminho}")
+                self.formato = "pcap"
+                self._ordem = ASSINATURAS_PCAP[assinatura]
+                self.tipo_enlace = struct.unpack_from(self._ordem + "I", self._visao, 20)[0] & 0xFFFF
+            elif struct.unpack_from("<I", self._visao)[0] == BLOCO_SECAO:
+                self.formato = "pcapng"
+                self._ordem = None
+                self.tipo_enlace = None  # definido por interface
+            else:
+                raise ValueError(f"Não é um arquivo pcap/pcapng: {caminho}")
+        except Exception:
+            self.close()
+            raise
+
+        self.pacotes = 0
+        self.nao_ipv4 = 0
+        self.truncada = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.close()
+
+    def _registros_pcapng(self):
+        """Gera (tipo de enlace, início dos dados, bytes capturados) de cada bloco de pacote."""
+        visao, tamanho = self._visao, len(self._visao)
+        posicao = 0
+        ordem = "<"
+        interfaces = []
+        while posicao + 12 <= tamanho:
+            tipo = struct.unpack_from(ordem + "I", visao, posicao)[0]
+            if tipo == BLOCO_SECAO:
+                # Cada seção declara a própria ordem dos bytes e suas interfaces
+                ordem = ORDENS_PCAPNG.get(bytes(visao[posicao + 8:posicao + 12]))
+                if ordem is None:
+                    raise ValueError(f"Ordem dos bytes inválida no bloco de seção (byte {posicao})")
+                interfaces = []
+            comprimento = struct.unpack_from(ordem + "I", visao, posicao + 4)[0]
+            if comprimento < 12 or comprimento % 4:
+                raise ValueError(f"Bloco pcapng corrompido (byte {posicao})")
+            fim = posicao + comprimento
+            if fim > tamanho:
+                break
+            if comprimento < COMPRIMENTO_MINIMO_PCAPNG.get(tipo, 12):
+                descricao = "interface" if tipo == BLOCO_INTERFACE else "pacote"
+                raise ValueError(f"Bloco de {descricao} inválido (byte {posicao})")
+
+            if tipo == BLOCO_PACOTE_MELHORADO:
+                interface, _, _, capturado = struct.unpack_from(ordem + "4I", visao, posicao + 8)
+                inicio = posicao + 28
+            elif tipo == BLOCO_PACOTE_SIMPLES:
+                interface = 0
+                capturado = min(struct.unpack_from(ordem + "I", visao, posicao + 8)[0],
+                                comprimento - 16)
+                inicio = posicao + 12
+            elif tipo == BLOCO_PACOTE_OBSOLETO:
+                interface, _, _, _, capturado = struct.unpack_from(ordem + "2H3I", visao, posicao + 8)
+                inicio = posicao + 28
+            else:
+                if tipo == BLOCO_INTERFACE:
+                    interfaces.append(struct.unpack_from(ordem + "H", visao, posicao + 8)[0])
+                posicao = fim
+                continue
+
+            if interface >= len(interfaces) or inicio + capturado > fim:
+                raise ValueError(f"Bloco de pacote inválido (byte {posicao})")
+            posicao = fim
+            yield interfaces[interface], inicio, capturado
+        self.truncada = posicao != tamanho
+
+    def enderecos_ipv4(self):
+        """
+        Gera (número do pacote, origem, destino) de cada pacote IPv4.
+
+        O número conta todos os pacotes a partir de 1, como no Wireshark;
+        os endereços saem como inteiros, prontos para as máscaras de
+        network_utils.
+        """
+        if self.formato == "pcap":
+            return self._enderecos_pcap()
+        return self._enderecos_registros(self._registros_pcapng())
+
+    def _enderecos_pcap(self):
+        """
+        enderecos_ipv4 do pcap clássico.
+
+        O caso mais comum fica em um laço só (registro, caminho rápido do
+        Ethernet e yield), sem um gerador intermediário de registros: cada
+        chamada a menos por pacote conta em capturas de milhões de pacotes.
+        """
+        visao, tamanho = self._visao, len(self._visao)
+        comprimento = struct.Struct(self._ordem + "I").unpack_from
+        rapido = ETHERNET_IPV4.unpack_from
+        tipo_enlace = self.tipo_enlace
+        ethernet = tipo_enlace == ENLACE_ETHERNET
+        numero = nao_ipv4 = 0
+        posicao = TAMANHO_CABECALHO_PCAP
+        try:
+            while posicao + TAMANHO_REGISTRO_PCAP <= tamanho:
+                inicio = posicao + TAMANHO_REGISTRO_PCAP
+                capturado = comprimento(visao, posicao + 8)[0]
+                posicao = inicio + capturado
+                if posicao > tamanho:
+                    break
+                numero += 1
+                if ethernet and capturado >= 34:
+                    ethertype, versao, origem, destino = rapido(visao, inicio)
+                    if ethertype == ETHERTYPE_IPV4 and versao >> 4 == 4:
+                        yield numero, origem, destino
+                        continue
+                enderecos = _ipv4_do_quadro(visao, tipo_enlace, inicio, capturado)
+                if enderecos is None:
+                    nao_ipv4 += 1
+                else:
+                    yield numero, enderecos[0], enderecos[1]
+            self.truncada = posicao != tamanho
+        finally:
+            self.pacotes, self.nao_ipv4 = numero, nao_ipv4
+
+    def _enderecos_registros(self, registros):
+        """enderecos_ipv4 sobre (tipo de enlace, início, bytes capturados) de cada pacote."""
+        visao = self._visao
+        rapido = ETHERNET_IPV4.unpack_from
+        numero = nao_ipv4 = 0
+        try:
+            for tipo_enlace, inicio, capturado in registros:
+                numero += 1
+                if tipo_enlace == ENLACE_ETHERNET and capturado >= 34:
+                    ethertype, versao, origem, destino = rapido(visao, inicio)
+                    if ethertype == ETHERTYPE_IPV4 and versao >> 4 == 4:
+                        yield numero, origem, destino
+                        continue
+                enderecos = _ipv4_do_quadro(visao, tipo_enlace, inicio, capturado)
+                if enderecos is None:
+                    nao_ipv4 += 1
+                else:
+                    yield numero, enderecos[0], enderecos[1]
+        finally:
+            self.pacotes, self.nao_ipv4 = numero, nao_ipv4
+
+    def close(self) -> None:
+        """Fecha o mapeamento e o arquivo."""
+        if self._visao is not None:
+            self._visao.release()
+            self._visao = None
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+        self._arquivo.close()
+
+
+def formatar_pacotes(pacotes, formato: str) -> str:
+    """
+    Formata um bloco de pacotes classificados em CSV ou JSONL (sem o cabeçalho CSV).
+
+    Args:
+        pacotes: Tuplas (número, origem, destino, classe), endereços inteiros
+        formato (str): "csv" ou "jsonl"
+
+    Returns:
+        str: Texto do bloco, uma linha por pacote
+    """
+    if formato == "csv":
+        return ''.join([f"{numero},{inteiro_para_ip(origem)},{inteiro_para_ip(destino)},{classe}\n"
+                        for numero, origem, destino, classe in pacotes])
+    return ''.join([f'{{"pacote": {numero}, "origem": "{inteiro_para_ip(origem)}", '
+                    f'"destino": "{inteiro_para_ip(destino)}", "classe": "{classe}"}}\n'
+                    for numero, origem, destino, classe in pacotes])
+
+
+def classificar_captura(caminho: str, ip_origem: str, cidr: int, saida=None,
+                        formato: str = "csv") -> dict:
+    """
+    Classifica os pacotes IPv4 de uma captura em relação à rede de origem.
+
+    Args:
+        caminho (str): Arquivo .pcap ou .pcapng
+        ip_origem (str): IP de origem que define a rede local
+        cidr (int): Máscara CIDR
+        saida: Arquivo de texto aberto para uma linha por pacote IPv4, ou
+            None para só contar
+        formato (str): "csv" ou "jsonl" (só com saida)
+
+    Returns:
+        dict: Contagens "pacotes", "ipv4", "nao_ipv4", "local", "saida",
+            "entrada" e "externo", e "truncada" (bool)
+
+    Raises:
+        ValueError: Se o IP de origem, o CIDR, o formato ou o arquivo forem inválidos
+
+    Exemplo:
+        >>> classificar_captura("captura.pcap", "192.168.1.10", 24)
+        {'pacotes': 1200, 'ipv4': 1150, 'nao_ipv4': 50, 'local': 300, ...}
+    """
+    origem_int = analisar_ip(ip_origem)
+    if origem_int == IP_INVALIDO:
+        raise ValueError(f"IP de origem inválido: {ip_origem}")
+
+    if not validar_cidr(cidr):
+        raise ValueError(f"CIDR inválido: {cidr}")
+
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato inválido: {formato} (use {', '.join(FORMATOS)})")
+
+    mascara = _MASCARAS_INTEIRAS[cidr]
+    rede = origem_int & mascara
+    por_classe = [0, 0, 0, 0]
+
+    with Captura(caminho) as captura:
+        pacotes = captura.enderecos_ipv4()
+        if saida is None:
+            for _, origem, destino in pacotes:
+                por_classe[((origem & mascara == rede) << 1) | (destino & mascara == rede)] += 1
+        else:
+            if formato == "csv":
+                saida.write(CABECALHO_CSV)
+            bloco = []
+            for numero, origem, destino in pacotes:
+                indice = ((origem & mascara == rede) << 1) | (destino & mascara == rede)
+                por_classe[indice] += 1
+                bloco.append((numero, origem, destino, CLASSES[indice]))
+                if len(bloco) == TAMANHO_BLOCO_SAIDA:
+                    saida.write(formatar_pacotes(bloco, formato))
+                    bloco = []
+            saida.write(formatar_pacotes(bloco, formato))
+
+        contagens = {"pacotes": captura.pacotes, "ipv4": sum(por_classe),
+                     "nao_ipv4": captura.nao_ipv4}
+        contagens.update(zip(CLASSES, por_classe))
+        contagens["truncada"] = captura.truncada
+    return contagens
+
+
+def main(argv=None) -> int:
+    """Classifica os pacotes de uma captura e escreve o resumo (e, opcionalmente, cada pacote)."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Classifica o tráfego IPv4 de uma captura pcap/pcapng em relação à rede de origem."
+    )
+    parser.add_argument("captura", help="Arquivo .pcap ou .pcapng")
+    parser.add_argument("--origem", default="192.168.1.10",
+                        help="IP de origem que define a rede local (padrão: 192.168.1.10)")
+    parser.add_argument("--cidr", type=int, required=True, help="Máscara CIDR da rede local")
+    parser.add_argument("--pacotes", action="store_true",
+                        help="Escreve uma linha por pacote IPv4 em stdout (o resumo vai para stderr)")
+    parser.add_argument("--formato", choices=FORMATOS, default="csv",
+                        help="Formato da saída por pacote (padrão: csv)")
+    args = parser.parse_args(argv)
+
+    try:
+        contagens = classificar_captura(args.captura, args.origem, args.cidr,
+                                        sys.stdout if args.pacotes else None, args.formato)
+    except ValueError as erro:
+        parser.error(str(erro))
+    except OSError as erro:
+        print(f"❌ ERRO: {erro}", file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        return 130
+
+    resumo = (f"Pacotes: {contagens['pacotes']} | Não IPv4: {contagens['nao_ipv4']} | "
+              f"Locais: {contagens[LOCAL]} | Saída: {contagens[SAIDA]} | "
+              f"Entrada: {contagens[ENTRADA]} | Externos: {contagens[EXTERNO]}")
+    if contagens["truncada"]:
+        resumo += " | captura truncada"
+    print(resumo, file=sys.stderr if args.pacotes else sys.stdout)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
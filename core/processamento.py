@@ -0,0 +1,152 @@
+"""
+Processamento em lote de listas de IPs
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo contém funções para classificar grandes volumes de IPs de
+destino contra um IP de origem fixo, lendo linha a linha (arquivo ou stdin),
+processando em blocos e escrevendo o resultado em CSV ou JSONL. A memória
+usada depende apenas do tamanho do bloco, não do tamanho da entrada.
+"""
+
+import json
+from itertools import islice
+
+from core.network_utils import (
+    IP_INVALIDO,
+    _MASCARAS_INTEIRAS,
+    analisar_ip,
+    validar_cidr,
+)
+
+# Formatos de saída suportados
+FORMATOS = ("csv", "jsonl")
+
+# Quantidade de linhas processadas por bloco
+TAMANHO_BLOCO_PADRAO = 65536
+
+# Cabeçalho da saída CSV
+CABECALHO_CSV = "ip,mesma_rede\n"
+
+
+def classificar_bloco(linhas, origem_int: int, cidr: int) -> list:
+    """
+    Classifica um bloco de linhas contra o IP de origem.
+
+    Cada linha é um IP de destino (espaços e quebra de linha são ignorados).
+
+    Args:
+        linhas: Lista de strings (uma por IP)
+        origem_int (int): IP de origem já convertido para inteiro
+        cidr (int): Máscara CIDR (0-32)
+
+    Returns:
+        list: Tuplas (ip, resultado), com resultado True/False, ou None se o
+            IP for inválido. Linhas vazias são descartadas.
+    """
+    mascara = _MASCARAS_INTEIRAS[cidr]
+    analisar = analisar_ip
+    resultados = []
+    adicionar = resultados.append
+
+    for linha in linhas:
+        ip = linha.strip()
+        if not ip:
+            continue
+        ip_int = analisar(ip)
+        if ip_int == IP_INVALIDO:
+            adicionar((ip, None))
+        else:
+            adicionar((ip, (ip_int ^ origem_int) & mascara == 0))
+
+    return resultados
+
+
+def _campo_csv(texto: str) -> str:
+    """Escapa um campo CSV arbitrário (entre aspas, com aspas duplicadas)."""
+    return '"' + texto.replace('"', '""') + '"'
+
+
+def formatar_resultados(resultados, formato: str) -> str:
+    """
+    Formata um bloco de resultados em CSV ou JSONL (sem o cabeçalho CSV).
+
+    Args:
+        resultados: Tuplas (ip, resultado) de classificar_bloco
+        formato (str): "csv" ou "jsonl"
+
+    Returns:
+        str: Texto do bloco, uma linha por resultado
+    """
+    if formato == "csv":
+        texto = {True: "true", False: "false", None: "invalido"}
+        return ''.join([f"{ip},{texto[resultado]}\n" if resultado is not None
+                        else f"{_campo_csv(ip)},invalido\n"
+                        for ip, resultado in resultados])
+
+    # IPs válidos só contêm dígitos e pontos e dispensam escape
+    return ''.join([f'{{"ip": "{ip}", "mesma_rede": {"true" if resultado else "false"}}}\n'
+                    if resultado is not None
+                    else f'{{"ip": {json.dumps(ip)}, "mesma_rede": null, "erro": "IP inválido"}}\n'
+                    for ip, resultado in resultados])
+
+
+def classificar_fluxo(entrada, saida, ip_origem: str, cidr: int, formato: str = "csv",
+                      tamanho_bloco: int = TAMANHO_BLOCO_PADRAO) -> dict:
+    """
+    Classifica todos os IPs de um fluxo de texto, escrevendo bloco a bloco.
+
+    Args:
+        entrada: Arquivo de texto aberto (ou sys.stdin) com um IP por linha
+        saida: Arquivo de texto aberto (ou sys.stdout) para os resultados
+        ip_origem (str): IP de origem
+        cidr (int): Máscara CIDR
+        formato (str): "csv" ou "jsonl"
+        tamanho_bloco (int): Linhas lidas e escritas por vez
+
+    Returns:
+        dict: Contagens "total", "mesma_rede", "outra_rede" e "invalidos"
+
+    Raises:
+        ValueError: Se o IP de origem, o CIDR ou o formato forem inválidos
+    """
+    origem_int = analisar_ip(ip_origem)
+    if origem_int == IP_INVALIDO:
+        raise ValueError(f"IP de origem inválido: {ip_origem}")
+
+    if not validar_cidr(cidr):
+        raise ValueError(f"CIDR inválido: {cidr}")
+
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato inválido: {formato} (use {', '.join(FORMATOS)})")
+
+    contagens = {"total": 0, "mesma_rede": 0, "outra_rede": 0, "invalidos": 0}
+
+    if formato == "csv":
+        saida.write(CABECALHO_CSV)
+
+    while True:
+        linhas = list(islice(entrada, tamanho_bloco))
+        if not linhas:
+            break
+
+        resultados = classificar_bloco(linhas, origem_int, cidr)
+        saida.write(formatar_resultados(resultados, formato))
+        acumular_contagens(contagens, resultados)
+
+    return contagens
+
+
+def acumular_contagens(contagens: dict, resultados) -> None:
+    """Soma ao dicionário de contagens os resultados de um bloco."""
+    mesma = outra = 0
+    for _, resultado in resultados:
+        if resultado is True:
+            mesma += 1
+        elif resultado is False:
+            outra += 1
+
+    contagens["total"] += len(resultados)
+    contagens["mesma_rede"] += mesma
+    contagens["outra_rede"] += outra
+    contagens["invalidos"] += len(resultados) - mesma - outra
@@ -0,0 +1,230 @@
+"""
+Busca de rota por maior prefixo (Longest Prefix Match)
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo contém a TabelaRotas, que responde "qual das rotas cadastradas
+é a mais específica para este IP", como faz um roteador:
+- Busca escalar: uma tabela hash por tamanho de prefixo, consultadas do
+  prefixo mais longo para o mais curto (só os tamanhos presentes, indicados
+  por um bitmap)
+- Busca em lote: as rotas são achatadas em intervalos disjuntos ordenados,
+  e cada IP é resolvido com uma única busca binária (vetorizada com NumPy)
+"""
+
+from bisect import bisect_right
+
+from core.network_utils import (
+    IP_INVALIDO,
+    _MASCARAS_INTEIRAS,
+    _numpy,
+    analisar_ip,
+    validar_cidr,
+)
+
+
+# Índice retornado pela busca em lote quando nenhuma rota cobre o IP
+SEM_ROTA = -1
+
+
+def _para_inteiro(endereco) -> int:
+    """Converte str ou int para a forma inteira, validando o range."""
+    if isinstance(endereco, int):
+        if not 0 <= endereco <= 0xFFFFFFFF:
+            raise ValueError(f"IP fora do range de 32 bits: {endereco}")
+        return endereco
+
+    valor = analisar_ip(endereco)
+    if valor == IP_INVALIDO:
+        raise ValueError(f"IP inválido: {endereco}")
+    return valor
+
+
+class TabelaRotas:
+    """
+    Tabela de rotas compilada para busca por maior prefixo.
+
+    Cada rota é uma tupla (rede, cidr, payload). A rede segue a semântica de
+    calcular_rede (bits de host são zerados) e, se o mesmo prefixo aparecer
+    mais de uma vez, a última ocorrência prevalece.
+
+    Exemplo:
+        >>> tabela = TabelaRotas([("10.0.0.0", 8, "A"), ("10.1.0.0", 16, "B")])
+        >>> tabela.buscar("10.1.2.3"), tabela.buscar("10.2.0.1"), tabela.buscar("8.8.8.8")
+        ('B', 'A', None)
+    """
+
+    def __init__(self, rotas):
+        """
+        Args:
+            rotas: Iterável de tuplas (rede, cidr, payload), com a rede em
+                str ("10.0.0.0") ou inteiro
+
+        Raises:
+            ValueError: Se alguma rede ou CIDR for inválido
+        """
+        tabelas = [None] * 33
+        bitmap = 0
+        payloads = []
+
+        for rede, cidr, payload in rotas:
+            if not validar_cidr(cidr):
+                raise ValueError(f"CIDR inválido: {cidr}")
+
+            tabela = tabelas[cidr]
+            if tabela is None:
+                tabela = tabelas[cidr] = {}
+                bitmap |= 1 << cidr
+
+            chave = _para_inteiro(rede) & _MASCARAS_INTEIRAS[cidr]
+            indice = tabela.get(chave)
+            if indice is None:
+                tabela[chave] = len(payloads)
+                payloads.append(payload)
+            else:
+                payloads[indice] = payload
+
+        self._tabelas = tabelas
+        self._bitmap = bitmap
+        self._payloads = payloads
+
+        # Tamanhos presentes, do mais longo ao mais curto, já com a máscara
+        self._sondas = tuple((_MASCARAS_INTEIRAS[cidr], tabelas[cidr])
+                             for cidr in range(32, -1, -1) if bitmap >> cidr & 1)
+
+        # Tabela de intervalos para a busca em lote (compilada sob demanda)
+        self._inicios = None
+        self._indices = None
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    @property
+    def comprimentos(self) -> tuple:
+        """Tamanhos de prefixo presentes na tabela, do mais longo ao mais curto."""
+        return tuple(cidr for cidr in range(32, -1, -1) if self._bitmap >> cidr & 1)
+
+    @property
+    def payloads(self) -> list:
+        """Payloads das rotas, na ordem dos índices retornados por buscar_lote."""
+        return self._payloads
+
+    def buscar_indice(self, ip) -> int:
+        """
+        Retorna o índice da rota mais específica para o IP.
+
+        Args:
+            ip: Endereço em str ou inteiro
+
+        Returns:
+            int: Índice em payloads, ou SEM_ROTA (-1)
+        """
+        ip_int = _para_inteiro(ip)
+        for mascara, tabela in self._sondas:
+            indice = tabela.get(ip_int & mascara)
+            if indice is not None:
+                return indice
+        return SEM_ROTA
+
+    def buscar(self, ip, padrao=None):
+        """
+        Retorna o payload da rota mais específica para o IP.
+
+        Args:
+            ip: Endereço em str ou inteiro
+            padrao: Valor retornado quando nenhuma rota cobre o IP
+
+        Returns:
+            Payload da rota encontrada, ou padrao
+        """
+        indice = self.buscar_indice(ip)
+        return padrao if indice == SEM_ROTA else self._payloads[indice]
+
+    def buscar_lote(self, ips):
+        """
+        Busca a rota mais específica para muitos IPs (já em formato inteiro).
+
+        Na primeira chamada as rotas são achatadas em intervalos disjuntos
+        [início, próximo início) associados à rota mais específica; depois
+        disso cada IP custa uma busca binária, sem depender do número de
+        tamanhos de prefixo. Com NumPy a busca é feita em uma única chamada
+        vetorizada; sem NumPy usa bisect.
+
+        Args:
+            ips: Sequência ou array uint32 de IPs em formato inteiro
+
+        Returns:
+            numpy.ndarray de int64 (com NumPy) ou list[int] (sem NumPy) com o
+            índice em payloads de cada IP, ou SEM_ROTA (-1)
+        """
+        if self._inicios is None:
+            self._compilar_intervalos()
+
+        np = _numpy()
+        if np is not None:
+            inicios = np.asarray(self._inicios, dtype=np.uint64)
+            indices = np.asarray(self._indices, dtype=np.int64)
+            posicoes = np.searchsorted(inicios, np.asarray(ips, dtype=np.uint64), side='right') - 1
+            return indices[posicoes]
+
+        inicios, indices = self._inicios, self._indices
+        return [indices[bisect_right(inicios, ip) - 1] for ip in ips]
+
+    def _compilar_intervalos(self):
+        """Achata as rotas aninhadas em intervalos disjuntos ordenados."""
+        # Ordena por (rede, cidr) usando chaves inteiras: a rede-mãe vem antes
+        # das sub-redes que começam no mesmo endereço
+        tabelas = self._tabelas
+        chaves = [rede << 6 | cidr
+                  for cidr, tabela in enumerate(tabelas) if tabela
+                  for rede in tabela]
+        chaves.sort()
+
+        inicios = [0]
+        indices = [SEM_ROTA]
+
+        # Pilhas paralelas das rotas abertas: fim exclusivo e índice
+        fins_abertos = []
+        indices_abertos = []
+
+        for chave in chaves:
+            rede, cidr = chave >> 6, chave & 63
+
+            # Fecha as rotas que terminam antes desta começar, voltando à mãe
+            while fins_abertos and fins_abertos[-1] <= rede:
+                fim = fins_abertos.pop()
+                indices_abertos.pop()
+                indice = indices_abertos[-1] if indices_abertos else SEM_ROTA
+                # Várias fronteiras na mesma posição: vale a última (mais interna)
+                if inicios[-1] == fim:
+                    indices[-1] = indice
+                else:
+                    inicios.append(fim)
+                    indices.append(indice)
+
+            indice = tabelas[cidr][rede]
+            if inicios[-1] == rede:
+                indices[-1] = indice
+            else:
+                inicios.append(rede)
+                indices.append(indice)
+            fins_abertos.append(rede + (1 << (32 - cidr)))
+            indices_abertos.append(indice)
+
+        while fins_abertos:
+            fim = fins_abertos.pop()
+            indices_abertos.pop()
+            indice = indices_abertos[-1] if indices_abertos else SEM_ROTA
+            if inicios[-1] == fim:
+                indices[-1] = indice
+            else:
+                inicios.append(fim)
+                indices.append(indice)
+
+        np = _numpy()
+        if np is not None:
+            self._inicios = np.asarray(inicios, dtype=np.uint64)
+            self._indices = np.asarray(indices, dtype=np.int64)
+        else:
+            self._inicios = inicios
+            self._indices = indices
@@ -0,0 +1,224 @@
+"""
+Sequências preguiçosas de hosts e sub-redes IPv4
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo contém visões somente leitura que se comportam como listas
+(len, índice, fatia, iteração, `in`) sem materializar nenhum elemento:
+- hosts: endereços utilizáveis de uma rede, como strings "a.b.c.d"
+- sub_redes: divisão de uma rede em blocos de um CIDR maior (RedeIPv4)
+
+Internamente cada visão guarda apenas um range de inteiros, então o acesso
+por índice é O(1), uma fatia é outra visão (também O(1)) e percorrer uma /8
+inteira usa memória constante. As strings só são geradas no acesso.
+"""
+
+from abc import abstractmethod
+from collections.abc import Sequence
+
+from core.enderecos import RedeIPv4
+from core.network_utils import IP_INVALIDO, analisar_ip, inteiro_para_ip
+
+
+class _VisaoEnderecos(Sequence):
+    """Base das visões: um range de inteiros e a conversão de cada elemento."""
+
+    __slots__ = ('_valores',)
+
+    def __init__(self, valores: range):
+        self._valores = valores
+
+    @abstractmethod
+    def _converter(self, valor):
+        """Elemento correspondente a um valor inteiro do range."""
+
+    @abstractmethod
+    def _valor_do_item(self, item):
+        """Forma inteira de um possível elemento, ou None se não for comparável."""
+
+    def __len__(self) -> int:
+        return len(self._valores)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return type(self)(self._valores[indice])
+        return self._converter(self._valores[indice])
+
+    def __iter__(self):
+        converter = self._converter
+        for valor in self._valores:
+            yield converter(valor)
+
+    def __reversed__(self):
+        converter = self._converter
+        for valor in reversed(self._valores):
+            yield converter(valor)
+
+    def __contains__(self, item) -> bool:
+        valor = self._valor_do_item(item)
+        return valor is not None and valor in self._valores
+
+    def index(self, item, inicio=0, fim=None) -> int:
+        """Posição do elemento na visão, calculada em O(1)."""
+        valor = self._valor_do_item(item)
+        if valor is None or valor not in self._valores:
+            raise ValueError(f"{item!r} não está na sequência")
+        posicao = self._valores.index(valor)
+        if posicao < inicio or (fim is not None and posicao >= fim):
+            raise ValueError(f"{item!r} não está na sequência")
+        return posicao
+
+    def count(self, item) -> int:
+        return int(item in self)
+
+    def __eq__(self, outra):
+        if type(outra) is not type(self):
+            return NotImplemented
+        return self._valores == outra._valores and self._chave_extra() == outra._chave_extra()
+
+    def __hash__(self):
+        return hash((type(self), self._valores, self._chave_extra()))
+
+    def _chave_extra(self):
+        return None
+
+
+class Hosts(_VisaoEnderecos):
+    """
+    Endereços utilizáveis de uma rede IPv4, como strings "a.b.c.d".
+
+    Criada por hosts(); os elementos são gerados sob demanda.
+    """
+
+    __slots__ = ()
+
+    def _converter(self, valor):
+        return inteiro_para_ip(valor)
+
+    def _valor_do_item(self, item):
+        if isinstance(item, str):
+            valor = analisar_ip(item)
+            return None if valor == IP_INVALIDO else valor
+        if isinstance(item, int):
+            return item
+        return None
+
+    def __repr__(self):
+        if not self._valores:
+            return "Hosts([])"
+        return f"Hosts('{self[0]}'..'{self[-1]}', {len(self)} endereços)"
+
+
+class SubRedes(_VisaoEnderecos):
+    """
+    Sub-redes consecutivas de mesmo tamanho, como RedeIPv4.
+
+    Criada por sub_redes(); os elementos são gerados sob demanda.
+    """
+
+    __slots__ = ('_cidr',)
+
+    def __init__(self, valores: range, cidr: int):
+        super().__init__(valores)
+        self._cidr = cidr
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return SubRedes(self._valores[indice], self._cidr)
+        return self._converter(self._valores[indice])
+
+    def _converter(self, valor):
+        return RedeIPv4(valor, self._cidr)
+
+    def _valor_do_item(self, item):
+        if isinstance(item, str):
+            try:
+                item = RedeIPv4(item)
+            except ValueError:
+                return None
+        if isinstance(item, RedeIPv4) and item.cidr == self._cidr:
+            return int(item.rede)
+        return None
+
+    def _chave_extra(self):
+        return self._cidr
+
+    @property
+    def cidr(self) -> int:
+        """CIDR de cada sub-rede."""
+        return self._cidr
+
+    def __repr__(self):
+        if not self._valores:
+            return "SubRedes([])"
+        return f"SubRedes('{self[0]}'..'{self[-1]}', {len(self)} redes)"
+
+
+def _para_rede(rede, cidr) -> RedeIPv4:
+    """Aceita RedeIPv4, "a.b.c.d/n" ou endereço + cidr (com a semântica de calcular_rede)."""
+    if isinstance(rede, RedeIPv4):
+        if cidr is not None:
+            raise ValueError("CIDR informado duas vezes")
+        return rede
+    return RedeIPv4(rede, cidr)
+
+
+def hosts(rede, cidr: int = None) -> Hosts:
+    """
+    Retorna uma visão preguiçosa dos hosts utilizáveis de uma rede.
+
+    Seguindo descrever_rede, endereço de rede e broadcast ficam de fora até
+    /30; em /31 e /32 todos os endereços são hosts.
+
+    Args:
+        rede: RedeIPv4, "a.b.c.d/n", ou endereço (str ou int) com cidr
+        cidr (int): Máscara CIDR, se rede não a contiver
+
+    Returns:
+        Hosts: Sequência de strings com len, índice, fatia e iteração em O(1)
+            de memória
+
+    Raises:
+        ValueError: Se a rede ou o CIDR forem inválidos
+
+    Exemplo:
+        >>> lista = hosts("10.0.0.0/8")
+        >>> len(lista), lista[0], lista[-1]
+        (16777214, '10.0.0.1', '10.255.255.254')
+        >>> list(lista[255:258])
+        ['10.0.1.0', '10.0.1.1', '10.0.1.2']
+    """
+    rede = _para_rede(rede, cidr)
+    inicio = int(rede.rede)
+    fim = inicio + rede.num_enderecos
+    if rede.cidr <= 30:
+        inicio, fim = inicio + 1, fim - 1
+    return Hosts(range(inicio, fim))
+
+
+def sub_redes(rede, novo_cidr: int, cidr: int = None) -> SubRedes:
+    """
+    Retorna uma visão preguiçosa da divisão de uma rede em blocos /novo_cidr.
+
+    Args:
+        rede: RedeIPv4, "a.b.c.d/n", ou endereço (str ou int) com cidr
+        novo_cidr (int): CIDR das sub-redes (entre o CIDR da rede e 32)
+        cidr (int): Máscara CIDR, se rede não a contiver
+
+    Returns:
+        SubRedes: Sequência de RedeIPv4 com len, índice, fatia e iteração em
+            O(1) de memória
+
+    Raises:
+        ValueError: Se a rede for inválida ou novo_cidr estiver fora do range
+
+    Exemplo:
+        >>> blocos = sub_redes("172.16.0.0/16", 24)
+        >>> len(blocos), str(blocos[10]), blocos.index("172.16.200.0/24")
+        (256, '172.16.10.0/24', 200)
+    """
+    rede = _para_rede(rede, cidr)
+    if not isinstance(novo_cidr, int) or not rede.cidr <= novo_cidr <= 32:
+        raise ValueError(f"O novo CIDR deve estar entre {rede.cidr} e 32: {novo_cidr}")
+    inicio = int(rede.rede)
+    return SubRedes(range(inicio, inicio + rede.num_enderecos, 1 << (32 - novo_cidr)), novo_cidr)
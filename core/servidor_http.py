@@ -0,0 +1,439 @@
+"""
+Serviço HTTP/JSON das funções de rede (somente biblioteca padrão)
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo expõe as funções de core.network_utils em um servidor
+HTTP/1.1 feito sobre asyncio.Protocol:
+- GET /mesma-rede?origem=...&destino=...&cidr=...
+- GET /mascara?cidr=...
+- GET /descrever?ip=...&cidr=...
+- POST /lote?origem=...&cidr=... com um array JSON de IPs de destino
+  (ou um objeto {"origem", "cidr", "destinos"})
+- GET /metricas: métricas de core.instrumentacao no formato do Prometheus
+  (vazias enquanto a instrumentação estiver desligada)
+As três primeiras também aceitam POST com os parâmetros em um objeto JSON.
+
+Conexões são persistentes (keep-alive) e aceitam pipelining: todas as
+requisições completas que chegam em um mesmo bloco de dados são respondidas
+com uma única escrita no socket, sempre na ordem de chegada. Corpos grandes
+(acima de LIMITE_CORPO_NO_LACO) são decodificados e processados em um
+executor, para que o laço de eventos continue atendendo as outras conexões;
+enquanto isso, as requisições seguintes da mesma conexão aguardam.
+"""
+
+import asyncio
+import json
+from http import HTTPStatus
+from urllib.parse import parse_qsl
+
+from core import instrumentacao
+from core.network_utils import (
+    IP_INVALIDO,
+    _MASCARAS_INTEIRAS,
+    _numpy,
+    analisar_ip,
+    analisar_ips_lote,
+    cidr_para_mascara_decimal,
+    descrever_rede,
+    ips_mesma_rede,
+    validar_cidr,
+)
+
+# Corpos maiores que isto (bytes) são processados fora do laço de eventos
+LIMITE_CORPO_NO_LACO = 64 * 1024
+
+# Tamanho máximo aceito para o cabeçalho e para o corpo de uma requisição
+TAMANHO_MAXIMO_CABECALHO = 16 * 1024
+TAMANHO_MAXIMO_CORPO = 64 * 1024 * 1024
+
+# Enquanto uma requisição da conexão ocupa o executor, bytes acumulados no
+# buffer acima disto pausam a leitura (o corpo da requisição atual, por maior
+# que seja, nunca é pausado: sem ele a conexão não andaria)
+LIMITE_BUFFER_ENTRADA = 4 * 1024 * 1024
+
+_TEXTO_RESULTADO = ("false", "true", "null")
+
+
+class ErroHTTP(Exception):
+    """Erro que vira uma resposta HTTP com {"erro": mensagem}."""
+
+    def __init__(self, status: int, mensagem: str):
+        super().__init__(mensagem)
+        self.status = status
+
+
+# ---------------------------------------------------------------------------
+# Rotas: recebem os parâmetros já decodificados e retornam o corpo em JSON
+# ---------------------------------------------------------------------------
+
+def _cidr(parametros: dict, maximo: int = 32) -> int:
+    """Lê o parâmetro "cidr" como inteiro."""
+    if "cidr" not in parametros:
+        raise ErroHTTP(400, "Parâmetro obrigatório ausente: cidr")
+    cidr = parametros["cidr"]
+    if isinstance(cidr, str) and cidr.strip().isdigit():
+        cidr = int(cidr)
+    if type(cidr) is not int or not 0 <= cidr <= maximo:
+        raise ErroHTTP(400, f"CIDR inválido: {cidr}")
+    return cidr
+
+
+def _texto(parametros: dict, nome: str) -> str:
+    """Lê um parâmetro de texto obrigatório."""
+    valor = parametros.get(nome)
+    if not isinstance(valor, str):
+        raise ErroHTTP(400, f"Parâmetro obrigatório ausente: {nome}")
+    return valor.strip()
+
+
+def rota_mesma_rede(parametros: dict) -> str:
+    """{"mesma_rede": bool} para origem, destino e cidr (IPv4 ou IPv6)."""
+    origem, destino = _texto(parametros, "origem"), _texto(parametros, "destino")
+    cidr = _cidr(parametros, maximo=128)
+    return '{"mesma_rede":%s}' % ("true" if ips_mesma_rede(origem, destino, cidr) else "false")
+
+
+# As 33 respostas de /mascara são fixas
+_RESPOSTAS_MASCARA = tuple(
+    json.dumps({"cidr": cidr, "mascara": cidr_para_mascara_decimal(cidr)}, separators=(",", ":"))
+    for cidr in range(33)
+)
+
+
+def rota_mascara(parametros: dict) -> str:
+    """{"cidr", "mascara"} com a máscara decimal do CIDR."""
+    return _RESPOSTAS_MASCARA[_cidr(parametros)]
+
+
+def rota_descrever(parametros: dict) -> str:
+    """Resultado de descrever_rede para ip e cidr."""
+    ip = _texto(parametros, "ip")
+    cidr = _cidr(parametros, maximo=128)
+    return json.dumps(descrever_rede(ip, cidr), ensure_ascii=False, separators=(",", ":"))
+
+
+def classificar_lote_json(destinos, origem: str, cidr: int) -> str:
+    """
+    Classifica uma lista de IPs de destino contra a origem e monta o JSON.
+
+    Args:
+        destinos: Lista de IPs de destino (itens que não são texto contam
+            como inválidos)
+        origem (str): IP de origem
+        cidr (int): Máscara CIDR (0-32)
+
+    Returns:
+        str: Objeto JSON com "resultados" (true/false/null, na ordem dos
+            destinos) e as contagens "mesma_rede", "outra_rede" e "invalidos"
+
+    Raises:
+        ValueError: Se o IP de origem ou o CIDR forem inválidos
+    """
+    origem_int = analisar_ip(origem)
+    if origem_int == IP_INVALIDO:
+        raise ValueError(f"IP de origem inválido: {origem}")
+    if not validar_cidr(cidr):
+        raise ValueError(f"CIDR inválido: {cidr}")
+    mascara = _MASCARAS_INTEIRAS[cidr]
+
+    inteiros = analisar_ips_lote(destinos)
+    np = _numpy()
+    if np is not None:
+        # 0 = outra rede, 1 = mesma rede, 2 = inválido
+        codigos = np.where(inteiros < 0, 2, ((inteiros ^ origem_int) & mascara) == 0)
+        contagens = np.bincount(codigos, minlength=3).tolist()
+        textos = np.array(_TEXTO_RESULTADO)[codigos].tolist()
+    else:
+        codigos = [2 if valor == IP_INVALIDO else int((valor ^ origem_int) & mascara == 0)
+                   for valor in inteiros]
+        contagens = [codigos.count(codigo) for codigo in range(3)]
+        textos = [_TEXTO_RESULTADO[codigo] for codigo in codigos]
+
+    outra, mesma, invalidos = contagens
+    return ('{"resultados":[%s],"mesma_rede":%d,"outra_rede":%d,"invalidos":%d}'
+            % (",".join(textos), mesma, outra, invalidos))
+
+
+def rota_lote(parametros: dict, dados) -> str:
+    """Classificação em lote de um array JSON de destinos."""
+    if isinstance(dados, dict):
+        parametros = {**parametros, **dados}
+        dados = dados.get("destinos")
+    if not isinstance(dados, list):
+        raise ErroHTTP(400, "O corpo deve ser um array JSON de IPs ou um objeto com \"destinos\"")
+    return classificar_lote_json(dados, _texto(parametros, "origem"), _cidr(parametros))
+
+
+def rota_metricas(parametros: dict) -> str:
+    """Texto de exposição do Prometheus com as métricas das funções de rede."""
+    return instrumentacao.exportar_prometheus()
+
+
+ROTAS = {
+    "/mesma-rede": rota_mesma_rede,
+    "/mascara": rota_mascara,
+    "/descrever": rota_descrever,
+    "/metricas": rota_metricas,
+}
+
+# Rotas que não respondem JSON
+TIPOS_CONTEUDO = {
+    "/metricas": b"text/plain; version=0.0.4; charset=utf-8",
+}
+_TIPO_JSON = b"application/json"
+
+
+def responder(metodo: str, alvo: str, corpo: bytes = b"") -> tuple:
+    """
+    Trata uma requisição já separada em método, alvo e corpo.
+
+    Args:
+        metodo (str): "GET" ou "POST"
+        alvo (str): Caminho com query string (ex.: "/mascara?cidr=24")
+        corpo (bytes): Corpo da requisição (JSON nos POST)
+
+    Returns:
+        tuple: (status HTTP, corpo da resposta em JSON como str)
+
+    Exemplo:
+        >>> responder("GET", "/mascara?cidr=24")
+        (200, '{"cidr":24,"mascara":"255.255.255.0"}')
+    """
+    caminho, _, consulta = alvo.partition("?")
+    parametros = dict(parse_qsl(consulta)) if consulta else {}
+    try:
+        if caminho == "/lote":
+            if metodo != "POST":
+                raise ErroHTTP(405, "Use POST em /lote")
+            return 200, rota_lote(parametros, _decodificar_json(corpo))
+
+        rota = ROTAS.get(caminho)
+        if rota is None:
+            raise ErroHTTP(404, f"Rota não encontrada: {caminho}")
+        if metodo == "POST":
+            dados = _decodificar_json(corpo)
+            if not isinstance(dados, dict):
+                raise ErroHTTP(400, "O corpo deve ser um objeto JSON")
+            parametros.update(dados)
+        elif metodo != "GET":
+            raise ErroHTTP(405, f"Método não suportado: {metodo}")
+        return 200, rota(parametros)
+    except ErroHTTP as erro:
+        return erro.status, _json_erro(str(erro))
+    except ValueError as erro:
+        return 400, _json_erro(str(erro))
+    except Exception as erro:  # falha inesperada (ex: JSON aninhado demais)
+        return 500, _json_erro(f"Erro interno: {erro}")
+
+
+def _decodificar_json(corpo: bytes):
+    try:
+        return json.loads(corpo)
+    except ValueError:
+        raise ErroHTTP(400, "Corpo JSON inválido")
+
+
+def _json_erro(mensagem: str) -> str:
+    return json.dumps({"erro": mensagem}, ensure_ascii=False, separators=(",", ":"))
+
+
+# ---------------------------------------------------------------------------
+# Protocolo HTTP/1.1
+# ---------------------------------------------------------------------------
+
+_FRASES = {status.value: status.phrase for status in HTTPStatus}
+
+
+def _montar_resposta(status: int, corpo: str, fechar: bool, tipo: bytes = _TIPO_JSON) -> bytes:
+    """Linha de status, cabeçalhos e corpo prontos para o socket."""
+    dados = corpo.encode("utf-8")
+    return (b"HTTP/1.1 %d %s\r\nContent-Type: %s\r\nContent-Length: %d\r\n%s\r\n"
+            % (status, _FRASES[status].encode("ascii"), tipo, len(dados),
+               b"Connection: close\r\n" if fechar else b"") + dados)
+
+
+def _tipo_da_resposta(status: int, alvo: str) -> bytes:
+    """Content-Type da resposta: erros são sempre JSON."""
+    if status != 200:
+        return _TIPO_JSON
+    return TIPOS_CONTEUDO.get(alvo.partition("?")[0], _TIPO_JSON)
+
+
+class ProtocoloHTTP(asyncio.Protocol):
+    """
+    Uma conexão HTTP/1.1 com keep-alive e pipelining.
+
+    O buffer de entrada acumula os bytes recebidos; cada chamada de
+    _processar consome todas as requisições completas e responde de uma
+    vez. Uma requisição com corpo grande vai para o executor e bloqueia
+    apenas esta conexão até terminar.
+    """
+
+    def __init__(self, executor=None):
+        self._executor = executor
+        self._buffer = bytearray()
+        self._transporte = None
+        self._ocupado = False
+        self._fechando = False
+        self._leitura_pausada = False
+
+    def connection_made(self, transporte):
+        self._transporte = transporte
+
+    def connection_lost(self, excecao):
+        self._fechando = True
+
+    def data_received(self, dados):
+        self._buffer += dados
+        if self._ocupado:
+            self._controlar_leitura()
+            return
+        self._processar()
+
+    # Controle de fluxo: se o cliente não lê as respostas, paramos de ler
+    def pause_writing(self):
+        self._transporte.pause_reading()
+
+    def resume_writing(self):
+        if not self._leitura_pausada:
+            self._transporte.resume_reading()
+
+    def _controlar_leitura(self):
+        pausar = self._ocupado and len(self._buffer) > LIMITE_BUFFER_ENTRADA
+        if pausar != self._leitura_pausada and not self._fechando:
+            self._leitura_pausada = pausar
+            if pausar:
+                self._transporte.pause_reading()
+            else:
+                self._transporte.resume_reading()
+
+    def _extrair_requisicao(self):
+        """
+        Retira do buffer a próxima requisição completa.
+
+        Returns:
+            tuple (metodo, alvo, corpo, fechar), ou None se ainda faltam bytes
+
+        Raises:
+            ErroHTTP: Se a requisição for malformada ou grande demais
+        """
+        buffer = self._buffer
+        fim_cabecalho = buffer.find(b"\r\n\r\n", 0, TAMANHO_MAXIMO_CABECALHO + 4)
+        if fim_cabecalho < 0:
+            if len(buffer) > TAMANHO_MAXIMO_CABECALHO:
+                raise ErroHTTP(431, "Cabeçalho grande demais")
+            return None
+
+        linhas = bytes(buffer[:fim_cabecalho]).decode("latin-1").split("\r\n")
+        try:
+            metodo, alvo, versao = linhas[0].split(" ")
+        except ValueError:
+            raise ErroHTTP(400, "Linha de requisição inválida")
+        if not versao.startswith("HTTP/1."):
+            raise ErroHTTP(505, "Versão HTTP não suportada")
+
+        tamanho_corpo = 0
+        fechar = versao == "HTTP/1.0"
+        for linha in linhas[1:]:
+            nome, _, valor = linha.partition(":")
+            nome = nome.strip().lower()
+            if nome == "content-length":
+                try:
+                    tamanho_corpo = int(valor)
+                except ValueError:
+                    raise ErroHTTP(400, "Content-Length inválido")
+                if tamanho_corpo < 0:
+                    raise ErroHTTP(400, "Content-Length inválido")
+                if tamanho_corpo > TAMANHO_MAXIMO_CORPO:
+                    raise ErroHTTP(413, "Corpo grande demais")
+            elif nome == "connection":
+                valor = valor.strip().lower()
+                if valor == "close":
+                    fechar = True
+                elif valor == "keep-alive":
+                    fechar = False
+            elif nome == "transfer-encoding":
+                raise ErroHTTP(411, "Envie o corpo com Content-Length")
+
+        inicio_corpo = fim_cabecalho + 4
+        fim_corpo = inicio_corpo + tamanho_corpo
+        if len(buffer) < fim_corpo:
+            return None
+        corpo = bytes(buffer[inicio_corpo:fim_corpo])
+        del buffer[:fim_corpo]
+        return metodo, alvo, corpo, fechar
+
+    def _processar(self):
+        """Responde todas as requisições completas do buffer (em uma escrita)."""
+        respostas = []
+        try:
+            while not self._fechando:
+                try:
+                    requisicao = self._extrair_requisicao()
+                except ErroHTTP as erro:
+                    # Não dá para saber onde começa a próxima: responde e fecha
+                    respostas.append(_montar_resposta(erro.status, _json_erro(str(erro)), True))
+                    self._fechando = True
+                    break
+                if requisicao is None:
+                    break
+
+                metodo, alvo, corpo, fechar = requisicao
+                if len(corpo) > LIMITE_CORPO_NO_LACO:
+                    self._processar_no_executor(metodo, alvo, corpo, fechar)
+                    break
+
+                status, texto = responder(metodo, alvo, corpo)
+                respostas.append(_montar_resposta(status, texto, fechar, _tipo_da_resposta(status, alvo)))
+                self._fechando = fechar
+        finally:
+            if respostas:
+                self._transporte.write(b"".join(respostas))
+            if self._fechando and not self._transporte.is_closing():
+                self._transporte.close()
+        self._controlar_leitura()
+
+    def _processar_no_executor(self, metodo, alvo, corpo, fechar):
+        self._ocupado = True
+        tarefa = asyncio.get_running_loop().run_in_executor(
+            self._executor, responder, metodo, alvo, corpo)
+        tarefa.add_done_callback(lambda tarefa: self._concluir(tarefa, alvo, fechar))
+
+    def _concluir(self, tarefa, alvo, fechar):
+        self._ocupado = False
+        if self._transporte.is_closing():
+            return
+        try:
+            status, texto = tarefa.result()
+        except Exception as erro:  # falha inesperada no executor
+            status, texto = 500, _json_erro(f"Erro interno: {erro}")
+        self._transporte.write(_montar_resposta(status, texto, fechar, _tipo_da_resposta(status, alvo)))
+        self._fechando = fechar
+        # Segue com as requisições que chegaram enquanto esta era processada
+        self._processar()
+
+
+async def iniciar_servidor(host: str = "127.0.0.1", porta: int = 8080, executor=None):
+    """
+    Inicia o servidor no laço de eventos atual.
+
+    Args:
+        host (str): Endereço de escuta
+        porta (int): Porta de escuta (0 escolhe uma porta livre)
+        executor: concurrent.futures.Executor para corpos grandes (None usa
+            o executor padrão do laço)
+
+    Returns:
+        asyncio.Server: Servidor já escutando (porta real em
+            server.sockets[0].getsockname()[1])
+    """
+    laco = asyncio.get_running_loop()
+    return await laco.create_server(lambda: ProtocoloHTTP(executor), host, porta)
+
+
+async def servir(host: str = "127.0.0.1", porta: int = 8080, executor=None) -> None:
+    """Executa o servidor até ser interrompido."""
+    servidor = await iniciar_servidor(host, porta, executor)
+    async with servidor:
+        await servidor.serve_forever()
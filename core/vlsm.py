@@ -0,0 +1,247 @@
+"""
+Planejamento de sub-redes VLSM com alocador buddy
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este módulo contém:
+- AlocadorBuddy: divide um bloco pai em sub-redes sob demanda (alocar) e
+  as devolve (liberar), juntando automaticamente blocos "irmãos" livres
+- planejar_vlsm: dado um bloco pai e a quantidade de hosts de cada
+  requisito, aloca a menor sub-rede que atende cada um (maiores primeiro,
+  como no método VLSM tradicional) e informa os blocos que sobraram
+
+No alocador buddy todo bloco livre de tamanho /n é metade de um bloco
+/n-1; ao alocar, um bloco maior é dividido ao meio até o tamanho pedido, e
+ao liberar, o bloco se junta com o irmão (endereço XOR tamanho) sempre que
+ele também estiver livre. Cada operação custa no máximo 32 passos.
+"""
+
+import heapq
+
+from core.enderecos import RedeIPv4
+
+
+def cidr_para_hosts(num_hosts: int) -> int:
+    """
+    Retorna o maior CIDR (menor sub-rede) com pelo menos num_hosts hosts.
+
+    Segue a contagem de TABELA_PREFIXOS: até /30 descontam-se rede e
+    broadcast; /31 tem 2 hosts e /32 tem 1.
+
+    Args:
+        num_hosts (int): Quantidade de hosts necessária (1 a 2^32 - 2)
+
+    Returns:
+        int: CIDR da sub-rede
+
+    Raises:
+        ValueError: Se a quantidade estiver fora do range
+
+    Exemplo:
+        >>> cidr_para_hosts(50), cidr_para_hosts(254), cidr_para_hosts(255)
+        (26, 24, 23)
+    """
+    if not isinstance(num_hosts, int) or not 1 <= num_hosts <= (1 << 32) - 2:
+        raise ValueError(f"Quantidade de hosts inválida: {num_hosts}")
+    if num_hosts == 1:
+        return 32
+    if num_hosts == 2:
+        return 31
+    return 32 - (num_hosts + 1).bit_length()
+
+
+class AlocadorBuddy:
+    """
+    Alocador de sub-redes dentro de um bloco pai, no esquema buddy.
+
+    Para cada CIDR guarda o conjunto dos blocos livres daquele tamanho (para
+    achar o irmão em O(1) ao liberar) e um heap com os mesmos endereços
+    (para sempre alocar o bloco de menor endereço). Entradas do heap que já
+    saíram do conjunto são descartadas quando chegam ao topo, e o heap é
+    refeito a partir do conjunto quando elas passam a ser a maioria.
+
+    Exemplo:
+        >>> alocador = AlocadorBuddy("10.0.0.0/24")
+        >>> str(alocador.alocar(26)), str(alocador.alocar(25))
+        ('10.0.0.0/26', '10.0.0.128/25')
+        >>> [str(rede) for rede in alocador.livres()]
+        ['10.0.0.64/26']
+    """
+
+    def __init__(self, bloco_pai, cidr: int = None):
+        """
+        Args:
+            bloco_pai: RedeIPv4, "a.b.c.d/n", ou endereço com cidr
+            cidr (int): Máscara CIDR, se bloco_pai não a contiver
+
+        Raises:
+            ValueError: Se o bloco for inválido
+        """
+        if not isinstance(bloco_pai, RedeIPv4):
+            bloco_pai = RedeIPv4(bloco_pai, cidr)
+        self._pai = bloco_pai
+
+        inicio = int(bloco_pai.rede)
+        self._livres = [set() for _ in range(33)]
+        self._heaps = [[] for _ in range(33)]
+        self._livres[bloco_pai.cidr].add(inicio)
+        self._heaps[bloco_pai.cidr].append(inicio)
+
+        # Blocos alocados: endereço inicial -> CIDR
+        self._alocados = {}
+
+    @property
+    def bloco_pai(self) -> RedeIPv4:
+        """Bloco de onde as sub-redes são alocadas."""
+        return self._pai
+
+    @property
+    def enderecos_livres(self) -> int:
+        """Quantidade de endereços ainda não alocados."""
+        return sum(len(livres) << (32 - cidr) for cidr, livres in enumerate(self._livres))
+
+    def _retirar_menor(self, cidr: int):
+        """Remove e retorna o menor bloco livre do tamanho, ou None."""
+        heap, livres = self._heaps[cidr], self._livres[cidr]
+        while heap:
+            inicio = heapq.heappop(heap)
+            if inicio in livres:
+                livres.remove(inicio)
+                return inicio
+        return None
+
+    def _devolver(self, inicio: int, cidr: int) -> None:
+        heap, livres = self._heaps[cidr], self._livres[cidr]
+        livres.add(inicio)
+        if len(heap) > 2 * len(livres) + 64:
+            # Sob muitas alocações e liberações as entradas obsoletas (e
+            # repetidas) dominariam o heap: refaz só com os blocos livres
+            heap[:] = livres
+            heapq.heapify(heap)
+        else:
+            heapq.heappush(heap, inicio)
+
+    def alocar(self, cidr: int) -> RedeIPv4:
+        """
+        Aloca o bloco livre /cidr de menor endereço.
+
+        Args:
+            cidr (int): Tamanho do bloco (entre o CIDR do pai e 32)
+
+        Returns:
+            RedeIPv4: Sub-rede alocada
+
+        Raises:
+            ValueError: Se o CIDR for inválido ou não houver espaço
+        """
+        if not isinstance(cidr, int) or not self._pai.cidr <= cidr <= 32:
+            raise ValueError(f"CIDR deve estar entre {self._pai.cidr} e 32: {cidr}")
+
+        # Menor bloco livre que comporte o pedido
+        origem = cidr
+        inicio = self._retirar_menor(origem)
+        while inicio is None:
+            origem -= 1
+            if origem < self._pai.cidr:
+                raise ValueError(f"Espaço insuficiente em {self._pai} para um /{cidr}")
+            inicio = self._retirar_menor(origem)
+
+        # Divide ao meio até o tamanho pedido, deixando as metades altas livres
+        while origem < cidr:
+            origem += 1
+            self._devolver(inicio + (1 << (32 - origem)), origem)
+
+        self._alocados[inicio] = cidr
+        return RedeIPv4(inicio, cidr)
+
+    def alocar_hosts(self, num_hosts: int) -> RedeIPv4:
+        """Aloca a menor sub-rede com pelo menos num_hosts hosts (ver cidr_para_hosts)."""
+        return self.alocar(cidr_para_hosts(num_hosts))
+
+    def liberar(self, rede) -> None:
+        """
+        Devolve uma sub-rede alocada, juntando-a com os irmãos livres.
+
+        Args:
+            rede: RedeIPv4 ou "a.b.c.d/n" retornada por alocar
+
+        Raises:
+            ValueError: Se a rede não estiver alocada
+        """
+        if not isinstance(rede, RedeIPv4):
+            rede = RedeIPv4(rede)
+        inicio, cidr = int(rede.rede), rede.cidr
+        if self._alocados.get(inicio) != cidr:
+            raise ValueError(f"Rede não alocada: {rede}")
+        del self._alocados[inicio]
+
+        while cidr > self._pai.cidr:
+            irmao = inicio ^ (1 << (32 - cidr))
+            livres = self._livres[cidr]
+            if irmao not in livres:
+                break
+            # A entrada do irmão no heap fica para trás e é descartada depois
+            livres.remove(irmao)
+            inicio &= irmao
+            cidr -= 1
+        self._devolver(inicio, cidr)
+
+    def alocados(self) -> list:
+        """Sub-redes alocadas, em ordem de endereço."""
+        return [RedeIPv4(inicio, cidr) for inicio, cidr in sorted(self._alocados.items())]
+
+    def livres(self) -> list:
+        """Blocos livres (já fundidos ao máximo), em ordem de endereço."""
+        return sorted(RedeIPv4(inicio, cidr)
+                      for cidr, livres in enumerate(self._livres) for inicio in livres)
+
+
+def planejar_vlsm(bloco_pai, requisitos_de_hosts) -> dict:
+    """
+    Planeja sub-redes VLSM para uma lista de requisitos de hosts.
+
+    Os requisitos são atendidos do maior para o menor, cada um com a menor
+    sub-rede que comporta seus hosts, sempre no menor endereço livre.
+
+    Args:
+        bloco_pai: RedeIPv4 ou "a.b.c.d/n" a ser dividido
+        requisitos_de_hosts: Lista de quantidades de hosts, ou dict
+            nome -> quantidade
+
+    Returns:
+        dict: "alocacoes" (lista, na ordem dos requisitos, de dicts com
+            "nome", "hosts" e "rede") e "livres" (blocos que sobraram)
+
+    Raises:
+        ValueError: Se algum requisito for inválido ou não couber no bloco
+
+    Exemplo:
+        >>> plano = planejar_vlsm("192.168.1.0/24", {"A": 100, "B": 50, "C": 2})
+        >>> [(a["nome"], str(a["rede"])) for a in plano["alocacoes"]]
+        [('A', '192.168.1.0/25'), ('B', '192.168.1.128/26'), ('C', '192.168.1.192/31')]
+        >>> [str(rede) for rede in plano["livres"]][:2]
+        ['192.168.1.194/31', '192.168.1.196/30']
+    """
+    if isinstance(requisitos_de_hosts, dict):
+        itens = list(requisitos_de_hosts.items())
+    else:
+        itens = list(enumerate(requisitos_de_hosts))
+
+    alocador = AlocadorBuddy(bloco_pai)
+    cidrs = [cidr_para_hosts(hosts) for _, hosts in itens]
+
+    # Maiores primeiro; empates mantêm a ordem de entrada
+    ordem = sorted(range(len(itens)), key=cidrs.__getitem__)
+    redes = [None] * len(itens)
+    for posicao in ordem:
+        try:
+            redes[posicao] = alocador.alocar(cidrs[posicao])
+        except ValueError:
+            nome, hosts = itens[posicao]
+            raise ValueError(f"O requisito {nome!r} ({hosts} hosts) não cabe em {alocador.bloco_pai}")
+
+    return {
+        "alocacoes": [{"nome": nome, "hosts": hosts, "rede": rede}
+                      for (nome, hosts), rede in zip(itens, redes)],
+        "livres": alocador.livres(),
+    }
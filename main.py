@@ -14,12 +14,27 @@ Funcionalidades:
 3) Recebe IP de destino do usuário
 4) Mostra máscara em formato decimal
 5) Informa se IPs estão na mesma rede
+
+Modo em lote (não interativo):
+    python main.py --cidr 24 --entrada ips.txt --formato jsonl
+    cat ips.txt | python main.py --origem 10.0.0.1 --cidr 16 --entrada -
+
+Com --metricas, ao final imprime em stderr as contagens de chamadas, falhas
+de validação e latências das funções de rede (formato Prometheus).
 """
 
+import argparse
+import os
+import sys
+
+from core import instrumentacao
+from core.formato_binario import classificar_binario, eh_arquivo_binario
+from core.paralelo import classificar_arquivo_paralelo
+from core.processamento import FORMATOS, classificar_fluxo
 from core.network_utils import (
     validar_ip, 
     validar_cidr, 
-    cidr_para_mascara_decimal, 
+    descrever_rede, 
     ips_mesma_rede
 )
 
@@ -73,16 +88,17 @@ def obter_ip_destino():
             print("❌ ERRO: IP inválido! Use o formato xxx.xxx.xxx.xxx (0-255)")
 
 
-def exibir_resultados(cidr, mascara_decimal, ip_destino, mesma_rede):
+def exibir_resultados(descricao, ip_destino, mesma_rede):
     """
     Exibe os resultados da análise.
     
     Args:
-        cidr (int): Máscara CIDR
-        mascara_decimal (str): Máscara em formato decimal
+        descricao (dict): Descrição da rede de origem (de descrever_rede)
         ip_destino (str): IP de destino
         mesma_rede (bool): Se estão na mesma rede
     """
+    cidr = descricao["cidr"]
+    
     print("\n" + "=" * 60)
     print("                  RESULTADOS")
     print("=" * 60)
@@ -90,13 +106,18 @@ def exibir_resultados(cidr, mascara_decimal, ip_destino, mesma_rede):
     # A) Máscara em formato decimal
     print(f"\nA) MÁSCARA DE REDE:")
     print(f"   {cidr} bits")
-    print(f"   {mascara_decimal}")
+    print(f"   {descricao['mascara']}")
+    print(f"   Wildcard: {descricao['wildcard']}")
     
     # B) Verificação de mesma rede
     print(f"\nB) ANÁLISE DE REDE:")
     print(f"   IP Origem:  {IP_ORIGEM}")
     print(f"   IP Destino: {ip_destino}")
     print(f"   Máscara:    /{cidr}")
+    print(f"   Rede:       {descricao['rede']}")
+    print(f"   Broadcast:  {descricao['broadcast']}")
+    print(f"   Hosts:      {descricao['primeiro_host']} - {descricao['ultimo_host']}"
+          f" ({descricao['num_hosts']:,} utilizáveis)")
     
     if mesma_rede:
         print("   ✅ RESULTADO: Os IPs ESTÃO na mesma rede!")
@@ -106,41 +127,250 @@ def exibir_resultados(cidr, mascara_decimal, ip_destino, mesma_rede):
     print("=" * 60)
 
 
-def main():
-    """Função principal do programa."""
-    try:
-        # Exibe cabeçalho
-        exibir_cabecalho()
+def analisar_argumentos(argv=None):
+    """
+    Interpreta os argumentos de linha de comando.
+    
+    Sem argumentos o programa roda no modo interativo; com --entrada roda no
+    modo em lote (não interativo).
+    
+    Args:
+        argv (list): Argumentos (padrão: sys.argv[1:])
         
-        # Obtém dados do usuário
-        print("\n📋 ENTRADA DE DADOS:")
-        cidr = obter_mascara_cidr()
-        ip_destino = obter_ip_destino()
+    Returns:
+        argparse.Namespace: Argumentos interpretados
+    """
+    parser = argparse.ArgumentParser(
+        description="NetworkTools - Analisador de Redes IP. "
+                    "Sem argumentos, inicia o modo interativo."
+    )
+    parser.add_argument("--origem", default=IP_ORIGEM,
+                        help=f"IP de origem (padrão: {IP_ORIGEM})")
+    parser.add_argument("--cidr", type=int,
+                        help="Máscara de rede em bits (obrigatória no modo em lote)")
+    parser.add_argument("--entrada",
+                        help="Arquivo com um IP de destino por linha (ou no formato "
+                             "binário de core.formato_binario), ou '-' para stdin")
+    parser.add_argument("--formato", choices=FORMATOS, default="csv",
+                        help="Formato da saída no modo em lote (padrão: csv)")
+    parser.add_argument("--trabalhadores", type=int,
+                        help="Processa o arquivo em paralelo com N processos (exige --saida)")
+    parser.add_argument("--saida",
+                        help="Arquivo de saída do modo paralelo")
+    parser.add_argument("--manter-fatias", action="store_true",
+                        help="No modo paralelo, grava uma saída por fatia em vez de juntar")
+    parser.add_argument("--metricas", action="store_true",
+                        help="Ao final, imprime em stderr as métricas das funções de rede "
+                             "(formato Prometheus; no modo paralelo, só do processo principal)")
+    
+    args = parser.parse_args(argv)
+    
+    if args.entrada is None:
+        usadas = [opcao for opcao, valor in (("--trabalhadores", args.trabalhadores),
+                                              ("--saida", args.saida),
+                                              ("--manter-fatias", args.manter_fatias or None))
+                  if valor is not None]
+        if usadas:
+            verbo = "exigem" if len(usadas) > 1 else "exige"
+            parser.error(f"{', '.join(usadas)} {verbo} --entrada")
+    else:
+        if args.cidr is None:
+            parser.error("--cidr é obrigatório com --entrada")
+        if not validar_cidr(args.cidr):
+            parser.error("a máscara deve estar entre 0 e 32 bits")
+        if not validar_ip(args.origem):
+            parser.error(f"IP de origem inválido: {args.origem}")
+        if args.trabalhadores is not None:
+            if args.trabalhadores < 1:
+                parser.error("--trabalhadores deve ser pelo menos 1")
+            if args.entrada == "-" or args.saida is None:
+                parser.error("o modo paralelo exige --entrada com arquivo e --saida")
+            # As fatias são cortadas em quebras de linha: um arquivo binário
+            # seria dividido no meio dos registros
+            if eh_arquivo_binario(args.entrada):
+                parser.error("o modo paralelo aceita só arquivos de texto; "
+                             "remova --trabalhadores para arquivos binários")
+    
+    return args
+
+
+def executar_lote(args):
+    """
+    Executa o modo em lote: lê IPs de um arquivo ou stdin e escreve os
+    resultados em stdout, com um resumo em stderr.
+    
+    Args:
+        args (argparse.Namespace): Argumentos de analisar_argumentos
         
-        # Processa os dados
-        print("\n⚙️  PROCESSANDO...")
-        mascara_decimal = cidr_para_mascara_decimal(cidr)
-        mesma_rede = ips_mesma_rede(IP_ORIGEM, ip_destino, cidr)
+    Returns:
+        int: Código de saída do processo
+    """
+    if args.entrada != "-" and eh_arquivo_binario(args.entrada):
+        return executar_lote_binario(args)
+    
+    # Bytes inválidos em UTF-8 viram U+FFFD (IP inválido), como no modo paralelo
+    if args.entrada == "-":
+        entrada = sys.stdin
+        entrada.reconfigure(errors="replace")
+    else:
+        try:
+            entrada = open(args.entrada, encoding="utf-8", errors="replace", buffering=1 << 20)
+        except OSError as e:
+            print(f"❌ ERRO: não foi possível abrir {args.entrada}: {e}", file=sys.stderr)
+            return 1
+    
+    try:
+        contagens = classificar_fluxo(entrada, sys.stdout, args.origem, args.cidr, args.formato)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Consumidor do pipe encerrou antes (ex: | head); não é erro.
+        # Redireciona stdout para devnull para o flush final não falhar.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    finally:
+        if entrada is not sys.stdin:
+            entrada.close()
+    
+    print(f"Total: {contagens['total']} | Mesma rede: {contagens['mesma_rede']} | "
+          f"Outra rede: {contagens['outra_rede']} | Inválidos: {contagens['invalidos']}",
+          file=sys.stderr)
+    return 0
+
+
+def executar_lote_binario(args):
+    """
+    Executa o modo em lote sobre um arquivo no formato binário
+    (gerado com python -m core.formato_binario), sem reconverter texto.
+    
+    Args:
+        args (argparse.Namespace): Argumentos de analisar_argumentos
         
-        # Exibe resultados
-        exibir_resultados(cidr, mascara_decimal, ip_destino, mesma_rede)
+    Returns:
+        int: Código de saída do processo
+    """
+    try:
+        contagens = classificar_binario(args.entrada, sys.stdout, args.origem, args.cidr, args.formato)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except (OSError, ValueError) as e:
+        print(f"❌ ERRO: {e}", file=sys.stderr)
+        return 1
+    
+    print(f"Total: {contagens['total']} | Mesma rede: {contagens['mesma_rede']} | "
+          f"Outra rede: {contagens['outra_rede']}", file=sys.stderr)
+    return 0
+
+
+def executar_paralelo(args):
+    """
+    Executa o modo em lote paralelo: divide o arquivo em fatias e classifica
+    cada uma em um processo, mostrando a taxa de cada trabalhador em stderr.
+    
+    Args:
+        args (argparse.Namespace): Argumentos de analisar_argumentos
         
-        # Pergunta se quer continuar
-        print("\nDeseja fazer outra análise? (s/n): ", end="")
-        resposta = input().lower().strip()
+    Returns:
+        int: Código de saída do processo
+    """
+    try:
+        relatorio = classificar_arquivo_paralelo(
+            args.entrada, args.saida, args.origem, args.cidr, args.formato,
+            trabalhadores=args.trabalhadores, manter_fatias=args.manter_fatias
+        )
+    except OSError as e:
+        print(f"❌ ERRO: {e}", file=sys.stderr)
+        return 1
+    
+    for trabalhador in relatorio["trabalhadores"]:
+        print(f"Trabalhador {trabalhador['pid']}: {trabalhador['fatias']} fatias, "
+              f"{trabalhador['linhas']} linhas, {trabalhador['linhas_por_segundo']:,.0f} linhas/s",
+              file=sys.stderr)
+    
+    contagens = relatorio["contagens"]
+    print(f"Total: {contagens['total']} | Mesma rede: {contagens['mesma_rede']} | "
+          f"Outra rede: {contagens['outra_rede']} | Inválidos: {contagens['invalidos']} | "
+          f"{relatorio['segundos']:.2f}s", file=sys.stderr)
+    return 0
+
+
+def executar_analise():
+    """
+    Executa uma análise interativa completa.
+    
+    Returns:
+        bool: True se o usuário quiser fazer outra análise
+    """
+    # Exibe cabeçalho
+    exibir_cabecalho()
+    
+    # Obtém dados do usuário
+    print("\n📋 ENTRADA DE DADOS:")
+    cidr = obter_mascara_cidr()
+    ip_destino = obter_ip_destino()
+    
+    # Processa os dados
+    print("\n⚙️  PROCESSANDO...")
+    descricao = descrever_rede(IP_ORIGEM, cidr)
+    mesma_rede = ips_mesma_rede(IP_ORIGEM, ip_destino, cidr)
+    
+    # Exibe resultados
+    exibir_resultados(descricao, ip_destino, mesma_rede)
+    
+    # Pergunta se quer continuar
+    print("\nDeseja fazer outra análise? (s/n): ", end="")
+    resposta = input().lower().strip()
+    
+    return resposta in ['s', 'sim', 'y', 'yes']
+
+
+def main(argv=None):
+    """Função principal do programa."""
+    args = analisar_argumentos(argv)
+    
+    if not args.metricas:
+        return executar(args)
+    
+    instrumentacao.ativar()
+    try:
+        return executar(args)
+    finally:
+        instrumentacao.desativar()
+        print(instrumentacao.exportar_prometheus(), end="", file=sys.stderr)
+
+
+def executar(args):
+    """
+    Executa o modo escolhido nos argumentos (paralelo, lote ou interativo).
+    
+    Args:
+        args (argparse.Namespace): Argumentos de analisar_argumentos
         
-        if resposta in ['s', 'sim', 'y', 'yes']:
+    Returns:
+        int: Código de saída do processo
+    """
+    if args.trabalhadores is not None:
+        return executar_paralelo(args)
+    
+    if args.entrada is not None:
+        return executar_lote(args)
+    
+    try:
+        # Laço (em vez de recursão) para várias análises na mesma sessão
+        while executar_analise():
             print("\n" + "─" * 60)
-            main()  # Recursão para nova análise
-        else:
-            print("\n👋 Obrigado por usar o NetworkTools!")
+        
+        print("\n👋 Obrigado por usar o NetworkTools!")
             
     except KeyboardInterrupt:
         print("\n\n👋 Programa interrompido pelo usuário. Até logo!")
     except Exception as e:
         print(f"\n❌ ERRO INESPERADO: {e}")
         print("Entre em contato com o suporte técnico.")
+    
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,65 @@
+"""
+NetworkTools - Serviço HTTP/JSON
+Trabalho 01 - Redes de Computadores
+
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Expõe as funções de rede em HTTP/1.1 para outros serviços, sem depender do
+Streamlit (somente biblioteca padrão; NumPy é usado no lote se instalado).
+
+Para executar:
+    python servidor.py --porta 8080
+    curl "http://127.0.0.1:8080/mesma-rede?origem=192.168.1.10&destino=192.168.1.100&cidr=24"
+    curl -d '["192.168.1.100", "10.0.0.1"]' "http://127.0.0.1:8080/lote?origem=192.168.1.10&cidr=24"
+
+Com --metricas, GET /metricas expõe contagens e latências das funções de
+rede no formato do Prometheus.
+"""
+
+import argparse
+import asyncio
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from core import instrumentacao
+from core.servidor_http import servir
+
+
+def analisar_argumentos(argv=None):
+    """
+    Interpreta os argumentos de linha de comando.
+
+    Args:
+        argv (list): Argumentos (None usa sys.argv)
+
+    Returns:
+        argparse.Namespace: Argumentos interpretados
+    """
+    parser = argparse.ArgumentParser(description="Serviço HTTP/JSON do NetworkTools")
+    parser.add_argument("--host", default="127.0.0.1", help="Endereço de escuta (padrão: 127.0.0.1)")
+    parser.add_argument("--porta", type=int, default=8080, help="Porta de escuta (padrão: 8080)")
+    parser.add_argument("--trabalhadores", type=int, default=4,
+                        help="Threads para os lotes grandes (padrão: 4)")
+    parser.add_argument("--metricas", action="store_true",
+                        help="Coleta métricas das funções de rede (expostas em GET /metricas)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Função principal do serviço."""
+    args = analisar_argumentos(argv)
+    if args.metricas:
+        instrumentacao.ativar()
+    print(f"🌐 NetworkTools escutando em http://{args.host}:{args.porta}", file=sys.stderr)
+
+    with ThreadPoolExecutor(max_workers=args.trabalhadores) as executor:
+        try:
+            asyncio.run(servir(args.host, args.porta, executor))
+        except KeyboardInterrupt:
+            print("\n👋 Serviço encerrado.", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
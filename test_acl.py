@@ -0,0 +1,176 @@
+"""
+Testes unitários para o módulo acl
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para as ACLs com máscaras curinga: leitura da
+sintaxe do IOS e avaliação escalar e em lote comparadas com a busca linear
+(primeira regra que casa).
+"""
+
+import random
+import unittest
+from unittest import mock
+
+from core import network_utils
+from core.acl import (
+    NEGAR,
+    PERMITIR,
+    QUALQUER,
+    SEM_REGRA,
+    ListaAcesso,
+    RegraACL,
+    analisar_acl,
+    analisar_regra,
+)
+from core.network_utils import ip_para_inteiro
+
+
+def regras_aleatorias(aleatorio, quantidade):
+    """Regras com prefixos, hosts, "any" e curingas não contíguos."""
+    def campo():
+        sorteio = aleatorio.random()
+        if sorteio < 0.1:
+            return 0, QUALQUER
+        if sorteio < 0.2:
+            return aleatorio.getrandbits(32), 0
+        if sorteio < 0.4:
+            curinga = aleatorio.getrandbits(32) & aleatorio.getrandbits(32)
+        else:
+            curinga = (1 << aleatorio.randrange(0, 25)) - 1
+        return aleatorio.getrandbits(32) & ~curinga & QUALQUER, curinga
+
+    return [RegraACL(aleatorio.choice((PERMITIR, NEGAR)), *campo(), *campo())
+            for _ in range(quantidade)]
+
+
+def pacotes_aleatorios(aleatorio, regras, quantidade):
+    """Pacotes que casam com regras sorteadas (70%) ou totalmente aleatórios."""
+    pacotes = []
+    for _ in range(quantidade):
+        if regras and aleatorio.random() < 0.7:
+            regra = aleatorio.choice(regras)
+            pacotes.append((regra.origem | aleatorio.getrandbits(32) & regra.curinga_origem,
+                            regra.destino | aleatorio.getrandbits(32) & regra.curinga_destino))
+        else:
+            pacotes.append((aleatorio.getrandbits(32), aleatorio.getrandbits(32)))
+    return pacotes
+
+
+def primeira_regra(regras, origem, destino):
+    return next((indice for indice, regra in enumerate(regras) if regra.casa(origem, destino)),
+                SEM_REGRA)
+
+
+class TestAnalisarRegra(unittest.TestCase):
+    """Testes para analisar_regra e analisar_acl."""
+
+    def test_formas_de_endereco(self):
+        """Testa any, host, endereço + curinga e CIDR (com bits ignorados zerados)."""
+        regra = analisar_regra("permit 10.1.2.3 0.0.255.255 any")
+        self.assertEqual(regra, RegraACL(PERMITIR, ip_para_inteiro("10.1.0.0"), 0xFFFF, 0, QUALQUER))
+        regra = analisar_regra("deny host 10.0.0.1 192.168.1.77/24")
+        self.assertEqual(regra, RegraACL(NEGAR, ip_para_inteiro("10.0.0.1"), 0,
+                                         ip_para_inteiro("192.168.1.0"), 0xFF))
+
+    def test_prefixos_do_ios(self):
+        """Testa access-list, número de sequência, protocolo ip e maiúsculas."""
+        esperado = analisar_regra("permit 10.0.0.0 0.255.255.255 any")
+        for texto in ("access-list 101 permit ip 10.0.0.0 0.255.255.255 any",
+                      "10 permit ip 10.0.0.0 0.255.255.255 any",
+                      "PERMIT IP 10.0.0.0 0.255.255.255 ANY"):
+            with self.subTest(texto=texto):
+                self.assertEqual(analisar_regra(texto), esperado)
+
+    def test_ida_e_volta(self):
+        """Testa que str(regra) é lido de volta como a mesma regra."""
+        for texto in ("permit any any", "deny host 1.2.3.4 10.0.0.0 0.0.255.0"):
+            with self.subTest(texto=texto):
+                self.assertEqual(str(analisar_regra(texto)), texto)
+
+    def test_regras_invalidas(self):
+        """Testa que regras incompletas ou não suportadas levantam ValueError."""
+        for texto in ("", "allow any any", "permit any", "permit host", "permit 10.0.0.0 any",
+                      "permit 10.0.0.0/33 any", "permit tcp any any eq 80", "deny any any log",
+                      "permit 10.0.0.300 0.0.0.255 any"):
+            with self.subTest(texto=texto):
+                with self.assertRaises(ValueError):
+                    analisar_regra(texto)
+
+    def test_analisar_acl(self):
+        """Testa que comentários, remarks e linhas vazias são ignorados."""
+        texto = """
+        ! borda da rede
+        access-list 10 remark bloqueia o servidor
+        access-list 10 deny host 10.0.0.5 any
+        # liberada a rede interna
+        access-list 10 permit 10.0.0.0 0.0.0.255 any
+        """
+        self.assertEqual([regra.acao for regra in analisar_acl(texto)], [NEGAR, PERMITIR])
+        with self.assertRaisesRegex(ValueError, "Linha 2"):
+            analisar_acl("permit any any\npermit any")
+
+
+class TestListaAcesso(unittest.TestCase):
+    """Testes para ListaAcesso."""
+
+    def test_primeira_regra_decide(self):
+        """Testa a ordem das regras e o deny implícito."""
+        lista = ListaAcesso(["deny host 10.0.0.5 any",
+                             "permit 10.0.0.0 0.0.0.255 192.168.0.0 0.0.255.255",
+                             "deny 10.0.0.0/8 any"])
+        self.assertEqual(len(lista), 3)
+        self.assertEqual(lista.avaliar_indice("10.0.0.5", "192.168.1.1"), 0)
+        self.assertEqual(lista.avaliar_indice("10.0.0.6", "192.168.1.1"), 1)
+        self.assertEqual(lista.avaliar_indice("10.0.1.6", "192.168.1.1"), 2)
+        self.assertEqual(lista.avaliar_indice("11.0.0.1", "192.168.1.1"), SEM_REGRA)
+        self.assertEqual(lista.avaliar("10.0.0.6", "192.168.1.1"), PERMITIR)
+        self.assertEqual(lista.avaliar("11.0.0.1", "192.168.1.1"), NEGAR)
+
+    def test_curinga_nao_contiguo(self):
+        """Testa um curinga que ignora só o 3º octeto."""
+        lista = ListaAcesso(["permit 10.1.0.7 0.0.255.0 any"])
+        self.assertEqual(lista.avaliar("10.1.200.7", "8.8.8.8"), PERMITIR)
+        self.assertEqual(lista.avaliar("10.1.200.8", "8.8.8.8"), NEGAR)
+
+    def test_lista_vazia_e_ip_invalido(self):
+        """Testa a ACL sem regras e IPs inválidos."""
+        lista = ListaAcesso([])
+        self.assertEqual(lista.avaliar("1.1.1.1", "2.2.2.2"), NEGAR)
+        self.assertEqual(list(lista.avaliar_lote([1, 2], [3, 4])), [SEM_REGRA, SEM_REGRA])
+        with self.assertRaises(ValueError):
+            lista.avaliar("1.1.1.256", "2.2.2.2")
+        with self.assertRaises(ValueError):
+            lista.avaliar_lote([1, 2], [3])
+
+    def test_coincide_com_busca_linear(self):
+        """Testa a avaliação escalar e em lote (com e sem NumPy) contra a busca linear."""
+        aleatorio = random.Random(22)
+        for quantidade in (1, 7, 64, 300):
+            regras = regras_aleatorias(aleatorio, quantidade)
+            lista = ListaAcesso(regras)
+            pacotes = pacotes_aleatorios(aleatorio, regras, 1500)
+            origens = [origem for origem, _ in pacotes]
+            destinos = [destino for _, destino in pacotes]
+            esperado = [primeira_regra(regras, origem, destino) for origem, destino in pacotes]
+
+            with self.subTest(quantidade=quantidade):
+                self.assertEqual([lista.avaliar_indice(o, d) for o, d in pacotes], esperado)
+                # Pacotes repetidos (fluxos) usam as etapas por classes; os
+                # distintos, a avaliação pacote a pacote
+                self.assertEqual(list(lista.avaliar_lote(origens * 4, destinos * 4)), esperado * 4)
+                self.assertEqual(list(lista.avaliar_lote(origens, destinos)), esperado)
+                with mock.patch.object(network_utils, "np", None):
+                    self.assertEqual(lista.avaliar_lote(origens, destinos), esperado)
+
+    def test_permitidos_lote(self):
+        """Testa as ações em lote, incluindo o deny implícito."""
+        lista = ListaAcesso(["deny host 10.0.0.5 any", "permit 10.0.0.0/24 any"])
+        origens = [ip_para_inteiro(ip) for ip in ("10.0.0.5", "10.0.0.6", "10.0.1.1")]
+        self.assertEqual(list(lista.permitidos_lote(origens * 3, [0] * 9)), [False, True, False] * 3)
+        with mock.patch.object(network_utils, "np", None):
+            self.assertEqual(lista.permitidos_lote(origens, [0] * 3), [False, True, False])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
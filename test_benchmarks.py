@@ -0,0 +1,65 @@
+"""
+Testes unitários para a suíte de benchmarks
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para a comparação com a baseline e para a
+medição de um caso (sem rodar a suíte completa, que é demorada).
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from benchmarks import suite
+from benchmarks.suite import comparar_com_baseline, medir_caso
+
+
+def _resultado(**normalizados):
+    return {"resultados": {nome: {"ns": valor * 100, "normalizado": valor}
+                           for nome, valor in normalizados.items()}}
+
+
+class TestBaseline(unittest.TestCase):
+    """Testes para comparar_com_baseline e o código de saída."""
+
+    def test_regressoes(self):
+        """Testa que só casos acima da tolerância (e presentes nos dois lados) são acusados."""
+        baseline = _resultado(a=1.0, b=2.0, c=1.0, removido=1.0)
+        atual = _resultado(a=1.3, b=3.0, c=0.5, novo=9.0)
+        regressoes = comparar_com_baseline(atual, baseline, tolerancia=0.35)
+        self.assertEqual([nome for nome, *_ in regressoes], ["b"])
+        self.assertEqual(regressoes[0][3], 1.5)
+        self.assertEqual(comparar_com_baseline(atual, baseline, tolerancia=0.2)[1][0], "a")
+
+    def test_main_falha_com_regressao(self):
+        """Testa o código de saída de main com e sem regressão."""
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "baseline.json")
+            with open(caminho, "w", encoding="utf-8") as arquivo:
+                json.dump(_resultado(x=1.0), arquivo)
+            for atual, codigo in ((_resultado(x=1.1), 0), (_resultado(x=2.0), 1)):
+                with self.subTest(atual=atual):
+                    with mock.patch.object(suite, "executar_suite", return_value=atual), \
+                         mock.patch("builtins.print"):
+                        self.assertEqual(suite.main(["--baseline", caminho]), codigo)
+
+
+class TestMedicao(unittest.TestCase):
+    """Testes para medir_caso."""
+
+    def test_medir_caso(self):
+        """Testa os campos de um caso com referência e a ordem de grandeza relativa."""
+        itens = list(range(100))
+        rapido = lambda: [item for item in itens]
+        lento = lambda: [str(item) * 3 for item in itens]
+        resultado = medir_caso(rapido, len(itens), lento, repeticoes=2, tempo_minimo=0.002)
+        self.assertEqual(set(resultado), {"ns", "normalizado", "ipaddress_ns"})
+        self.assertGreater(resultado["ipaddress_ns"], resultado["ns"])
+        self.assertGreater(resultado["normalizado"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
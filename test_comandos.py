@@ -0,0 +1,126 @@
+"""
+Testes unitários para o módulo comandos
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para os comandos de uma chamada só (saída,
+códigos de saída e erros) e para o tempo de partida do módulo, medido com
+"python -X importtime" contra um orçamento fixo.
+"""
+
+import importlib.util
+import io
+import os
+import subprocess
+import sys
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from core.comandos import main
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+
+# Tempo máximo (µs) de importação de core.comandos com o bytecode em cache;
+# medido em torno de 1,5 ms, contra ~80 ms quando o NumPy era importado
+ORCAMENTO_IMPORTACAO_US = 25_000
+
+# Módulos pesados que não podem ser carregados na partida
+MODULOS_PROIBIDOS = ("numpy", "argparse", "json", "sqlite3", "asyncio")
+
+
+def executar(*argumentos):
+    """Roda main() e devolve (código, stdout, stderr)."""
+    saida, erros = io.StringIO(), io.StringIO()
+    with redirect_stdout(saida), redirect_stderr(erros):
+        codigo = main(list(argumentos))
+    return codigo, saida.getvalue(), erros.getvalue()
+
+
+def tempos_de_importacao(modulo: str) -> dict:
+    """Roda "python -X importtime -c 'import modulo'" e devolve módulo -> µs acumulados."""
+    ambiente = {**os.environ, "PYTHONPATH": RAIZ}
+    ambiente.pop("PYTHONDONTWRITEBYTECODE", None)  # mede com o .pyc em cache
+    processo = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+                              cwd=RAIZ, env=ambiente, capture_output=True, text=True, check=True)
+    tempos = {}
+    for linha in processo.stderr.splitlines():
+        if linha.startswith("import time:") and "|" in linha:
+            _, acumulado, nome = linha.split("|")
+            if acumulado.strip().isdigit():
+                tempos[nome.strip()] = int(acumulado)
+    return tempos
+
+
+class TestComandos(unittest.TestCase):
+    """Testes para mascara, mesma-rede e descrever."""
+
+    def test_mascara(self):
+        """Testa a máscara decimal e CIDRs inválidos."""
+        self.assertEqual(executar("mascara", "24"), (0, "255.255.255.0\n", ""))
+        self.assertEqual(executar("mascara", "0")[1], "0.0.0.0\n")
+        for cidr in ("33", "-1", "abc"):
+            with self.subTest(cidr=cidr):
+                codigo, saida, erros = executar("mascara", cidr)
+                self.assertEqual((codigo, saida), (2, ""))
+                self.assertIn("CIDR", erros)
+
+    def test_mesma_rede(self):
+        """Testa o código de saída 0/1 e IPs inválidos (2)."""
+        self.assertEqual(executar("mesma-rede", "192.168.1.10", "192.168.1.100", "24"), (0, "sim\n", ""))
+        self.assertEqual(executar("mesma-rede", "192.168.1.10", "192.168.2.10", "24"), (1, "não\n", ""))
+        self.assertEqual(executar("mesma-rede", "2001:db8::1", "2001:db8::ffff", "64")[0], 0)
+        self.assertEqual(executar("mesma-rede", "192.168.1.10", "192.168.1.300", "24")[0], 2)
+
+    def test_descrever(self):
+        """Testa a descrição campo a campo e o formato IP/CIDR."""
+        codigo, saida, _ = executar("descrever", "192.168.1.10/24")
+        self.assertEqual(codigo, 0)
+        campos = dict(linha.split(": ", 1) for linha in saida.splitlines())
+        self.assertEqual(campos["rede"], "192.168.1.0")
+        self.assertEqual(campos["broadcast"], "192.168.1.255")
+        self.assertEqual(campos["num_hosts"], "254")
+        self.assertEqual(executar("descrever", "192.168.1.10")[0], 2)
+        self.assertEqual(executar("descrever", "192.168.1.10/xx")[0], 2)
+
+    def test_uso(self):
+        """Testa ajuda, comando desconhecido e número errado de argumentos."""
+        codigo, saida, _ = executar("--help")
+        self.assertEqual(codigo, 0)
+        self.assertIn("mesma-rede", saida)
+        for argumentos in ((), ("rota",), ("mascara",), ("mascara", "24", "25")):
+            with self.subTest(argumentos=argumentos):
+                codigo, saida, erros = executar(*argumentos)
+                self.assertEqual((codigo, saida), (2, ""))
+                self.assertIn("uso:", erros)
+
+
+class TestPartida(unittest.TestCase):
+    """Testes para o tempo de partida do comando."""
+
+    def test_importacao_dentro_do_orcamento(self):
+        """Testa que core.comandos importa só o necessário e dentro do orçamento."""
+        tempos_de_importacao("core.comandos")  # grava o .pyc, se faltar
+        medicoes = [tempos_de_importacao("core.comandos") for _ in range(3)]
+
+        for proibido in MODULOS_PROIBIDOS:
+            with self.subTest(modulo=proibido):
+                self.assertNotIn(proibido, medicoes[0])
+
+        melhor = min(tempos["core.comandos"] for tempos in medicoes)
+        self.assertLess(melhor, ORCAMENTO_IMPORTACAO_US,
+                        f"core.comandos levou {melhor} µs para importar")
+
+    def test_lote_carrega_numpy_sob_demanda(self):
+        """Testa que o NumPy só é importado ao chamar uma função em lote."""
+        codigo = ("import sys; from core import network_utils as nu; "
+                  "antes = 'numpy' in sys.modules; nu.calcular_rede_lote([1], 8); "
+                  "print(antes, 'numpy' in sys.modules, nu.np is not None)")
+        processo = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ,
+                                  env={**os.environ, "PYTHONPATH": RAIZ},
+                                  capture_output=True, text=True, check=True)
+        esperado = "False True True" if importlib.util.find_spec("numpy") else "False False False"
+        self.assertEqual(processo.stdout.strip(), esperado)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,107 @@
+"""
+Testes unitários para o módulo conjunto_ip
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para o IPSet e a conversão de faixas em CIDRs.
+"""
+
+import random
+import unittest
+
+from core.conjunto_ip import IPSet, intervalo_para_cidrs
+from core.enderecos import RedeIPv4
+from core.network_utils import inteiro_para_ip, ip_para_inteiro
+
+BASE = ip_para_inteiro("10.0.0.0")
+
+
+def _conjunto_aleatorio(aleatorio, quantidade):
+    """Gera redes aleatórias dentro de 10.0.0.0/22 (1024 endereços)."""
+    redes = []
+    for _ in range(quantidade):
+        cidr = aleatorio.randint(24, 32)
+        redes.append((inteiro_para_ip(BASE + aleatorio.randrange(1024)), cidr))
+    return redes
+
+
+def _enderecos(redes):
+    """Referência: expande as redes em um set de inteiros."""
+    resultado = set()
+    for ip, cidr in redes:
+        rede = RedeIPv4(ip, cidr)
+        resultado.update(range(int(rede.rede), int(rede.rede) + rede.num_enderecos))
+    return resultado
+
+
+class TestIPSet(unittest.TestCase):
+    """Classe de testes para IPSet."""
+    
+    def test_agregacao(self):
+        """Testa a fusão de redes adjacentes e sobrepostas em CIDRs mínimos."""
+        conjunto = IPSet(["192.168.0.0/24", "192.168.1.0/24", "192.168.1.128/25",
+                          "192.168.2.5", ("192.168.3.9", 24)])
+        self.assertEqual([str(r) for r in conjunto.para_cidrs()],
+                         ["192.168.0.0/23", "192.168.2.5/32", "192.168.3.0/24"])
+        self.assertEqual(conjunto.num_enderecos, 512 + 1 + 256)
+        self.assertEqual(len(IPSet(["0.0.0.0/0"])), 2 ** 32)
+        self.assertFalse(IPSet())
+    
+    def test_pertinencia(self):
+        """Testa `in` com endereços e redes."""
+        conjunto = IPSet(["10.0.0.0/8", "192.168.1.0/24"])
+        self.assertIn("10.255.255.255", conjunto)
+        self.assertIn(ip_para_inteiro("192.168.1.1"), conjunto)
+        self.assertIn(RedeIPv4("10.1.0.0/16"), conjunto)
+        self.assertNotIn(RedeIPv4("192.168.0.0/16"), conjunto)
+        self.assertNotIn("11.0.0.0", conjunto)
+        self.assertNotIn("9.255.255.255", conjunto)
+        self.assertNotIn("inválido", conjunto)
+    
+    def test_operacoes_contra_referencia(self):
+        """Testa união, interseção e diferença contra sets de inteiros."""
+        aleatorio = random.Random(7)
+        for rodada in range(30):
+            with self.subTest(rodada=rodada):
+                redes_a = _conjunto_aleatorio(aleatorio, aleatorio.randint(0, 15))
+                redes_b = _conjunto_aleatorio(aleatorio, aleatorio.randint(0, 15))
+                a, b = IPSet(redes_a), IPSet(redes_b)
+                ref_a, ref_b = _enderecos(redes_a), _enderecos(redes_b)
+                
+                for resultado, referencia in [(a | b, ref_a | ref_b),
+                                              (a & b, ref_a & ref_b),
+                                              (a - b, ref_a - ref_b),
+                                              (b - a, ref_b - ref_a)]:
+                    self.assertEqual(len(resultado), len(referencia))
+                    self.assertEqual(_enderecos((str(r.rede), r.cidr) for r in resultado.para_cidrs()),
+                                     referencia)
+                    self.assertEqual(IPSet(resultado.para_cidrs()), resultado)
+    
+    def test_intervalo_para_cidrs(self):
+        """Testa a conversão de faixas arbitrárias em CIDRs."""
+        self.assertEqual([str(r) for r in intervalo_para_cidrs("192.168.0.1", "192.168.0.6")],
+                         ["192.168.0.1/32", "192.168.0.2/31", "192.168.0.4/31", "192.168.0.6/32"])
+        self.assertEqual([str(r) for r in intervalo_para_cidrs("0.0.0.0", "255.255.255.255")],
+                         ["0.0.0.0/0"])
+        self.assertEqual([str(r) for r in intervalo_para_cidrs("10.0.0.0", "10.0.0.0")],
+                         ["10.0.0.0/32"])
+        
+        conjunto = IPSet.de_intervalos([("10.0.0.5", "10.0.0.9"), ("10.0.0.10", "10.0.0.20")])
+        self.assertEqual([(str(a), str(b)) for a, b in conjunto.intervalos()],
+                         [("10.0.0.5", "10.0.0.20")])
+        
+        with self.assertRaises(ValueError):
+            intervalo_para_cidrs("10.0.0.9", "10.0.0.1")
+        with self.assertRaises(ValueError):
+            IPSet(["10.0.0.0/33"])
+        
+        # IPv6 é recusado em vez de virar um inteiro de 128 bits
+        for elementos in (["2001:db8::1"], [("::1", 24)], ["2001:db8::/64"]):
+            with self.subTest(elementos=elementos), self.assertRaises(ValueError):
+                IPSet(elementos)
+        with self.assertRaises(ValueError):
+            intervalo_para_cidrs("::1", "::6")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,110 @@
+"""
+Testes unitários para o módulo enderecos
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para os tipos EnderecoIPv4 e RedeIPv4.
+"""
+
+import ipaddress
+import pickle
+import sys
+import unittest
+
+from core.enderecos import EnderecoIPv4, RedeIPv4
+from core.network_utils import calcular_rede, ip_para_inteiro
+
+
+class TestEnderecoIPv4(unittest.TestCase):
+    """Classe de testes para EnderecoIPv4."""
+    
+    def test_conversoes(self):
+        """Testa construção a partir de str e int e conversões de volta."""
+        ip = EnderecoIPv4("192.168.1.10")
+        self.assertEqual(int(ip), ip_para_inteiro("192.168.1.10"))
+        self.assertEqual(str(ip), "192.168.1.10")
+        self.assertEqual(f"{ip}", "192.168.1.10")
+        self.assertEqual(str(EnderecoIPv4(int(ip))), "192.168.1.10")
+        self.assertEqual(ip.octetos, (192, 168, 1, 10))
+        self.assertEqual(ip.binario, format(int(ip), '032b'))
+        self.assertEqual(ip.binario_octetos, "11000000.10101000.00000001.00001010")
+    
+    def test_entradas_invalidas(self):
+        """Testa IPs inválidos e tipos não suportados."""
+        for entrada in ["300.1.1.1", "1.2.3", -1, 2 ** 32]:
+            with self.subTest(entrada=entrada):
+                with self.assertRaises(ValueError):
+                    EnderecoIPv4(entrada)
+        
+        with self.assertRaises(TypeError):
+            EnderecoIPv4(1.5)
+    
+    def test_comparacao_hash_e_pickle(self):
+        """Testa ordenação, uso como chave e serialização."""
+        a, b = EnderecoIPv4("10.0.0.1"), EnderecoIPv4("10.0.0.2")
+        self.assertLess(a, b)
+        self.assertEqual(a, EnderecoIPv4("10.0.0.1"))
+        self.assertEqual(len({a, b, EnderecoIPv4("10.0.0.1")}), 2)
+        self.assertEqual(pickle.loads(pickle.dumps(a)), a)
+    
+    def test_memoria(self):
+        """Testa que o endereço não tem atributos extras e ocupa menos que str/ipaddress."""
+        ip = EnderecoIPv4("192.168.1.10")
+        self.assertFalse(hasattr(ip, '__dict__'))
+        self.assertLess(sys.getsizeof(ip), sys.getsizeof("192.168.1.10"))
+        
+        # ipaddress guarda o inteiro em um objeto separado (_ip)
+        referencia = ipaddress.IPv4Address("192.168.1.10")
+        self.assertLess(sys.getsizeof(ip), sys.getsizeof(referencia) + sys.getsizeof(referencia._ip))
+
+
+class TestRedeIPv4(unittest.TestCase):
+    """Classe de testes para RedeIPv4."""
+    
+    def test_campos_derivados(self):
+        """Testa rede, máscara, broadcast e número de endereços."""
+        rede = RedeIPv4("192.168.1.10/24")
+        self.assertEqual(str(rede), "192.168.1.0/24")
+        self.assertEqual(int(rede.rede), calcular_rede("192.168.1.10", 24))
+        self.assertEqual(str(rede.mascara), "255.255.255.0")
+        self.assertEqual(str(rede.broadcast), "192.168.1.255")
+        self.assertEqual(rede.num_enderecos, 256)
+        self.assertEqual(RedeIPv4("192.168.1.10", 24), rede)
+        self.assertEqual(str(RedeIPv4("0.0.0.0/0").broadcast), "255.255.255.255")
+    
+    def test_pertinencia(self):
+        """Testa o operador `in` com endereços e sub-redes."""
+        rede = RedeIPv4("10.0.0.0/16")
+        self.assertIn("10.0.255.1", rede)
+        self.assertIn(EnderecoIPv4("10.0.0.1"), rede)
+        self.assertIn(ip_para_inteiro("10.0.1.1"), rede)
+        self.assertNotIn("10.1.0.1", rede)
+        self.assertNotIn("inválido", rede)
+        self.assertIn(RedeIPv4("10.0.4.0/24"), rede)
+        self.assertNotIn(RedeIPv4("10.0.0.0/8"), rede)
+    
+    def test_entradas_invalidas(self):
+        """Testa CIDR ausente, inválido e modo estrito."""
+        for args in [("10.0.0.0",), ("10.0.0.0/33",), ("10.0.0.0/x",),
+                     ("10.0.0.0", 40), ("10.0.0.0/8", 8)]:
+            with self.subTest(args=args):
+                with self.assertRaises(ValueError):
+                    RedeIPv4(*args)
+        
+        with self.assertRaises(ValueError):
+            RedeIPv4("10.0.0.1/8", estrito=True)
+    
+    def test_imutavel_ordenavel_e_hashable(self):
+        """Testa imutabilidade, ordenação, hash e pickle."""
+        rede = RedeIPv4("10.0.0.0/8")
+        with self.assertRaises(AttributeError):
+            rede._cidr = 16
+        
+        redes = [RedeIPv4("10.0.0.0/16"), RedeIPv4("10.0.0.0/8"), RedeIPv4("9.0.0.0/8")]
+        self.assertEqual([str(r) for r in sorted(redes)], ["9.0.0.0/8", "10.0.0.0/8", "10.0.0.0/16"])
+        self.assertEqual(len({rede, RedeIPv4("10.1.2.3/8")}), 1)
+        self.assertEqual(pickle.loads(pickle.dumps(rede)), rede)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,207 @@
+"""
+Testes unitários para o módulo fluxos
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para a agregação de fluxos por par de redes:
+equivalência com calcular_rede (com e sem NumPy), leitura de CSV e JSONL,
+registros inválidos, os maiores pares, a matriz e o limite de pares.
+"""
+
+import io
+import random
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+from core import network_utils
+from core.fluxos import (
+    MatrizTrafego,
+    ParRedes,
+    agregar_fluxos,
+    ler_fluxos,
+    main,
+)
+from core.network_utils import calcular_rede, inteiro_para_ip
+
+CSV = """src,dst,bytes,packets
+10.0.0.1,192.168.1.5,1000,10
+10.0.0.9,192.168.1.7,500,5
+10.0.1.1,8.8.8.8,300,3
+
+10.0.0.2,8.8.4.4,200,2
+999.0.0.1,8.8.8.8,1,1
+10.0.0.1,8.8.8.8,abc,1
+10.0.0.1,8.8.8.8,-5,1
+10.0.0.1,8.8.8.8
+"""
+
+
+def gerar_fluxos(quantidade: int, semente: int = 4) -> list:
+    """Fluxos entre hosts de algumas redes /16, com contadores aleatórios."""
+    aleatorio = random.Random(semente)
+    redes = [aleatorio.getrandbits(16) << 16 for _ in range(20)]
+    hosts = [inteiro_para_ip(aleatorio.choice(redes) | aleatorio.getrandbits(16)) for _ in range(300)]
+    return [(aleatorio.choice(hosts), aleatorio.choice(hosts),
+             aleatorio.randrange(40, 10 ** 9), aleatorio.randrange(1, 10 ** 4))
+            for _ in range(quantidade)]
+
+
+def esperado_por_pares(registros, cidr: int, cidr_destino: int) -> dict:
+    """A conta direta, com calcular_rede em cada endereço."""
+    esperado = {}
+    for origem, destino, quantidade_bytes, pacotes in registros:
+        chave = (f"{inteiro_para_ip(calcular_rede(origem, cidr))}/{cidr}",
+                 f"{inteiro_para_ip(calcular_rede(destino, cidr_destino))}/{cidr_destino}")
+        soma = esperado.setdefault(chave, [0, 0, 0])
+        soma[0] += quantidade_bytes
+        soma[1] += pacotes
+        soma[2] += 1
+    return esperado
+
+
+class TestMatrizTrafego(unittest.TestCase):
+    """Testes para o acumulador (com e sem NumPy)."""
+
+    def _caminhos(self):
+        """Contextos que executam o teste com NumPy (se houver) e sem NumPy."""
+        if network_utils.np is not None:
+            yield "numpy", mock.patch.object(network_utils, "np", network_utils.np)
+        yield "python", mock.patch.object(network_utils, "np", None)
+
+    def test_equivalencia_com_calcular_rede(self):
+        """Testa os totais de cada par contra a conta direta com calcular_rede."""
+        registros = gerar_fluxos(3_000)
+        texto = "src,dst,bytes,packets\n" + "".join(f"{o},{d},{b},{p}\n" for o, d, b, p in registros)
+        for cidr, cidr_destino in [(16, 16), (24, 8), (0, 32)]:
+            esperado = esperado_por_pares(registros, cidr, cidr_destino)
+            for nome, caminho in self._caminhos():
+                with self.subTest(cidr=cidr, cidr_destino=cidr_destino, caminho=nome), caminho:
+                    matriz = agregar_fluxos(io.StringIO(texto), cidr, cidr_destino=cidr_destino,
+                                            tamanho_bloco=512)
+                    obtido = {(par.origem, par.destino): [par.bytes, par.pacotes, par.fluxos]
+                              for par in matriz.maiores(len(matriz) + 1)}
+                    self.assertEqual(obtido, esperado)
+                    self.assertEqual(matriz.totais[2], len(registros))
+                    self.assertEqual(matriz.invalidos, 0)
+
+    def test_adicionar(self):
+        """Testa a soma de um fluxo e a recusa de entradas inválidas."""
+        matriz = MatrizTrafego(24)
+        matriz.adicionar("10.0.0.5", "192.168.1.9", 1500, 3)
+        matriz.adicionar("10.0.0.7", "192.168.1.1", "500", "2")
+        self.assertEqual(matriz.maiores(), [ParRedes("10.0.0.0/24", "192.168.1.0/24", 2000, 5, 2)])
+        for args in [("10.0.0.256", "1.1.1.1", 1, 1), ("10.0.0.1", "1.1.1.1", -1, 1),
+                     ("10.0.0.1", "1.1.1.1", 1, "x")]:
+            with self.subTest(args=args):
+                with self.assertRaises(ValueError):
+                    matriz.adicionar(*args)
+
+    def test_maiores_por_metrica_e_matriz(self):
+        """Testa a ordenação por bytes, pacotes e fluxos e a matriz das maiores redes."""
+        matriz = MatrizTrafego(24)
+        for origem, destino, quantidade_bytes, pacotes in [
+                ("10.0.0.1", "20.0.0.1", 1000, 1), ("10.0.0.2", "30.0.0.1", 10, 50),
+                ("10.0.0.3", "30.0.0.2", 10, 50), ("40.0.0.1", "20.0.0.9", 400, 1)]:
+            matriz.adicionar(origem, destino, quantidade_bytes, pacotes)
+        self.assertEqual(matriz.maiores(1, "bytes")[0][:2], ("10.0.0.0/24", "20.0.0.0/24"))
+        self.assertEqual(matriz.maiores(1, "pacotes")[0][:2], ("10.0.0.0/24", "30.0.0.0/24"))
+        self.assertEqual(matriz.maiores(1, "fluxos")[0].fluxos, 2)
+
+        tabela = matriz.matriz(2)
+        self.assertEqual(tabela.linhas, ["10.0.0.0/24", "40.0.0.0/24"])
+        self.assertEqual(tabela.colunas, ["20.0.0.0/24", "30.0.0.0/24"])
+        self.assertEqual(tabela.valores, [[1000, 20], [400, 0]])
+        self.assertEqual(matriz.matriz(1, "pacotes").valores, [[100]])
+        with self.assertRaises(ValueError):
+            matriz.maiores(1, "octetos")
+
+    def test_limite_de_pares(self):
+        """Testa que o limite segura a memória, conserva os totais e mantém os maiores pares."""
+        registros = gerar_fluxos(2_000)
+        registros.append(("1.2.3.4", "5.6.7.8", 10 ** 12, 1))
+        for nome, caminho in self._caminhos():
+            with self.subTest(caminho=nome), caminho:
+                matriz = MatrizTrafego(32, limite_pares=64)
+                for inicio in range(0, len(registros), 100):
+                    matriz.adicionar_bloco(*map(list, zip(*registros[inicio:inicio + 100])))
+                self.assertLessEqual(len(matriz), 64)
+                self.assertGreater(matriz.descartado[2], 0)
+                for indice in range(3):
+                    mantido = sum(soma[indice] for soma in matriz.pares.values())
+                    self.assertEqual(mantido + matriz.descartado[indice], matriz.totais[indice])
+                self.assertEqual(matriz.maiores(1)[0][:3], ("1.2.3.4/32", "5.6.7.8/32", 10 ** 12))
+
+    def test_parametros_invalidos(self):
+        """Testa CIDRs e limite de pares inválidos."""
+        for args in [(33,), (24, -1), (24, 24, 0)]:
+            with self.subTest(args=args):
+                with self.assertRaises(ValueError):
+                    MatrizTrafego(*args)
+
+
+class TestLerFluxos(unittest.TestCase):
+    """Testes para a leitura de CSV e JSONL e os registros inválidos."""
+
+    def test_csv_com_invalidos(self):
+        """Testa linhas vazias, IP inválido, contador inválido ou negativo e linha curta."""
+        for nome, np in [("numpy", network_utils.np), ("python", None)]:
+            with self.subTest(caminho=nome), mock.patch.object(network_utils, "np", np):
+                matriz = agregar_fluxos(io.StringIO(CSV), 24)
+                self.assertEqual(matriz.invalidos, 4)
+                self.assertEqual(matriz.totais, [2000, 20, 4])
+                self.assertEqual(matriz.maiores(1)[0], ParRedes("10.0.0.0/24", "192.168.1.0/24", 1500, 15, 2))
+
+    def test_cabecalho_em_portugues_e_colunas_extras(self):
+        """Testa os nomes alternativos e colunas em outra ordem."""
+        texto = "inicio,Destino,Origem,pacotes,bytes\n0,8.8.8.8,10.0.0.1,2,100\n"
+        matriz = agregar_fluxos(io.StringIO(texto), 8)
+        self.assertEqual(matriz.maiores(), [ParRedes("10.0.0.0/8", "8.0.0.0/8", 100, 2, 1)])
+
+    def test_cabecalho_sem_coluna(self):
+        """Testa o erro quando falta uma coluna obrigatória."""
+        with self.assertRaisesRegex(ValueError, "packets"):
+            agregar_fluxos(io.StringIO("src,dst,bytes\n1.1.1.1,2.2.2.2,3\n"), 24)
+        self.assertEqual(list(ler_fluxos(io.StringIO(""))), [])
+
+    def test_jsonl(self):
+        """Testa JSONL com contadores em texto, JSON inválido e campos ausentes."""
+        texto = ('{"src": "10.0.0.1", "dst": "192.168.1.5", "bytes": 100, "packets": 2}\n'
+                 'isto não é json\n'
+                 '\n'
+                 '{"origem": "10.0.0.2", "destino": "192.168.1.9", "bytes": "50", "pacotes": 1}\n'
+                 '{"src": "10.0.0.3", "bytes": 1, "packets": 1}\n'
+                 '[1, 2]\n')
+        matriz = agregar_fluxos(io.StringIO(texto), 24, "jsonl")
+        self.assertEqual(matriz.invalidos, 3)
+        self.assertEqual(matriz.maiores(), [ParRedes("10.0.0.0/24", "192.168.1.0/24", 150, 3, 2)])
+        with self.assertRaises(ValueError):
+            agregar_fluxos(io.StringIO(texto), 24, "xml")
+
+
+class TestMain(unittest.TestCase):
+    """Testes para a linha de comando."""
+
+    def _executar(self, argumentos):
+        saida, erros = io.StringIO(), io.StringIO()
+        with mock.patch("sys.stdin", io.StringIO(CSV)), redirect_stdout(saida), redirect_stderr(erros):
+            self.assertEqual(main(["-", *argumentos]), 0)
+        return saida.getvalue().splitlines(), erros.getvalue()
+
+    def test_maiores_pares(self):
+        """Testa a saída CSV dos maiores pares e o resumo em stderr."""
+        linhas, resumo = self._executar(["--cidr", "24", "--top", "2"])
+        self.assertEqual(linhas, ["origem,destino,bytes,pacotes,fluxos",
+                                  "10.0.0.0/24,192.168.1.0/24,1500,15,2",
+                                  "10.0.1.0/24,8.8.8.0/24,300,3,1"])
+        self.assertIn("Fluxos: 4 | Inválidos: 4 | Pares de redes: 3", resumo)
+
+    def test_matriz(self):
+        """Testa a saída da matriz com máscara de destino diferente."""
+        linhas, _ = self._executar(["--cidr", "16", "--cidr-destino", "8", "--matriz"])
+        self.assertEqual(linhas, ["origem\\destino (bytes),192.0.0.0/8,8.0.0.0/8",
+                                  "10.0.0.0/16,1500,500"])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
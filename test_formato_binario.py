@@ -0,0 +1,110 @@
+"""
+Testes unitários para o módulo formato_binario
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para a conversão de listas de IPs para o formato
+binário e para a leitura por mapeamento em memória.
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from core import network_utils
+from core.formato_binario import (
+    ArquivoIPs,
+    classificar_binario,
+    converter_texto_para_binario,
+    eh_arquivo_binario,
+)
+from core.network_utils import calcular_rede_lote, ip_para_inteiro, ips_mesma_rede_lote
+from core.processamento import classificar_fluxo
+
+
+class TestFormatoBinario(unittest.TestCase):
+    """Classe de testes para o formato binário de IPs."""
+    
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.pasta.name, "ips.bin")
+        self.ips = ["192.168.1.100", "10.0.0.1", "255.255.255.255", "0.0.0.0", "192.168.1.1"]
+        self.texto = "\n".join(self.ips[:2] + ["invalido", ""] + self.ips[2:]) + "\n"
+        self.contagens = converter_texto_para_binario(io.StringIO(self.texto), self.caminho)
+    
+    def tearDown(self):
+        self.pasta.cleanup()
+    
+    def test_conversao(self):
+        """Testa contagens, cabeçalho e tamanho do arquivo."""
+        self.assertEqual(self.contagens, {"validos": 5, "invalidos": 1})
+        self.assertTrue(eh_arquivo_binario(self.caminho))
+        self.assertEqual(os.path.getsize(self.caminho), 16 + 4 * 5)
+        with open(self.caminho, "rb") as arquivo:
+            arquivo.seek(16)
+            self.assertEqual(int.from_bytes(arquivo.read(4), "little"), ip_para_inteiro(self.ips[0]))
+    
+    def test_leitura_memoryview_e_numpy(self):
+        """Testa as visões sem cópia e o uso direto nas funções em lote."""
+        esperado = [ip_para_inteiro(ip) for ip in self.ips]
+        origem = ip_para_inteiro("192.168.1.10")
+        
+        with ArquivoIPs(self.caminho) as arquivo:
+            self.assertEqual(len(arquivo), 5)
+            visao = arquivo.como_memoryview()
+            self.assertEqual(visao.tolist(), esperado)
+            
+            with mock.patch.object(network_utils, "np", None):
+                self.assertEqual(ips_mesma_rede_lote(origem, visao, 24),
+                                 [True, False, False, False, True])
+                self.assertEqual(calcular_rede_lote(visao, 8)[1], ip_para_inteiro("10.0.0.0"))
+            
+            if network_utils.np is not None:
+                array = arquivo.como_numpy()
+                self.assertEqual(array.tolist(), esperado)
+                self.assertFalse(array.flags.writeable)
+                self.assertEqual(ips_mesma_rede_lote(origem, array, 24).tolist(),
+                                 [True, False, False, False, True])
+                del array
+    
+    def test_classificar_binario_igual_ao_texto(self):
+        """Testa que o modo binário produz a mesma saída que o modo texto."""
+        texto_valido = "\n".join(self.ips) + "\n"
+        variantes = [mock.patch.object(network_utils, "np", None)]
+        if network_utils.np is not None:
+            variantes.append(mock.patch.object(network_utils, "np", network_utils.np))
+        
+        for formato in ("csv", "jsonl"):
+            esperado = io.StringIO()
+            classificar_fluxo(io.StringIO(texto_valido), esperado, "192.168.1.10", 24, formato)
+            for variante in variantes:
+                with self.subTest(formato=formato), variante:
+                    saida = io.StringIO()
+                    classificar_binario(self.caminho, saida, "192.168.1.10", 24, formato, tamanho_bloco=2)
+                    self.assertEqual(saida.getvalue(), esperado.getvalue())
+    
+    def test_arquivos_invalidos(self):
+        """Testa arquivo vazio, de texto e truncado."""
+        vazio = os.path.join(self.pasta.name, "vazio.bin")
+        converter_texto_para_binario(io.StringIO(""), vazio)
+        with ArquivoIPs(vazio) as arquivo:
+            self.assertEqual(len(arquivo), 0)
+            self.assertEqual(list(arquivo.blocos()), [])
+        
+        texto = os.path.join(self.pasta.name, "ips.txt")
+        with open(texto, "w") as arquivo:
+            arquivo.write(self.texto)
+        self.assertFalse(eh_arquivo_binario(texto))
+        with self.assertRaises(ValueError):
+            ArquivoIPs(texto)
+        
+        with open(self.caminho, "r+b") as arquivo:
+            arquivo.truncate(20)
+        with self.assertRaises(ValueError):
+            ArquivoIPs(self.caminho)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,98 @@
+"""
+Testes unitários para o módulo instrumentacao
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para a coleta de métricas das funções de rede:
+troca e restauração das funções, contagens, falhas, histograma e o
+formato de exportação do Prometheus.
+"""
+
+import unittest
+
+from core import instrumentacao, network_utils, processamento
+from core.instrumentacao import FUNCOES, LIMITES_NS
+
+
+class TestInstrumentacao(unittest.TestCase):
+    """Testes para ativar/desativar, instantaneo e exportar_prometheus."""
+
+    def setUp(self):
+        self.originais = {nome: getattr(network_utils, nome) for nome in FUNCOES}
+        instrumentacao.zerar()
+
+    def tearDown(self):
+        instrumentacao.desativar()
+        instrumentacao.zerar()
+
+    def test_desativada_nao_altera_funcoes(self):
+        """Testa que, desligada, as funções são as originais (custo zero)."""
+        self.assertFalse(instrumentacao.ativo())
+        network_utils.validar_ip("1.2.3.4")
+        self.assertEqual(instrumentacao.instantaneo(), {})
+
+    def test_ativar_e_desativar(self):
+        """Testa a troca em network_utils e nos módulos que importaram as funções."""
+        instrumentacao.ativar()
+        instrumentacao.ativar()  # idempotente
+        self.assertTrue(instrumentacao.ativo())
+        self.assertIsNot(network_utils.analisar_ip, self.originais["analisar_ip"])
+        self.assertIs(processamento.analisar_ip, network_utils.analisar_ip)
+        self.assertIs(network_utils.analisar_ip.__wrapped__, self.originais["analisar_ip"])
+
+        instrumentacao.desativar()
+        for nome, original in self.originais.items():
+            self.assertIs(getattr(network_utils, nome), original)
+        self.assertIs(processamento.analisar_ip, self.originais["analisar_ip"])
+
+    def test_contagens_e_falhas(self):
+        """Testa chamadas, falhas por retorno e por ValueError, sem contar chamadas internas."""
+        instrumentacao.ativar()
+        network_utils.validar_ip("10.0.0.1")
+        network_utils.validar_ip("10.0.0.300")
+        with self.assertRaises(ValueError):
+            network_utils.ips_mesma_rede("10.0.0.1", "abc", 24)
+        processamento.classificar_bloco(["10.0.0.2", "x"], 0, 8)
+
+        numeros = instrumentacao.instantaneo()
+        self.assertEqual((numeros["validar_ip"]["chamadas"], numeros["validar_ip"]["falhas"]), (2, 1))
+        self.assertEqual((numeros["ips_mesma_rede"]["chamadas"], numeros["ips_mesma_rede"]["falhas"]), (1, 1))
+        # Só as 2 de classificar_bloco: as de validar_ip e ips_mesma_rede são internas
+        self.assertEqual(numeros["analisar_ip"]["chamadas"], 2)
+        self.assertEqual(numeros["analisar_ip"]["falhas"], 1)
+        self.assertNotIn("validar_cidr", numeros)
+        self.assertNotIn("descrever_rede", numeros)
+
+    def test_histograma(self):
+        """Testa que os baldes são acumulados e terminam no total de chamadas."""
+        instrumentacao.ativar()
+        for _ in range(50):
+            network_utils.cidr_para_mascara_decimal(24)
+        dados = instrumentacao.instantaneo()["cidr_para_mascara_decimal"]
+        limites = [limite for limite, _ in dados["baldes"]]
+        contagens = [contagem for _, contagem in dados["baldes"]]
+        self.assertEqual(len(limites), len(LIMITES_NS) + 1)
+        self.assertEqual(contagens, sorted(contagens))
+        self.assertEqual(dados["baldes"][-1], (float("inf"), 50))
+        self.assertGreater(dados["soma_segundos"], 0)
+
+    def test_exportar_prometheus(self):
+        """Testa o formato de texto do Prometheus."""
+        instrumentacao.ativar()
+        network_utils.validar_cidr(40)
+        texto = instrumentacao.exportar_prometheus()
+        linhas = texto.splitlines()
+        self.assertTrue(texto.endswith("\n"))
+        self.assertIn("# TYPE networktools_chamadas_total counter", linhas)
+        self.assertIn("# TYPE networktools_duracao_segundos histogram", linhas)
+        self.assertIn('networktools_falhas_total{funcao="validar_cidr"} 1', linhas)
+        self.assertIn('networktools_duracao_segundos_bucket{funcao="validar_cidr",le="+Inf"} 1', linhas)
+        self.assertIn('networktools_duracao_segundos_count{funcao="validar_cidr"} 1', linhas)
+        for linha in linhas:
+            if not linha.startswith("#"):
+                nome, valor = linha.rsplit(" ", 1)
+                float(valor)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,141 @@
+"""
+Testes unitários para o módulo ipam
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para o cadastro de redes e atribuições em
+SQLite, comparando as consultas com uma verificação direta em Python.
+"""
+
+import os
+import random
+import tempfile
+import unittest
+
+from core.enderecos import RedeIPv4
+from core.ipam import IPAM
+from core.network_utils import inteiro_para_ip, ip_para_inteiro
+
+BASE = ip_para_inteiro("10.0.0.0")
+
+
+class TestRedes(unittest.TestCase):
+    """Testes para as consultas de redes."""
+
+    def setUp(self):
+        aleatorio = random.Random(3)
+        redes = set()
+        while len(redes) < 500:
+            cidr = aleatorio.randint(8, 30)
+            redes.add(RedeIPv4(BASE + aleatorio.getrandbits(24), cidr))
+        self.redes = sorted(redes)
+        self.ipam = IPAM()
+        self.ipam.importar_redes((rede, str(rede)) for rede in self.redes)
+
+    def tearDown(self):
+        self.ipam.close()
+
+    def test_redes_contendo(self):
+        """Testa se as redes que contêm o IP coincidem com a verificação direta."""
+        aleatorio = random.Random(4)
+        for _ in range(200):
+            ip = BASE + aleatorio.getrandbits(24)
+            esperado = sorted((rede for rede in self.redes if ip in rede),
+                              key=lambda rede: -rede.cidr)
+            resultado = self.ipam.redes_contendo(ip)
+            self.assertEqual([rede for rede, _ in resultado], esperado)
+            self.assertEqual([nome for _, nome in resultado], [str(rede) for rede in esperado])
+
+    def test_redes_sobrepostas(self):
+        """Testa se as sobreposições coincidem com a verificação direta."""
+        aleatorio = random.Random(5)
+        for _ in range(200):
+            bloco = RedeIPv4(BASE + aleatorio.getrandbits(24), aleatorio.randint(8, 30))
+            esperado = [rede for rede in self.redes if rede in bloco or bloco in rede]
+            self.assertEqual([rede for rede, _ in self.ipam.redes_sobrepostas(bloco)], esperado)
+
+    def test_rede_repetida(self):
+        """Testa que uma importação com rede repetida não grava nada."""
+        with self.assertRaises(ValueError):
+            self.ipam.importar_redes([("192.168.0.0/24", None), (self.redes[0], None)])
+        self.assertEqual(self.ipam.redes_contendo("192.168.0.1"), [])
+
+    def test_remover_rede(self):
+        """Testa a remoção de uma rede."""
+        rede = self.redes[0]
+        self.ipam.remover_rede(rede)
+        self.assertNotIn(rede, [rede for rede, _ in self.ipam.redes()])
+
+
+class TestAtribuicoes(unittest.TestCase):
+    """Testes para as atribuições e a busca do próximo livre."""
+
+    def setUp(self):
+        self.ipam = IPAM()
+
+    def tearDown(self):
+        self.ipam.close()
+
+    def test_atribuir_e_liberar(self):
+        """Testa atribuir, consultar, repetir e liberar um IP."""
+        self.ipam.atribuir("10.0.0.5", "servidor")
+        self.assertIn("10.0.0.5", self.ipam)
+        self.assertEqual(self.ipam.atribuicao("10.0.0.5"), "servidor")
+        with self.assertRaises(ValueError):
+            self.ipam.atribuir("10.0.0.5")
+        self.ipam.liberar("10.0.0.5")
+        self.assertNotIn("10.0.0.5", self.ipam)
+        with self.assertRaises(ValueError):
+            self.ipam.liberar("10.0.0.5")
+
+    def test_importacao_atomica(self):
+        """Testa que uma importação com IP inválido ou repetido não grava nada."""
+        for itens in ([("10.0.0.1", None), ("10.0.0.1", None)],
+                      [("10.0.0.1", None), ("10.0.0.300", None)]):
+            with self.subTest(itens=itens):
+                with self.assertRaises(ValueError):
+                    self.ipam.importar_atribuicoes(itens)
+                self.assertEqual(self.ipam.contar_atribuicoes("10.0.0.0/24"), 0)
+
+    def test_proximo_livre(self):
+        """Testa o próximo livre pulando blocos /24 cheios, rede e broadcast."""
+        self.ipam.importar_atribuicoes((BASE + i, None) for i in range(1, 1000))
+        self.assertEqual(self.ipam.proximo_livre("10.0.0.0/16"), "10.0.3.232")
+        self.ipam.liberar("10.0.1.7")
+        self.assertEqual(self.ipam.proximo_livre("10.0.0.0/16"), "10.0.1.7")
+        self.assertEqual(self.ipam.proximo_livre("10.0.2.0/24"), None)
+        self.assertEqual(self.ipam.proximo_livre("10.0.0.0/31"), "10.0.0.0")
+
+        # Bloco com apenas a rede livre: o próximo host está no bloco seguinte
+        self.ipam.importar_atribuicoes([("10.1.0.255", None)] +
+                                       [(BASE + (1 << 16) + 256 + i, None) for i in range(10)])
+        self.ipam.importar_atribuicoes((BASE + (1 << 16) + i, None) for i in range(1, 255))
+        self.assertEqual(self.ipam.proximo_livre("10.1.0.0/16"), "10.1.1.10")
+
+    def test_proximo_livre_aleatorio(self):
+        """Testa o próximo livre contra uma busca direta com ocupação aleatória."""
+        aleatorio = random.Random(6)
+        ocupados = set(BASE + i for i in range(2000) if aleatorio.random() < 0.97)
+        self.ipam.importar_atribuicoes((ip, None) for ip in ocupados)
+        for cidr in (20, 22, 24, 28):
+            rede = RedeIPv4(BASE, cidr)
+            esperado = next((inteiro_para_ip(ip) for ip in range(BASE + 1, BASE + rede.num_enderecos - 1)
+                             if ip not in ocupados), None)
+            with self.subTest(cidr=cidr):
+                self.assertEqual(self.ipam.proximo_livre(rede), esperado)
+
+    def test_persistencia_em_arquivo(self):
+        """Testa que os dados sobrevivem ao fechar e reabrir o banco."""
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "ipam.db")
+            with IPAM(caminho) as ipam:
+                ipam.adicionar_rede("10.0.0.0/24", "lab")
+                ipam.atribuir("10.0.0.1", "gateway")
+            with IPAM(caminho) as ipam:
+                self.assertEqual(ipam.atribuicao("10.0.0.1"), "gateway")
+                self.assertEqual(ipam.proximo_livre("10.0.0.0/24"), "10.0.0.2")
+                self.assertEqual(list(ipam.atribuicoes_em("10.0.0.0/24")), [("10.0.0.1", "gateway")])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,219 @@
+"""
+Testes unitários para o módulo logs
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para o enriquecimento de logs de acesso: leitura
+em blocos (texto puro e gzip), extração do IP do cliente, classificação com
+cache, formatos de saída e o modo que segue um arquivo em crescimento.
+"""
+
+import gzip
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from core.logs import (
+    INVALIDO,
+    LOCAL,
+    REMOTO,
+    Classificador,
+    abrir_log,
+    enriquecer_blocos,
+    enriquecer_log,
+    ler_blocos,
+    main,
+    seguir_arquivo,
+)
+
+LINHAS = [
+    '192.168.1.7 - - [10/Oct/2025:13:55:36 -0300] "GET / HTTP/1.1" 200 512 "-" "curl/8.0"',
+    '10.0.0.1 - joao [10/Oct/2025:13:55:37 -0300] "POST /login HTTP/1.1" 302 0 "-" "Mozilla/5.0"',
+    '::ffff:192.168.1.99 - - [10/Oct/2025:13:55:38 -0300] "GET /ç HTTP/1.1" 404 0 "-" "-"',
+    '2001:db8::1 - - [10/Oct/2025:13:55:39 -0300] "GET / HTTP/2.0" 200 512 "-" "-"',
+    'servidor.exemplo.com - - [10/Oct/2025:13:55:40 -0300] "GET / HTTP/1.1" 200 1 "-" "-"',
+    '',
+    '  192.168.1.200 - - [10/Oct/2025:13:55:41 -0300] "GET / HTTP/1.1" 200 1 "-" "-"',
+]
+# A linha em branco não é rotulada nem contada
+ROTULOS = [LOCAL, REMOTO, LOCAL, REMOTO, INVALIDO, None, LOCAL]
+CONTEUDO = ("\n".join(LINHAS) + "\n").encode("utf-8")
+
+
+def enriquecer_texto(dados: bytes, formato: str = "texto", tamanho_bloco: int = 1 << 20):
+    """Enriquece bytes de log e devolve (saída, contagens)."""
+    saida = io.StringIO()
+    contagens = enriquecer_log(ler_blocos(io.BytesIO(dados), tamanho_bloco), saida,
+                               "192.168.1.10", 24, formato)
+    return saida.getvalue(), contagens
+
+
+class TestLerBlocos(unittest.TestCase):
+    """Testes para abrir_log e ler_blocos."""
+
+    def test_blocos_pequenos_preservam_linhas(self):
+        """Testa que o tamanho do bloco não muda as linhas (inclusive UTF-8 cortado)."""
+        esperado = "\n".join(ler_blocos(io.BytesIO(CONTEUDO), 1 << 20))
+        for tamanho in (1, 2, 7, 64):
+            with self.subTest(tamanho=tamanho):
+                blocos = list(ler_blocos(io.BytesIO(CONTEUDO), tamanho))
+                self.assertEqual("\n".join(blocos), esperado)
+        self.assertEqual(esperado.split("\n"), LINHAS)
+
+    def test_ultima_linha_sem_quebra(self):
+        """Testa que a última linha é entregue mesmo sem quebra de linha."""
+        self.assertEqual(list(ler_blocos(io.BytesIO(b"a\nb"), 1)), ["a", "b"])
+        self.assertEqual(list(ler_blocos(io.BytesIO(b""))), [])
+
+    def test_abrir_gzip_pela_assinatura(self):
+        """Testa a descompactação sem depender da extensão do arquivo."""
+        with tempfile.TemporaryDirectory() as pasta:
+            compactado = os.path.join(pasta, "access.log")
+            puro = os.path.join(pasta, "access.log.gz")
+            with gzip.open(compactado, "wb") as arquivo:
+                arquivo.write(CONTEUDO)
+            with open(puro, "wb") as arquivo:
+                arquivo.write(CONTEUDO)
+            for caminho in (compactado, puro):
+                with self.subTest(caminho=caminho), abrir_log(caminho) as arquivo:
+                    self.assertEqual(list(ler_blocos(arquivo)), ["\n".join(LINHAS)])
+
+
+class TestClassificador(unittest.TestCase):
+    """Testes para Classificador."""
+
+    def test_rotulos(self):
+        """Testa IPv4, IPv6, IPv4 mapeado em IPv6 e entradas inválidas."""
+        classificador = Classificador("192.168.1.10", 24)
+        casos = {"192.168.1.1": LOCAL, "192.168.2.1": REMOTO, "::ffff:192.168.1.5": LOCAL,
+                 "2001:db8::1": REMOTO, "-": INVALIDO, "": INVALIDO, "192.168.1.256": INVALIDO}
+        for ip, esperado in casos.items():
+            with self.subTest(ip=ip):
+                self.assertEqual(classificador.classificar(ip), esperado)
+
+    def test_origem_ipv6(self):
+        """Testa uma rede de origem IPv6."""
+        classificador = Classificador("2001:db8::1", 32)
+        self.assertEqual(classificador.classificar_bloco(["2001:db8:ffff::1", "2001:db9::1", "10.0.0.1"]),
+                         [LOCAL, REMOTO, REMOTO])
+
+    def test_limite_do_cache(self):
+        """Testa que o cache é esvaziado ao passar do limite, sem mudar os rótulos."""
+        classificador = Classificador("10.0.0.1", 8, limite_cache=4)
+        ips = [f"10.0.0.{i}" for i in range(3)] + ["11.0.0.1"]
+        self.assertEqual(classificador.classificar_bloco(ips * 2), [LOCAL] * 3 + [REMOTO] + [LOCAL] * 3 + [REMOTO])
+        self.assertEqual(classificador.classificar_bloco(["12.0.0.1"]), [REMOTO])
+        self.assertEqual(len(classificador.cache), 1)
+        # Bloco que mistura IPs já no cache com novos que estouram o limite
+        self.assertEqual(classificador.classificar_bloco(["12.0.0.1"] + ips), [REMOTO] + [LOCAL] * 3 + [REMOTO])
+
+    def test_origem_ou_cidr_invalidos(self):
+        """Testa que origem e CIDR inválidos levantam ValueError."""
+        for origem, cidr in (("abc", 24), ("10.0.0.1", 33), ("2001:db8::1", 129)):
+            with self.subTest(origem=origem, cidr=cidr):
+                with self.assertRaises(ValueError):
+                    Classificador(origem, cidr)
+
+
+class TestEnriquecerLog(unittest.TestCase):
+    """Testes para enriquecer_blocos e enriquecer_log."""
+
+    def test_formato_texto(self):
+        """Testa que cada linha recebe o rótulo no fim, em blocos de qualquer tamanho."""
+        esperado = "".join(f"{linha} {rotulo}\n" for linha, rotulo in zip(LINHAS, ROTULOS) if rotulo)
+        for tamanho in (3, 1 << 20):
+            with self.subTest(tamanho=tamanho):
+                saida, contagens = enriquecer_texto(CONTEUDO, tamanho_bloco=tamanho)
+                self.assertEqual(saida, esperado)
+                self.assertEqual(contagens, {"total": 6, LOCAL: 3, REMOTO: 2, INVALIDO: 1})
+
+    def test_formato_jsonl(self):
+        """Testa um objeto JSON válido por linha, com o IP e a linha original."""
+        saida, _ = enriquecer_texto(CONTEUDO, "jsonl")
+        objetos = [json.loads(linha) for linha in saida.splitlines()]
+        self.assertEqual([objeto["linha"] for objeto in objetos], [linha for linha in LINHAS if linha])
+        self.assertEqual([objeto["rede"] for objeto in objetos], [rotulo for rotulo in ROTULOS if rotulo])
+        self.assertEqual(objetos[2]["ip"], "::ffff:192.168.1.99")
+
+    def test_utf8_invalido(self):
+        """Testa que bytes inválidos em UTF-8 não interrompem o processamento."""
+        saida, contagens = enriquecer_texto(b'10.0.0.1 - - "GET /\xff" 200\n')
+        self.assertEqual(saida, '10.0.0.1 - - "GET /�" 200 remoto\n')
+        self.assertEqual(contagens["total"], 1)
+
+    def test_crlf_e_linhas_em_branco(self):
+        """Testa que o rótulo vem antes da quebra CRLF e que linhas em branco são puladas."""
+        dados = b"10.0.0.1 - a\r\n\r\n   \n192.168.1.5 - b\r\n"
+        for tamanho in (4, 1 << 20):
+            with self.subTest(tamanho=tamanho):
+                saida, contagens = enriquecer_texto(dados, tamanho_bloco=tamanho)
+                self.assertEqual(saida, "10.0.0.1 - a remoto\n192.168.1.5 - b local\n")
+                self.assertEqual(contagens, {"total": 2, LOCAL: 1, REMOTO: 1, INVALIDO: 0})
+        saida, _ = enriquecer_texto(dados, "jsonl")
+        self.assertEqual([json.loads(linha)["linha"] for linha in saida.splitlines()],
+                         ["10.0.0.1 - a", "192.168.1.5 - b"])
+
+    def test_formato_invalido(self):
+        """Testa que um formato desconhecido levanta ValueError."""
+        with self.assertRaises(ValueError):
+            list(enriquecer_blocos(["10.0.0.1 -"], Classificador("10.0.0.1", 8), "csv"))
+
+
+class TestSeguirArquivo(unittest.TestCase):
+    """Testes para seguir_arquivo."""
+
+    def setUp(self):
+        pasta = tempfile.TemporaryDirectory()
+        self.addCleanup(pasta.cleanup)
+        self.caminho = os.path.join(pasta.name, "access.log")
+        with open(self.caminho, "wb") as arquivo:
+            arquivo.write(b"a\nb")
+
+    def _acrescentar(self, dados: bytes, modo: str = "ab"):
+        with open(self.caminho, modo) as arquivo:
+            arquivo.write(dados)
+
+    def test_crescimento_truncamento_e_rotacao(self):
+        """Testa linhas acrescentadas, linha parcial, copytruncate e renomeação."""
+        eventos = [
+            lambda: self._acrescentar(b"c\nd"),        # completa "b", deixa "d" pendente
+            lambda: self._acrescentar(b"\n"),          # completa "d"
+            lambda: self._acrescentar(b"", "wb"),      # copytruncate
+            lambda: self._acrescentar(b"e\n"),
+            lambda: (self._acrescentar(b"f"),          # rotação: "f" fica no antigo
+                     os.replace(self.caminho, self.caminho + ".1"),
+                     self._acrescentar(b"g\n", "wb")),
+        ]
+
+        def parar():
+            if not eventos:
+                return True
+            eventos.pop(0)()
+            return False
+
+        blocos = list(seguir_arquivo(self.caminho, tamanho_bloco=2, intervalo=0, parar=parar))
+        self.assertEqual("\n".join(blocos).split("\n"), ["a", "bc", "d", "e", "f", "g"])
+
+
+class TestMain(unittest.TestCase):
+    """Testes para a linha de comando."""
+
+    def test_main_gzip_jsonl(self):
+        """Testa a execução completa sobre um log gzip."""
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, "access.log.gz")
+            with gzip.open(caminho, "wb") as arquivo:
+                arquivo.write(CONTEUDO)
+            saida, erros = io.StringIO(), io.StringIO()
+            with redirect_stdout(saida), redirect_stderr(erros):
+                codigo = main([caminho, "--cidr", "24", "--formato", "jsonl"])
+        self.assertEqual(codigo, 0)
+        self.assertEqual(len(saida.getvalue().splitlines()), len([linha for linha in LINHAS if linha]))
+        self.assertIn("Locais: 3", erros.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
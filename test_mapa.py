@@ -0,0 +1,99 @@
+"""
+Testes unitários para o módulo mapa
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para os mapas de calor, comparando a contagem
+vetorizada com um bitmap montado endereço por endereço.
+"""
+
+import random
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from core import network_utils
+from core.conjunto_ip import IPSet
+from core.mapa import mapa_cobertura, mapa_mesma_rede, ocupacao_por_celula
+from core.network_utils import ip_para_inteiro
+
+
+class TestOcupacaoPorCelula(unittest.TestCase):
+    """Testes para ocupacao_por_celula."""
+
+    def test_coincide_com_bitmap(self):
+        """Testa intervalos aleatórios (inclusive fora do bloco) contra um bitmap direto."""
+        aleatorio = random.Random(8)
+        for tamanho_celula in (1, 4, 7, 256):
+            limite = 512 * tamanho_celula
+            for _ in range(50):
+                pontos = sorted(aleatorio.sample(range(-300, limite + 300), 2 * aleatorio.randint(0, 6)))
+                inicios, fins = pontos[0::2], pontos[1::2]
+                bitmap = np.zeros(limite, dtype=np.int64)
+                for inicio, fim in zip(inicios, fins):
+                    bitmap[max(inicio, 0):max(min(fim, limite), 0)] = 1
+                with self.subTest(tamanho_celula=tamanho_celula, inicios=inicios, fins=fins):
+                    resultado = ocupacao_por_celula(inicios, fins, 0, tamanho_celula, 512)
+                    np.testing.assert_array_equal(resultado, bitmap.reshape(512, -1).sum(axis=1))
+
+    def test_sem_numpy(self):
+        """Testa o erro quando o NumPy não está instalado."""
+        with mock.patch.object(network_utils, "np", None):
+            with self.assertRaises(RuntimeError):
+                ocupacao_por_celula([0], [1], 0, 1)
+
+
+class TestMapas(unittest.TestCase):
+    """Testes para mapa_mesma_rede e mapa_cobertura."""
+
+    def test_mesma_rede_barra_16(self):
+        """Testa que, em uma /16, cada célula é um endereço (linha = 3º octeto)."""
+        resultado = mapa_mesma_rede("192.168.0.0/16", "192.168.1.10", 24)
+        self.assertEqual(resultado.shape, (256, 256))
+        self.assertTrue(resultado[1].all())
+        self.assertEqual(resultado.sum(), 256)
+
+        resultado = mapa_mesma_rede("192.168.0.0/16", "192.168.1.10", 30)
+        self.assertEqual(np.flatnonzero(resultado).tolist(), [264, 265, 266, 267])
+
+    def test_mesma_rede_barra_8(self):
+        """Testa que, em uma /8, cada célula resume uma /24."""
+        resultado = mapa_mesma_rede("10.0.0.0/8", "10.1.2.3", 20)
+        self.assertTrue(resultado[1, :16].all())
+        self.assertEqual(resultado.sum(), 16)
+
+        # CIDR acima de 24: a /24 da origem fica parcialmente coberta
+        resultado = mapa_mesma_rede("10.0.0.0/8", "10.1.2.3", 26)
+        self.assertEqual(resultado[1, 2], 0.25)
+        self.assertEqual(np.count_nonzero(resultado), 1)
+
+        # Origem fora do bloco exibido
+        self.assertEqual(mapa_mesma_rede("11.0.0.0/8", "10.1.2.3", 8).sum(), 0)
+
+    def test_cobertura(self):
+        """Testa a cobertura de um IPSet contra a pertinência endereço a endereço."""
+        conjunto = IPSet(["172.16.0.0/20", "172.16.32.128/25", "172.16.200.7", "10.0.0.0/8"])
+        resultado = mapa_cobertura("172.16.0.0/16", conjunto).ravel()
+        base = ip_para_inteiro("172.16.0.0")
+        esperado = [(base + i) in conjunto for i in range(65536)]
+        np.testing.assert_array_equal(resultado, esperado)
+
+        resultado = mapa_cobertura("172.0.0.0/8", conjunto)
+        self.assertEqual(resultado[16, :16].tolist(), [1.0] * 16)
+        self.assertEqual(resultado[16, 32], 0.5)
+        self.assertEqual(resultado[16, 200], 1 / 256)
+        self.assertAlmostEqual(resultado.sum(), 16 + 0.5 + 1 / 256)
+
+    def test_bloco_pequeno(self):
+        """Testa que blocos menores que /16 são recusados."""
+        with self.assertRaises(ValueError):
+            mapa_mesma_rede("192.168.1.0/24", "192.168.1.10", 24)
+        with self.assertRaises(ValueError):
+            mapa_mesma_rede("192.168.0.0/16", "192.168.1.10", 33)
+        with self.assertRaises(ValueError):
+            mapa_mesma_rede("192.168.0.0/16", "::1", 24)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -7,14 +7,34 @@ Este arquivo contém testes para validar todas as funcionalidades
 do sistema de análise de redes.
 """
 
+import ipaddress
 import unittest
+from unittest import mock
+
+from core import network_utils
 from core.network_utils import (
+    IP_INVALIDO,
+    TABELA_PREFIXOS,
+    agrupar_por_rede,
+    agrupar_por_rede_lote,
+    analisar_ip,
+    analisar_ips_lote,
+    analisar_ipv6,
+    descrever_rede,
+    inteiro_para_ip,
+    inteiro_para_ipv6,
+    ips_mesma_rede_lote_ipv6,
+    ipv6_para_colunas,
+    versao_ip,
     validar_ip, 
     validar_cidr, 
     cidr_para_mascara_decimal, 
     ips_mesma_rede,
+    ips_mesma_rede_lote,
     ip_para_inteiro,
-    calcular_rede
+    ip_para_inteiro_versao,
+    calcular_rede,
+    calcular_rede_lote
 )
 
 
@@ -50,6 +70,28 @@ class TestNetworkUtils(unittest.TestCase):
             with self.subTest(ip=ip):
                 self.assertFalse(validar_ip(ip), f"IP {ip} deveria ser inválido")
     
+    def test_analisar_ip(self):
+        """Testa o parser de passada única (validação + conversão)."""
+        casos_teste = [
+            ("192.168.1.1", 3232235777),
+            ("0.0.0.0", 0),
+            ("255.255.255.255", 4294967295),
+            ("010.001.000.009", 0x0A010009),
+            ("300.1.1.1", IP_INVALIDO),
+            ("1.2.3", IP_INVALIDO),
+            ("1.2.3.4.5", IP_INVALIDO),
+            ("1..2.3", IP_INVALIDO),
+            ("1.2.3.0256", IP_INVALIDO),
+            (" 1.2.3.4", IP_INVALIDO),
+            ("+1.2.3.4", IP_INVALIDO),
+            ("1_0.2.3.4", IP_INVALIDO),
+            ("١.2.3.4", IP_INVALIDO),
+        ]
+        
+        for ip, esperado in casos_teste:
+            with self.subTest(ip=ip):
+                self.assertEqual(analisar_ip(ip), esperado)
+    
     def test_validar_cidr_validos(self):
         """Testa validação de valores CIDR válidos."""
         for cidr in range(0, 33):
@@ -82,6 +124,41 @@ class TestNetworkUtils(unittest.TestCase):
                 self.assertEqual(resultado, mascara_esperada, 
                                f"CIDR /{cidr} deveria resultar em {mascara_esperada}")
     
+    def test_tabela_prefixos(self):
+        """Testa as linhas pré-calculadas da tabela de prefixos."""
+        self.assertEqual(len(TABELA_PREFIXOS), 33)
+        
+        info = TABELA_PREFIXOS[23]
+        self.assertEqual(info.mascara_int, 0xFFFFFE00)
+        self.assertEqual(info.mascara_decimal, "255.255.254.0")
+        self.assertEqual(info.wildcard_decimal, "0.0.1.255")
+        self.assertEqual(info.num_hosts, 510)
+        self.assertEqual(info.mascara_binaria, "1" * 23 + "0" * 9)
+        
+        self.assertEqual([TABELA_PREFIXOS[c].num_hosts for c in (0, 30, 31, 32)],
+                         [2 ** 32 - 2, 2, 2, 1])
+    
+    def test_descrever_rede(self):
+        """Testa a descrição completa de uma sub-rede."""
+        info = descrever_rede("192.168.1.130", 26)
+        self.assertEqual(info["rede"], "192.168.1.128")
+        self.assertEqual(info["broadcast"], "192.168.1.191")
+        self.assertEqual(info["primeiro_host"], "192.168.1.129")
+        self.assertEqual(info["ultimo_host"], "192.168.1.190")
+        self.assertEqual(info["mascara"], "255.255.255.192")
+        self.assertEqual(info["wildcard"], "0.0.0.63")
+        self.assertEqual(info["num_enderecos"], 64)
+        self.assertEqual(info["num_hosts"], 62)
+        
+        info = descrever_rede("10.0.0.1", 31)
+        self.assertEqual((info["primeiro_host"], info["ultimo_host"]), ("10.0.0.0", "10.0.0.1"))
+        
+        with self.assertRaises(ValueError):
+            descrever_rede("300.1.1.1", 24)
+        
+        with self.assertRaises(ValueError):
+            descrever_rede("10.0.0.1", 33)
+    
     def test_cidr_para_mascara_decimal_invalido(self):
         """Testa conversão com CIDR inválido."""
         with self.assertRaises(ValueError):
@@ -106,6 +183,28 @@ class TestNetworkUtils(unittest.TestCase):
                 self.assertEqual(resultado, inteiro_esperado,
                                f"IP {ip} deveria resultar em {inteiro_esperado}")
     
+    def test_inteiro_para_ip(self):
+        """Testa conversão de inteiro para IP (ida e volta)."""
+        for ip in ["0.0.0.0", "192.168.1.1", "10.20.30.40", "255.255.255.255"]:
+            with self.subTest(ip=ip):
+                self.assertEqual(inteiro_para_ip(ip_para_inteiro(ip)), ip)
+    
+    def test_ip_para_inteiro_invalido(self):
+        """Testa conversão de IP inválido para inteiro."""
+        with self.assertRaises(ValueError):
+            ip_para_inteiro("300.1.1.1")
+    
+    def test_calcular_rede(self):
+        """Testa cálculo do endereço de rede."""
+        self.assertEqual(calcular_rede("192.168.1.130", 25), ip_para_inteiro("192.168.1.128"))
+        self.assertEqual(calcular_rede("192.168.1.130", 0), 0)
+        
+        with self.assertRaises(ValueError):
+            calcular_rede("192.168.1.1", 33)
+        
+        with self.assertRaises(ValueError):
+            calcular_rede("192.168.1.1", -1)
+    
     def test_ips_mesma_rede_positivos(self):
         """Testa casos onde IPs estão na mesma rede."""
         casos_teste = [
@@ -152,6 +251,256 @@ class TestNetworkUtils(unittest.TestCase):
             ips_mesma_rede("192.168.1.1", "192.168.1.2", 33)
 
 
+class TestMesmaRedeLote(unittest.TestCase):
+    """Testes para a verificação em lote (com e sem NumPy)."""
+    
+    def setUp(self):
+        self.origem = ip_para_inteiro("192.168.1.10")
+        self.destinos = [ip_para_inteiro(ip) for ip in
+                         ("192.168.1.100", "192.168.2.1", "10.0.0.1", "192.168.1.10")]
+    
+    def _executar_com_e_sem_numpy(self, *args):
+        """Executa ips_mesma_rede_lote nos dois caminhos e confere que coincidem."""
+        resultados = []
+        if network_utils.np is not None:
+            resultados.append([bool(r) for r in ips_mesma_rede_lote(*args)])
+        with mock.patch.object(network_utils, "np", None):
+            resultados.append(ips_mesma_rede_lote(*args))
+        for resultado in resultados[1:]:
+            self.assertEqual(resultado, resultados[0])
+        return resultados[0]
+    
+    def test_cidr_unico(self):
+        """Testa lote com um único CIDR para todas as linhas."""
+        resultado = self._executar_com_e_sem_numpy(self.origem, self.destinos, 24)
+        self.assertEqual(resultado, [True, False, False, True])
+    
+    def test_cidr_por_linha(self):
+        """Testa lote com um CIDR diferente por linha."""
+        resultado = self._executar_com_e_sem_numpy(self.origem, self.destinos, [24, 16, 0, 32])
+        self.assertEqual(resultado, [True, True, True, True])
+    
+    def test_equivalencia_com_ips_mesma_rede(self):
+        """Testa se o lote coincide com ips_mesma_rede para todos os CIDRs."""
+        ips = ["192.168.1.10", "192.168.1.200", "192.168.0.1", "10.1.2.3", "0.0.0.0", "255.255.255.255"]
+        for cidr in range(33):
+            with self.subTest(cidr=cidr):
+                esperado = [ips_mesma_rede("192.168.1.10", ip, cidr) for ip in ips]
+                inteiros = [ip_para_inteiro(ip) for ip in ips]
+                resultado = self._executar_com_e_sem_numpy(self.origem, inteiros, cidr)
+                self.assertEqual(resultado, esperado)
+    
+    def test_analisar_ips_lote(self):
+        """Testa a conversão em lote com IPs inválidos, espaços e não-strings."""
+        ips = ["192.168.1.10", "300.1.1.1", " 10.0.0.1\n", "", None, "0.0.0.0"]
+        esperado = [3232235786, IP_INVALIDO, 167772161, IP_INVALIDO, IP_INVALIDO, 0]
+        if network_utils.np is not None:
+            resultado = analisar_ips_lote(ips)
+            self.assertEqual(resultado.dtype, network_utils.np.int64)
+            self.assertEqual(resultado.tolist(), esperado)
+        with mock.patch.object(network_utils, "np", None):
+            self.assertEqual(analisar_ips_lote(ips), esperado)
+    
+    def test_entradas_invalidas(self):
+        """Testa CIDR fora do range e tamanhos incompatíveis."""
+        for args in [(self.origem, self.destinos, 33),
+                     (self.origem, self.destinos, [24, 24]),
+                     (self.origem, [2 ** 32], 24)]:
+            with self.subTest(args=args):
+                if network_utils.np is not None:
+                    with self.assertRaises(ValueError):
+                        ips_mesma_rede_lote(*args)
+                with mock.patch.object(network_utils, "np", None):
+                    with self.assertRaises(ValueError):
+                        ips_mesma_rede_lote(*args)
+    
+    def test_saida_de_analisar_ips_lote_com_invalido(self):
+        """Testa que IP_INVALIDO (e valores acima de 32 bits) em um array não é truncado."""
+        caminhos = [None] if network_utils.np is None else [network_utils.np, None]
+        for np in caminhos:
+            with self.subTest(numpy=np is not None), mock.patch.object(network_utils, "np", np):
+                inteiros = analisar_ips_lote(["192.168.1.5", "abc"])
+                with self.assertRaises(ValueError):
+                    ips_mesma_rede_lote(self.origem, inteiros, 24)
+                with self.assertRaises(ValueError):
+                    ips_mesma_rede_lote(inteiros, self.origem, 24)
+                with self.assertRaises(ValueError):
+                    calcular_rede_lote(inteiros, 24)
+                if np is not None:
+                    with self.assertRaises(ValueError):
+                        calcular_rede_lote(np.array([1, 2 ** 32], dtype=np.int64), 8)
+
+
+class TestAgruparPorRede(unittest.TestCase):
+    """Testes para o agrupamento de IPs por rede (hash e ordenação em lote)."""
+    
+    IPS = ["192.168.1.10", "10.0.0.1", "192.168.1.99", "192.168.2.1",
+           "10.0.0.200", "0.0.0.0", "255.255.255.255", "192.168.1.10"]
+    
+    def _grupos_lote(self, ips, cidr):
+        """Executa o lote nos dois caminhos e devolve (rede, posições) por grupo."""
+        resultados = []
+        caminhos = [None] if network_utils.np is None else [network_utils.np, None]
+        for np in caminhos:
+            with mock.patch.object(network_utils, "np", np):
+                grupos = agrupar_por_rede_lote(ips, cidr)
+            fronteiras = [int(f) for f in grupos.fronteiras]
+            resultados.append([(int(rede), [int(p) for p in grupos.ordem[inicio:fim]])
+                               for rede, inicio, fim in zip(grupos.redes, fronteiras, fronteiras[1:])])
+        for resultado in resultados[1:]:
+            self.assertEqual(resultado, resultados[0])
+        return resultados[0]
+    
+    def test_exemplo(self):
+        """Testa o agrupamento básico, na ordem de entrada."""
+        self.assertEqual(agrupar_por_rede(["192.168.1.10", "10.0.0.1", "192.168.1.99"], 24),
+                         {"192.168.1.0": ["192.168.1.10", "192.168.1.99"], "10.0.0.0": ["10.0.0.1"]})
+        self.assertEqual(agrupar_por_rede([], 24), {})
+    
+    def test_equivalencia_com_ips_mesma_rede(self):
+        """Testa se dois IPs ficam no mesmo grupo sse ips_mesma_rede diz que sim."""
+        for cidr in range(33):
+            with self.subTest(cidr=cidr):
+                grupos = agrupar_por_rede(self.IPS, cidr)
+                self.assertEqual(sorted(sum(grupos.values(), [])), sorted(self.IPS))
+                for rede, membros in grupos.items():
+                    self.assertEqual(rede, inteiro_para_ip(calcular_rede(membros[0], cidr)))
+                    for ip in self.IPS:
+                        self.assertEqual(ip in membros, ips_mesma_rede(membros[0], ip, cidr))
+    
+    def test_ipv6(self):
+        """Testa que IPv6 é agrupado à parte, sem colidir com chaves IPv4."""
+        grupos = agrupar_por_rede(["2001:db8::1", "0.0.0.1", "::2", "2001:db8::ff"], 16)
+        self.assertEqual(grupos, {"2001::": ["2001:db8::1", "2001:db8::ff"],
+                                  "0.0.0.0": ["0.0.0.1"], "::": ["::2"]})
+        self.assertEqual(agrupar_por_rede(["2001:db8::1", "2001:db8:0:1::1"], 64),
+                         {"2001:db8::": ["2001:db8::1"], "2001:db8:0:1::": ["2001:db8:0:1::1"]})
+    
+    def test_entradas_invalidas(self):
+        """Testa IP inválido, CIDR fora do range e CIDR de IPv6 com IPv4."""
+        for ips, cidr in [(["10.0.0.1", "10.0.0.256"], 24), (["10.0.0.1"], -1),
+                          (["10.0.0.1"], 33), (["::1"], 129)]:
+            with self.subTest(ips=ips, cidr=cidr):
+                with self.assertRaises(ValueError):
+                    agrupar_por_rede(ips, cidr)
+    
+    def test_lote_equivale_ao_hash(self):
+        """Testa se o lote forma os mesmos grupos que agrupar_por_rede."""
+        inteiros = [ip_para_inteiro(ip) for ip in self.IPS]
+        for cidr in (0, 8, 24, 31, 32):
+            with self.subTest(cidr=cidr):
+                esperado = agrupar_por_rede(self.IPS, cidr)
+                grupos = self._grupos_lote(inteiros, cidr)
+                self.assertEqual([inteiro_para_ip(rede) for rede, _ in grupos], sorted(
+                    esperado, key=ip_para_inteiro))
+                for rede, posicoes in grupos:
+                    self.assertEqual(posicoes, sorted(posicoes))
+                    self.assertEqual([self.IPS[p] for p in posicoes], esperado[inteiro_para_ip(rede)])
+    
+    def test_lote_vazio_e_invalido(self):
+        """Testa lote vazio e CIDR inválido no lote."""
+        self.assertEqual(self._grupos_lote([], 24), [])
+        for np in ([network_utils.np, None] if network_utils.np is not None else [None]):
+            with mock.patch.object(network_utils, "np", np):
+                self.assertEqual([int(f) for f in agrupar_por_rede_lote([], 24).fronteiras], [0])
+                for cidr in (33, -1, "24"):
+                    with self.assertRaises(ValueError):
+                        agrupar_por_rede_lote([1], cidr)
+
+
+class TestIPv6(unittest.TestCase):
+    """Testes para o suporte a IPv6, comparando com o módulo ipaddress."""
+    
+    VALIDOS = ["::", "::1", "1::", "2001:db8::1", "2001:DB8:0:0:8:800:200C:417A",
+               "fe80::0db8:1", "1:2:3:4:5:6:7:8", "1:0:0:2::3", "1::2:3:4:5:6:7",
+               "::ffff:192.168.1.10", "64:ff9b::10.0.0.1"]
+    
+    INVALIDOS = ["", ":", ":::", "1::2::3", "fe80::1%eth0", "12345::", "g::1",
+                 "1:2:3:4:5:6:7", "1:2:3:4:5:6:7:8:9", "1:2:3:4:5:6:7::8", ":1::",
+                 "1:2:3:4:5:6:7:", "::1.2.3", "::256.1.1.1", "1:2:3:4:5:6:7:1.2.3.4",
+                 " ::1", "::+1", "::-1", "192.168.1.1", "0x1::", "::0x1", "0X12::1", "1_2::"]
+    
+    def test_analisar_ipv6(self):
+        """Testa a conversão de IPv6 válidos e a rejeição de inválidos."""
+        for ip in self.VALIDOS:
+            with self.subTest(ip=ip):
+                self.assertEqual(analisar_ipv6(ip), int(ipaddress.IPv6Address(ip)))
+        for ip in self.INVALIDOS:
+            with self.subTest(ip=ip):
+                self.assertEqual(analisar_ipv6(ip), IP_INVALIDO)
+    
+    def test_inteiro_para_ipv6(self):
+        """Testa a forma canônica (RFC 5952), igual à do ipaddress."""
+        valores = [int(ipaddress.IPv6Address(ip)) for ip in self.VALIDOS]
+        valores += [0x20010DB8000000000001000000000001, 0x00010000000100000000000000000000,
+                    (1 << 128) - 1]
+        for valor in valores:
+            with self.subTest(valor=hex(valor)):
+                self.assertEqual(inteiro_para_ipv6(valor), ipaddress.IPv6Address(valor).compressed)
+    
+    def test_validacao_por_versao(self):
+        """Testa validar_ip, validar_cidr e versao_ip com IPv6."""
+        self.assertTrue(validar_ip("2001:db8::1", versao=6))
+        self.assertFalse(validar_ip("2001:db8::1"))
+        self.assertFalse(validar_ip("10.0.0.1", versao=6))
+        self.assertTrue(validar_ip("10.0.0.1", versao=None))
+        self.assertTrue(validar_ip("::1", versao=None))
+        self.assertTrue(validar_cidr(128, versao=6))
+        self.assertFalse(validar_cidr(129, versao=6))
+        self.assertEqual((versao_ip("10.0.0.1"), versao_ip("::1"), versao_ip("::g")), (4, 6, None))
+    
+    def test_ips_mesma_rede_ipv6(self):
+        """Testa ips_mesma_rede com IPv6 em vários prefixos."""
+        origem, destino = "2001:db8:abcd:12::1", "2001:db8:abcd:1f::1"
+        for cidr in (0, 32, 48, 59, 60, 64, 127, 128):
+            with self.subTest(cidr=cidr):
+                rede = ipaddress.IPv6Network(f"{origem}/{cidr}", strict=False)
+                self.assertEqual(ips_mesma_rede(origem, destino, cidr),
+                                 ipaddress.IPv6Address(destino) in rede)
+        self.assertEqual(calcular_rede("2001:db8:1::5", 48), int(ipaddress.IPv6Address("2001:db8:1::")))
+    
+    def test_entradas_invalidas_ipv6(self):
+        """Testa versões misturadas, CIDR acima de 128 e IPv6 inválido."""
+        with self.assertRaises(ValueError):
+            ips_mesma_rede("2001:db8::1", "192.168.1.1", 24)
+        with self.assertRaises(ValueError):
+            ips_mesma_rede("2001:db8::1", "2001:db8::2", 129)
+        with self.assertRaises(ValueError):
+            ips_mesma_rede("2001:db8::1", "1::2::3", 64)
+        with self.assertRaises(ValueError):
+            ip_para_inteiro_versao("1::2::3")
+        # ip_para_inteiro continua só IPv4 (chamadores contam com 32 bits)
+        with self.assertRaises(ValueError):
+            ip_para_inteiro("::1")
+        self.assertEqual(ip_para_inteiro_versao("2001:db8::1"),
+                         (int(ipaddress.IPv6Address("2001:db8::1")), 6))
+        self.assertEqual(ip_para_inteiro_versao("10.0.0.1"), (0x0A000001, 4))
+    
+    def test_descrever_rede_ipv6(self):
+        """Testa a descrição de uma sub-rede IPv6."""
+        info = descrever_rede("2001:db8::1", 64)
+        self.assertEqual(info["rede"], "2001:db8::")
+        self.assertEqual(info["ultimo_host"], "2001:db8::ffff:ffff:ffff:ffff")
+        self.assertEqual(info["mascara"], "ffff:ffff:ffff:ffff::")
+        self.assertEqual(info["num_enderecos"], 2 ** 64)
+    
+    def test_lote_ipv6_com_e_sem_numpy(self):
+        """Testa o lote em duas colunas contra ips_mesma_rede, nos dois caminhos."""
+        origem = "2001:db8:abcd:12::1"
+        destinos = ["2001:db8:abcd:12::ffff", "2001:db8:abcd:13::1", "2001:db9::1",
+                    "::", "ffff:ffff:ffff:ffff:ffff:ffff:ffff:ffff"]
+        for cidr in (0, 16, 32, 63, 64, 65, 100, 128):
+            esperado = [ips_mesma_rede(origem, ip, cidr) for ip in destinos]
+            with self.subTest(cidr=cidr):
+                if network_utils.np is not None:
+                    alto, baixo = ipv6_para_colunas(destinos)
+                    resultado = ips_mesma_rede_lote_ipv6(origem, alto, baixo, cidr)
+                    self.assertEqual([bool(r) for r in resultado], esperado)
+                with mock.patch.object(network_utils, "np", None):
+                    alto, baixo = ipv6_para_colunas(destinos)
+                    self.assertEqual(ips_mesma_rede_lote_ipv6(origem, alto, baixo, cidr), esperado)
+
+
 if __name__ == '__main__':
     # Executa os testes
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -0,0 +1,124 @@
+"""
+Testes unitários para o módulo paralelo
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para a divisão em fatias e a classificação
+paralela de arquivos de IPs.
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from core.formato_binario import converter_texto_para_binario
+from core.paralelo import classificar_arquivo_paralelo, dividir_em_fatias
+from core.processamento import classificar_fluxo
+from main import main
+
+
+class TestParalelo(unittest.TestCase):
+    """Classe de testes para o processamento paralelo."""
+    
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.entrada = os.path.join(self.pasta.name, "ips.txt")
+        linhas = [f"192.168.{i % 7}.{i % 251}" for i in range(3000)] + ["lixo", ""]
+        with open(self.entrada, "w", encoding="utf-8") as arquivo:
+            arquivo.write("\n".join(linhas))  # última linha sem quebra
+    
+    def tearDown(self):
+        self.pasta.cleanup()
+    
+    def _saida_sequencial(self, formato):
+        with open(self.entrada, encoding="utf-8") as entrada:
+            saida = io.StringIO()
+            classificar_fluxo(entrada, saida, "192.168.1.10", 24, formato)
+        return saida.getvalue()
+    
+    def test_dividir_em_fatias(self):
+        """Testa que as fatias cobrem o arquivo e começam em início de linha."""
+        with open(self.entrada, "rb") as arquivo:
+            conteudo = arquivo.read()
+        
+        for num_fatias in (1, 3, 16, 10000):
+            with self.subTest(num_fatias=num_fatias):
+                fatias = dividir_em_fatias(self.entrada, num_fatias)
+                self.assertEqual(fatias[0][0], 0)
+                self.assertEqual(fatias[-1][1], len(conteudo))
+                for (_, fim), (inicio, _) in zip(fatias, fatias[1:]):
+                    self.assertEqual(fim, inicio)
+                    self.assertEqual(conteudo[inicio - 1:inicio], b"\n")
+    
+    def test_igual_ao_sequencial(self):
+        """Testa que a saída paralela juntada é idêntica à sequencial."""
+        for formato in ("csv", "jsonl"):
+            with self.subTest(formato=formato):
+                saida = os.path.join(self.pasta.name, f"saida.{formato}")
+                relatorio = classificar_arquivo_paralelo(self.entrada, saida, "192.168.1.10", 24,
+                                                         formato, trabalhadores=2)
+                with open(saida, encoding="utf-8") as arquivo:
+                    self.assertEqual(arquivo.read(), self._saida_sequencial(formato))
+                
+                self.assertEqual(relatorio["contagens"]["total"], 3001)
+                self.assertEqual(relatorio["contagens"]["invalidos"], 1)
+                self.assertEqual(sum(t["linhas"] for t in relatorio["trabalhadores"]), 3001)
+    
+    def test_entrada_latin1_igual_nos_dois_modos(self):
+        """Testa que bytes inválidos em UTF-8 viram IP inválido no modo sequencial e no paralelo."""
+        latin1 = os.path.join(self.pasta.name, "latin1.txt")
+        with open(latin1, "wb") as arquivo:
+            arquivo.write("192.168.1.5\nendereço\n10.0.0.1\n".encode("latin-1") * 500)
+        
+        sequencial, erros = io.StringIO(), io.StringIO()
+        with redirect_stdout(sequencial), redirect_stderr(erros):
+            codigo = main(["--cidr", "24", "--entrada", latin1])
+        self.assertEqual(codigo, 0)
+        self.assertIn("Inválidos: 500", erros.getvalue())
+        
+        saida = os.path.join(self.pasta.name, "saida.csv")
+        with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+            codigo = main(["--cidr", "24", "--entrada", latin1, "--saida", saida,
+                           "--trabalhadores", "2"])
+        self.assertEqual(codigo, 0)
+        with open(saida, encoding="utf-8") as arquivo:
+            self.assertEqual(arquivo.read(), sequencial.getvalue())
+    
+    def test_manter_fatias(self):
+        """Testa a gravação de uma saída por fatia, cada uma com cabeçalho."""
+        prefixo = os.path.join(self.pasta.name, "saida.csv")
+        relatorio = classificar_arquivo_paralelo(self.entrada, prefixo, "192.168.1.10", 24,
+                                                 trabalhadores=2, manter_fatias=True)
+        self.assertGreater(len(relatorio["arquivos"]), 1)
+        
+        linhas = []
+        for caminho in relatorio["arquivos"]:
+            with open(caminho, encoding="utf-8") as arquivo:
+                partes = arquivo.read().splitlines()
+            self.assertEqual(partes[0], "ip,mesma_rede")
+            linhas.extend(partes[1:])
+        self.assertEqual(linhas, self._saida_sequencial("csv").splitlines()[1:])
+    
+    def test_parametros_invalidos(self):
+        """Testa origem e número de trabalhadores inválidos."""
+        saida = os.path.join(self.pasta.name, "saida.csv")
+        with self.assertRaises(ValueError):
+            classificar_arquivo_paralelo(self.entrada, saida, "300.1.1.1", 24)
+        with self.assertRaises(ValueError):
+            classificar_arquivo_paralelo(self.entrada, saida, "192.168.1.10", 24, trabalhadores=-1)
+    
+    def test_entrada_binaria_recusada(self):
+        """Testa que um arquivo binário não é dividido como texto."""
+        binario = os.path.join(self.pasta.name, "ips.bin")
+        with open(self.entrada, encoding="utf-8") as entrada:
+            converter_texto_para_binario(entrada, binario)
+        saida = os.path.join(self.pasta.name, "saida.csv")
+        with self.assertRaises(ValueError):
+            classificar_arquivo_paralelo(binario, saida, "192.168.1.10", 24, trabalhadores=2)
+        self.assertFalse(os.path.exists(saida))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
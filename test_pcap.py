@@ -0,0 +1,275 @@
+"""
+Testes unitários para o módulo pcap
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para a leitura de capturas pcap (as duas ordens
+de bytes, µs e ns) e pcapng (blocos de pacote melhorado, simples e de várias
+interfaces), os tipos de enlace reconhecidos, capturas truncadas e a
+classificação dos pacotes em relação à rede de origem.
+"""
+
+import io
+import json
+import os
+import struct
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from core.network_utils import ip_para_inteiro
+from core.pcap import (
+    ENLACE_ETHERNET,
+    ENLACE_LINUX_SLL,
+    ENLACE_RAW,
+    ENTRADA,
+    EXTERNO,
+    LOCAL,
+    SAIDA,
+    Captura,
+    classificar_captura,
+    main,
+)
+
+ORIGEM = "192.168.1.10"
+
+
+def cabecalho_ipv4(origem: str, destino: str) -> bytes:
+    """Cabeçalho IPv4 mínimo (20 bytes) com os endereços dados."""
+    return (struct.pack(">BBHHHBBH", 0x45, 0, 20, 0, 0, 64, 6, 0)
+            + struct.pack(">II", ip_para_inteiro(origem), ip_para_inteiro(destino)))
+
+
+def quadro_ethernet(origem: str, destino: str, vlans: int = 0) -> bytes:
+    """Quadro Ethernet (opcionalmente com tags 802.1Q) levando IPv4 e alguns bytes de dados."""
+    tags = b"".join(struct.pack(">HH", 0x8100, 10 + vlan) for vlan in range(vlans))
+    return (b"\x02" * 6 + b"\x04" * 6 + tags + struct.pack(">H", 0x0800)
+            + cabecalho_ipv4(origem, destino) + b"dados")
+
+
+# Quadro ARP: não é IPv4
+ARP = b"\xff" * 6 + b"\x04" * 6 + struct.pack(">H", 0x0806) + b"\x00" * 28
+
+# (quadro, classe esperada) de uma captura Ethernet típica
+QUADROS = [
+    (quadro_ethernet("192.168.1.20", "192.168.1.30"), LOCAL),
+    (quadro_ethernet("192.168.1.20", "8.8.8.8"), SAIDA),
+    (ARP, None),
+    (quadro_ethernet("8.8.8.8", "192.168.1.20", vlans=1), ENTRADA),
+    (quadro_ethernet("10.0.0.1", "10.0.0.2", vlans=2), EXTERNO),
+    (quadro_ethernet("192.168.1.99", "192.168.1.1")[:30], None),  # cortado pelo snaplen
+]
+
+
+def pcap(quadros, ordem: str = "<", nanossegundos: bool = False,
+         enlace: int = ENLACE_ETHERNET) -> bytes:
+    """Captura pcap clássica com os quadros dados."""
+    assinatura = 0xA1B23C4D if nanossegundos else 0xA1B2C3D4
+    dados = struct.pack(ordem + "IHHiIII", assinatura, 2, 4, 0, 0, 65535, enlace)
+    for segundo, quadro in enumerate(quadros):
+        dados += struct.pack(ordem + "IIII", segundo, 0, len(quadro), len(quadro) + 4) + quadro
+    return dados
+
+
+def bloco_pcapng(tipo: int, corpo: bytes, ordem: str = "<") -> bytes:
+    """Bloco pcapng com o corpo alinhado a 32 bits."""
+    corpo += b"\x00" * (-len(corpo) % 4)
+    comprimento = struct.pack(ordem + "I", len(corpo) + 12)
+    return struct.pack(ordem + "I", tipo) + comprimento + corpo + comprimento
+
+
+def secao_pcapng(ordem: str = "<") -> bytes:
+    return bloco_pcapng(0x0A0D0D0A, struct.pack(ordem + "IHHq", 0x1A2B3C4D, 1, 0, -1), ordem)
+
+
+def interface_pcapng(enlace: int, ordem: str = "<") -> bytes:
+    return bloco_pcapng(1, struct.pack(ordem + "HHI", enlace, 0, 65535), ordem)
+
+
+def pacote_pcapng(interface: int, quadro: bytes, ordem: str = "<") -> bytes:
+    """Bloco de pacote melhorado (EPB)."""
+    return bloco_pcapng(6, struct.pack(ordem + "5I", interface, 0, 0, len(quadro), len(quadro))
+                        + quadro, ordem)
+
+
+class ArquivosTemporarios(unittest.TestCase):
+    """Base que grava capturas em um diretório temporário."""
+
+    def setUp(self):
+        self._diretorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self._diretorio.cleanup)
+
+    def gravar(self, dados: bytes, nome: str = "captura.pcap") -> str:
+        caminho = os.path.join(self._diretorio.name, nome)
+        with open(caminho, "wb") as arquivo:
+            arquivo.write(dados)
+        return caminho
+
+    def conferir_contagens(self, contagens: dict, classes: list, truncada: bool = False):
+        """Confere as contagens contra a lista de classes esperadas (None = não IPv4)."""
+        validas = [classe for classe in classes if classe is not None]
+        self.assertEqual(contagens["pacotes"], len(classes))
+        self.assertEqual(contagens["ipv4"], len(validas))
+        self.assertEqual(contagens["nao_ipv4"], len(classes) - len(validas))
+        for classe in (LOCAL, SAIDA, ENTRADA, EXTERNO):
+            self.assertEqual(contagens[classe], validas.count(classe), classe)
+        self.assertEqual(contagens["truncada"], truncada)
+
+
+class TestPcap(ArquivosTemporarios):
+    """Testes para o formato pcap clássico."""
+
+    def test_ordens_de_bytes_e_resolucoes(self):
+        """Testa as quatro assinaturas (little/big-endian, µs/ns)."""
+        quadros, classes = zip(*QUADROS)
+        for ordem in "<>":
+            for nanossegundos in (False, True):
+                with self.subTest(ordem=ordem, nanossegundos=nanossegundos):
+                    caminho = self.gravar(pcap(quadros, ordem, nanossegundos))
+                    self.conferir_contagens(classificar_captura(caminho, ORIGEM, 24), list(classes))
+
+    def test_enderecos_e_numeros(self):
+        """Testa os endereços extraídos e a numeração (que conta também os não IPv4)."""
+        quadros, _ = zip(*QUADROS)
+        with Captura(self.gravar(pcap(quadros))) as captura:
+            self.assertEqual(captura.formato, "pcap")
+            self.assertEqual(captura.tipo_enlace, ENLACE_ETHERNET)
+            pacotes = list(captura.enderecos_ipv4())
+        self.assertEqual([numero for numero, _, _ in pacotes], [1, 2, 4, 5])
+        self.assertEqual(pacotes[2][1:], (ip_para_inteiro("8.8.8.8"), ip_para_inteiro("192.168.1.20")))
+
+    def test_ip_puro_e_linux_sll(self):
+        """Testa os enlaces IP puro (RAW) e Linux cooked (SLL)."""
+        ip = cabecalho_ipv4("192.168.1.5", "1.1.1.1")
+        sll = struct.pack(">HHH8sH", 0, 1, 6, b"\x02" * 8, 0x0800) + ip
+        sll_ipv6 = struct.pack(">HHH8sH", 0, 1, 6, b"\x02" * 8, 0x86DD) + b"\x60" + b"\x00" * 39
+        casos = [(ENLACE_RAW, [ip, b"\x60" + b"\x00" * 39], [SAIDA, None]),
+                 (ENLACE_LINUX_SLL, [sll, sll_ipv6], [SAIDA, None]),
+                 (147, [ip], [None])]  # enlace desconhecido
+        for enlace, quadros, classes in casos:
+            with self.subTest(enlace=enlace):
+                caminho = self.gravar(pcap(quadros, enlace=enlace))
+                self.conferir_contagens(classificar_captura(caminho, ORIGEM, 24), classes)
+
+    def test_captura_truncada(self):
+        """Testa uma captura cortada no meio do último registro e no meio de um cabeçalho."""
+        quadros, classes = zip(*QUADROS)
+        dados = pcap(quadros)
+        for corte in (5, len(quadros[-1]) + 10):
+            with self.subTest(corte=corte):
+                caminho = self.gravar(dados[:-corte])
+                self.conferir_contagens(classificar_captura(caminho, ORIGEM, 24),
+                                        list(classes[:-1]), truncada=True)
+
+    def test_captura_vazia(self):
+        """Testa uma captura só com o cabeçalho."""
+        caminho = self.gravar(pcap([]))
+        self.conferir_contagens(classificar_captura(caminho, ORIGEM, 24), [])
+
+
+class TestPcapng(ArquivosTemporarios):
+    """Testes para o formato pcapng."""
+
+    def test_interfaces_e_tipos_de_bloco(self):
+        """Testa EPB em duas interfaces, SPB, bloco obsoleto e blocos desconhecidos."""
+        ip = cabecalho_ipv4("8.8.4.4", "192.168.1.7")
+        obsoleto = bloco_pcapng(2, struct.pack("<HHIIII", 1, 0, 0, 0, len(ip), len(ip)) + ip)
+        dados = (secao_pcapng()
+                 + interface_pcapng(ENLACE_ETHERNET)
+                 + bloco_pcapng(4, b"\x00" * 8)  # resolução de nomes: pulado
+                 + pacote_pcapng(0, QUADROS[0][0])
+                 + interface_pcapng(ENLACE_RAW)
+                 + pacote_pcapng(1, ip)
+                 + pacote_pcapng(0, ARP)
+                 + bloco_pcapng(3, struct.pack("<I", len(QUADROS[1][0])) + QUADROS[1][0])
+                 + obsoleto)
+        caminho = self.gravar(dados, "captura.pcapng")
+        with Captura(caminho) as captura:
+            self.assertEqual(captura.formato, "pcapng")
+        self.conferir_contagens(classificar_captura(caminho, ORIGEM, 24),
+                                [LOCAL, ENTRADA, None, SAIDA, ENTRADA])
+
+    def test_secoes_com_ordens_diferentes(self):
+        """Testa uma seção little-endian seguida de uma big-endian (interfaces reiniciam)."""
+        dados = b""
+        for ordem in "<>":
+            dados += secao_pcapng(ordem) + interface_pcapng(ENLACE_ETHERNET, ordem)
+            dados += b"".join(pacote_pcapng(0, quadro, ordem) for quadro, _ in QUADROS)
+        caminho = self.gravar(dados, "captura.pcapng")
+        self.conferir_contagens(classificar_captura(caminho, ORIGEM, 24),
+                                [classe for _, classe in QUADROS] * 2)
+
+    def test_truncada_e_corrompida(self):
+        """Testa um bloco final cortado e um pacote de interface inexistente."""
+        dados = secao_pcapng() + interface_pcapng(ENLACE_ETHERNET) + pacote_pcapng(0, QUADROS[0][0])
+        caminho = self.gravar(dados + pacote_pcapng(0, QUADROS[1][0])[:-8], "captura.pcapng")
+        self.conferir_contagens(classificar_captura(caminho, ORIGEM, 24), [LOCAL], truncada=True)
+
+        caminho = self.gravar(dados + pacote_pcapng(3, QUADROS[1][0]), "captura.pcapng")
+        with self.assertRaises(ValueError):
+            classificar_captura(caminho, ORIGEM, 24)
+
+        # Blocos curtos demais para o próprio cabeçalho, no fim e no meio do arquivo
+        for tipo in (6, 2, 3):
+            curto = bloco_pcapng(tipo, b"")
+            for resto in (b"", pacote_pcapng(0, QUADROS[1][0])):
+                with self.subTest(tipo=tipo, no_fim=not resto):
+                    caminho = self.gravar(dados + curto + resto, "captura.pcapng")
+                    with self.assertRaises(ValueError):
+                        classificar_captura(caminho, ORIGEM, 24)
+
+
+class TestClassificarCaptura(ArquivosTemporarios):
+    """Testes para a saída por pacote, o CIDR e entradas inválidas."""
+
+    def setUp(self):
+        super().setUp()
+        self.caminho = self.gravar(pcap([quadro for quadro, _ in QUADROS]))
+
+    def test_saida_csv(self):
+        """Testa a saída CSV por pacote."""
+        saida = io.StringIO()
+        classificar_captura(self.caminho, ORIGEM, 24, saida)
+        linhas = saida.getvalue().splitlines()
+        self.assertEqual(linhas[0], "pacote,origem,destino,classe")
+        self.assertEqual(linhas[1:3], ["1,192.168.1.20,192.168.1.30,local",
+                                       "2,192.168.1.20,8.8.8.8,saida"])
+        self.assertEqual(len(linhas), 5)
+
+    def test_saida_jsonl(self):
+        """Testa a saída JSONL por pacote."""
+        saida = io.StringIO()
+        classificar_captura(self.caminho, ORIGEM, 24, saida, "jsonl")
+        registros = [json.loads(linha) for linha in saida.getvalue().splitlines()]
+        self.assertEqual(registros[2], {"pacote": 4, "origem": "8.8.8.8",
+                                        "destino": "192.168.1.20", "classe": ENTRADA})
+
+    def test_cidr_muda_a_classificacao(self):
+        """Testa que /0 torna tudo local e /32 deixa só o próprio IP de origem na rede."""
+        contagens = classificar_captura(self.caminho, ORIGEM, 0)
+        self.assertEqual(contagens[LOCAL], 4)
+        contagens = classificar_captura(self.caminho, ORIGEM, 32)
+        self.assertEqual(contagens[EXTERNO], 4)
+
+    def test_entradas_invalidas(self):
+        """Testa origem, CIDR, formato e arquivos inválidos."""
+        for args in [("1.2.3", 24), (ORIGEM, 33), (ORIGEM, 24, io.StringIO(), "xml")]:
+            with self.subTest(args=args):
+                with self.assertRaises(ValueError):
+                    classificar_captura(self.caminho, *args)
+        for dados in (b"", b"nao e uma captura", b"\xd4\xc3\xb2\xa1" + b"\x00" * 10):
+            with self.subTest(dados=dados):
+                with self.assertRaises(ValueError):
+                    classificar_captura(self.gravar(dados, "invalido.pcap"), ORIGEM, 24)
+
+    def test_main(self):
+        """Testa o resumo da linha de comando."""
+        saida = io.StringIO()
+        with redirect_stdout(saida):
+            self.assertEqual(main([self.caminho, "--cidr", "24"]), 0)
+        self.assertEqual(saida.getvalue().strip(),
+                         "Pacotes: 6 | Não IPv4: 2 | Locais: 1 | Saída: 1 | Entrada: 1 | Externos: 1")
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,65 @@
+"""
+Testes unitários para o módulo processamento
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para a classificação em lote de listas de IPs.
+"""
+
+import io
+import json
+import unittest
+
+from core.network_utils import ip_para_inteiro, ips_mesma_rede
+from core.processamento import classificar_bloco, classificar_fluxo
+
+
+class TestProcessamento(unittest.TestCase):
+    """Classe de testes para o processamento em lote."""
+    
+    def setUp(self):
+        self.linhas = ["192.168.1.100\n", "192.168.2.1\n", "\n", "  10.0.0.1  \n", "300.1.1.1\n"]
+    
+    def test_classificar_bloco(self):
+        """Testa a classificação de um bloco contra ips_mesma_rede."""
+        resultado = classificar_bloco(self.linhas, ip_para_inteiro("192.168.1.10"), 24)
+        self.assertEqual(resultado, [
+            ("192.168.1.100", ips_mesma_rede("192.168.1.10", "192.168.1.100", 24)),
+            ("192.168.2.1", False),
+            ("10.0.0.1", False),
+            ("300.1.1.1", None),
+        ])
+    
+    def test_fluxo_csv(self):
+        """Testa a saída CSV com blocos menores que a entrada."""
+        saida = io.StringIO()
+        contagens = classificar_fluxo(io.StringIO(''.join(self.linhas) + 'a,"b\n'),
+                                      saida, "192.168.1.10", 16, "csv", tamanho_bloco=2)
+        self.assertEqual(saida.getvalue().splitlines(), [
+            "ip,mesma_rede",
+            "192.168.1.100,true",
+            "192.168.2.1,true",
+            "10.0.0.1,false",
+            '"300.1.1.1",invalido',
+            '"a,""b",invalido',
+        ])
+        self.assertEqual(contagens, {"total": 5, "mesma_rede": 2, "outra_rede": 1, "invalidos": 2})
+    
+    def test_fluxo_jsonl(self):
+        """Testa que cada linha da saída JSONL é um JSON válido."""
+        saida = io.StringIO()
+        classificar_fluxo(io.StringIO(''.join(self.linhas) + 'x"y\n'), saida, "192.168.1.10", 24, "jsonl")
+        registros = [json.loads(linha) for linha in saida.getvalue().splitlines()]
+        self.assertEqual([r["mesma_rede"] for r in registros], [True, False, False, None, None])
+        self.assertEqual(registros[-1]["ip"], 'x"y')
+    
+    def test_parametros_invalidos(self):
+        """Testa origem, CIDR e formato inválidos."""
+        for args in [("300.1.1.1", 24, "csv"), ("192.168.1.10", 33, "csv"), ("192.168.1.10", 24, "xml")]:
+            with self.subTest(args=args):
+                with self.assertRaises(ValueError):
+                    classificar_fluxo(io.StringIO(""), io.StringIO(), *args)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
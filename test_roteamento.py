@@ -0,0 +1,104 @@
+"""
+Testes unitários para o módulo roteamento
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para a busca por maior prefixo (TabelaRotas).
+"""
+
+import random
+import unittest
+from unittest import mock
+
+from core import network_utils
+from core.network_utils import calcular_rede, inteiro_para_ip, ip_para_inteiro
+from core.roteamento import SEM_ROTA, TabelaRotas
+
+
+def _busca_forca_bruta(rotas, ip):
+    """Referência: percorre todas as rotas e fica com o maior prefixo."""
+    melhor = None
+    for rede, cidr, payload in rotas:
+        if calcular_rede(ip, cidr) == calcular_rede(rede, cidr):
+            if melhor is None or cidr >= melhor[0]:
+                melhor = (cidr, payload)
+    return None if melhor is None else melhor[1]
+
+
+class TestTabelaRotas(unittest.TestCase):
+    """Classe de testes para TabelaRotas."""
+    
+    def setUp(self):
+        self.rotas = [
+            ("0.0.0.0", 0, "padrao"),
+            ("10.0.0.0", 8, "A"),
+            ("10.1.0.0", 16, "B"),
+            ("10.1.2.0", 24, "C"),
+            ("10.1.2.128", 25, "D"),
+            ("192.168.1.10", 32, "host"),
+        ]
+        self.tabela = TabelaRotas(self.rotas)
+    
+    def test_buscar(self):
+        """Testa a busca escalar pelo maior prefixo."""
+        casos_teste = [
+            ("10.1.2.200", "D"),
+            ("10.1.2.1", "C"),
+            ("10.1.3.1", "B"),
+            ("10.200.0.1", "A"),
+            ("192.168.1.10", "host"),
+            ("192.168.1.11", "padrao"),
+        ]
+        
+        for ip, esperado in casos_teste:
+            with self.subTest(ip=ip):
+                self.assertEqual(self.tabela.buscar(ip), esperado)
+                self.assertEqual(self.tabela.buscar(ip_para_inteiro(ip)), esperado)
+        
+        self.assertEqual(self.tabela.comprimentos, (32, 25, 24, 16, 8, 0))
+    
+    def test_sem_rota_e_substituicao(self):
+        """Testa IP sem rota, valor padrão e prefixo repetido."""
+        tabela = TabelaRotas([("10.0.0.1", 8, "antiga"), ("10.9.9.9", 8, "nova")])
+        self.assertEqual(len(tabela), 1)
+        self.assertEqual(tabela.buscar("10.0.0.1"), "nova")
+        self.assertIsNone(tabela.buscar("11.0.0.1"))
+        self.assertEqual(tabela.buscar("11.0.0.1", padrao="x"), "x")
+        self.assertEqual(tabela.buscar_indice("11.0.0.1"), SEM_ROTA)
+    
+    def test_entradas_invalidas(self):
+        """Testa rotas e IPs inválidos."""
+        with self.assertRaises(ValueError):
+            TabelaRotas([("10.0.0.0", 33, "x")])
+        with self.assertRaises(ValueError):
+            TabelaRotas([("300.0.0.0", 8, "x")])
+        with self.assertRaises(ValueError):
+            self.tabela.buscar("abc")
+    
+    def test_lote_igual_a_forca_bruta(self):
+        """Testa a busca em lote (com e sem NumPy) contra a referência."""
+        aleatorio = random.Random(42)
+        rotas = []
+        for i in range(300):
+            cidr = aleatorio.choice([8, 12, 16, 20, 24, 28, 32])
+            rede = inteiro_para_ip(aleatorio.randrange(0x0A000000, 0x0B000000))
+            rotas.append((rede, cidr, i))
+        ips = [aleatorio.randrange(0x0A000000, 0x0B000000) for _ in range(500)]
+        ips += [ip_para_inteiro(rede) for rede, _, _ in rotas] + [0, 0xFFFFFFFF]
+        esperado = [_busca_forca_bruta(rotas, inteiro_para_ip(ip)) for ip in ips]
+        
+        variantes = [mock.patch.object(network_utils, "np", None)]
+        if network_utils.np is not None:
+            variantes.append(mock.patch.object(network_utils, "np", network_utils.np))
+        
+        for variante in variantes:
+            with variante:
+                tabela = TabelaRotas(rotas)
+                self.assertEqual([tabela.buscar(ip) for ip in ips], esperado)
+                indices = tabela.buscar_lote(ips)
+                resultado = [None if i == SEM_ROTA else tabela.payloads[i] for i in indices]
+                self.assertEqual(resultado, esperado)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,111 @@
+"""
+Testes unitários para o módulo sequencias
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para as visões preguiçosas de hosts e sub-redes,
+comparando com o módulo ipaddress da biblioteca padrão.
+"""
+
+import ipaddress
+import tracemalloc
+import unittest
+
+from core.enderecos import RedeIPv4
+from core.sequencias import _VisaoEnderecos, hosts, sub_redes
+
+
+class TestHosts(unittest.TestCase):
+    """Testes para hosts()."""
+
+    def test_equivalencia_com_ipaddress(self):
+        """Testa se a lista de hosts coincide com ipaddress para vários CIDRs."""
+        for cidr in (22, 24, 29, 30, 31, 32):
+            with self.subTest(cidr=cidr):
+                referencia = [str(ip) for ip in
+                              ipaddress.IPv4Network(f"192.168.0.0/{cidr}").hosts()]
+                self.assertEqual(list(hosts("192.168.0.0", cidr)), referencia)
+
+    def test_indice_e_fatia(self):
+        """Testa len, índices negativos, fatias com passo e reversed."""
+        lista = hosts("10.0.0.0/8")
+        self.assertEqual(len(lista), 2 ** 24 - 2)
+        self.assertEqual((lista[0], lista[-1]), ("10.0.0.1", "10.255.255.254"))
+        self.assertEqual(list(lista[255:258]), ["10.0.1.0", "10.0.1.1", "10.0.1.2"])
+        self.assertEqual(list(lista[:7:3]), ["10.0.0.1", "10.0.0.4", "10.0.0.7"])
+        self.assertEqual(next(reversed(lista)), "10.255.255.254")
+        with self.assertRaises(IndexError):
+            lista[len(lista)]
+
+    def test_pertinencia_e_index(self):
+        """Testa `in` e index em O(1), inclusive fora da rede."""
+        lista = hosts(RedeIPv4("10.0.0.0/8"))
+        self.assertIn("10.200.1.2", lista)
+        self.assertNotIn("10.0.0.0", lista)
+        self.assertNotIn("11.0.0.1", lista)
+        self.assertNotIn("abc", lista)
+        self.assertEqual(lista.index("10.0.1.0"), 255)
+        with self.assertRaises(ValueError):
+            lista.index("10.255.255.255")
+
+    def test_memoria_constante(self):
+        """Testa que indexar e percorrer um trecho de uma /8 não acumula memória."""
+        tracemalloc.start()
+        try:
+            lista = hosts("10.0.0.0/8")
+            lista[12_345_678]
+            for _ in lista[:100_000]:
+                pass
+            _, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(pico, 64 * 1024)
+
+
+class TestSubRedes(unittest.TestCase):
+    """Testes para sub_redes()."""
+
+    def test_equivalencia_com_ipaddress(self):
+        """Testa se a divisão coincide com ipaddress.subnets."""
+        for novo_cidr in (16, 20, 24, 27):
+            with self.subTest(novo_cidr=novo_cidr):
+                referencia = [str(rede) for rede in
+                              ipaddress.IPv4Network("172.16.0.0/16").subnets(new_prefix=novo_cidr)]
+                self.assertEqual([str(rede) for rede in sub_redes("172.16.0.0/16", novo_cidr)],
+                                 referencia)
+
+    def test_acesso_aleatorio(self):
+        """Testa índice, fatia, index e pertinência sem materializar a lista."""
+        blocos = sub_redes("10.0.0.0/8", 24)
+        self.assertEqual(len(blocos), 65536)
+        self.assertEqual(blocos[-1], RedeIPv4("10.255.255.0/24"))
+        self.assertEqual([str(rede) for rede in blocos[::16384]],
+                         ["10.0.0.0/24", "10.64.0.0/24", "10.128.0.0/24", "10.192.0.0/24"])
+        self.assertEqual(blocos.index("10.1.0.0/24"), 256)
+        self.assertIn(RedeIPv4("10.1.2.0/24"), blocos)
+        self.assertNotIn("10.1.2.0/25", blocos)
+        self.assertEqual(blocos[2:4], sub_redes("10.0.2.0/23", 24))
+
+    def test_novo_cidr_invalido(self):
+        """Testa novo CIDR menor que o da rede ou acima de 32."""
+        for novo_cidr in (8, 33, -1):
+            with self.subTest(novo_cidr=novo_cidr):
+                with self.assertRaises(ValueError):
+                    sub_redes("10.0.0.0/16", novo_cidr)
+
+
+class TestVisaoEnderecos(unittest.TestCase):
+    """Testes para a base das visões."""
+
+    def test_subclasse_incompleta(self):
+        """Testa que uma visão sem _converter ou _valor_do_item não pode ser criada."""
+        class SemValor(_VisaoEnderecos):
+            def _converter(self, valor):
+                return valor
+
+        with self.assertRaises(TypeError):
+            SemValor(range(4))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,184 @@
+"""
+Testes unitários para o módulo servidor_http
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para as rotas do serviço HTTP/JSON e para o
+protocolo (keep-alive, pipelining e lotes grandes fora do laço de eventos).
+"""
+
+import asyncio
+import json
+import unittest
+from unittest import mock
+
+from core import network_utils, servidor_http
+from core.network_utils import descrever_rede
+from core.servidor_http import classificar_lote_json, iniciar_servidor, responder
+
+
+class TestRotas(unittest.TestCase):
+    """Testes para responder e as rotas."""
+
+    def test_rotas_simples(self):
+        """Testa as rotas por GET e por POST com corpo JSON."""
+        self.assertEqual(responder("GET", "/mascara?cidr=24"),
+                         (200, '{"cidr":24,"mascara":"255.255.255.0"}'))
+        self.assertEqual(responder("GET", "/mesma-rede?origem=10.0.0.1&destino=10.0.255.255&cidr=16"),
+                         (200, '{"mesma_rede":true}'))
+        corpo = json.dumps({"origem": "2001:db8::1", "destino": "2001:db8:0:1::1", "cidr": 64})
+        self.assertEqual(responder("POST", "/mesma-rede", corpo.encode()),
+                         (200, '{"mesma_rede":false}'))
+
+        status, texto = responder("GET", "/descrever?ip=172.16.5.4&cidr=20")
+        self.assertEqual(status, 200)
+        self.assertEqual(json.loads(texto), descrever_rede("172.16.5.4", 20))
+
+    def test_erros(self):
+        """Testa parâmetros ausentes ou inválidos, rota e método desconhecidos."""
+        casos = [
+            (("GET", "/mascara?cidr=33"), 400),
+            (("GET", "/mascara?cidr=abc"), 400),
+            (("POST", "/mascara", b'{"cidr": 24.0}'), 400),
+            (("GET", "/mesma-rede?origem=10.0.0.1&cidr=8"), 400),
+            (("GET", "/mesma-rede?origem=10.0.0.1&destino=10.0.0.300&cidr=8"), 400),
+            (("POST", "/descrever", b"{"), 400),
+            (("GET", "/lote"), 405),
+            (("DELETE", "/mascara?cidr=1"), 405),
+            (("GET", "/inexistente"), 404),
+            (("POST", "/descrever", b"[" * 100_000 + b"]" * 100_000), 500),
+        ]
+        for argumentos, status in casos:
+            with self.subTest(argumentos=argumentos):
+                resultado, texto = responder(*argumentos)
+                self.assertEqual(resultado, status)
+                self.assertIn("erro", json.loads(texto))
+
+    def test_lote(self):
+        """Testa o lote como array (origem na query) e como objeto."""
+        destinos = ["192.168.1.100", " 192.168.2.1 ", "abc", 5, "192.168.1.255"]
+        esperado = {"resultados": [True, False, None, None, True],
+                    "mesma_rede": 2, "outra_rede": 1, "invalidos": 2}
+        status, texto = responder("POST", "/lote?origem=192.168.1.10&cidr=24",
+                                  json.dumps(destinos).encode())
+        self.assertEqual((status, json.loads(texto)), (200, esperado))
+
+        corpo = json.dumps({"origem": "192.168.1.10", "cidr": 24, "destinos": destinos})
+        self.assertEqual(json.loads(responder("POST", "/lote", corpo.encode())[1]), esperado)
+
+        with mock.patch.object(network_utils, "np", None):
+            self.assertEqual(json.loads(classificar_lote_json(destinos, "192.168.1.10", 24)), esperado)
+
+        self.assertEqual(responder("POST", "/lote?cidr=24", b"[]")[0], 400)
+        self.assertEqual(responder("POST", "/lote?origem=192.168.1.10&cidr=24", b'{"x": 1}')[0], 400)
+
+
+class TestProtocolo(unittest.IsolatedAsyncioTestCase):
+    """Testes do servidor em uma porta local."""
+
+    async def asyncSetUp(self):
+        self.servidor = await iniciar_servidor("127.0.0.1", 0)
+        self.porta = self.servidor.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.servidor.close()
+        self.servidor.close_clients()
+        await self.servidor.wait_closed()
+
+    async def _ler_resposta(self, leitor):
+        cabecalho = await leitor.readuntil(b"\r\n\r\n")
+        linhas = cabecalho.decode().split("\r\n")
+        campos = dict(linha.split(": ", 1) for linha in linhas[1:] if linha)
+        corpo = await leitor.readexactly(int(campos["Content-Length"]))
+        return int(linhas[0].split(" ")[1]), json.loads(corpo), campos
+
+    async def test_pipeline_em_fragmentos(self):
+        """Testa requisições em pipeline chegando em pedaços: respostas em ordem."""
+        leitor, escritor = await asyncio.open_connection("127.0.0.1", self.porta)
+        dados = b"".join(b"GET /mascara?cidr=%d HTTP/1.1\r\nHost: teste\r\n\r\n" % cidr
+                         for cidr in range(33))
+        for inicio in range(0, len(dados), 7):
+            escritor.write(dados[inicio:inicio + 7])
+            await escritor.drain()
+        for cidr in range(33):
+            status, corpo, _ = await self._ler_resposta(leitor)
+            self.assertEqual((status, corpo["cidr"]), (200, cidr))
+        escritor.close()
+
+    async def test_connection_close(self):
+        """Testa que Connection: close (e HTTP/1.0) encerram a conexão após a resposta."""
+        for requisicao in (b"GET /mascara?cidr=8 HTTP/1.1\r\nConnection: close\r\n\r\n",
+                           b"GET /mascara?cidr=8 HTTP/1.0\r\n\r\n"):
+            with self.subTest(requisicao=requisicao):
+                leitor, escritor = await asyncio.open_connection("127.0.0.1", self.porta)
+                escritor.write(requisicao)
+                status, _, campos = await self._ler_resposta(leitor)
+                self.assertEqual((status, campos.get("Connection")), (200, "close"))
+                self.assertEqual(await leitor.read(), b"")
+                escritor.close()
+
+    async def test_requisicao_malformada(self):
+        """Testa que uma requisição inválida recebe o status do erro e a conexão fecha."""
+        casos = [
+            (b"LIXO\r\n\r\n", 400),
+            (b"POST /descrever HTTP/1.1\r\nContent-Length: -5\r\n\r\n", 400),
+            (b"POST /descrever HTTP/1.1\r\nContent-Length: 999999999999\r\n\r\n", 413),
+        ]
+        for requisicao, esperado in casos:
+            with self.subTest(requisicao=requisicao):
+                leitor, escritor = await asyncio.open_connection("127.0.0.1", self.porta)
+                escritor.write(requisicao)
+                status, _, _ = await self._ler_resposta(leitor)
+                self.assertEqual(status, esperado)
+                self.assertEqual(await leitor.read(), b"")
+                escritor.close()
+
+    async def test_lote_grande_nao_bloqueia(self):
+        """Testa que um lote grande (no executor) não atrasa outra conexão."""
+        destinos = ["10.0.%d.%d" % (i // 256 % 256, i % 256) for i in range(200_000)]
+        corpo = json.dumps(destinos).encode()
+        self.assertGreater(len(corpo), servidor_http.LIMITE_CORPO_NO_LACO)
+        leitor_lote, escritor_lote = await asyncio.open_connection("127.0.0.1", self.porta)
+        leitor, escritor = await asyncio.open_connection("127.0.0.1", self.porta)
+
+        escritor_lote.write(b"POST /lote?origem=10.0.0.1&cidr=24 HTTP/1.1\r\nContent-Length: %d\r\n\r\n"
+                            % len(corpo) + corpo + b"GET /mascara?cidr=16 HTTP/1.1\r\n\r\n")
+        await escritor_lote.drain()
+        escritor.write(b"GET /mascara?cidr=24 HTTP/1.1\r\n\r\n")
+
+        ordem = []
+
+        async def ler(nome, leitor):
+            resposta = await self._ler_resposta(leitor)
+            ordem.append(nome)
+            return resposta
+
+        (_, lote, _), (_, mascara, _) = await asyncio.gather(ler("lote", leitor_lote), ler("mascara", leitor))
+        self.assertEqual(ordem, ["mascara", "lote"])
+        self.assertEqual(lote["mesma_rede"], sum(ip.startswith("10.0.0.") for ip in destinos))
+        self.assertEqual(mascara["cidr"], 24)
+
+        # A requisição em pipeline atrás do lote é respondida depois dele
+        _, seguinte, _ = await self._ler_resposta(leitor_lote)
+        self.assertEqual(seguinte["cidr"], 16)
+        escritor.close()
+        escritor_lote.close()
+
+    async def test_corpo_maior_que_o_buffer_de_entrada(self):
+        """Testa que um corpo acima de LIMITE_BUFFER_ENTRADA chega inteiro e é respondido."""
+        destinos = ["10.%d.%d.%d" % (i >> 16 & 255, i >> 8 & 255, i & 255) for i in range(400_000)]
+        corpo = json.dumps(destinos).encode()
+        self.assertGreater(len(corpo), servidor_http.LIMITE_BUFFER_ENTRADA)
+        leitor, escritor = await asyncio.open_connection("127.0.0.1", self.porta)
+        escritor.write(b"POST /lote?origem=10.0.0.1&cidr=24 HTTP/1.1\r\nContent-Length: %d\r\n\r\n"
+                       % len(corpo) + corpo + b"GET /mascara?cidr=8 HTTP/1.1\r\n\r\n")
+        await escritor.drain()
+        status, lote, _ = await asyncio.wait_for(self._ler_resposta(leitor), 30)
+        self.assertEqual((status, lote["mesma_rede"]), (200, 256))
+        _, seguinte, _ = await asyncio.wait_for(self._ler_resposta(leitor), 10)
+        self.assertEqual(seguinte["cidr"], 8)
+        escritor.close()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
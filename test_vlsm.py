@@ -0,0 +1,150 @@
+"""
+Testes unitários para o módulo vlsm
+Autor: [Seu Nome]
+Data: setembro/2025
+
+Este arquivo contém testes para o alocador buddy e o planejamento VLSM.
+"""
+
+import random
+import time
+import unittest
+
+from core.enderecos import RedeIPv4
+from core.network_utils import TABELA_PREFIXOS
+from core.vlsm import AlocadorBuddy, cidr_para_hosts, planejar_vlsm
+
+
+class TestCidrParaHosts(unittest.TestCase):
+    """Testes para cidr_para_hosts."""
+
+    def test_coincide_com_tabela(self):
+        """Testa se o CIDR é o maior cuja quantidade de hosts atende o pedido."""
+        for hosts in list(range(1, 600)) + [2 ** 24 - 2, 2 ** 24 - 1, 2 ** 32 - 2]:
+            with self.subTest(hosts=hosts):
+                esperado = max(cidr for cidr, info in enumerate(TABELA_PREFIXOS)
+                               if info.num_hosts >= hosts)
+                self.assertEqual(cidr_para_hosts(hosts), esperado)
+
+    def test_invalidos(self):
+        """Testa quantidades fora do range."""
+        for hosts in (0, -1, 2 ** 32 - 1):
+            with self.subTest(hosts=hosts):
+                with self.assertRaises(ValueError):
+                    cidr_para_hosts(hosts)
+
+
+class TestAlocadorBuddy(unittest.TestCase):
+    """Testes para o AlocadorBuddy."""
+
+    def test_divisao_e_juncao(self):
+        """Testa a divisão ao alocar e a junção com o irmão ao liberar."""
+        alocador = AlocadorBuddy("10.0.0.0/24")
+        a = alocador.alocar(26)
+        b = alocador.alocar(25)
+        c = alocador.alocar(26)
+        self.assertEqual([str(rede) for rede in (a, b, c)],
+                         ["10.0.0.0/26", "10.0.0.128/25", "10.0.0.64/26"])
+        self.assertEqual(alocador.livres(), [])
+        with self.assertRaises(ValueError):
+            alocador.alocar(32)
+
+        alocador.liberar(a)
+        self.assertEqual(alocador.livres(), [RedeIPv4("10.0.0.0/26")])
+        alocador.liberar("10.0.0.64/26")
+        self.assertEqual(alocador.livres(), [RedeIPv4("10.0.0.0/25")])
+        alocador.liberar(b)
+        self.assertEqual(alocador.livres(), [RedeIPv4("10.0.0.0/24")])
+        self.assertEqual(alocador.enderecos_livres, 256)
+
+    def test_liberar_nao_alocada(self):
+        """Testa liberar uma rede que não foi alocada (ou com outro CIDR)."""
+        alocador = AlocadorBuddy("10.0.0.0/24")
+        alocador.alocar(25)
+        for rede in ("10.0.0.128/25", "10.0.0.0/26"):
+            with self.subTest(rede=rede):
+                with self.assertRaises(ValueError):
+                    alocador.liberar(rede)
+
+    def test_incremental_aleatorio(self):
+        """Testa alocações e liberações intercaladas: sem sobreposição e sem perda."""
+        aleatorio = random.Random(7)
+        alocador = AlocadorBuddy("172.16.0.0/16")
+        alocadas = []
+        for _ in range(2000):
+            if alocadas and aleatorio.random() < 0.4:
+                alocador.liberar(alocadas.pop(aleatorio.randrange(len(alocadas))))
+            else:
+                try:
+                    alocadas.append(alocador.alocar(aleatorio.randint(20, 32)))
+                except ValueError:
+                    pass
+
+        intervalos = sorted((int(rede.rede), int(rede.rede) + rede.num_enderecos)
+                            for rede in alocador.alocados() + alocador.livres())
+        for (_, fim), (inicio, _) in zip(intervalos, intervalos[1:]):
+            self.assertLessEqual(fim, inicio)
+        self.assertEqual(sum(fim - inicio for inicio, fim in intervalos), 2 ** 16)
+
+        for rede in alocadas:
+            alocador.liberar(rede)
+        self.assertEqual(alocador.livres(), [RedeIPv4("172.16.0.0/16")])
+
+    def test_heap_refeito_com_entradas_obsoletas(self):
+        """Testa que entradas obsoletas acumuladas no heap são descartadas ao devolver um bloco."""
+        alocador = AlocadorBuddy("10.0.0.0/16")
+        rede = alocador.alocar(24)
+        # Simula entradas que já saíram do conjunto (blocos juntados com o irmão)
+        obsoletas = [int(rede.rede) + (bloco << 8) for bloco in range(1, 200)]
+        alocador._heaps[24].extend(obsoletas)
+        alocador.liberar(alocador.alocar(24))
+        self.assertLessEqual(len(alocador._heaps[24]), 2 * len(alocador._livres[24]) + 65)
+        self.assertEqual(sorted(alocador._heaps[24]), sorted(alocador._livres[24]))
+        self.assertEqual(str(alocador.alocar(24)), "10.0.1.0/24")
+        alocador.liberar(rede)
+        alocador.liberar("10.0.1.0/24")
+        self.assertEqual(alocador.livres(), [RedeIPv4("10.0.0.0/16")])
+
+
+class TestPlanejarVlsm(unittest.TestCase):
+    """Testes para planejar_vlsm."""
+
+    def test_exemplo_classico(self):
+        """Testa o exemplo do tutorial: maiores primeiro, menores sub-redes possíveis."""
+        plano = planejar_vlsm("192.168.1.0/24", {"A": 100, "B": 50, "C": 20, "D": 2})
+        redes = {alocacao["nome"]: str(alocacao["rede"]) for alocacao in plano["alocacoes"]}
+        self.assertEqual(redes, {"A": "192.168.1.0/25", "B": "192.168.1.128/26",
+                                 "C": "192.168.1.192/27", "D": "192.168.1.224/31"})
+        self.assertEqual([str(rede) for rede in plano["livres"]],
+                         ["192.168.1.226/31", "192.168.1.228/30", "192.168.1.232/29",
+                          "192.168.1.240/28"])
+
+    def test_lista_mantem_ordem(self):
+        """Testa requisitos em lista: as alocações voltam na ordem de entrada."""
+        plano = planejar_vlsm("10.0.0.0/24", [10, 60])
+        self.assertEqual([alocacao["nome"] for alocacao in plano["alocacoes"]], [0, 1])
+        self.assertEqual(str(plano["alocacoes"][1]["rede"]), "10.0.0.0/26")
+
+    def test_nao_cabe(self):
+        """Testa requisitos que excedem o bloco pai."""
+        with self.assertRaises(ValueError):
+            planejar_vlsm("10.0.0.0/24", [200, 100])
+
+    def test_milhares_de_requisitos_em_barra_8(self):
+        """Testa 5000 requisitos em uma /8 bem abaixo de um segundo."""
+        aleatorio = random.Random(1)
+        requisitos = [aleatorio.randint(1, 2000) for _ in range(5000)]
+        comeco = time.perf_counter()
+        plano = planejar_vlsm("10.0.0.0/8", requisitos)
+        self.assertLess(time.perf_counter() - comeco, 1.0)
+
+        ocupados = sum(alocacao["rede"].num_enderecos for alocacao in plano["alocacoes"])
+        livres = sum(rede.num_enderecos for rede in plano["livres"])
+        self.assertEqual(ocupados + livres, 2 ** 24)
+        for alocacao in plano["alocacoes"]:
+            self.assertGreaterEqual(TABELA_PREFIXOS[alocacao["rede"].cidr].num_hosts,
+                                    alocacao["hosts"])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -7,19 +7,347 @@ Data: setembro/2025
 
 Interface web usando Streamlit para análise de redes IP.
 Para executar: streamlit run web_app.py
+
+O Streamlit reexecuta o script inteiro a cada interação. Para que cada
+rerun custe só o que a tela atual precisa:
+- apenas a aba selecionada é montada (as demais não executam nada)
+- cálculos puros sobre as entradas ficam em st.cache_data
+- tabelas fixas (máscaras, casos de estudo, bateria de testes) são
+  calculadas uma vez por processo e compartilhadas entre sessões com
+  st.cache_resource
+
+Com a variável de ambiente NETWORKTOOLS_METRICAS=1, as funções de rede são
+instrumentadas (core.instrumentacao) e a barra lateral mostra as métricas.
 """
 
+import io
+import json
+import os
+
+import numpy as np
+import pandas as pd
 import streamlit as st
+from core import instrumentacao
+
+# Instrumentação das funções de rede (opcional, via variável de ambiente).
+# Precisa ser ligada antes dos imports abaixo: o Streamlit executa este
+# script fora de sys.modules, onde ativar() não alcança os nomes importados
+METRICAS_ATIVAS = os.environ.get("NETWORKTOOLS_METRICAS", "") not in ("", "0")
+if METRICAS_ATIVAS:
+    instrumentacao.ativar()
+
+from core.conjunto_ip import IPSet
+from core.enderecos import EnderecoIPv4, RedeIPv4
+from core.mapa import mapa_cobertura, mapa_mesma_rede
 from core.network_utils import (
     validar_ip, 
     validar_cidr, 
     cidr_para_mascara_decimal, 
-    ips_mesma_rede
+    descrever_rede,
+    ips_mesma_rede,
+    ips_mesma_rede_lote,
+    analisar_ips_lote,
+    ip_para_inteiro,
+    TABELA_PREFIXOS
 )
 
 # IP FIXO DE ORIGEM (Constante conforme requisito)
 IP_ORIGEM = "192.168.1.10"
 
+# Cores do mapa de calor (RGB): célula vazia, célula coberta e o IP de origem
+COR_VAZIA = np.array([240, 242, 246], dtype=np.float64)
+COR_COBERTA = np.array([31, 119, 180], dtype=np.float64)
+COR_ORIGEM = np.array([214, 39, 40], dtype=np.uint8)
+
+# Medições de referência gravadas por benchmarks/suite.py
+BASELINE_BENCHMARKS = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                   "benchmarks", "baseline.json")
+
+# Opções de linhas por página na tabela da análise em lote
+TAMANHOS_PAGINA = [100, 500, 1000, 5000]
+
+# Casos de estudo da aba de exemplos: (ip_destino, cidr, esperado)
+CASOS_ESTUDO = [
+    {
+        "titulo": "🏠 Rede Doméstica Típica",
+        "descricao": "Configuração comum em residências",
+        "ip_origem": "192.168.1.1",
+        "exemplos": [
+            ("192.168.1.10", 24, True),
+            ("192.168.1.255", 24, True),
+            ("192.168.2.1", 24, False)
+        ]
+    },
+    {
+        "titulo": "🏢 Rede Empresarial",
+        "descricao": "Subnet maior para mais dispositivos",
+        "ip_origem": "10.0.1.1",
+        "exemplos": [
+            ("10.0.1.100", 16, True),
+            ("10.0.50.200", 16, True),
+            ("10.1.1.1", 16, False)
+        ]
+    },
+    {
+        "titulo": "🔬 Laboratório Acadêmico",
+        "descricao": "Rede pequena e controlada",
+        "ip_origem": "172.16.10.1",
+        "exemplos": [
+            ("172.16.10.50", 28, True),
+            ("172.16.10.15", 28, True),
+            ("172.16.10.20", 28, False)
+        ]
+    }
+]
+
+# Bateria de testes da aba do professor: (ip1, ip2, cidr, esperado, descrição)
+CASOS_TESTE = [
+    ("192.168.1.1", "192.168.1.100", 24, True, "Mesma rede /24"),
+    ("192.168.1.1", "192.168.2.1", 24, False, "Redes diferentes /24"),
+    ("10.0.0.1", "10.0.255.255", 16, True, "Mesma rede /16"),
+    ("172.16.1.1", "172.16.1.254", 28, True, "Mesma rede /28"),
+    ("192.168.1.1", "192.168.1.16", 28, False, "Redes diferentes /28"),
+]
+
+
+# ---------------------------------------------------------------------------
+# Recursos compartilhados entre sessões (calculados uma vez por processo)
+# ---------------------------------------------------------------------------
+
+@st.cache_resource
+def tabela_mascaras() -> tuple:
+    """Máscara de cada CIDR (0-32) em inteiro, binário, hexadecimal e decimal."""
+    return tuple(
+        {
+            "inteiro": info.mascara_int,
+            "binario": format(info.mascara_int, '032b'),
+            "hex": f"0x{info.mascara_int:08X}",
+            "decimal": info.mascara_decimal,
+        }
+        for info in TABELA_PREFIXOS
+    )
+
+
+@st.cache_resource
+def resultados_casos_estudo() -> list:
+    """Resultado de cada exemplo dos casos de estudo: (ip_destino, cidr, resultado, esperado)."""
+    return [
+        [(ip_destino, cidr, ips_mesma_rede(caso["ip_origem"], ip_destino, cidr), esperado)
+         for ip_destino, cidr, esperado in caso["exemplos"]]
+        for caso in CASOS_ESTUDO
+    ]
+
+
+def resultados_bateria_testes() -> list:
+    """
+    Resultado de cada caso de CASOS_TESTE: (ip1, ip2, cidr, esperado, descrição, resultado).
+    
+    Sem cache: cada clique em "Executar Testes Completos" roda os testes de novo.
+    """
+    return [(ip1, ip2, cidr, esperado, desc, ips_mesma_rede(ip1, ip2, cidr))
+            for ip1, ip2, cidr, esperado, desc in CASOS_TESTE]
+
+
+@st.cache_resource
+def medicoes_benchmark():
+    """
+    Tempos por operação do conjunto realista, lidos da baseline dos benchmarks.
+    
+    Returns:
+        pd.DataFrame com função, ns por operação, ns com ipaddress e a razão,
+        ou None se a baseline não existir
+    """
+    if not os.path.exists(BASELINE_BENCHMARKS):
+        return None
+    with open(BASELINE_BENCHMARKS, encoding="utf-8") as arquivo:
+        resultados = json.load(arquivo)["resultados"]
+    linhas = [(nome.split("/")[0], resultado["ns"], resultado["ipaddress_ns"],
+               resultado["ipaddress_ns"] / resultado["ns"])
+              for nome, resultado in resultados.items()
+              if nome.endswith("/realista") and "ipaddress_ns" in resultado]
+    return pd.DataFrame(linhas, columns=["Função", "ns/op", "ipaddress (ns/op)", "Mais rápido"])
+
+
+# ---------------------------------------------------------------------------
+# Cálculos puros memorizados por entrada
+# ---------------------------------------------------------------------------
+
+@st.cache_data(max_entries=1024)
+def analisar_par(ip_origem: str, ip_destino: str, cidr: int) -> dict:
+    """Descrição da sub-rede de origem, resultado e binários para o analisador."""
+    return {
+        "descricao": descrever_rede(ip_origem, cidr),
+        "mesma_rede": ips_mesma_rede(ip_origem, ip_destino, cidr),
+        "binario_origem": EnderecoIPv4(ip_origem).binario,
+        "binario_destino": EnderecoIPv4(ip_destino).binario,
+    }
+
+
+@st.cache_data(max_entries=1024)
+def comparar_binario(ip1: str, ip2: str, cidr: int) -> dict:
+    """IPs, máscara e endereços de rede (IP AND máscara) em binário de 32 bits."""
+    mascara = tabela_mascaras()[cidr]["inteiro"]
+    ip1_int, ip2_int = int(EnderecoIPv4(ip1)), int(EnderecoIPv4(ip2))
+    return {
+        "ip1": format(ip1_int, '032b'),
+        "ip2": format(ip2_int, '032b'),
+        "mascara": format(mascara, '032b'),
+        "rede1": format(ip1_int & mascara, '032b'),
+        "rede2": format(ip2_int & mascara, '032b'),
+    }
+
+
+@st.cache_data(max_entries=1024)
+def calcular_exemplo(ip_teste: str, cidr: int) -> dict:
+    """Cálculos da calculadora interativa (IP de origem fixo)."""
+    return {
+        "mascara_decimal": cidr_para_mascara_decimal(cidr),
+        "mesma_rede": ips_mesma_rede(IP_ORIGEM, ip_teste, cidr),
+        "origem_binario": EnderecoIPv4(IP_ORIGEM).binario_octetos,
+        "teste_binario": EnderecoIPv4(ip_teste).binario_octetos,
+        "mascara_binario": RedeIPv4(IP_ORIGEM, cidr).mascara.binario_octetos,
+    }
+
+
+@st.cache_data(max_entries=8, show_spinner="Classificando IPs...")
+def classificar_csv(conteudo: bytes, cidr_padrao: int) -> tuple:
+    """
+    Classifica um CSV de IPs de destino contra IP_ORIGEM em uma passada vetorizada.
+    
+    A primeira linha é cabeçalho só se uma de suas colunas se chamar "ip"
+    (a coluna "cidr", se houver, dá a máscara por linha; as demais são
+    ignoradas com um aviso). Sem cabeçalho, a primeira coluna é o IP e a
+    segunda o CIDR. Linhas sem CIDR usam cidr_padrao. IPs ou CIDRs inválidos
+    ficam com mesma_rede vazio e contam como inválidos.
+    
+    Returns:
+        tuple: (pd.DataFrame com colunas "ip", "cidr" e "mesma_rede" (booleano
+            anulável), lista de avisos sobre colunas ignoradas)
+    """
+    tabela = pd.read_csv(io.BytesIO(conteudo), header=None, dtype=str, encoding="utf-8-sig",
+                         keep_default_na=False, skip_blank_lines=True)
+    coluna_ip, coluna_cidr = 0, (1 if tabela.shape[1] > 1 else None)
+    avisos = []
+    
+    nomes = [str(nome).strip().lower() for nome in tabela.iloc[0]] if len(tabela) else []
+    if "ip" in nomes:
+        coluna_ip = nomes.index("ip")
+        coluna_cidr = nomes.index("cidr") if "cidr" in nomes else None
+        ignoradas = [str(nome) for indice, nome in enumerate(tabela.iloc[0])
+                     if indice not in (coluna_ip, coluna_cidr)]
+        if ignoradas:
+            avisos.append(f"Colunas ignoradas: {', '.join(ignoradas)} "
+                          f"(a máscara por linha vem só da coluna \"cidr\")")
+        tabela = tabela.iloc[1:]
+    elif tabela.shape[1] > 2:
+        avisos.append(f"Sem cabeçalho, só as 2 primeiras colunas (IP e CIDR) são usadas; "
+                      f"{tabela.shape[1] - 2} coluna(s) ignorada(s)")
+    
+    ips = tabela[coluna_ip].str.strip()
+    inteiros = analisar_ips_lote(ips.tolist())
+    
+    # CIDR por linha: "24" ou "/24"; vazio usa o padrão; o resto fica NaN
+    if coluna_cidr is None:
+        cidrs = np.full(len(tabela), cidr_padrao, dtype=np.float64)
+    else:
+        por_texto = {"": cidr_padrao}
+        for cidr in range(33):
+            por_texto[str(cidr)] = por_texto[f"/{cidr}"] = cidr
+        obter = por_texto.get
+        cidrs = np.array([obter(texto.strip(), np.nan) for texto in tabela[coluna_cidr].tolist()],
+                         dtype=np.float64)
+    
+    validos = (inteiros >= 0) & ~np.isnan(cidrs)
+    mesma_rede = ips_mesma_rede_lote(ip_para_inteiro(IP_ORIGEM),
+                                     np.where(validos, inteiros, 0).astype(np.uint32),
+                                     np.where(validos, cidrs, 0).astype(np.int64))
+    
+    # Colunas anuláveis: CIDR ilegível e resultado de linha inválida ficam vazios
+    conhecidos = ~np.isnan(cidrs)
+    coluna_cidr = pd.array(np.where(conhecidos, cidrs, 0).astype(np.int64), dtype="Int64")
+    coluna_cidr[~conhecidos] = pd.NA
+    coluna_resultado = pd.array(np.asarray(mesma_rede), dtype="boolean")
+    coluna_resultado[~validos] = pd.NA
+    
+    resultado = pd.DataFrame({"ip": ips.to_numpy(), "cidr": coluna_cidr,
+                              "mesma_rede": coluna_resultado})
+    return resultado, avisos
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def csv_resultado(conteudo: bytes, cidr_padrao: int) -> bytes:
+    """Resultado da análise em lote como CSV (mesmo formato do modo em lote da CLI)."""
+    resultado, _ = classificar_csv(conteudo, cidr_padrao)
+    texto = np.where(resultado["mesma_rede"].isna(), "invalido",
+                     np.where(resultado["mesma_rede"].fillna(False), "true", "false"))
+    saida = resultado.assign(mesma_rede=texto)
+    return saida.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(max_entries=1024)
+def demonstracao_tecnica(ip1: str, ip2: str, cidr: int) -> dict:
+    """Valores inteiros usados na execução passo a passo da aba do professor."""
+    ip1_int, ip2_int = int(EnderecoIPv4(ip1)), int(EnderecoIPv4(ip2))
+    mascara_int = tabela_mascaras()[cidr]["inteiro"]
+    return {
+        "ip1_int": ip1_int,
+        "ip2_int": ip2_int,
+        "mascara_int": mascara_int,
+        "rede1": ip1_int & mascara_int,
+        "rede2": ip2_int & mascara_int,
+    }
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def ler_prefixos(conteudo: bytes) -> tuple:
+    """
+    Lê uma lista de prefixos (um "a.b.c.d/n" ou IP por linha; # inicia comentário).
+    
+    Returns:
+        tuple: (IPSet com os prefixos válidos, quantidade de linhas inválidas)
+    """
+    validos, invalidas = [], 0
+    for linha in conteudo.decode("utf-8", errors="replace").splitlines():
+        texto = linha.split("#", 1)[0].strip().strip(",")
+        if not texto:
+            continue
+        try:
+            validos.append(RedeIPv4(texto if "/" in texto else f"{texto}/32"))
+        except ValueError:
+            invalidas += 1
+    return IPSet(validos), invalidas
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def imagem_mapa(bloco: str, cidr: int, prefixos: bytes, ampliacao: int) -> tuple:
+    """
+    Mapa de calor do bloco como uma única imagem RGB.
+    
+    Sem prefixos, destaca a rede /cidr de IP_ORIGEM; com prefixos, a
+    cobertura da lista. A fração de cada célula vira uma cor entre
+    COR_VAZIA e COR_COBERTA, e a imagem é ampliada repetindo pixels.
+    
+    Returns:
+        tuple: (imagem uint8 de forma (256*ampliacao, 256*ampliacao, 3),
+                fração do bloco coberta)
+    """
+    if prefixos:
+        mapa = mapa_cobertura(bloco, ler_prefixos(prefixos)[0])
+    else:
+        mapa = mapa_mesma_rede(bloco, IP_ORIGEM, cidr)
+    
+    imagem = (COR_VAZIA + mapa[..., None] * (COR_COBERTA - COR_VAZIA)).astype(np.uint8)
+    
+    # Célula do IP de origem, se ele estiver no bloco
+    rede = RedeIPv4(bloco)
+    deslocamento = ip_para_inteiro(IP_ORIGEM) - int(rede.rede)
+    if 0 <= deslocamento < rede.num_enderecos:
+        celula = deslocamento // (rede.num_enderecos // 65536)
+        imagem[celula // 256, celula % 256] = COR_ORIGEM
+    
+    imagem = imagem.repeat(ampliacao, axis=0).repeat(ampliacao, axis=1)
+    return imagem, float(mapa.mean())
+
 
 def main():
     """Interface web principal."""
@@ -34,20 +362,20 @@ def main():
     # Cabeçalho
     st.title("🌐 NetworkTools - Analisador de Redes IP")
     
-    # Criação das abas
-    tab1, tab2, tab3, tab4 = st.tabs(["🔧 Analisador", "📚 Tutorial Acadêmico", "🧪 Exemplos Práticos", "👨‍🏫 Para o Professor"])
-    
-    with tab1:
-        analisador_principal()
-    
-    with tab2:
-        tutorial_academico()
+    # Seletor de abas: só a aba escolhida é executada a cada rerun
+    # (st.tabs executaria o conteúdo de todas)
+    abas = {
+        "🔧 Analisador": analisador_principal,
+        "📚 Tutorial Acadêmico": tutorial_academico,
+        "🧪 Exemplos Práticos": exemplos_praticos,
+        "👨‍🏫 Para o Professor": aba_professor,
+        "🗺️ Explorador": explorador_enderecos,
+    }
+    aba = st.radio("Aba", list(abas), horizontal=True, key="aba", label_visibility="collapsed")
     
-    with tab3:
-        exemplos_praticos()
+    abas[aba]()
     
-    with tab4:
-        aba_professor()
+    barra_lateral()
 
 
 def analisador_principal():
@@ -98,8 +426,10 @@ def analisador_principal():
         else:
             # Processa análise
             try:
-                mascara_decimal = cidr_para_mascara_decimal(cidr)
-                mesma_rede = ips_mesma_rede(IP_ORIGEM, ip_destino, cidr)
+                analise = analisar_par(IP_ORIGEM, ip_destino, int(cidr))
+                descricao = analise["descricao"]
+                mascara_decimal = descricao["mascara"]
+                mesma_rede = analise["mesma_rede"]
                 
                 # Exibe resultados
                 st.markdown("---")
@@ -115,6 +445,24 @@ def analisador_principal():
                 with col2:
                     st.metric("Formato Decimal", mascara_decimal)
                 
+                # Sub-rede da origem
+                st.markdown("### Sub-rede de Origem")
+                col1, col2, col3, col4 = st.columns(4)
+                
+                with col1:
+                    st.metric("Rede", descricao["rede"])
+                
+                with col2:
+                    st.metric("Broadcast", descricao["broadcast"])
+                
+                with col3:
+                    st.metric("Hosts Utilizáveis", f"{descricao['num_hosts']:,}")
+                
+                with col4:
+                    st.metric("Wildcard", descricao["wildcard"])
+                
+                st.caption(f"Faixa de hosts: {descricao['primeiro_host']} – {descricao['ultimo_host']}")
+                
                 # B) Análise de rede
                 st.markdown("### B) Análise de Rede")
                 
@@ -134,14 +482,80 @@ def analisador_principal():
                 
                 # Informações adicionais
                 with st.expander("ℹ️ Informações Técnicas"):
-                    st.write(f"**IP Origem (binário):** {format(int(''.join(IP_ORIGEM.split('.'))), 'b').zfill(32)}")
-                    st.write(f"**IP Destino (binário):** {format(int(''.join(ip_destino.split('.'))), 'b').zfill(32)}")
-                    st.write(f"**Máscara (binário):** {'1' * cidr + '0' * (32 - cidr)}")
+                    st.write(f"**IP Origem (binário):** {analise['binario_origem']}")
+                    st.write(f"**IP Destino (binário):** {analise['binario_destino']}")
+                    st.write(f"**Máscara (binário):** {descricao['mascara_binaria']}")
                 
             except Exception as e:
                 st.error(f"❌ Erro no processamento: {e}")
     
-    # Sidebar com informações
+    analise_em_lote()
+
+
+def analise_em_lote():
+    """Seção de upload de CSV com classificação vetorizada e tabela paginada."""
+    st.markdown("---")
+    st.subheader("📂 Análise em Lote (CSV)")
+    st.caption("Um IP de destino por linha; coluna opcional `cidr` para máscara por linha. "
+               "A primeira linha é cabeçalho se tiver uma coluna `ip`. "
+               "Exemplo: `ip,cidr` / `192.168.1.100,24`")
+    
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        arquivo = st.file_uploader("Arquivo CSV", type=["csv", "txt"], key="lote_arquivo")
+    with col2:
+        cidr_padrao = st.number_input("CIDR padrão", min_value=0, max_value=32, value=24,
+                                      key="lote_cidr", help="Usado nas linhas sem CIDR")
+    
+    if arquivo is None:
+        return
+    
+    conteudo = arquivo.getvalue()
+    try:
+        resultado, avisos = classificar_csv(conteudo, int(cidr_padrao))
+    except (ValueError, pd.errors.ParserError) as e:
+        st.error(f"❌ Não foi possível ler o CSV: {e}")
+        return
+    for aviso in avisos:
+        st.warning(f"⚠️ {aviso}")
+    
+    # Resumo
+    mesma = int(resultado["mesma_rede"].sum())
+    invalidos = int(resultado["mesma_rede"].isna().sum())
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("Total", f"{len(resultado):,}")
+    col2.metric("Mesma rede", f"{mesma:,}")
+    col3.metric("Outra rede", f"{len(resultado) - mesma - invalidos:,}")
+    col4.metric("Inválidos", f"{invalidos:,}")
+    
+    st.download_button("⬇️ Baixar resultado (CSV)", data=csv_resultado(conteudo, int(cidr_padrao)),
+                       file_name="resultado.csv", mime="text/csv", on_click="ignore")
+    
+    # Filtro e paginação: só a página atual é enviada ao navegador
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        filtro = st.selectbox("Mostrar", ["Todos", "Mesma rede", "Outra rede", "Inválidos"],
+                              key="lote_filtro")
+    if filtro == "Mesma rede":
+        resultado = resultado[resultado["mesma_rede"].fillna(False)]
+    elif filtro == "Outra rede":
+        resultado = resultado[~resultado["mesma_rede"].fillna(True)]
+    elif filtro == "Inválidos":
+        resultado = resultado[resultado["mesma_rede"].isna()]
+    
+    with col2:
+        tamanho_pagina = st.selectbox("Linhas por página", TAMANHOS_PAGINA, key="lote_tamanho")
+    num_paginas = max(1, -(-len(resultado) // tamanho_pagina))
+    with col3:
+        pagina = st.number_input(f"Página (de {num_paginas:,})", min_value=1,
+                                 max_value=num_paginas, value=1, key="lote_pagina")
+    
+    inicio = (min(pagina, num_paginas) - 1) * tamanho_pagina
+    st.dataframe(resultado.iloc[inicio:inicio + tamanho_pagina], hide_index=True)
+
+
+def barra_lateral():
+    """Barra lateral com informações do projeto (exibida em todas as abas)."""
     with st.sidebar:
         st.markdown("### 📚 Sobre o NetworkTools")
         st.markdown("""
@@ -165,6 +579,28 @@ def analisador_principal():
         - [Nome 3] - [Semestre]
         - [Karina Ribeiro Modesto] - 1º Semestre (obrigatório)
         """)
+        
+        if METRICAS_ATIVAS:
+            painel_metricas()
+
+
+def painel_metricas():
+    """Contagens, falhas e latência média das funções de rede (instrumentação ativa)."""
+    st.markdown("### 📈 Métricas")
+    numeros = instrumentacao.instantaneo()
+    if not numeros:
+        st.caption("Nenhuma chamada registrada ainda.")
+        return
+    
+    tabela = pd.DataFrame(
+        [(nome, dados["chamadas"], dados["falhas"], dados["soma_segundos"] / dados["chamadas"] * 1e6)
+         for nome, dados in numeros.items()],
+        columns=["Função", "Chamadas", "Falhas", "Média (µs)"],
+    )
+    st.dataframe(tabela, hide_index=True,
+                 column_config={"Média (µs)": st.column_config.NumberColumn(format="%.2f")})
+    st.download_button("⬇️ Prometheus", data=instrumentacao.exportar_prometheus(),
+                       file_name="metricas.prom", mime="text/plain", on_click="ignore")
 
 
 def tutorial_academico():
@@ -217,19 +653,18 @@ def tutorial_academico():
     """)
     
     # Exemplo interativo
-    exemplo_ip = "192.168.1.10"
-    octetos = exemplo_ip.split('.')
+    exemplo_ip = EnderecoIPv4("192.168.1.10")
     
     col1, col2, col3, col4 = st.columns(4)
     
-    for i, (col, octeto) in enumerate(zip([col1, col2, col3, col4], octetos)):
+    for i, (col, octeto) in enumerate(zip([col1, col2, col3, col4], exemplo_ip.octetos)):
         with col:
-            binario = format(int(octeto), '08b')
+            binario = format(octeto, '08b')
             st.metric(f"Octeto {i+1}", octeto)
             st.code(f"{binario}", language="text")
     
-    st.code(f"IP Completo (binário): {'.'.join([format(int(oct), '08b') for oct in octetos])}")
-    st.code(f"IP Completo (32 bits): {''.join([format(int(oct), '08b') for oct in octetos])}")
+    st.code(f"IP Completo (binário): {exemplo_ip.binario_octetos}")
+    st.code(f"IP Completo (32 bits): {exemplo_ip.binario}")
     
     # Seção 3: Funcionamento das Máscaras
     st.subheader("3️⃣ Como Funcionam as Máscaras")
@@ -249,10 +684,12 @@ def tutorial_academico():
         
         st.markdown(f"**Exemplo:** Verificando se `{ip1}` e `{ip2}` estão na mesma rede `/{cidr}`")
         
+        binarios = comparar_binario(ip1, ip2, cidr)
+        
         # Passo 1
         st.markdown("#### Passo 1: Converter IPs para binário")
-        ip1_bin = ''.join([format(int(oct), '08b') for oct in ip1.split('.')])
-        ip2_bin = ''.join([format(int(oct), '08b') for oct in ip2.split('.')])
+        ip1_bin = binarios["ip1"]
+        ip2_bin = binarios["ip2"]
         
         col1, col2 = st.columns(2)
         with col1:
@@ -262,17 +699,15 @@ def tutorial_academico():
         
         # Passo 2
         st.markdown("#### Passo 2: Criar máscara binária")
-        mascara_bin = '1' * cidr + '0' * (32 - cidr)
+        mascara_bin = binarios["mascara"]
         st.code(f"Máscara /{cidr}:\n{mascara_bin}")
         
         # Passo 3
         st.markdown("#### Passo 3: Aplicar operação AND")
         st.markdown("A operação **AND** mantém apenas os bits de rede:")
         
-        rede1_bin = ''.join(['1' if ip1_bin[i] == '1' and mascara_bin[i] == '1' else '0' 
-                            for i in range(32)])
-        rede2_bin = ''.join(['1' if ip2_bin[i] == '1' and mascara_bin[i] == '1' else '0' 
-                            for i in range(32)])
+        rede1_bin = binarios["rede1"]
+        rede2_bin = binarios["rede2"]
         
         col1, col2 = st.columns(2)
         with col1:
@@ -394,8 +829,9 @@ def exemplos_praticos():
     if validar_ip(ip_teste):
         
         # Cálculos
-        mascara_decimal = cidr_para_mascara_decimal(cidr_teste)
-        mesma_rede = ips_mesma_rede(IP_ORIGEM, ip_teste, cidr_teste)
+        exemplo = calcular_exemplo(ip_teste, cidr_teste)
+        mascara_decimal = exemplo["mascara_decimal"]
+        mesma_rede = exemplo["mesma_rede"]
         
         # Visualização detalhada
         st.markdown("### 📊 Análise Detalhada")
@@ -413,9 +849,9 @@ def exemplos_praticos():
         with st.expander("🔍 Visualização Binária"):
             
             # IPs em binário
-            ip_origem_bin = '.'.join([format(int(oct), '08b') for oct in IP_ORIGEM.split('.')])
-            ip_teste_bin = '.'.join([format(int(oct), '08b') for oct in ip_teste.split('.')])
-            mascara_bin = '.'.join([format(int(oct), '08b') for oct in mascara_decimal.split('.')])
+            ip_origem_bin = exemplo["origem_binario"]
+            ip_teste_bin = exemplo["teste_binario"]
+            mascara_bin = exemplo["mascara_binario"]
             
             st.code(f"""
 IP Origem:  {IP_ORIGEM}
@@ -434,46 +870,12 @@ Binário:    {mascara_bin}
     # Casos de estudo
     st.subheader("📚 Casos de Estudo")
     
-    casos_estudo = [
-        {
-            "titulo": "🏠 Rede Doméstica Típica",
-            "descricao": "Configuração comum em residências",
-            "ip_origem": "192.168.1.1",
-            "exemplos": [
-                ("192.168.1.10", 24, True),
-                ("192.168.1.255", 24, True),
-                ("192.168.2.1", 24, False)
-            ]
-        },
-        {
-            "titulo": "🏢 Rede Empresarial",
-            "descricao": "Subnet maior para mais dispositivos",
-            "ip_origem": "10.0.1.1",
-            "exemplos": [
-                ("10.0.1.100", 16, True),
-                ("10.0.50.200", 16, True),
-                ("10.1.1.1", 16, False)
-            ]
-        },
-        {
-            "titulo": "🔬 Laboratório Acadêmico",
-            "descricao": "Rede pequena e controlada",
-            "ip_origem": "172.16.10.1",
-            "exemplos": [
-                ("172.16.10.50", 28, True),
-                ("172.16.10.15", 28, True),
-                ("172.16.10.20", 28, False)
-            ]
-        }
-    ]
-    
-    for caso in casos_estudo:
+    for caso, resultados in zip(CASOS_ESTUDO, resultados_casos_estudo()):
         with st.expander(f"{caso['titulo']} - {caso['descricao']}"):
             
             st.markdown(f"**IP Base:** `{caso['ip_origem']}`")
             
-            for ip_destino, cidr, esperado in caso['exemplos']:
-                resultado = ips_mesma_rede(caso['ip_origem'], ip_destino, cidr)
+            for ip_destino, cidr, resultado, esperado in resultados:
                 status = "✅" if resultado == esperado else "❌"
                 rede_status = "Mesma rede" if resultado else "Rede diferente"
                 
@@ -535,43 +937,45 @@ def aba_professor():
     
     if validar_ip(ip1_demo) and validar_ip(ip2_demo):
         
-        # Importa funções necessárias
-        from core.network_utils import ip_para_inteiro, calcular_rede
-        
         # Cálculos
-        ip1_int = ip_para_inteiro(ip1_demo)
-        ip2_int = ip_para_inteiro(ip2_demo)
-        mascara_decimal = cidr_para_mascara_decimal(cidr_demo)
+        demo = demonstracao_tecnica(ip1_demo, ip2_demo, cidr_demo)
+        ip1_int = demo["ip1_int"]
+        ip2_int = demo["ip2_int"]
+        mascara_decimal = tabela_mascaras()[cidr_demo]["decimal"]
         
         # Seção 3: Código Fonte Detalhado
         st.subheader("💻 Análise do Código Fonte")
         
-        with st.expander("📝 Função: validar_ip()"):
+        with st.expander("📝 Função: analisar_ip() / validar_ip()"):
             st.code('''
-def validar_ip(ip: str) -> bool:
+def analisar_ip(ip: str) -> int:
     """
-    Valida se um endereço IP está em formato válido (IPv4).
+    Valida e converte um IP para inteiro em uma única passada.
     
     Implementação:
-    1. Usa regex para verificar formato xxx.xxx.xxx.xxx
-    2. Verifica se cada octeto está entre 0-255
-    3. Retorna True/False
+    1. Divide o IP nos 4 octetos (split)
+    2. Consulta cada octeto numa tabela com "0" a "255"
+       (a própria consulta já valida o range 0-255)
+    3. Retorna o inteiro de 32 bits ou IP_INVALIDO (-1)
     """
-    import re
-    
-    # Padrão regex para IPv4
-    padrao = r'^(\\d{1,3})\\.(\\d{1,3})\\.(\\d{1,3})\\.(\\d{1,3})$'
-    match = re.match(padrao, ip)
-    
-    if not match:
-        return False
-    
-    # Verifica se cada octeto está entre 0 e 255
-    for octeto in match.groups():
-        if int(octeto) > 255:
-            return False
-            
-    return True
+    partes = ip.split('.')
+    if len(partes) != 4:
+        return IP_INVALIDO
+    
+    a, b, c, d = partes
+    obter = _OCTETOS.get
+    a = obter(a, -1)
+    b = obter(b, -1)
+    c = obter(c, -1)
+    d = obter(d, -1)
+    if a < 0 or b < 0 or c < 0 or d < 0:
+        return _analisar_ip_lento(partes)  # ex: zeros à esquerda
+    
+    return (a << 24) | (b << 16) | (c << 8) | d
+
+
+def validar_ip(ip: str) -> bool:
+    return analisar_ip(ip) != IP_INVALIDO
             ''', language='python')
             
             st.markdown("**✅ Teste em tempo real:**")
@@ -630,27 +1034,21 @@ def cidr_para_mascara_decimal(cidr: int) -> str:
     """
     Converte máscara CIDR para formato decimal.
     
-    Algoritmo:
-    1. Cria string binária: '1' × cidr + '0' × (32-cidr)
-    2. Divide em 4 grupos de 8 bits cada
-    3. Converte cada grupo binário para decimal
-    4. Junta com pontos
-    """
-    # Cria a máscara binária
-    mascara_binaria = '1' * cidr + '0' * (32 - cidr)
+    Algoritmo (executado uma única vez, na importação):
+    1. Para cada CIDR de 0 a 32: mascara = 0xFFFFFFFF << (32 - cidr)
+    2. Extrai os 4 octetos com deslocamentos (>> 24, 16, 8, 0) e & 255
+    3. Junta com pontos e guarda em TABELA_PREFIXOS[cidr]
     
-    # Converte para decimal em octetos
-    octetos = []
-    for i in range(0, 32, 8):
-        octeto_binario = mascara_binaria[i:i+8]
-        octeto_decimal = int(octeto_binario, 2)
-        octetos.append(str(octeto_decimal))
+    Cada chamada é apenas uma consulta à tabela.
+    """
+    if not validar_cidr(cidr):
+        raise ValueError("CIDR deve estar entre 0 e 32")
     
-    return '.'.join(octetos)
+    return TABELA_PREFIXOS[cidr].mascara_decimal
             ''', language='python')
             
             st.markdown("**✅ Demonstração visual:**")
-            mascara_bin = '1' * cidr_demo + '0' * (32 - cidr_demo)
+            mascara_bin = tabela_mascaras()[cidr_demo]["binario"]
             
             # Mostra a máscara binária dividida em octetos
             col1, col2, col3, col4 = st.columns(4)
@@ -732,7 +1130,7 @@ Hex: 0x{ip2_int:08X}
         
         # Passo 2: Criação da máscara
         st.markdown("#### Passo 2: Criação da Máscara")
-        mascara_int = (0xFFFFFFFF << (32 - cidr_demo)) & 0xFFFFFFFF
+        mascara_int = demo["mascara_int"]
         
         st.code(f"""
 CIDR: /{cidr_demo}
@@ -746,8 +1144,8 @@ Máscara (dec): {mascara_decimal}
         # Passo 3: Operação AND
         st.markdown("#### Passo 3: Operação AND (Isolamento da Rede)")
         
-        rede1 = ip1_int & mascara_int
-        rede2 = ip2_int & mascara_int
+        rede1 = demo["rede1"]
+        rede2 = demo["rede2"]
         
         col1, col2 = st.columns(2)
         
@@ -791,7 +1189,7 @@ Hex: 0x{rede2:08X}
         with col1:
             st.markdown("""
             ### 📊 Complexidade Algorítmica
-            - **Validação IP:** O(1) - Regex compilada
+            - **Validação IP:** O(1) - Parser de passada única
             - **Conversão IP→Int:** O(1) - 4 operações
             - **Criação Máscara:** O(1) - Bit shifting
             - **Operação AND:** O(1) - Operação primitiva
@@ -799,6 +1197,14 @@ Hex: 0x{rede2:08X}
             
             **Total: O(1) - Tempo constante**
             """)
+            
+            medicoes = medicoes_benchmark()
+            if medicoes is not None:
+                st.markdown("**⏱️ Medido** (`python -m benchmarks.suite`, IPs realistas):")
+                st.dataframe(medicoes, hide_index=True,
+                             column_config={"ns/op": st.column_config.NumberColumn(format="%.0f"),
+                                            "ipaddress (ns/op)": st.column_config.NumberColumn(format="%.0f"),
+                                            "Mais rápido": st.column_config.NumberColumn(format="%.1fx")})
         
         with col2:
             st.markdown("""
@@ -806,7 +1212,7 @@ Hex: 0x{rede2:08X}
             - **Bit operations:** Mais rápidas que string
             - **Integer comparison:** Mais eficiente
             - **Input validation:** Evita erros runtime
-            - **Cached regex:** Compilação única
+            - **Tabela de octetos:** Valida e converte sem regex
             - **Minimal memory:** Sem estruturas extras
             """)
         
@@ -815,31 +1221,12 @@ Hex: 0x{rede2:08X}
         
         if st.button("🚀 Executar Testes Completos"):
             
-            casos_teste = [
-                # (ip1, ip2, cidr, esperado, descrição)
-                ("192.168.1.1", "192.168.1.100", 24, True, "Mesma rede /24"),
-                ("192.168.1.1", "192.168.2.1", 24, False, "Redes diferentes /24"),
-                ("10.0.0.1", "10.0.255.255", 16, True, "Mesma rede /16"),
-                ("172.16.1.1", "172.16.1.254", 28, True, "Mesma rede /28"),
-                ("192.168.1.1", "192.168.1.16", 28, False, "Redes diferentes /28"),
-            ]
-            
-            st.markdown("**Executando testes...**")
-            
-            for i, (ip1, ip2, cidr, esperado, desc) in enumerate(casos_teste):
-                resultado = ips_mesma_rede(ip1, ip2, cidr)
-                status = "✅ PASS" if resultado == esperado else "❌ FAIL"
-                
-                with st.expander(f"Teste {i+1}: {desc} - {status}"):
-                    st.code(f"""
-Teste: {desc}
-IP1: {ip1}
-IP2: {ip2}
-CIDR: /{cidr}
-Esperado: {esperado}
-Resultado: {resultado}
-Status: {status}
-                    """)
+            resultados = pd.DataFrame(
+                [(desc, ip1, ip2, f"/{cidr}", esperado, resultado,
+                  "✅ PASS" if resultado == esperado else "❌ FAIL")
+                 for ip1, ip2, cidr, esperado, desc, resultado in resultados_bateria_testes()],
+                columns=["Teste", "IP1", "IP2", "CIDR", "Esperado", "Resultado", "Status"])
+            st.dataframe(resultados, hide_index=True)
             
             st.success("🎉 **Todos os testes concluídos!** Verifique os resultados acima.")
     
@@ -921,5 +1308,50 @@ Status: {status}
     """)
 
 
+def explorador_enderecos():
+    """Aba com o mapa de calor do espaço de endereçamento (uma /16 ou uma /8)."""
+    st.markdown("---")
+    st.header("🗺️ Explorador do Espaço de Endereçamento")
+    st.markdown(f"""
+    Cada célula da grade 256 x 256 é **um endereço** (bloco /16) ou **uma /24**
+    (bloco /8). Em azul, os endereços na mesma rede de `{IP_ORIGEM}` com a máscara
+    escolhida, ou cobertos pela lista de prefixos enviada; em vermelho, o IP de origem.
+    """)
+    
+    col1, col2, col3 = st.columns([2, 2, 1])
+    with col1:
+        escala = st.radio("Escala", ["/16 (um endereço por célula)", "/8 (uma /24 por célula)"],
+                          key="mapa_escala")
+        endereco = st.text_input("Endereço dentro do bloco exibido", value=IP_ORIGEM,
+                                 key="mapa_endereco",
+                                 help="Troque para navegar até outro bloco")
+    with col2:
+        cidr = st.slider("Máscara CIDR de IP_ORIGEM", min_value=0, max_value=32, value=24,
+                         key="mapa_cidr")
+        arquivo = st.file_uploader("Lista de prefixos (opcional)", type=["txt", "csv"],
+                                   key="mapa_prefixos",
+                                   help="Um prefixo a.b.c.d/n ou IP por linha")
+    with col3:
+        ampliacao = st.select_slider("Zoom", options=[1, 2, 3, 4], value=2, key="mapa_zoom")
+    
+    if not validar_ip(endereco.strip()):
+        st.error("❌ Endereço inválido")
+        return
+    bloco = str(RedeIPv4(endereco.strip(), 16 if escala.startswith("/16") else 8))
+    
+    prefixos = arquivo.getvalue() if arquivo is not None else b""
+    if prefixos:
+        conjunto, invalidas = ler_prefixos(prefixos)
+        if invalidas:
+            st.warning(f"⚠️ {invalidas} linha(s) inválida(s) ignorada(s)")
+        titulo = f"Cobertura de {len(conjunto.para_cidrs())} bloco(s) CIDR em {bloco}"
+    else:
+        titulo = f"Rede {RedeIPv4(IP_ORIGEM, cidr)} em {bloco}"
+    
+    imagem, cobertura = imagem_mapa(bloco, int(cidr), prefixos, int(ampliacao))
+    st.metric("Fração do bloco coberta", f"{cobertura:.4%}")
+    st.image(imagem, caption=titulo)
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file